@@ -2,46 +2,73 @@
 accessibility/methods.py
 """
 
-from django.core.cache import cache
+from django.db.models import Exists, OuterRef
 
-from accessibility.accessibility import ACCESSBILITY_FEATURE
-from accessibility.filters import AccessibilityFilter
 from accessibility.models import DefaultAccessibility
-from horilla.horilla_middlewares import _thread_locals
+from horilla.horilla_cache import HorillaCache
 
+# a day on a shared cache, PROCESS_CACHE_TIMEOUT on a process local one
+ACCESSIBILITY_CACHE = HorillaCache("accessibility", timeout=60 * 60 * 24)
 
-def check_is_accessible(feature, cache_key, employee):
+
+def invalidate_accessibility(employee_ids=None):
     """
-    Method to check the employee is accessible for the feature or not
+    Invalidate the cached accessible features of the employees, or of
+    everybody when no employee is given
     """
-    if not employee:
-        return False
+    if employee_ids is None:
+        ACCESSIBILITY_CACHE.bump()
+        return
+    ACCESSIBILITY_CACHE.delete_many(employee_ids)
 
-    accessibility = DefaultAccessibility.objects.filter(
-        feature=feature, is_enabled=True
-    ).first()
 
-    if accessibility and accessibility.exclude_all:
-        return False
-    if not feature or not accessibility:
-        return True
+def compile_rules(employee):
+    """
+    Compile the enabled accessibility rules into {feature: accessible} for the
+    employee with a single query. The first enabled rule of a feature
+    applies, features without a rule are accessible to everyone.
+    """
+    through = DefaultAccessibility.employees.through
+    rules = (
+        DefaultAccessibility.objects.filter(is_enabled=True)
+        .annotate(
+            is_member=Exists(
+                through.objects.filter(
+                    defaultaccessibility_id=OuterRef("pk"), employee_id=employee.pk
+                )
+            )
+        )
+        .order_by("pk")
+        .values_list("feature", "exclude_all", "is_member")
+    )
+    features = {}
+    for feature, exclude_all, is_member in rules:
+        features.setdefault(feature, is_member and not exclude_all)
+    return features
 
-    data: dict = cache.get(cache_key, default={})
-    if data and data.get(feature) is not None:
-        return data.get(feature)
 
-    employees = accessibility.employees.all()
-    accessible = employee in employees
-    return accessible
+def get_accessible_features(employee):
+    """
+    Returns {feature: accessible} of the enabled rules for the employee,
+    cached in the accessibility cache namespace until the rules or the employee's work
+    information change, and on the employee instance for the request
+    """
+    features = getattr(employee, "_accessible_features", None)
+    if features is not None:
+        return features
+    features = ACCESSIBILITY_CACHE.get_or_set(
+        employee.pk, lambda: compile_rules(employee)
+    )
+    employee._accessible_features = features
+    return features
 
 
-def update_employee_accessibility_cache(cache_key, employee):
+def check_is_accessible(feature, employee):
     """
-    Cache for get all the queryset
+    Method to check the employee is accessible for the feature or not
     """
-    feature_accessible = {}
-    for accessibility, _display in ACCESSBILITY_FEATURE:
-        feature_accessible[accessibility] = check_is_accessible(
-            accessibility, cache_key, employee
-        )
-    cache.set(cache_key, feature_accessible)
+    if not employee:
+        return False
+    if not feature:
+        return True
+    return get_accessible_features(employee).get(feature, True)
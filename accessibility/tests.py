@@ -1,3 +1,87 @@
-from django.test import TestCase
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from accessibility.methods import check_is_accessible
+from accessibility.models import DefaultAccessibility
+from employee.models import Employee
+from horilla.horilla_cache import PROCESS_CACHE_TIMEOUT
+from horilla.horilla_middlewares import _thread_locals
+
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "horilla.horilla_cache.LocMemCache",
+        "LOCATION": "accessibility-tests",
+        "KEY_PREFIX": "horilla",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class AccessibilityCacheTests(TestCase):
+    """
+    Tests of the accessible features cached per employee
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.employee = Employee.objects.create(
+            employee_first_name="Viewer",
+            email="viewer@horilla.com",
+            phone="1234567890",
+            badge_id="VIEW",
+        )
+        self.rules = DefaultAccessibility.objects.bulk_create(
+            [
+                DefaultAccessibility(feature=feature, filter={})
+                for feature in ["birthday_view", "gender_chart", "employees_chart"]
+            ]
+        )
+        self.rules[0].employees.add(self.employee)
+        user = self.employee.employee_user_id
+        user.is_new_employee = False
+        user.save()
+        self.client.force_login(user)
+
+    def tearDown(self):
+        # the middleware leaves the last request of the client in the thread
+        _thread_locals.__dict__.pop("request", None)
+
+    def accessibility_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/")
+        self.assertEqual(response.status_code, 200)
+        return [
+            query
+            for query in queries.captured_queries
+            if "accessibility_defaultaccessibility" in query["sql"]
+        ]
+
+    def test_page_render_runs_at_most_one_accessibility_query(self):
+        self.assertEqual(len(self.accessibility_queries()), 1)
+        self.assertEqual(self.accessibility_queries(), [])
+
+        # a rule change is seen by the next render
+        self.rules[1].employees.add(self.employee)
+        self.assertEqual(len(self.accessibility_queries()), 1)
+
+    def test_process_local_entries_expire(self):
+        employee = Employee.objects.get(pk=self.employee.pk)
+        self.assertTrue(check_is_accessible("birthday_view", employee))
+        self.assertFalse(check_is_accessible("gender_chart", employee))
+
+        # a worker sharing no cache with this one changed the rule
+        DefaultAccessibility.employees.through.objects.create(
+            defaultaccessibility=self.rules[1], employee=self.employee
+        )
+        employee = Employee.objects.get(pk=self.employee.pk)
+        self.assertFalse(check_is_accessible("gender_chart", employee))
+
+        later = time.time() + PROCESS_CACHE_TIMEOUT + 1
+        with mock.patch("time.time", return_value=later):
+            employee = Employee.objects.get(pk=self.employee.pk)
+            self.assertTrue(check_is_accessible("gender_chart", employee))
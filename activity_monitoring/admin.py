@@ -7,6 +7,7 @@ This module is used to register models in Django admin
 from django.contrib import admin
 
 from activity_monitoring.models import (
+    ActivityHourlyRollup,
     ActivityLog,
     AllowedDomain,
     DailyEmployeeReport,
@@ -53,6 +54,25 @@ class ActivityLogAdmin(admin.ModelAdmin):
     search_fields = ["domain_name", "work_session__employee_id__employee_first_name"]
 
 
+@admin.register(ActivityHourlyRollup)
+class ActivityHourlyRollupAdmin(admin.ModelAdmin):
+    """
+    ActivityHourlyRollupAdmin
+    """
+
+    list_display = [
+        "work_session",
+        "hour",
+        "domain_name",
+        "is_allowed",
+        "active_seconds",
+        "idle_seconds",
+        "log_count",
+    ]
+    list_filter = ["is_allowed", "hour"]
+    search_fields = ["domain_name"]
+
+
 @admin.register(ExtensionHeartbeat)
 class ExtensionHeartbeatAdmin(admin.ModelAdmin):
     """
@@ -8,6 +8,8 @@ import logging
 import secrets
 from datetime import timedelta
 
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.authentication import SessionAuthentication
@@ -18,11 +20,15 @@ from rest_framework.views import APIView
 from activity_monitoring.methods.utils import (
     check_domain_allowed,
     extract_domain_from_url,
+    normalize_domain,
+    retention_cutoff,
 )
 from activity_monitoring.models import ActivityLog, ExtensionHeartbeat, WorkSession
 from activity_monitoring.serializers import (
+    MAX_CLOCK_SKEW,
     ActivityLogSerializer,
     BatchActivityLogSerializer,
+    BatchHeartbeatSerializer,
     HeartbeatSerializer,
     SessionStatusSerializer,
     SessionTokenResponseSerializer,
@@ -32,6 +38,88 @@ from employee.models import Employee
 
 logger = logging.getLogger(__name__)
 
+# Longest time range a single activity log may cover
+MAX_LOG_SECONDS = 28800  # 8 hours
+
+
+def get_active_work_session(token):
+    """
+    Returns the active, unexpired work session of the token or None
+    """
+    return (
+        WorkSession.objects.entire()
+        .select_related("employee_id__employee_work_info")
+        .filter(session_token=token, status="active", token_expiry__gt=timezone.now())
+        .first()
+    )
+
+
+def build_activity_log(work_session, log_data):
+    """
+    Validate one activity log payload and build the (unsaved) ActivityLog
+
+    Returns:
+        tuple: (ActivityLog or None, error message or None)
+    """
+    domain_name = log_data["domain_name"]
+    active_seconds = log_data["active_seconds"]
+    idle_seconds = log_data["idle_seconds"]
+    timestamp_start = log_data.get("timestamp_start")
+    timestamp_end = log_data.get("timestamp_end")
+
+    # Normalize domain name and check it server side against the allow list
+    normalized_domain = normalize_domain(domain_name)
+    is_allowed = check_domain_allowed(normalized_domain, work_session.employee_id)
+
+    # If timestamps not provided, calculate from current time
+    if not timestamp_start:
+        timestamp_start = timezone.now() - timedelta(seconds=active_seconds + idle_seconds)
+    if not timestamp_end:
+        timestamp_end = timezone.now()
+
+    # Validate timestamp order
+    if timestamp_start >= timestamp_end:
+        return None, f"Invalid timestamps for {domain_name}"
+
+    # Validate time range is reasonable (not negative, not too large - max 8 hours)
+    total_seconds = (timestamp_end - timestamp_start).total_seconds()
+    if total_seconds < 0 or total_seconds > MAX_LOG_SECONDS:
+        return None, f"Invalid time range for {domain_name}"
+
+    # Hours past the retention period are only kept as rollups, a late log
+    # would replace their totals
+    if timestamp_start < retention_cutoff():
+        return None, f"Activity for {domain_name} is past the retention period"
+
+    log = ActivityLog(
+        work_session=work_session,
+        domain_name=normalized_domain,
+        active_seconds=active_seconds,
+        idle_seconds=idle_seconds,
+        is_allowed=is_allowed,
+        timestamp_start=timestamp_start,
+        timestamp_end=timestamp_end,
+    )
+    return log, None
+
+
+def save_activity_logs(work_session, logs):
+    """
+    Insert the validated logs with one bulk insert and add their time to the
+    session totals. The hourly rollups are refreshed by the scheduler and on
+    checkout, not per request.
+    """
+    if not logs:
+        return
+    with transaction.atomic():
+        ActivityLog.objects.bulk_create(logs, batch_size=500)
+        WorkSession.objects.entire().filter(id=work_session.id).update(
+            total_active_seconds=F("total_active_seconds")
+            + sum(log.active_seconds for log in logs),
+            total_idle_seconds=F("total_idle_seconds")
+            + sum(log.idle_seconds for log in logs),
+        )
+
 
 class SessionTokenView(APIView):
     """
@@ -134,11 +222,8 @@ class HeartbeatView(APIView):
         heartbeat_status = serializer.validated_data["status"]
 
         # Validate token and get work session
-        try:
-            work_session = WorkSession.objects.get(
-                session_token=token, status="active", token_expiry__gt=timezone.now()
-            )
-        except WorkSession.DoesNotExist:
+        work_session = get_active_work_session(token)
+        if work_session is None:
             return Response(
                 {"error": "Invalid or expired token"}, status=status.HTTP_401_UNAUTHORIZED
             )
@@ -183,70 +268,26 @@ class ActivityLogView(APIView):
         domain_name = serializer.validated_data["domain_name"]
         active_seconds = serializer.validated_data["active_seconds"]
         idle_seconds = serializer.validated_data["idle_seconds"]
-        is_allowed_flag = serializer.validated_data["is_allowed"]
 
         # Validate token and get work session
-        try:
-            work_session = WorkSession.objects.get(
-                session_token=token, status="active", token_expiry__gt=timezone.now()
-            )
-        except WorkSession.DoesNotExist:
+        work_session = get_active_work_session(token)
+        if work_session is None:
             return Response(
                 {"error": "Invalid or expired token"}, status=status.HTTP_401_UNAUTHORIZED
             )
 
-        # Check if domain is actually allowed (server-side validation)
-        employee = work_session.employee_id
-        # Normalize domain name before checking
-        from activity_monitoring.methods.utils import normalize_domain
-        normalized_domain = normalize_domain(domain_name)
-        is_allowed = check_domain_allowed(normalized_domain, employee)
-
-        # Validate timestamps if provided
-        timestamp_start = serializer.validated_data.get("timestamp_start")
-        timestamp_end = serializer.validated_data.get("timestamp_end")
-        
-        # If timestamps not provided, calculate from current time
-        if not timestamp_start:
-            timestamp_start = timezone.now() - timedelta(seconds=active_seconds + idle_seconds)
-        if not timestamp_end:
-            timestamp_end = timezone.now()
-        
-        # Validate timestamp order
-        if timestamp_start >= timestamp_end:
-            return Response(
-                {"error": "timestamp_start must be before timestamp_end"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        # Validate time range is reasonable (not negative, not too large - max 8 hours)
-        total_seconds = (timestamp_end - timestamp_start).total_seconds()
-        if total_seconds < 0 or total_seconds > 28800:  # 8 hours max
-            return Response(
-                {"error": "Invalid time range"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # Create activity log (use normalized domain)
-        ActivityLog.objects.create(
-            work_session=work_session,
-            domain_name=normalized_domain,
-            active_seconds=active_seconds,
-            idle_seconds=idle_seconds,
-            is_allowed=is_allowed,
-            timestamp_start=timestamp_start,
-            timestamp_end=timestamp_end,
-        )
+        log, error = build_activity_log(work_session, serializer.validated_data)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Update work session totals (will be recalculated on checkout)
-        work_session.total_active_seconds += active_seconds
-        work_session.total_idle_seconds += idle_seconds
-        work_session.save()
+        # Create activity log and update work session totals
+        # (will be recalculated on checkout)
+        save_activity_logs(work_session, [log])
 
         logger.info(
             f"Activity log created for session {work_session.id}, "
             f"domain: {domain_name}, active: {active_seconds}s, idle: {idle_seconds}s, "
-            f"allowed: {is_allowed}"
+            f"allowed: {log.is_allowed}"
         )
 
         return Response({"status": "success"}, status=status.HTTP_200_OK)
@@ -273,74 +314,28 @@ class BatchActivityLogView(APIView):
         logs = serializer.validated_data["logs"]
 
         # Validate token and get work session
-        try:
-            work_session = WorkSession.objects.get(
-                session_token=token, status="active", token_expiry__gt=timezone.now()
-            )
-        except WorkSession.DoesNotExist:
+        work_session = get_active_work_session(token)
+        if work_session is None:
             return Response(
                 {"error": "Invalid or expired token"}, status=status.HTTP_401_UNAUTHORIZED
             )
 
-        employee = work_session.employee_id
-        created_count = 0
+        # Validate the whole payload first, then insert it in one go
+        activity_logs = []
         errors = []
-
-        # Process each log in batch
         for log_data in logs:
             try:
-                domain_name = log_data["domain_name"]
-                active_seconds = log_data["active_seconds"]
-                idle_seconds = log_data["idle_seconds"]
-                is_allowed_flag = log_data.get("is_allowed", True)
-                timestamp_start = log_data.get("timestamp_start")
-                timestamp_end = log_data.get("timestamp_end")
-
-                # Normalize domain name before checking
-                from activity_monitoring.methods.utils import normalize_domain
-                normalized_domain = normalize_domain(domain_name)
-                
-                # Check if domain is actually allowed (server-side validation)
-                is_allowed = check_domain_allowed(normalized_domain, employee)
-
-                # Validate timestamps
-                if not timestamp_start:
-                    timestamp_start = timezone.now() - timedelta(seconds=active_seconds + idle_seconds)
-                if not timestamp_end:
-                    timestamp_end = timezone.now()
-
-                # Validate timestamp order
-                if timestamp_start >= timestamp_end:
-                    errors.append(f"Invalid timestamps for {domain_name}")
-                    continue
-
-                # Validate time range
-                total_seconds = (timestamp_end - timestamp_start).total_seconds()
-                if total_seconds < 0 or total_seconds > 28800:  # 8 hours max
-                    errors.append(f"Invalid time range for {domain_name}")
-                    continue
-
-                # Create activity log (use normalized domain)
-                ActivityLog.objects.create(
-                    work_session=work_session,
-                    domain_name=normalized_domain,
-                    active_seconds=active_seconds,
-                    idle_seconds=idle_seconds,
-                    is_allowed=is_allowed,
-                    timestamp_start=timestamp_start,
-                    timestamp_end=timestamp_end,
-                )
-
-                # Update work session totals
-                work_session.total_active_seconds += active_seconds
-                work_session.total_idle_seconds += idle_seconds
-                created_count += 1
-
+                log, error = build_activity_log(work_session, log_data)
             except Exception as e:
-                errors.append(f"Error processing log for {log_data.get('domain_name', 'unknown')}: {str(e)}")
+                domain_name = log_data.get("domain_name", "unknown")
+                log, error = None, f"Error processing log for {domain_name}: {str(e)}"
+            if error:
+                errors.append(error)
+            else:
+                activity_logs.append(log)
 
-        # Save work session with updated totals
-        work_session.save()
+        save_activity_logs(work_session, activity_logs)
+        created_count = len(activity_logs)
 
         logger.info(
             f"Batch activity logs processed for session {work_session.id}, "
@@ -352,7 +347,7 @@ class BatchActivityLogView(APIView):
             "created": created_count,
             "total": len(logs),
         }
-        
+
         if errors:
             response_data["errors"] = errors
             logger.warning(f"Errors in batch processing: {errors}")
@@ -360,6 +355,70 @@ class BatchActivityLogView(APIView):
         return Response(response_data, status=status.HTTP_200_OK)
 
 
+class BatchHeartbeatView(APIView):
+    """
+    API endpoint to receive buffered heartbeat pings in batch
+    POST /api/activity-monitoring/heartbeats/batch/
+    """
+
+    authentication_classes = []  # No authentication required, token-based
+    permission_classes = []  # No permission required, token-based
+
+    def post(self, request):
+        """
+        Process buffered heartbeats from extension
+        """
+        serializer = BatchHeartbeatSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        token = serializer.validated_data["token"]
+        heartbeats = serializer.validated_data["heartbeats"]
+
+        # Validate token and get work session
+        work_session = get_active_work_session(token)
+        if work_session is None:
+            return Response(
+                {"error": "Invalid or expired token"}, status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        # Buffered heartbeats keep the time they were recorded at, only the
+        # ones without a timestamp get the receive time
+        received_at = timezone.now()
+        session_start = work_session.session_start - MAX_CLOCK_SKEW
+        extension_heartbeats = []
+        errors = []
+        for heartbeat in heartbeats:
+            timestamp = heartbeat.get("timestamp") or received_at
+            if timestamp < session_start:
+                errors.append(f"Heartbeat at {timestamp} precedes the work session")
+                continue
+            extension_heartbeats.append(
+                ExtensionHeartbeat(
+                    work_session=work_session,
+                    domain_name=heartbeat.get("domain_name", ""),
+                    status=heartbeat["status"],
+                    timestamp=timestamp,
+                )
+            )
+        ExtensionHeartbeat.objects.bulk_create(extension_heartbeats, batch_size=500)
+
+        logger.info(
+            f"{len(extension_heartbeats)}/{len(heartbeats)} heartbeats received "
+            f"for session {work_session.id}"
+        )
+
+        response_data = {
+            "status": "success",
+            "created": len(extension_heartbeats),
+            "total": len(heartbeats),
+        }
+        if errors:
+            response_data["errors"] = errors
+
+        return Response(response_data, status=status.HTTP_200_OK)
+
+
 class SessionStatusView(APIView):
     """
     API endpoint to get current session status
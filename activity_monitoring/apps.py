@@ -18,5 +18,6 @@ class ActivityMonitoringConfig(AppConfig):
         """
         Import signals when app is ready
         """
+        import activity_monitoring.scheduler  # noqa
         import activity_monitoring.signals  # noqa
 
@@ -4,12 +4,16 @@ Django management command to recalculate daily reports from activity logs
 Usage:
     python manage.py recalculate_daily_reports [--employee-id ID] [--date YYYY-MM-DD]
 
-This command recalculates daily reports from activity logs to fix any data inconsistencies.
+This command rolls up the remaining raw activity logs into hourly rollups and
+recalculates daily reports from those rollups to fix any data inconsistencies.
 """
 
 from django.core.management.base import BaseCommand
 
-from activity_monitoring.methods.utils import generate_daily_report
+from activity_monitoring.methods.utils import (
+    generate_daily_report,
+    rollup_activity_logs,
+)
 from activity_monitoring.models import DailyEmployeeReport, WorkSession
 
 
@@ -56,6 +60,12 @@ class Command(BaseCommand):
 
         total_sessions = work_sessions.count()
         self.stdout.write(f"Found {total_sessions} work sessions to recalculate...")
+
+        # Refresh the hourly rollups from the raw logs still within retention
+        rollups = rollup_activity_logs(
+            work_session_ids=work_sessions.values_list("id", flat=True)
+        )
+        self.stdout.write(f"Refreshed {rollups} hourly rollups")
         self.stdout.write("")
 
         recalculated = 0
@@ -4,11 +4,21 @@ utils.py
 Utility functions for activity monitoring
 """
 
-from collections import Counter
-from datetime import datetime
+from datetime import timedelta
 
-from activity_monitoring.models import ActivityLog, AllowedDomain, DailyEmployeeReport
-from base.models import Company
+from django.conf import settings
+from django.db.models import Count, F, Max, Min, Q, Sum
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from activity_monitoring.models import (
+    ActivityHourlyRollup,
+    ActivityLog,
+    AllowedDomain,
+    DailyEmployeeReport,
+    ExtensionHeartbeat,
+)
+from horilla.horilla_cache import HorillaCache
 
 
 def normalize_domain(domain_name):
@@ -32,6 +42,80 @@ def normalize_domain(domain_name):
     return domain
 
 
+class DomainTrie:
+    """
+    Suffix trie of allowed domains keyed on reversed domain labels, so a
+    lookup matches an allowed domain and any of its sub domains in
+    O(number of labels)
+    """
+
+    END = "$"
+
+    def __init__(self, domains=()):
+        self.root = {}
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain_name):
+        """
+        Add a domain to the trie
+        """
+        domain = normalize_domain(domain_name)
+        if not domain:
+            return
+        node = self.root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[self.END] = True
+
+    def match(self, domain_name):
+        """
+        Returns True when the domain or one of its parent domains was added
+        """
+        node = self.root
+        for label in reversed(domain_name.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if self.END in node:
+                return True
+        return False
+
+
+ALLOWED_DOMAIN_CACHE = HorillaCache("allowed_domains")
+
+
+def invalidate_allowed_domains():
+    """
+    Invalidate the compiled allow lists of every worker process
+    """
+    ALLOWED_DOMAIN_CACHE.bump()
+
+
+def compile_allowed_domains(company_id):
+    """
+    Compile the allow list (company specific and global domains) of the
+    company
+    """
+    domains = AllowedDomain.objects.entire().filter(is_active=True)
+    domains = domains.filter(
+        Q(company_id__isnull=True) | Q(company_id=company_id)
+        if company_id
+        else Q(company_id__isnull=True)
+    )
+    return DomainTrie(domains.values_list("domain_name", flat=True))
+
+
+def get_allowed_domain_trie(company_id):
+    """
+    Returns the compiled allow list of the company. Tries are compiled once
+    per process and allow list version.
+    """
+    return ALLOWED_DOMAIN_CACHE.local(
+        company_id, lambda: compile_allowed_domains(company_id)
+    )
+
+
 def check_domain_allowed(domain_name, employee):
     """
     Check if a domain is allowed for the employee's company
@@ -41,39 +125,130 @@ def check_domain_allowed(domain_name, employee):
         employee: Employee instance
 
     Returns:
-        bool: True if domain is allowed, False otherwise
+        bool: True if domain (or a parent domain) is allowed, False otherwise
     """
     # Normalize domain name for consistent comparison
     normalized_domain = normalize_domain(domain_name)
-    
+
     if not normalized_domain:
         return False
-    
+
     try:
-        company = employee.employee_work_info.company_id
+        company_id = employee.employee_work_info.company_id_id
     except Exception:
-        company = None
-
-    # Check company-specific allowed domains (normalized)
-    if company:
-        allowed_domains = AllowedDomain.objects.filter(
-            company_id=company, is_active=True
-        ).values_list("domain_name", flat=True)
-        # Normalize all allowed domains for comparison
-        normalized_allowed = [normalize_domain(d) for d in allowed_domains]
-        if normalized_domain in normalized_allowed:
-            return True
-
-    # Check global allowed domains (company_id is None, normalized)
-    global_allowed = AllowedDomain.objects.filter(
-        company_id=None, is_active=True
-    ).values_list("domain_name", flat=True)
-    # Normalize all allowed domains for comparison
-    normalized_global = [normalize_domain(d) for d in global_allowed]
-    if normalized_domain in normalized_global:
-        return True
-
-    return False
+        company_id = None
+
+    return get_allowed_domain_trie(company_id).match(normalized_domain)
+
+
+def rollup_activity_logs(work_session_ids=None, since=None, until=None):
+    """
+    Recompute the hourly rollups from the raw activity logs. The buckets are
+    derived from the raw rows with one grouped query and written with one
+    upsert, so the rollup is idempotent.
+
+    Args:
+        work_session_ids: restrict to these work sessions
+        since: only hours starting at or after this datetime
+        until: only hours before this datetime
+    """
+    logs = ActivityLog.objects.entire()
+    if work_session_ids is not None:
+        logs = logs.filter(work_session_id__in=work_session_ids)
+    if since is not None:
+        logs = logs.filter(timestamp_start__gte=since)
+    if until is not None:
+        logs = logs.filter(timestamp_start__lt=until)
+
+    buckets = (
+        logs.order_by()
+        .annotate(hour=TruncHour("timestamp_start"))
+        .values("work_session_id", "hour", "domain_name", "is_allowed")
+        .annotate(
+            active=Sum("active_seconds"),
+            idle=Sum("idle_seconds"),
+            count=Count("id"),
+        )
+    )
+    rollups = [
+        ActivityHourlyRollup(
+            work_session_id=bucket["work_session_id"],
+            hour=bucket["hour"],
+            domain_name=bucket["domain_name"],
+            is_allowed=bucket["is_allowed"],
+            active_seconds=bucket["active"] or 0,
+            idle_seconds=bucket["idle"] or 0,
+            log_count=bucket["count"],
+        )
+        for bucket in buckets
+    ]
+    ActivityHourlyRollup.objects.bulk_create(
+        rollups,
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["work_session", "hour", "domain_name", "is_allowed"],
+        update_fields=["active_seconds", "idle_seconds", "log_count"],
+    )
+    return len(rollups)
+
+
+def hour_start(timestamp):
+    """
+    Returns the start of the hour of the timestamp in the current time zone,
+    the same boundary TruncHour groups the rollups on
+    """
+    return timezone.localtime(timestamp).replace(minute=0, second=0, microsecond=0)
+
+
+def rollup_recent_activity(since):
+    """
+    Refresh the rollups of the hours touched by the logs ingested since the
+    given datetime. Ingestion only inserts raw logs, this job folds them into
+    the hourly rollups.
+    """
+    sessions = (
+        ActivityLog.objects.entire()
+        .filter(created_at__gte=since)
+        .order_by()
+        .values("work_session_id")
+        .annotate(first=Min("timestamp_start"), last=Max("timestamp_start"))
+    )
+    refreshed = 0
+    for session in sessions:
+        refreshed += rollup_activity_logs(
+            work_session_ids=[session["work_session_id"]],
+            since=hour_start(session["first"]),
+            until=hour_start(session["last"]) + timedelta(hours=1),
+        )
+    return refreshed
+
+
+def retention_cutoff(retention_days=None):
+    """
+    Returns the start of the oldest hour whose raw activity is still kept
+    (ACTIVITY_LOG_RETENTION_DAYS, default 30 days). Older hours only exist as
+    rollups, so raw logs for them are refused at ingestion: recomputing such
+    an hour from a late log would overwrite its rollup with partial totals.
+    """
+    if retention_days is None:
+        retention_days = getattr(settings, "ACTIVITY_LOG_RETENTION_DAYS", 30)
+    return hour_start(timezone.now() - timedelta(days=retention_days))
+
+
+def purge_raw_activity(retention_days=None):
+    """
+    Delete raw activity logs and heartbeats older than the retention period.
+    The hours being purged are rolled up first so reports stay complete.
+    """
+    cutoff = retention_cutoff(retention_days)
+    rollup_activity_logs(until=cutoff)
+    deleted_logs, _ = (
+        ActivityLog.objects.entire().filter(timestamp_start__lt=cutoff).delete()
+    )
+    deleted_heartbeats, _ = (
+        ExtensionHeartbeat.objects.entire().filter(timestamp__lt=cutoff).delete()
+    )
+    return deleted_logs, deleted_heartbeats
 
 
 def update_work_session_on_checkout(work_session):
@@ -83,14 +258,14 @@ def update_work_session_on_checkout(work_session):
     Args:
         work_session: WorkSession instance
     """
-    # Aggregate activity logs for this session
-    activity_logs = ActivityLog.objects.filter(work_session=work_session)
-
-    total_active = sum(log.active_seconds for log in activity_logs)
-    total_idle = sum(log.idle_seconds for log in activity_logs)
+    # Make sure the latest raw logs are rolled up, then aggregate the rollups
+    rollup_activity_logs(work_session_ids=[work_session.id])
+    totals = ActivityHourlyRollup.objects.filter(work_session=work_session).aggregate(
+        active=Sum("active_seconds"), idle=Sum("idle_seconds")
+    )
 
-    work_session.total_active_seconds = total_active
-    work_session.total_idle_seconds = total_idle
+    work_session.total_active_seconds = totals["active"] or 0
+    work_session.total_idle_seconds = totals["idle"] or 0
     work_session.save()
 
 
@@ -111,47 +286,39 @@ def generate_daily_report(work_session):
     if not created:
         daily_report.work_session = work_session
 
-    # Calculate statistics from activity logs
-    activity_logs = ActivityLog.objects.filter(work_session=work_session)
-
-    # Productive time: ONLY count active seconds from ALLOWED domains
-    productive_time = sum(
-        log.active_seconds 
-        for log in activity_logs 
-        if log.is_allowed is True
-    )
-    
-    # Idle time: sum of all idle seconds (regardless of domain)
-    idle_time = sum(log.idle_seconds for log in activity_logs)
-    
-    # Blocked active time: active time on blocked/not-allowed domains (non-productive)
-    blocked_active_time = sum(
-        log.active_seconds 
-        for log in activity_logs 
-        if log.is_allowed is False
+    # Calculate statistics from the hourly rollups
+    rollups = ActivityHourlyRollup.objects.filter(work_session=work_session)
+    totals = rollups.aggregate(
+        # Productive time: ONLY count active seconds from ALLOWED domains
+        productive=Sum("active_seconds", filter=Q(is_allowed=True)),
+        # Idle time: sum of all idle seconds (regardless of domain)
+        idle=Sum("idle_seconds"),
+        # Blocked active time: active time on blocked/not-allowed domains
+        blocked=Sum("active_seconds", filter=Q(is_allowed=False)),
+        # Count violations (logs on domains that are not allowed)
+        violations=Sum("log_count", filter=Q(is_allowed=False)),
     )
-    
+    productive_time = totals["productive"] or 0
+    idle_time = totals["idle"] or 0
+    blocked_active_time = totals["blocked"] or 0
+
     # Total work time = productive time + idle time + blocked active time
     # This ensures totals always add up correctly
     total_work_time = productive_time + idle_time + blocked_active_time
 
-    # Count violations (domains that are not allowed)
-    violation_count = ActivityLog.objects.filter(
-        work_session=work_session, is_allowed=False
-    ).count()
-
     # Get top domains
-    domain_counter = Counter()
-    for log in activity_logs:
-        domain_counter[log.domain_name] += log.active_seconds + log.idle_seconds
-
-    top_domains = dict(domain_counter.most_common(10))
+    top_domains = {
+        row["domain_name"]: row["total"]
+        for row in rollups.values("domain_name")
+        .annotate(total=Sum(F("active_seconds") + F("idle_seconds")))
+        .order_by("-total")[:10]
+    }
 
     # Update daily report
     daily_report.total_work_time = total_work_time
     daily_report.productive_time = productive_time
     daily_report.idle_time = idle_time
-    daily_report.violation_count = violation_count
+    daily_report.violation_count = totals["violations"] or 0
     daily_report.top_domains = top_domains
     daily_report.save()
 
@@ -0,0 +1,315 @@
+# Generated by Django 4.2.23 on 2026-10-19 00:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ActivityHourlyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("hour", models.DateTimeField(verbose_name="Hour")),
+                (
+                    "domain_name",
+                    models.CharField(max_length=255, verbose_name="Domain Name"),
+                ),
+                (
+                    "is_allowed",
+                    models.BooleanField(default=True, verbose_name="Is Allowed Domain"),
+                ),
+                (
+                    "active_seconds",
+                    models.IntegerField(default=0, verbose_name="Active Seconds"),
+                ),
+                (
+                    "idle_seconds",
+                    models.IntegerField(default=0, verbose_name="Idle Seconds"),
+                ),
+                ("log_count", models.IntegerField(default=0, verbose_name="Log Count")),
+            ],
+            options={
+                "verbose_name": "Activity Hourly Rollup",
+                "verbose_name_plural": "Activity Hourly Rollups",
+                "ordering": ["-hour"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ActivityLog",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, null=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                (
+                    "domain_name",
+                    models.CharField(max_length=255, verbose_name="Domain Name"),
+                ),
+                (
+                    "active_seconds",
+                    models.IntegerField(default=0, verbose_name="Active Seconds"),
+                ),
+                (
+                    "idle_seconds",
+                    models.IntegerField(default=0, verbose_name="Idle Seconds"),
+                ),
+                (
+                    "is_allowed",
+                    models.BooleanField(default=True, verbose_name="Is Allowed Domain"),
+                ),
+                (
+                    "timestamp_start",
+                    models.DateTimeField(verbose_name="Timestamp Start"),
+                ),
+                (
+                    "timestamp_end",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Timestamp End"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Activity Log",
+                "verbose_name_plural": "Activity Logs",
+                "ordering": ["-timestamp_start"],
+            },
+        ),
+        migrations.CreateModel(
+            name="AllowedDomain",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "domain_name",
+                    models.CharField(max_length=255, verbose_name="Domain Name"),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created At"),
+                ),
+            ],
+            options={
+                "verbose_name": "Allowed Domain",
+                "verbose_name_plural": "Allowed Domains",
+                "ordering": ["company_id", "domain_name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="DailyEmployeeReport",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, null=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                ("report_date", models.DateField(verbose_name="Report Date")),
+                (
+                    "total_work_time",
+                    models.IntegerField(
+                        default=0, verbose_name="Total Work Time (seconds)"
+                    ),
+                ),
+                (
+                    "productive_time",
+                    models.IntegerField(
+                        default=0, verbose_name="Productive Time (seconds)"
+                    ),
+                ),
+                (
+                    "idle_time",
+                    models.IntegerField(default=0, verbose_name="Idle Time (seconds)"),
+                ),
+                (
+                    "violation_count",
+                    models.IntegerField(
+                        default=0, verbose_name="Policy Violation Count"
+                    ),
+                ),
+                (
+                    "top_domains",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="Top Domains"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Daily Employee Report",
+                "verbose_name_plural": "Daily Employee Reports",
+                "ordering": ["-report_date", "employee_id"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ExtensionHeartbeat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, null=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                (
+                    "timestamp",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Timestamp"),
+                ),
+                (
+                    "domain_name",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="Domain Name",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("active", "Active"), ("idle", "Idle")],
+                        default="active",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Extension Heartbeat",
+                "verbose_name_plural": "Extension Heartbeats",
+                "ordering": ["-timestamp"],
+            },
+        ),
+        migrations.CreateModel(
+            name="WorkSession",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, null=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                ("attendance_date", models.DateField(verbose_name="Attendance Date")),
+                ("session_start", models.DateTimeField(verbose_name="Session Start")),
+                (
+                    "session_end",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Session End"
+                    ),
+                ),
+                (
+                    "total_active_seconds",
+                    models.IntegerField(default=0, verbose_name="Total Active Seconds"),
+                ),
+                (
+                    "total_idle_seconds",
+                    models.IntegerField(default=0, verbose_name="Total Idle Seconds"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("active", "Active"), ("completed", "Completed")],
+                        default="active",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "session_token",
+                    models.CharField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        unique=True,
+                        verbose_name="Session Token",
+                    ),
+                ),
+                (
+                    "token_expiry",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Token Expiry"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Work Session",
+                "verbose_name_plural": "Work Sessions",
+                "ordering": ["-attendance_date", "-session_start"],
+            },
+        ),
+    ]
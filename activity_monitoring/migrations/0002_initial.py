@@ -0,0 +1,43 @@
+# Generated by Django 4.2.23 on 2026-10-19 00:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("activity_monitoring", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("attendance", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worksession",
+            name="attendance_activity",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="work_session",
+                to="attendance.attendanceactivity",
+                verbose_name="Attendance Activity",
+            ),
+        ),
+        migrations.AddField(
+            model_name="worksession",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Created By",
+            ),
+        ),
+    ]
@@ -0,0 +1,287 @@
+# Generated by Django 4.2.23 on 2026-10-19 00:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("activity_monitoring", "0002_initial"),
+        ("base", "0001_initial"),
+        ("employee", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="worksession",
+            name="employee_id",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="work_sessions",
+                to="employee.employee",
+                verbose_name="Employee",
+            ),
+        ),
+        migrations.AddField(
+            model_name="worksession",
+            name="modified_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_modified_by",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Modified By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="extensionheartbeat",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Created By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="extensionheartbeat",
+            name="modified_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_modified_by",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Modified By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="extensionheartbeat",
+            name="work_session",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="heartbeats",
+                to="activity_monitoring.worksession",
+                verbose_name="Work Session",
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailyemployeereport",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Created By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailyemployeereport",
+            name="employee_id",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="daily_activity_reports",
+                to="employee.employee",
+                verbose_name="Employee",
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailyemployeereport",
+            name="modified_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_modified_by",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Modified By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="dailyemployeereport",
+            name="work_session",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="daily_report",
+                to="activity_monitoring.worksession",
+                verbose_name="Work Session",
+            ),
+        ),
+        migrations.AddField(
+            model_name="alloweddomain",
+            name="company_id",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="allowed_domains",
+                to="base.company",
+                verbose_name="Company",
+            ),
+        ),
+        migrations.AddField(
+            model_name="alloweddomain",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Created By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="alloweddomain",
+            name="modified_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_modified_by",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Modified By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="activitylog",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Created By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="activitylog",
+            name="modified_by",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_modified_by",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="Modified By",
+            ),
+        ),
+        migrations.AddField(
+            model_name="activitylog",
+            name="work_session",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="activity_logs",
+                to="activity_monitoring.worksession",
+                verbose_name="Work Session",
+            ),
+        ),
+        migrations.AddField(
+            model_name="activityhourlyrollup",
+            name="work_session",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="hourly_rollups",
+                to="activity_monitoring.worksession",
+                verbose_name="Work Session",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="worksession",
+            index=models.Index(
+                fields=["employee_id", "attendance_date"],
+                name="activity_mo_employe_95df16_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="worksession",
+            index=models.Index(fields=["status"], name="activity_mo_status_cd7612_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="worksession",
+            index=models.Index(
+                fields=["session_token"], name="activity_mo_session_04745a_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="extensionheartbeat",
+            index=models.Index(
+                fields=["work_session", "timestamp"],
+                name="activity_mo_work_se_c42bfa_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="extensionheartbeat",
+            index=models.Index(fields=["status"], name="activity_mo_status_4ce059_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="extensionheartbeat",
+            index=models.Index(
+                fields=["timestamp"], name="activity_mo_timesta_a17393_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dailyemployeereport",
+            index=models.Index(
+                fields=["employee_id", "report_date"],
+                name="activity_mo_employe_f0703a_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dailyemployeereport",
+            index=models.Index(
+                fields=["report_date"], name="activity_mo_report__973660_idx"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="dailyemployeereport",
+            unique_together={("employee_id", "report_date")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="alloweddomain",
+            unique_together={("company_id", "domain_name")},
+        ),
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["work_session", "domain_name"],
+                name="activity_mo_work_se_926c4f_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["is_allowed"], name="activity_mo_is_allo_2bdfd2_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activitylog",
+            index=models.Index(
+                fields=["timestamp_start"], name="activity_mo_timesta_81a387_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="activityhourlyrollup",
+            index=models.Index(fields=["hour"], name="activity_mo_hour_6e78ce_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="activityhourlyrollup",
+            unique_together={("work_session", "hour", "domain_name", "is_allowed")},
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.23 on 2026-10-19 00:37
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("activity_monitoring", "0003_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="extensionheartbeat",
+            name="timestamp",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, verbose_name="Timestamp"
+            ),
+        ),
+    ]
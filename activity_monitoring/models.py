@@ -7,6 +7,7 @@ This module is used to register models for activity_monitoring app
 from datetime import datetime
 
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from attendance.models import AttendanceActivity
@@ -169,6 +170,7 @@ class ActivityLog(HorillaModel):
         indexes = [
             models.Index(fields=["work_session", "domain_name"]),
             models.Index(fields=["is_allowed"]),
+            models.Index(fields=["timestamp_start"]),
         ]
         verbose_name = _("Activity Log")
         verbose_name_plural = _("Activity Logs")
@@ -194,7 +196,7 @@ class ExtensionHeartbeat(HorillaModel):
         verbose_name=_("Work Session"),
     )
     timestamp = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
         verbose_name=_("Timestamp"),
     )
     domain_name = models.CharField(
@@ -225,6 +227,7 @@ class ExtensionHeartbeat(HorillaModel):
         indexes = [
             models.Index(fields=["work_session", "timestamp"]),
             models.Index(fields=["status"]),
+            models.Index(fields=["timestamp"]),
         ]
         verbose_name = _("Extension Heartbeat")
         verbose_name_plural = _("Extension Heartbeats")
@@ -233,6 +236,60 @@ class ExtensionHeartbeat(HorillaModel):
         return f"{self.work_session.employee_id} - {self.timestamp} - {self.status}"
 
 
+class ActivityHourlyRollup(models.Model):
+    """
+    ActivityHourlyRollup model - Activity log totals per work session, hour and
+    domain. Reports read these rows so raw activity logs can be purged after
+    the retention period.
+    """
+
+    work_session = models.ForeignKey(
+        WorkSession,
+        on_delete=models.CASCADE,
+        related_name="hourly_rollups",
+        verbose_name=_("Work Session"),
+    )
+    hour = models.DateTimeField(
+        verbose_name=_("Hour"),
+    )
+    domain_name = models.CharField(
+        max_length=255,
+        verbose_name=_("Domain Name"),
+    )
+    is_allowed = models.BooleanField(
+        default=True,
+        verbose_name=_("Is Allowed Domain"),
+    )
+    active_seconds = models.IntegerField(
+        default=0,
+        verbose_name=_("Active Seconds"),
+    )
+    idle_seconds = models.IntegerField(
+        default=0,
+        verbose_name=_("Idle Seconds"),
+    )
+    log_count = models.IntegerField(
+        default=0,
+        verbose_name=_("Log Count"),
+    )
+
+    class Meta:
+        """
+        Meta class to add some additional options
+        """
+
+        ordering = ["-hour"]
+        unique_together = [["work_session", "hour", "domain_name", "is_allowed"]]
+        indexes = [
+            models.Index(fields=["hour"]),
+        ]
+        verbose_name = _("Activity Hourly Rollup")
+        verbose_name_plural = _("Activity Hourly Rollups")
+
+    def __str__(self):
+        return f"{self.work_session_id} - {self.hour} - {self.domain_name}"
+
+
 class AllowedDomain(HorillaModel):
     """
     AllowedDomain model - Maintains list of allowed domains per company
@@ -0,0 +1,87 @@
+"""
+scheduler.py
+
+Background jobs for activity monitoring
+"""
+
+import sys
+from datetime import timedelta
+
+import pytz
+from apscheduler.schedulers.background import BackgroundScheduler
+from django.conf import settings
+from django.db import OperationalError
+from django.utils import timezone
+
+from base.backends import logger
+
+# Interval of the rollup job, each run also covers the previous interval so a
+# late or missed run does not leave logs out
+ROLLUP_INTERVAL_MINUTES = 10
+
+
+def rollup_recent_activity_logs():
+    """
+    Fold the recently ingested raw activity logs into the hourly rollups
+    """
+    from activity_monitoring.methods.utils import rollup_recent_activity
+
+    try:
+        rollup_recent_activity(
+            timezone.now() - timedelta(minutes=2 * ROLLUP_INTERVAL_MINUTES)
+        )
+    except OperationalError:
+        # Database tables not ready yet (migrations not completed)
+        pass
+    except Exception as e:
+        logger.error(f"Error in rollup_recent_activity_logs scheduler: {e}")
+
+
+def purge_raw_activity_logs():
+    """
+    Roll up and delete raw activity logs and heartbeats past the retention
+    period (ACTIVITY_LOG_RETENTION_DAYS, default 30 days)
+    """
+    from activity_monitoring.methods.utils import purge_raw_activity
+
+    try:
+        deleted_logs, deleted_heartbeats = purge_raw_activity()
+        if deleted_logs or deleted_heartbeats:
+            logger.info(
+                f"Purged {deleted_logs} activity logs and "
+                f"{deleted_heartbeats} heartbeats past retention"
+            )
+    except OperationalError:
+        # Database tables not ready yet (migrations not completed)
+        pass
+    except Exception as e:
+        logger.error(f"Error in purge_raw_activity_logs scheduler: {e}")
+
+
+if not any(
+    cmd in sys.argv
+    for cmd in ["makemigrations", "migrate", "compilemessages", "flush", "shell"]
+):
+    """
+    Initializes and starts background tasks using APScheduler when the server is running.
+    """
+    scheduler = BackgroundScheduler(timezone=pytz.timezone(settings.TIME_ZONE))
+
+    scheduler.add_job(
+        rollup_recent_activity_logs,
+        "interval",
+        minutes=ROLLUP_INTERVAL_MINUTES,
+        id="rollup_recent_activity_logs",
+        replace_existing=True,
+    )
+    scheduler.add_job(
+        purge_raw_activity_logs,
+        "cron",
+        hour=1,
+        minute=15,
+        misfire_grace_time=3600 * 6,
+        id="purge_raw_activity_logs",
+        replace_existing=True,
+    )
+
+    scheduler.start()
@@ -4,10 +4,17 @@ serializers.py
 Django REST Framework serializers for activity monitoring API
 """
 
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
 
+from activity_monitoring.methods.utils import retention_cutoff
 from activity_monitoring.models import ActivityLog, ExtensionHeartbeat, WorkSession
 
+# Clock skew tolerated on the timestamps reported by the extension
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
 
 class WorkSessionSerializer(serializers.ModelSerializer):
     """
@@ -86,6 +93,40 @@ class BatchActivityLogSerializer(serializers.Serializer):
     logs = BatchActivityLogItemSerializer(many=True, required=True)
 
 
+class BatchHeartbeatItemSerializer(serializers.Serializer):
+    """
+    Serializer for individual heartbeat in batch
+    """
+
+    domain_name = serializers.CharField(required=False, allow_blank=True, default="")
+    status = serializers.ChoiceField(choices=["active", "idle"], required=True)
+    timestamp = serializers.DateTimeField(required=False, allow_null=True)
+
+    def validate_timestamp(self, value):
+        """
+        Buffered heartbeats may be late, but not from the future or older than
+        the raw activity retention period
+        """
+        if value is None:
+            return value
+        if value > timezone.now() + MAX_CLOCK_SKEW:
+            raise serializers.ValidationError("Timestamp is in the future.")
+        if value < retention_cutoff():
+            raise serializers.ValidationError(
+                "Timestamp is past the retention period."
+            )
+        return value
+
+
+class BatchHeartbeatSerializer(serializers.Serializer):
+    """
+    BatchHeartbeatSerializer for buffered heartbeat requests
+    """
+
+    token = serializers.CharField(required=True)
+    heartbeats = BatchHeartbeatItemSerializer(many=True, required=True)
+
+
 class SessionTokenResponseSerializer(serializers.Serializer):
     """
     SessionTokenResponseSerializer
@@ -7,11 +7,11 @@ This module handles signals for activity monitoring integration with attendance
 import secrets
 from datetime import timedelta
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
-from activity_monitoring.models import WorkSession
+from activity_monitoring.models import AllowedDomain, WorkSession
 from attendance.models import AttendanceActivity
 from django.utils.timezone import make_aware
 
@@ -80,3 +80,13 @@ def complete_work_session_on_checkout(sender, instance, **kwargs):
             # Generate daily report
             generate_daily_report(work_session)
 
+
+@receiver(post_save, sender=AllowedDomain)
+@receiver(post_delete, sender=AllowedDomain)
+def invalidate_allowed_domains_on_change(sender, instance, **kwargs):
+    """
+    Recompile the domain allow lists after an allowed domain changes
+    """
+    from activity_monitoring.methods.utils import invalidate_allowed_domains
+
+    invalidate_allowed_domains()
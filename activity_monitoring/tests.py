@@ -0,0 +1,149 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+from activity_monitoring.api.views import (
+    BatchActivityLogView,
+    BatchHeartbeatView,
+)
+from activity_monitoring.methods.utils import (
+    purge_raw_activity,
+    rollup_recent_activity,
+    update_work_session_on_checkout,
+)
+from activity_monitoring.models import (
+    ActivityHourlyRollup,
+    ActivityLog,
+    ExtensionHeartbeat,
+    WorkSession,
+)
+from employee.models import Employee
+
+
+class ActivityIngestionTests(TestCase):
+    """
+    Tests of the extension ingestion endpoints and the hourly rollups
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employee = Employee.objects.create(
+            employee_first_name="Tracked",
+            email="tracked@horilla.com",
+            phone="1234567890",
+            badge_id="TRK",
+        )
+
+    def setUp(self):
+        self.now = timezone.now()
+        self.work_session = WorkSession.objects.create(
+            employee_id=self.employee,
+            attendance_date=self.now.date(),
+            session_start=self.now - timedelta(days=40),
+            session_token="token",
+            token_expiry=self.now + timedelta(hours=1),
+        )
+
+    def post(self, view, data):
+        request = APIRequestFactory().post("/", data, format="json")
+        return view.as_view()(request)
+
+    def log(self, start, active_seconds=60):
+        return {
+            "domain_name": "example.com",
+            "active_seconds": active_seconds,
+            "idle_seconds": 0,
+            "timestamp_start": start.isoformat(),
+            "timestamp_end": (start + timedelta(seconds=active_seconds)).isoformat(),
+        }
+
+    def test_buffered_heartbeats_keep_their_timestamp(self):
+        recorded_at = self.now - timedelta(hours=2)
+        response = self.post(
+            BatchHeartbeatView,
+            {
+                "token": "token",
+                "heartbeats": [
+                    {"status": "idle", "timestamp": recorded_at.isoformat()},
+                    {"status": "active"},
+                ],
+            },
+        )
+        self.assertEqual(response.data["created"], 2)
+        timestamps = sorted(
+            ExtensionHeartbeat.objects.values_list("timestamp", flat=True)
+        )
+        self.assertEqual(timestamps[0], recorded_at)
+        self.assertGreaterEqual(timestamps[1], self.now)
+
+    def test_heartbeat_timestamps_are_validated(self):
+        for timestamp in [
+            self.now + timedelta(hours=1),
+            self.now - timedelta(days=60),
+        ]:
+            response = self.post(
+                BatchHeartbeatView,
+                {
+                    "token": "token",
+                    "heartbeats": [
+                        {"status": "active", "timestamp": timestamp.isoformat()}
+                    ],
+                },
+            )
+            self.assertEqual(response.status_code, 400)
+
+        self.work_session.session_start = self.now - timedelta(hours=1)
+        self.work_session.save()
+        response = self.post(
+            BatchHeartbeatView,
+            {
+                "token": "token",
+                "heartbeats": [
+                    {
+                        "status": "active",
+                        "timestamp": (self.now - timedelta(hours=3)).isoformat(),
+                    }
+                ],
+            },
+        )
+        self.assertEqual(response.data["created"], 0)
+        self.assertEqual(len(response.data["errors"]), 1)
+        self.assertFalse(ExtensionHeartbeat.objects.exists())
+
+    def test_late_log_does_not_overwrite_a_purged_hour(self):
+        old_hour = self.now - timedelta(days=35)
+        # ingested before the retention period moved past it
+        ActivityLog.objects.create(
+            work_session=self.work_session,
+            domain_name="example.com",
+            active_seconds=60,
+            idle_seconds=0,
+            timestamp_start=old_hour,
+            timestamp_end=old_hour + timedelta(seconds=60),
+        )
+        purge_raw_activity()
+        self.assertFalse(ActivityLog.objects.exists())
+        self.assertEqual(ActivityHourlyRollup.objects.get().active_seconds, 60)
+
+        response = self.post(
+            BatchActivityLogView,
+            {"token": "token", "logs": [self.log(old_hour, 10)]},
+        )
+        self.assertEqual(response.data["created"], 0)
+        update_work_session_on_checkout(self.work_session)
+        self.assertEqual(ActivityHourlyRollup.objects.get().active_seconds, 60)
+
+    def test_rollups_are_refreshed_outside_the_request(self):
+        start = self.now - timedelta(minutes=30)
+        response = self.post(
+            BatchActivityLogView,
+            {"token": "token", "logs": [self.log(start), self.log(start, 30)]},
+        )
+        self.assertEqual(response.data["created"], 2)
+        self.assertFalse(ActivityHourlyRollup.objects.exists())
+
+        rollup_recent_activity(self.now - timedelta(minutes=20))
+        totals = ActivityHourlyRollup.objects.values_list("active_seconds", flat=True)
+        self.assertEqual(sum(totals), 90)
@@ -3,3 +3,59 @@ This module contains test cases for the assets application.
 """
 
 from django.test import TestCase
+
+from asset.models import Asset
+from asset.views import AssetImportError, import_asset_rows
+
+
+def asset_row(**fields):
+    return {
+        "asset_name": "Laptop",
+        "asset_description": "",
+        "asset_tracking_id": "LAP-001",
+        "asset_purchase_date": "2024-01-15",
+        "asset_purchase_cost": "1200.50",
+        "asset_category_id": "Computers",
+        "asset_status": "Available",
+        "asset_lot_number_id": "LOT-1",
+        **fields,
+    }
+
+
+class AssetImportTests(TestCase):
+    """
+    Tests of the validation of the asset imports
+    """
+
+    def import_errors(self, rows):
+        with self.assertRaises(AssetImportError) as context:
+            import_asset_rows(rows)
+        return context.exception.errors
+
+    def test_valid_rows_are_imported(self):
+        self.assertEqual(
+            import_asset_rows([asset_row(), asset_row(asset_tracking_id="LAP-002")]),
+            2,
+        )
+        self.assertEqual(Asset.objects.count(), 2)
+
+    def test_oversized_values_are_reported_by_row(self):
+        errors = self.import_errors(
+            [
+                asset_row(),
+                asset_row(asset_tracking_id="T" * 31),
+                asset_row(asset_tracking_id="LAP-003", asset_lot_number_id="L" * 31),
+                asset_row(asset_tracking_id="LAP-004", asset_purchase_cost="123456789"),
+            ]
+        )
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(errors[0].startswith("Row 3:"))
+        self.assertIn("asset_tracking_id", errors[0])
+        self.assertTrue(errors[1].startswith("Row 4:"))
+        self.assertIn("asset_lot_number_id", errors[1])
+        self.assertTrue(errors[2].startswith("Row 5:"))
+        self.assertFalse(Asset.objects.exists())
+
+    def test_largest_cost_is_accepted(self):
+        import_asset_rows([asset_row(asset_purchase_cost="99999999.99")])
+        self.assertEqual(str(Asset.objects.get().asset_purchase_cost), "99999999.99")
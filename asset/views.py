@@ -7,6 +7,7 @@ import csv
 import json
 import os
 from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
 from urllib.parse import parse_qs
 
 import pandas as pd
@@ -14,6 +15,7 @@ from django.contrib import messages
 from django.core.files.base import ContentFile
 from django.core.files.storage import FileSystemStorage
 from django.core.paginator import Paginator
+from django.db import transaction
 from django.db.models import ProtectedError
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
@@ -1147,81 +1149,258 @@ def convert_nan(val):
 
 fs = FileSystemStorage(location="csv_tmp/")
 
+# import column -> Asset field, in the column order of the csv template
+ASSET_IMPORT_COLUMNS = {
+    "Asset name": "asset_name",
+    "Description": "asset_description",
+    "Tracking id": "asset_tracking_id",
+    "Purchase date": "asset_purchase_date",
+    "Purchase cost": "asset_purchase_cost",
+    "Category": "asset_category_id",
+    "Status": "asset_status",
+    "Batch number": "asset_lot_number_id",
+}
+# Asset field -> model field bounding the length of its imported value
+ASSET_IMPORT_LENGTHS = {
+    "asset_name": Asset._meta.get_field("asset_name"),
+    "asset_description": Asset._meta.get_field("asset_description"),
+    "asset_tracking_id": Asset._meta.get_field("asset_tracking_id"),
+    "asset_category_id": AssetCategory._meta.get_field("asset_category_name"),
+    "asset_lot_number_id": AssetLot._meta.get_field("lot_number"),
+}
+ASSET_IMPORT_BATCH_SIZE = 1000
+# row errors shown after a failed import
+ASSET_IMPORT_ERROR_LIMIT = 20
+
+
+class AssetImportError(Exception):
+    """
+    Raised with the row numbered errors of an asset import
+    """
+
+    def __init__(self, errors):
+        super().__init__("\n".join(errors))
+        self.errors = errors
 
-def csv_asset_import(file):
-    file_content = ContentFile(file.read())
-    file_name = fs.save("_tmp.csv", file_content)
-    tmp_file = fs.path(file_name)
 
-    with open(tmp_file, errors="ignore") as csv_file:
-        reader = csv.reader(csv_file)
-        next(reader)  # Skip header row
-
-        asset_list = []
-        for row in reader:
-            (
-                asset_name,
-                asset_description,
-                asset_tracking_id,
-                asset_purchase_date,
-                asset_purchase_cost,
-                asset_category_name,
-                asset_status,
-                asset_lot_number,
-            ) = row
-
-            # Helper function to get or create categories and lots
-            asset_category, _ = AssetCategory.objects.get_or_create(
-                asset_category_name=asset_category_name
+def parse_import_date(value):
+    """
+    Returns the date of an imported cell, None when it is not a date
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value).strip(), "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def validate_asset_rows(rows):
+    """
+    Validate the imported rows in memory
+
+    Args:
+        rows: list of {Asset field: cell value} dictionaries, the first one
+        being spreadsheet row 2
+
+    Returns:
+        tuple: (cleaned rows, row numbered errors)
+    """
+    statuses = {status for status, _label in Asset.ASSET_STATUS}
+    tracking_ids = {}
+    cleaned = []
+    errors = []
+    for row_number, row in enumerate(rows, start=2):
+        row = {
+            field: (str(value).strip() if isinstance(value, str) else value)
+            for field, value in row.items()
+        }
+        row_errors = []
+        for field in ["asset_name", "asset_tracking_id", "asset_category_id"]:
+            if row.get(field) in (None, ""):
+                row_errors.append(_("%(field)s is required") % {"field": field})
+        for field, model_field in ASSET_IMPORT_LENGTHS.items():
+            if len(str(row.get(field) or "")) > model_field.max_length:
+                row_errors.append(
+                    _("%(field)s must have at most %(length)s characters")
+                    % {"field": field, "length": model_field.max_length}
+                )
+
+        tracking_id = str(row.get("asset_tracking_id") or "")
+        if tracking_id in tracking_ids:
+            row_errors.append(
+                _("Tracking id %(id)s is repeated from row %(row)s")
+                % {"id": tracking_id, "row": tracking_ids[tracking_id]}
             )
-            asset_lot, _ = AssetLot.objects.get_or_create(lot_number=asset_lot_number)
+        elif tracking_id:
+            tracking_ids[tracking_id] = row_number
 
-            asset_list.append(
-                Asset(
-                    asset_name=asset_name,
-                    asset_description=asset_description,
-                    asset_tracking_id=asset_tracking_id,
-                    asset_purchase_date=asset_purchase_date,
-                    asset_purchase_cost=asset_purchase_cost,
-                    asset_status=asset_status,
-                    asset_category_id=asset_category,
-                    asset_lot_number_id=asset_lot,
+        purchase_date = parse_import_date(row.get("asset_purchase_date"))
+        if purchase_date is None:
+            row_errors.append(_("Purchase date must be in YYYY-MM-DD format"))
+        try:
+            purchase_cost = Decimal(str(row.get("asset_purchase_cost"))).quantize(
+                Decimal("0.01")
+            )
+        except (InvalidOperation, ValueError):
+            purchase_cost = None
+            row_errors.append(_("Purchase cost must be a number"))
+        else:
+            cost_field = Asset._meta.get_field("asset_purchase_cost")
+            integer_digits = cost_field.max_digits - cost_field.decimal_places
+            if (
+                not purchase_cost.is_finite()
+                or abs(purchase_cost) >= 10**integer_digits
+            ):
+                row_errors.append(
+                    _("Purchase cost must have at most %(digits)s digits")
+                    % {"digits": integer_digits}
                 )
+
+        status = row.get("asset_status") or "Available"
+        if status not in statuses:
+            row_errors.append(_("Invalid status %(status)s") % {"status": status})
+
+        if row_errors:
+            errors.extend(
+                f"{_('Row')} {row_number}: {message}" for message in row_errors
             )
+            continue
+        cleaned.append(
+            {
+                "asset_name": str(row["asset_name"]),
+                "asset_description": row.get("asset_description") or None,
+                "asset_tracking_id": tracking_id,
+                "asset_purchase_date": purchase_date,
+                "asset_purchase_cost": purchase_cost,
+                "asset_status": status,
+                "asset_category_id": str(row["asset_category_id"]),
+                "asset_lot_number_id": (
+                    str(row["asset_lot_number_id"])
+                    if row.get("asset_lot_number_id") not in (None, "")
+                    else None
+                ),
+            }
+        )
 
-    # Bulk create assets from CSV
-    Asset.objects.bulk_create(asset_list)
+    existing = set(
+        Asset.objects.entire()
+        .filter(asset_tracking_id__in=tracking_ids.keys())
+        .values_list("asset_tracking_id", flat=True)
+    )
+    for tracking_id in sorted(existing):
+        errors.append(
+            f"{_('Row')} {tracking_ids[tracking_id]}: "
+            + _("An asset with the tracking id %(id)s already exists")
+            % {"id": tracking_id}
+        )
+    return cleaned, errors
+
+
+def resolve_by_name(model, field, names):
+    """
+    Returns {name: instance} for the names, creating the missing ones with a
+    single bulk insert
+    """
+    # company filtering would hide existing names and break the lookup
+    queryset = getattr(model.objects, "entire", model.objects.all)()
+    instances = {
+        getattr(instance, field): instance
+        for instance in queryset.filter(**{f"{field}__in": names})
+    }
+    missing = [name for name in names if name not in instances]
+    if missing:
+        model.objects.bulk_create(
+            [model(**{field: name}) for name in missing], ignore_conflicts=True
+        )
+        instances.update(
+            {
+                getattr(instance, field): instance
+                for instance in queryset.filter(**{f"{field}__in": missing})
+            }
+        )
+    return instances
 
-    # Delete the temporary file
-    if os.path.exists(tmp_file):
-        os.remove(tmp_file)
 
+def import_asset_rows(rows, user=None):
+    """
+    Validate the rows and insert the assets in batches inside a transaction.
+    Nothing is imported when any row is invalid.
 
-def spreadsheetml_asset_import(dataframe):
-    for index, row in dataframe.iterrows():
-        asset_name = convert_nan(row["Asset name"])
-        asset_description = convert_nan(row["Description"])
-        asset_tracking_id = convert_nan(row["Tracking id"])
-        purchase_date = convert_nan(row["Purchase date"])
-        purchase_cost = convert_nan(row["Purchase cost"])
-        category_name = convert_nan(row["Category"])
-        lot_number = convert_nan(row["Batch number"])
-        status = convert_nan(row["Status"])
+    Raises:
+        AssetImportError: with the row numbered errors
+    """
+    cleaned, errors = validate_asset_rows(rows)
+    if errors:
+        raise AssetImportError(errors)
 
-        asset_category, create = AssetCategory.objects.get_or_create(
-            asset_category_name=category_name
+    with transaction.atomic():
+        categories = resolve_by_name(
+            AssetCategory,
+            "asset_category_name",
+            {row["asset_category_id"] for row in cleaned},
+        )
+        lots = resolve_by_name(
+            AssetLot,
+            "lot_number",
+            {row["asset_lot_number_id"] for row in cleaned} - {None},
         )
-        asset_lot_number, create = AssetLot.objects.get_or_create(lot_number=lot_number)
-        Asset.objects.create(
-            asset_name=asset_name,
-            asset_description=asset_description,
-            asset_tracking_id=asset_tracking_id,
-            asset_purchase_date=purchase_date,
-            asset_purchase_cost=purchase_cost,
-            asset_category_id=asset_category,
-            asset_status=status,
-            asset_lot_number_id=asset_lot_number,
+        user = user if user is not None and user.is_authenticated else None
+        Asset.objects.bulk_create(
+            [
+                Asset(
+                    **{
+                        **row,
+                        "asset_category_id": categories[row["asset_category_id"]],
+                        "asset_lot_number_id": lots.get(row["asset_lot_number_id"]),
+                    },
+                    created_by=user,
+                    modified_by=user,
+                )
+                for row in cleaned
+            ],
+            batch_size=ASSET_IMPORT_BATCH_SIZE,
         )
+    return len(cleaned)
+
+
+def csv_asset_import(file, user=None):
+    """
+    Import the assets of the uploaded csv file
+    """
+    file_content = ContentFile(file.read())
+    file_name = fs.save("_tmp.csv", file_content)
+    tmp_file = fs.path(file_name)
+
+    try:
+        with open(tmp_file, errors="ignore") as csv_file:
+            reader = csv.reader(csv_file)
+            next(reader)  # Skip header row
+            fields = list(ASSET_IMPORT_COLUMNS.values())
+            rows = [dict(zip(fields, row)) for row in reader]
+        return import_asset_rows(rows, user)
+    finally:
+        # Delete the temporary file
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+
+
+def spreadsheetml_asset_import(dataframe, user=None):
+    """
+    Import the assets of the uploaded workbook
+    """
+    missing = [column for column in ASSET_IMPORT_COLUMNS if column not in dataframe]
+    if missing:
+        raise KeyError(", ".join(missing))
+    dataframe = dataframe[list(ASSET_IMPORT_COLUMNS)].astype(object)
+    dataframe = dataframe.where(pd.notna(dataframe), None)
+    rows = [
+        dict(zip(ASSET_IMPORT_COLUMNS.values(), values))
+        for values in dataframe.itertuples(index=False, name=None)
+    ]
+    return import_asset_rows(rows, user)
 
 
 @login_required
@@ -1248,8 +1427,11 @@ def asset_import(request):
             file = request.FILES.get("asset_import")
             if file is not None and file.content_type == "text/csv":
                 try:
-                    csv_asset_import(file)
+                    csv_asset_import(file, request.user)
                     messages.success(request, _("Successfully imported Assets"))
+                except AssetImportError as exception:
+                    for error in exception.errors[:ASSET_IMPORT_ERROR_LIMIT]:
+                        messages.error(request, error)
                 except Exception as exception:
                     messages.error(request, f"{exception}")
             elif (
@@ -1259,8 +1441,11 @@ def asset_import(request):
             ):
                 try:
                     dataframe = pd.read_excel(file)
-                    spreadsheetml_asset_import(dataframe)
+                    spreadsheetml_asset_import(dataframe, request.user)
                     messages.success(request, _("Successfully imported Assets"))
+                except AssetImportError as exception:
+                    for error in exception.errors[:ASSET_IMPORT_ERROR_LIMIT]:
+                        messages.error(request, error)
                 except KeyError as exception:
                     messages.error(request, f"{exception}")
             else:
@@ -9,6 +9,7 @@ from django.contrib import admin
 from .models import (
     Attendance,
     AttendanceActivity,
+    AttendanceDailyStatistics,
     AttendanceLateComeEarlyOut,
     AttendanceOverTime,
     AttendanceRequestComment,
@@ -26,3 +27,4 @@ admin.site.register(AttendanceValidationCondition)
 admin.site.register(GraceTime)
 admin.site.register(AttendanceRequestComment)
 admin.site.register(WorkRecords)
+admin.site.register(AttendanceDailyStatistics)
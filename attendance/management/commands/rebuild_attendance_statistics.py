@@ -0,0 +1,66 @@
+"""
+Django management command to rebuild the attendance dashboard statistics
+
+Usage:
+    python manage.py rebuild_attendance_statistics [--start-date YYYY-MM-DD] [--end-date YYYY-MM-DD]
+
+This command recomputes the `AttendanceDailyStatistics` rows of every date in
+the range. Without a start date the range begins at the earliest attendance.
+"""
+
+from datetime import date, datetime
+
+from django.core.management.base import BaseCommand
+
+from attendance.methods.daily_statistics import date_range, refresh_daily_statistics
+from attendance.models import Attendance
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized daily attendance statistics"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--start-date",
+            type=str,
+            help="First date to rebuild (YYYY-MM-DD format)",
+        )
+        parser.add_argument(
+            "--end-date",
+            type=str,
+            help="Last date to rebuild (YYYY-MM-DD format), defaults to today",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            start_date = (
+                datetime.strptime(options["start_date"], "%Y-%m-%d").date()
+                if options.get("start_date")
+                else None
+            )
+            end_date = (
+                datetime.strptime(options["end_date"], "%Y-%m-%d").date()
+                if options.get("end_date")
+                else date.today()
+            )
+        except ValueError:
+            self.stdout.write(self.style.ERROR("Invalid date format. Use YYYY-MM-DD"))
+            return
+
+        if start_date is None:
+            first = (
+                Attendance.objects.entire()
+                .order_by("attendance_date")
+                .values_list("attendance_date", flat=True)
+                .first()
+            )
+            start_date = first or end_date
+
+        dates = list(date_range(start_date, end_date))
+        self.stdout.write(
+            f"Rebuilding statistics for {len(dates)} days ({start_date} - {end_date})..."
+        )
+        refresh_daily_statistics(dates)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuild complete: {len(dates)} days refreshed")
+        )
@@ -0,0 +1,395 @@
+"""
+daily_statistics.py
+
+This module is used to maintain the materialized attendance dashboard counters
+stored in `AttendanceDailyStatistics`
+"""
+
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+
+from attendance.methods.utils import strtime_seconds
+from employee.models import Employee, EmployeeWorkInformation
+from horilla.methods import get_horilla_model_class
+
+logger = logging.getLogger(__name__)
+
+COMPANY_FIELD = "employee_work_info__company_id"
+DEPARTMENT_FIELD = "employee_work_info__department_id"
+
+COUNTER_FIELDS = [
+    "expected_count",
+    "present_count",
+    "late_come_count",
+    "early_out_count",
+    "on_leave_count",
+    "overtime_count",
+    "approved_overtime_second",
+]
+
+
+def employee_id_bucket(employee_id):
+    """
+    Returns the (company id, department id) statistics bucket of the employee
+    with the given id
+    """
+    work_info = (
+        EmployeeWorkInformation.objects.entire()
+        .filter(employee_id=employee_id)
+        .values_list("company_id", "department_id")
+        .first()
+    )
+    return tuple(work_info) if work_info else (None, None)
+
+
+def minimum_overtime_second():
+    """
+    Returns the minimum overtime (in seconds) to approve, overtime below it is
+    not counted as approved overtime
+    """
+    AttendanceValidationCondition = get_horilla_model_class(
+        app_label="attendance", model="attendancevalidationcondition"
+    )
+    condition = AttendanceValidationCondition.objects.entire().first()
+    if condition is None or condition.minimum_overtime_to_approve is None:
+        return 0
+    return strtime_seconds(condition.minimum_overtime_to_approve)
+
+
+def _grouped(queryset, prefix, **annotations):
+    """
+    Group the queryset by the company/department of the employee reached
+    through `prefix` and return {(company_id, department_id): values}
+    """
+    company = f"{prefix}{COMPANY_FIELD}"
+    department = f"{prefix}{DEPARTMENT_FIELD}"
+    rows = (
+        queryset.order_by()
+        .values(company, department)
+        .annotate(**annotations)
+        .values(company, department, *annotations.keys())
+    )
+    return {(row[company], row[department]): row for row in rows}
+
+
+def _bucket_filter(buckets, prefix):
+    """
+    Build a Q object restricting a queryset to the given buckets
+    """
+    query = Q()
+    for company_id, department_id in buckets:
+        query |= Q(
+            **{
+                f"{prefix}{COMPANY_FIELD}": company_id,
+                f"{prefix}{DEPARTMENT_FIELD}": department_id,
+            }
+        )
+    return query
+
+
+def compute_daily_statistics(day, buckets=None):
+    """
+    Compute the dashboard counters of a single day with one grouped query per
+    counter. When `buckets` is given only those (company, department) pairs
+    are computed.
+
+    Returns:
+        dict: {(company_id, department_id): {counter: value}}
+    """
+    Attendance = get_horilla_model_class(app_label="attendance", model="attendance")
+    AttendanceLateComeEarlyOut = get_horilla_model_class(
+        app_label="attendance", model="attendancelatecomeearlyout"
+    )
+
+    def restrict(queryset, prefix):
+        if buckets is None:
+            return queryset
+        return queryset.filter(_bucket_filter(buckets, prefix))
+
+    employees = restrict(Employee.objects.entire().filter(is_active=True), "")
+    head_count = _grouped(employees, "", head_count=Count("id"))
+
+    on_leave = {}
+    if apps.is_installed("leave"):
+        LeaveRequest = get_horilla_model_class(app_label="leave", model="leaverequest")
+        leaves = restrict(
+            LeaveRequest.objects.entire().filter(
+                status="approved",
+                start_date__lte=day,
+                end_date__gte=day,
+                employee_id__is_active=True,
+            ),
+            "employee_id__",
+        )
+        on_leave = _grouped(
+            leaves,
+            "employee_id__",
+            on_leave_count=Count("employee_id", distinct=True),
+        )
+
+    attendances = restrict(
+        Attendance.objects.entire().filter(attendance_date=day),
+        "employee_id__",
+    )
+    approved_overtime = Q(
+        overtime_second__gte=minimum_overtime_second(),
+        attendance_validated=True,
+        attendance_overtime_approve=True,
+        employee_id__is_active=True,
+    )
+    present = _grouped(
+        attendances,
+        "employee_id__",
+        present_count=Count("id"),
+        overtime_count=Count("id", filter=approved_overtime),
+        approved_overtime_second=Sum(
+            "approved_overtime_second", filter=approved_overtime
+        ),
+    )
+
+    late_early = restrict(
+        AttendanceLateComeEarlyOut.objects.entire().filter(
+            attendance_id__attendance_date=day
+        ),
+        "attendance_id__employee_id__",
+    )
+    late_early = _grouped(
+        late_early,
+        "attendance_id__employee_id__",
+        late_come_count=Count("id", filter=Q(type="late_come")),
+        early_out_count=Count("id", filter=Q(type="early_out")),
+    )
+
+    keys = set(head_count) | set(on_leave) | set(present) | set(late_early)
+    if buckets is not None:
+        keys |= set(buckets)
+
+    statistics = {}
+    for key in keys:
+        on_leave_count = on_leave.get(key, {}).get("on_leave_count", 0)
+        values = {
+            "expected_count": max(
+                head_count.get(key, {}).get("head_count", 0) - on_leave_count, 0
+            ),
+            "on_leave_count": on_leave_count,
+            "present_count": present.get(key, {}).get("present_count", 0),
+            "overtime_count": present.get(key, {}).get("overtime_count", 0),
+            "approved_overtime_second": present.get(key, {}).get(
+                "approved_overtime_second"
+            )
+            or 0,
+            "late_come_count": late_early.get(key, {}).get("late_come_count", 0),
+            "early_out_count": late_early.get(key, {}).get("early_out_count", 0),
+        }
+        statistics[key] = values
+    return statistics
+
+
+def refresh_daily_statistics(dates, buckets=None):
+    """
+    Recompute and store the statistics rows of the given dates. Only the given
+    (company, department) buckets are touched when `buckets` is passed,
+    otherwise every row of those dates is replaced and the dates are marked
+    complete.
+    """
+    AttendanceDailyStatistics = get_horilla_model_class(
+        app_label="attendance", model="attendancedailystatistics"
+    )
+    AttendanceStatisticsDate = get_horilla_model_class(
+        app_label="attendance", model="attendancestatisticsdate"
+    )
+    for day in sorted(set(dates)):
+        statistics = compute_daily_statistics(day, buckets)
+        with transaction.atomic():
+            rows = AttendanceDailyStatistics.objects.entire().filter(date=day)
+            if buckets is not None:
+                query = Q()
+                for company_id, department_id in buckets:
+                    query |= Q(company_id=company_id, department_id=department_id)
+                rows = rows.filter(query)
+            existing = {(row.company_id_id, row.department_id_id): row for row in rows}
+
+            to_create = []
+            to_update = []
+            for key, values in statistics.items():
+                row = existing.pop(key, None)
+                if row is None:
+                    to_create.append(
+                        AttendanceDailyStatistics(
+                            date=day,
+                            company_id_id=key[0],
+                            department_id_id=key[1],
+                            **values,
+                        )
+                    )
+                    continue
+                if any(getattr(row, field) != values[field] for field in values):
+                    for field, value in values.items():
+                        setattr(row, field, value)
+                    to_update.append(row)
+
+            if existing:
+                AttendanceDailyStatistics.objects.entire().filter(
+                    id__in=[row.id for row in existing.values()]
+                ).delete()
+            if to_create:
+                AttendanceDailyStatistics.objects.bulk_create(to_create)
+            if to_update:
+                AttendanceDailyStatistics.objects.bulk_update(
+                    to_update, COUNTER_FIELDS, batch_size=500
+                )
+            if buckets is None:
+                AttendanceStatisticsDate.objects.get_or_create(date=day)
+
+
+def complete_dates(dates):
+    """
+    Returns the dates among `dates` whose statistics are materialized for
+    every bucket
+    """
+    AttendanceStatisticsDate = get_horilla_model_class(
+        app_label="attendance", model="attendancestatisticsdate"
+    )
+    return set(
+        AttendanceStatisticsDate.objects.filter(date__in=list(dates)).values_list(
+            "date", flat=True
+        )
+    )
+
+
+def invalidate_daily_statistics():
+    """
+    Forget which dates are complete, so that their statistics are computed
+    again on the next dashboard load (e.g. the overtime threshold changed)
+    """
+    AttendanceStatisticsDate = get_horilla_model_class(
+        app_label="attendance", model="attendancestatisticsdate"
+    )
+    AttendanceStatisticsDate.objects.all().delete()
+
+
+def refresh_statistics_dates(dates):
+    """
+    Recompute the complete dates among `dates` after a bulk write that sent
+    no signals. Incomplete dates are materialized on the next dashboard load.
+    """
+    dates = [day for day in set(dates) if day is not None and day <= date.today()]
+    try:
+        refresh_daily_statistics(complete_dates(dates))
+    except Exception as e:
+        logger.error(f"Failed to refresh attendance statistics: {e}")
+
+
+def refresh_employee_statistics(employee, dates, previous=()):
+    """
+    Refresh the statistics rows of the employee's bucket for the given dates.
+    Used by the attendance, leave and late come/early out signals.
+
+    Args:
+        employee: the employee of the record, may be None
+        dates: the dates of the record
+        previous: (bucket, date) pairs the record counted in before the
+            change, refreshed as well when the record moved
+    """
+    targets = defaultdict(set)
+    if employee is not None:
+        # read from the database, the work information cached on the
+        # instance may predate a company or department change
+        bucket = employee_id_bucket(employee.pk)
+        for day in dates:
+            targets[day].add(bucket)
+    for bucket, day in previous:
+        targets[day].add(bucket)
+    targets = {
+        day: buckets
+        for day, buckets in targets.items()
+        if day is not None and day <= date.today()
+    }
+    if not targets:
+        return
+    try:
+        complete = complete_dates(targets)
+        for day, buckets in sorted(targets.items()):
+            # an incomplete date is materialized entirely, refreshing only the
+            # bucket would let it look complete with the other buckets missing
+            refresh_daily_statistics(
+                [day], buckets=list(buckets) if day in complete else None
+            )
+    except Exception as e:
+        logger.error(f"Failed to refresh attendance statistics: {e}")
+
+
+def date_range(start_date, end_date):
+    """
+    Yields every date from start_date to end_date, both inclusive
+    """
+    for offset in range((end_date - start_date).days + 1):
+        yield start_date + timedelta(days=offset)
+
+
+def ensure_daily_statistics(start_date, end_date):
+    """
+    Materialize the statistics of the dates in the range that are not complete
+    yet (e.g. the first dashboard load of the day). Future dates are skipped.
+    """
+    AttendanceStatisticsDate = get_horilla_model_class(
+        app_label="attendance", model="attendancestatisticsdate"
+    )
+    end_date = min(end_date, date.today())
+    if start_date > end_date:
+        return
+    materialized = set(
+        AttendanceStatisticsDate.objects.filter(
+            date__range=(start_date, end_date)
+        ).values_list("date", flat=True)
+    )
+    missing = [
+        day for day in date_range(start_date, end_date) if day not in materialized
+    ]
+    if missing:
+        refresh_daily_statistics(missing)
+
+
+def statistics_totals(
+    start_date, end_date=None, department=None, group_by_department=False
+):
+    """
+    Read the summed counters of the date range from the statistics table
+
+    Returns:
+        dict | list: the totals, or a list of per-department totals when
+        `group_by_department` is set
+    """
+    AttendanceDailyStatistics = get_horilla_model_class(
+        app_label="attendance", model="attendancedailystatistics"
+    )
+    end_date = end_date or start_date
+    ensure_daily_statistics(start_date, end_date)
+    rows = AttendanceDailyStatistics.objects.filter(
+        date__range=(start_date, end_date)
+    ).order_by()
+    if department is not None:
+        rows = rows.filter(department_id=department)
+    sums = {field: Sum(field) for field in COUNTER_FIELDS}
+    if not group_by_department:
+        totals = rows.aggregate(**sums)
+        return {field: totals[field] or 0 for field in COUNTER_FIELDS}
+
+    grouped = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+    for row in (
+        rows.filter(department_id__isnull=False)
+        .values("department_id__department")
+        .annotate(**sums)
+        .order_by("department_id__department")
+    ):
+        totals = grouped[row["department_id__department"]]
+        for field in COUNTER_FIELDS:
+            totals[field] += row[field] or 0
+    return [
+        {"department": department, **totals} for department, totals in grouped.items()
+    ]
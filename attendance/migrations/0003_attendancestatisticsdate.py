@@ -0,0 +1,33 @@
+# Generated by Django 4.2.23 on 2026-10-19 00:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttendanceStatisticsDate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(unique=True, verbose_name="Date")),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Attendance Statistics Date",
+                "verbose_name_plural": "Attendance Statistics Dates",
+            },
+        ),
+    ]
@@ -29,7 +29,13 @@ from attendance.methods.utils import (
 )
 from base.horilla_company_manager import HorillaCompanyManager
 from base.methods import is_company_leave, is_holiday
-from base.models import Company, EmployeeShift, EmployeeShiftDay, WorkType
+from base.models import (
+    Company,
+    Department,
+    EmployeeShift,
+    EmployeeShiftDay,
+    WorkType,
+)
 from employee.models import Employee
 from horilla.methods import get_horilla_model_class
 from horilla.models import HorillaModel, upload_path
@@ -253,6 +259,10 @@ class Attendance(HorillaModel):
         ]
         verbose_name = _("Attendance")
         verbose_name_plural = _("Attendances")
+        indexes = [
+            # cursor pagination of the attendance API
+            models.Index(fields=["-attendance_date", "-id"]),
+        ]
 
     def check_min_ot(self):
         """
@@ -306,13 +316,15 @@ class Attendance(HorillaModel):
         ).order_by("id")
         return activities.last()
 
-    def get_at_work_from_activities(self):
+    def get_at_work_from_activities(self, activities=None):
         """
-        This method is used to retun the at work calculated from the activities
+        This method is used to retun the at work calculated from the activities,
+        the activities of the attendance are queried when not given
         """
-        activities = AttendanceActivity.objects.filter(
-            attendance_date=self.attendance_date, employee_id=self.employee_id
-        ).order_by("clock_in")
+        if activities is None:
+            activities = AttendanceActivity.objects.filter(
+                attendance_date=self.attendance_date, employee_id=self.employee_id
+            ).order_by("clock_in")
         at_work_seconds = 0
         now = datetime.now()
         for activity in activities:
@@ -1026,3 +1038,71 @@ class WorkRecords(models.Model):
         verbose_name = _("Work Record")
         verbose_name_plural = _("Work Records")
         # unique_together = ['date', 'employee_id']
+
+
+class AttendanceDailyStatistics(models.Model):
+    """
+    Materialized per-day attendance counters, one row per date, company and
+    department. Rows are kept current by the attendance, leave and late
+    come/early out signals and can be rebuilt with the
+    `rebuild_attendance_statistics` management command.
+    """
+
+    date = models.DateField(db_index=True, verbose_name=_("Date"))
+    company_id = models.ForeignKey(
+        Company,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=_("Company"),
+    )
+    department_id = models.ForeignKey(
+        Department,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        verbose_name=_("Department"),
+    )
+    expected_count = models.IntegerField(default=0)
+    present_count = models.IntegerField(default=0)
+    late_come_count = models.IntegerField(default=0)
+    early_out_count = models.IntegerField(default=0)
+    on_leave_count = models.IntegerField(default=0)
+    overtime_count = models.IntegerField(default=0)
+    approved_overtime_second = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    objects = HorillaCompanyManager(related_company_field="company_id")
+
+    class Meta:
+        """
+        Meta class to add some additional options
+        """
+
+        unique_together = ("date", "company_id", "department_id")
+        verbose_name = _("Attendance Daily Statistics")
+        verbose_name_plural = _("Attendance Daily Statistics")
+
+    def __str__(self) -> str:
+        return f"{self.date} - {self.company_id} - {self.department_id}"
+
+
+class AttendanceStatisticsDate(models.Model):
+    """
+    Marks the dates whose `AttendanceDailyStatistics` rows were materialized
+    for every company and department. Per employee refreshes only rewrite the
+    bucket of the employee, they never complete a date.
+    """
+
+    date = models.DateField(unique=True, verbose_name=_("Date"))
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """
+        Meta class to add some additional options
+        """
+
+        verbose_name = _("Attendance Statistics Date")
+        verbose_name_plural = _("Attendance Statistics Dates")
+
+    def __str__(self) -> str:
+        return str(self.date)
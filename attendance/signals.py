@@ -3,14 +3,31 @@
 from datetime import datetime, timedelta
 
 from django.apps import apps
-from django.db.models.signals import post_migrate, post_save, pre_delete
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
+from attendance.methods.daily_statistics import (
+    employee_id_bucket,
+    invalidate_daily_statistics,
+    refresh_employee_statistics,
+)
 from attendance.methods.utils import strtime_seconds
-from attendance.models import Attendance, AttendanceGeneralSetting, WorkRecords
+from attendance.models import (
+    Attendance,
+    AttendanceGeneralSetting,
+    AttendanceLateComeEarlyOut,
+    AttendanceValidationCondition,
+    WorkRecords,
+)
 from base.models import Company, PenaltyAccounts
-from employee.models import Employee
+from employee.models import Employee, EmployeeWorkInformation
 from horilla.methods import get_horilla_model_class
 
 
@@ -82,6 +99,97 @@ def handle_attendance_deletion(sender, instance, **kwargs):
             workrecord.delete()
 
 
+@receiver(pre_save, sender=Attendance)
+def track_attendance_statistics(sender, instance, **kwargs):
+    """
+    Remember the statistics bucket and day the attendance counted in, when it
+    moves to another employee or day the old bucket is refreshed as well
+    """
+    instance._previous_statistics = []
+    if instance.pk is None:
+        return
+    previous = (
+        Attendance.objects.entire()
+        .filter(pk=instance.pk)
+        .values_list("employee_id", "attendance_date")
+        .first()
+    )
+    if previous and previous != (instance.employee_id_id, instance.attendance_date):
+        employee_id, attendance_date = previous
+        instance._previous_statistics = [
+            (employee_id_bucket(employee_id), attendance_date)
+        ]
+
+
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def update_attendance_statistics(sender, instance, **kwargs):
+    """
+    Refresh the dashboard statistics of the attendance day
+    """
+    refresh_employee_statistics(
+        instance.employee_id,
+        [instance.attendance_date],
+        previous=getattr(instance, "_previous_statistics", ()),
+    )
+
+
+@receiver(post_save, sender=AttendanceLateComeEarlyOut)
+@receiver(post_delete, sender=AttendanceLateComeEarlyOut)
+def update_late_come_early_out_statistics(sender, instance, **kwargs):
+    """
+    Refresh the dashboard statistics of the late come/early out day
+    """
+    attendance = (
+        Attendance.objects.entire().filter(id=instance.attendance_id_id).first()
+    )
+    if attendance is not None:
+        refresh_employee_statistics(
+            attendance.employee_id, [attendance.attendance_date]
+        )
+
+
+@receiver(pre_save, sender=EmployeeWorkInformation)
+def track_work_info_statistics(sender, instance, **kwargs):
+    """
+    Remember the company and department the employee counted in before the
+    change
+    """
+    instance._previous_bucket = None
+    if instance.pk is not None:
+        instance._previous_bucket = (
+            EmployeeWorkInformation.objects.entire()
+            .filter(pk=instance.pk)
+            .values_list("company_id", "department_id")
+            .first()
+        )
+
+
+@receiver(post_save, sender=EmployeeWorkInformation)
+def update_work_info_statistics(sender, instance, **kwargs):
+    """
+    Refresh today's expected attendance when an employee changes company or
+    department, in the new and the old bucket. Past days keep their recorded
+    figures until a rebuild.
+    """
+    today = datetime.today().date()
+    previous = getattr(instance, "_previous_bucket", None)
+    refresh_employee_statistics(
+        instance.employee_id,
+        [today],
+        previous=[(tuple(previous), today)] if previous else (),
+    )
+
+
+@receiver(post_save, sender=AttendanceValidationCondition)
+def update_overtime_threshold_statistics(sender, instance, **kwargs):
+    """
+    The minimum overtime to approve decides which overtime is counted, the
+    statistics are computed again on the next dashboard load
+    """
+    invalidate_daily_statistics()
+
+
 # @receiver(post_migrate)
 def add_missing_attendance_to_workrecord(sender, **kwargs):
     if sender.label not in ["attendance", "leave"]:
@@ -1,3 +1,195 @@
+from datetime import date, timedelta
+
 from django.test import TestCase
 
-# Create your tests here.
+from attendance.methods.daily_statistics import (
+    refresh_daily_statistics,
+    refresh_employee_statistics,
+    statistics_totals,
+)
+from attendance.models import (
+    Attendance,
+    AttendanceDailyStatistics,
+    AttendanceValidationCondition,
+)
+from attendance.views.process_attendance_data import process_attendance_data
+from base.models import (
+    Company,
+    Department,
+    EmployeeShift,
+    EmployeeShiftDay,
+    WorkType,
+)
+from employee.models import Employee, EmployeeWorkInformation
+
+
+class DailyStatisticsTests(TestCase):
+    """
+    Tests of the materialized attendance dashboard statistics
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        EmployeeShiftDay.objects.bulk_create(
+            [
+                EmployeeShiftDay(day=day)
+                for day in [
+                    "monday",
+                    "tuesday",
+                    "wednesday",
+                    "thursday",
+                    "friday",
+                    "saturday",
+                    "sunday",
+                ]
+            ]
+        )
+        cls.company = Company.objects.create(
+            company="Horilla", address="-", country="-", state="-", city="-", zip="-"
+        )
+        cls.sales = Department(department="Sales")
+        cls.sales.save()
+        cls.support = Department(department="Support")
+        cls.support.save()
+        cls.seller = cls.create_employee("seller", cls.sales)
+        cls.agent = cls.create_employee("agent", cls.support)
+        cls.today = date.today()
+
+    @classmethod
+    def create_employee(cls, name, department):
+        employee = Employee.objects.create(
+            employee_first_name=name,
+            email=f"{name}@horilla.com",
+            phone="1234567890",
+            badge_id=name.upper(),
+        )
+        EmployeeWorkInformation.objects.update_or_create(
+            employee_id=employee,
+            defaults={"company_id": cls.company, "department_id": department},
+        )
+        return employee
+
+    def create_attendance(self, employee, day, **fields):
+        return Attendance.objects.create(
+            employee_id=employee,
+            attendance_date=day,
+            attendance_clock_in_date=day,
+            attendance_clock_in="09:00",
+            attendance_clock_out_date=day,
+            attendance_clock_out="17:00",
+            attendance_worked_hour="08:00",
+            minimum_hour="08:00",
+            **fields,
+        )
+
+    def department_totals(self, day):
+        return {
+            totals["department"]: totals
+            for totals in statistics_totals(day, group_by_department=True)
+        }
+
+    def test_employee_refresh_materializes_every_department(self):
+        # the first signal driven refresh of the day must not leave the other
+        # departments without rows
+        self.create_attendance(self.seller, self.today)
+        totals = self.department_totals(self.today)
+        self.assertEqual(set(totals), {"Sales", "Support"})
+        self.assertEqual(totals["Sales"]["present_count"], 1)
+        self.assertEqual(totals["Support"]["expected_count"], 1)
+        self.assertEqual(statistics_totals(self.today)["expected_count"], 2)
+
+    def test_employee_refresh_updates_only_its_bucket_once_complete(self):
+        statistics_totals(self.today)
+        AttendanceDailyStatistics.objects.filter(
+            date=self.today, department_id=self.support
+        ).update(present_count=5)
+        refresh_employee_statistics(self.seller, [self.today])
+        self.assertEqual(
+            self.department_totals(self.today)["Support"]["present_count"], 5
+        )
+
+    def test_overtime_below_approval_threshold_is_not_counted(self):
+        AttendanceValidationCondition.objects.create(
+            validation_at_work="09:00", minimum_overtime_to_approve="01:00"
+        )
+        attendance = self.create_attendance(self.seller, self.today)
+        Attendance.objects.filter(pk=attendance.pk).update(
+            overtime_second=30 * 60,
+            approved_overtime_second=30 * 60,
+            attendance_validated=True,
+            attendance_overtime_approve=True,
+        )
+        refresh_daily_statistics([self.today])
+        totals = statistics_totals(self.today)
+        self.assertEqual(totals["overtime_count"], 0)
+        self.assertEqual(totals["approved_overtime_second"], 0)
+
+        Attendance.objects.filter(pk=attendance.pk).update(
+            overtime_second=2 * 60 * 60, approved_overtime_second=2 * 60 * 60
+        )
+        refresh_daily_statistics([self.today])
+        totals = statistics_totals(self.today)
+        self.assertEqual(totals["overtime_count"], 1)
+        self.assertEqual(totals["approved_overtime_second"], 2 * 60 * 60)
+
+    def test_threshold_change_recomputes_statistics(self):
+        attendance = self.create_attendance(self.seller, self.today)
+        Attendance.objects.filter(pk=attendance.pk).update(
+            overtime_second=30 * 60,
+            approved_overtime_second=30 * 60,
+            attendance_validated=True,
+            attendance_overtime_approve=True,
+        )
+        refresh_daily_statistics([self.today])
+        self.assertEqual(statistics_totals(self.today)["overtime_count"], 1)
+        AttendanceValidationCondition.objects.create(
+            validation_at_work="09:00", minimum_overtime_to_approve="01:00"
+        )
+        self.assertEqual(statistics_totals(self.today)["overtime_count"], 0)
+
+    def test_moved_attendance_refreshes_the_old_day(self):
+        yesterday = self.today - timedelta(days=1)
+        attendance = self.create_attendance(self.seller, yesterday)
+        self.assertEqual(statistics_totals(yesterday)["present_count"], 1)
+
+        attendance.attendance_date = self.today
+        attendance.attendance_clock_in_date = self.today
+        attendance.attendance_clock_out_date = self.today
+        attendance.save()
+        self.assertEqual(statistics_totals(yesterday)["present_count"], 0)
+        self.assertEqual(statistics_totals(self.today)["present_count"], 1)
+
+    def test_department_change_refreshes_the_old_department(self):
+        self.assertEqual(
+            self.department_totals(self.today)["Sales"]["expected_count"], 1
+        )
+        work_info = self.seller.employee_work_info
+        work_info.department_id = self.support
+        work_info.save()
+        totals = self.department_totals(self.today)
+        self.assertEqual(totals["Sales"]["expected_count"], 0)
+        self.assertEqual(totals["Support"]["expected_count"], 2)
+
+    def test_imported_attendances_refresh_complete_dates(self):
+        yesterday = self.today - timedelta(days=1)
+        self.assertEqual(statistics_totals(yesterday)["present_count"], 0)
+        EmployeeShift(employee_shift="Regular").save()
+        WorkType(work_type="Office").save()
+        errors = process_attendance_data(
+            [
+                {
+                    "Badge ID": "AGENT",
+                    "Shift": "Regular",
+                    "Work type": "Office",
+                    "Attendance date": yesterday,
+                    "Check-in date": yesterday,
+                    "Check-out date": yesterday,
+                    "Check-in": "09:00:00",
+                    "Check-out": "17:00:00",
+                    "Worked hour": "08:00:00",
+                    "Minimum hour": "08:00:00",
+                }
+            ]
+        )
+        self.assertEqual(errors, [])
+        self.assertEqual(statistics_totals(yesterday)["present_count"], 1)
@@ -7,7 +7,6 @@ This module is used to register endpoints for dashboard-related requests
 import json
 from datetime import date, datetime
 
-from django.apps import apps
 from django.http import JsonResponse
 from django.shortcuts import render
 from django.utils.translation import gettext_lazy as _
@@ -17,6 +16,7 @@ from attendance.filters import (
     AttendanceOverTimeFilter,
     LateComeEarlyOutFilter,
 )
+from attendance.methods.daily_statistics import statistics_totals
 from attendance.methods.utils import (
     get_month_start_end_dates,
     get_week_start_end_dates,
@@ -31,42 +31,48 @@ from attendance.models import (
 from attendance.views.views import strtime_seconds
 from base.methods import filtersubordinates, paginator_qry
 from base.models import Department
-from employee.models import Employee
 from horilla import settings
 from horilla.decorators import hx_request_required, login_required
-from horilla.methods import get_horilla_model_class
 
 
 def find_on_time(request, today, week_day, department=None):
     """
     This method is used to find count for on time attendances
     """
-
-    on_time = 0
-    attendances = Attendance.objects.filter(attendance_date=today)
-    if department is not None:
-        attendances = attendances.filter(
-            employee_id__employee_work_info__department_id=department
-        )
-    late_come = AttendanceLateComeEarlyOut.objects.filter(
-        attendance_id__attendance_date=today, type="late_come"
-    )
-    on_time = len(attendances) - len(late_come)
-    return on_time
+    totals = statistics_totals(today, department=department)
+    return totals["present_count"] - totals["late_come_count"]
 
 
 def find_expected_attendances(week_day):
     """
     This method is used to find count of expected attendances for the week day
     """
-    employees = Employee.objects.filter(is_active=True)
-    if apps.is_installed("leave"):
-        LeaveRequest = get_horilla_model_class(app_label="leave", model="leaverequest")
-        on_leave = LeaveRequest.objects.filter(status="Approved")
-    else:
-        on_leave = []
-    expected_attendances = len(employees) - len(on_leave)
-    return expected_attendances
+    return statistics_totals(date.today())["expected_count"]
+
+
+def get_chart_date_range(chart_type, start_date, end_date=None):
+    """
+    This method is used to resolve the chart filter into a start and end date
+    """
+    if chart_type == "weekly":
+        return get_week_start_end_dates(start_date)
+    if chart_type == "monthly":
+        return get_month_start_end_dates(start_date)
+    start_date = parse_date(start_date)
+    if chart_type == "date_range" and end_date:
+        return start_date, parse_date(end_date)
+    return start_date, start_date
+
+
+def parse_date(value):
+    """
+    This method is used to accept both date objects and ISO date strings
+    """
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
 
 
 @login_required
@@ -75,16 +81,13 @@ def dashboard(request):
     This method is used to render individual dashboard for attendance module
     """
 
-    today = datetime.today()
-    week_day = today.strftime("%A").lower()
-
-    on_time = find_on_time(request, today=today, week_day=week_day)
-    late_come = find_late_come(start_date=today)
-    late_come_obj = len(late_come)
+    totals = statistics_totals(date.today())
+    late_come_obj = totals["late_come_count"]
+    on_time = totals["present_count"] - late_come_obj
 
     marked_attendances = late_come_obj + on_time
 
-    expected_attendances = find_expected_attendances(week_day=week_day)
+    expected_attendances = totals["expected_count"]
     on_time_ratio = 0
     late_come_ratio = 0
     marked_attendances_ratio = 0
@@ -278,49 +281,17 @@ def find_early_out(start_date, end_date=None, department=None):
 
 def generate_data_set(request, start_date, type, end_date, dept):
     """
-    This method is used to generate all the dashboard data
+    This method is used to generate the dashboard data of a department
     """
-    attendance = []
-    late_come_obj = []
-    early_out_obj = []
-    on_time = 0
-    if type == "day":
-        start_date = start_date
-        end_date = start_date
-    if type == "weekly":
-        start_date, end_date = get_week_start_end_dates(start_date)
-    if type == "monthly":
-        start_date, end_date = get_month_start_end_dates(start_date)
-    if type == "date_range":
-        start_date = start_date
-        end_date = end_date
-    # below method will find all the on-time attendance corresponding to the
-    # employee shift and shift schedule.
-    attendance = total_attendance(
-        start_date=start_date, department=dept, end_date=end_date
-    )
-
-    # below method will find all the late-come attendance corresponding to the
-    # employee shift and schedule.
-    late_come_obj = find_late_come(
-        start_date=start_date, department=dept, end_date=end_date
-    )
-
-    # below method will find all the early-out attendance corresponding to the
-    # employee shift and shift schedule
-    early_out_obj = find_early_out(
-        department=dept, start_date=start_date, end_date=end_date
-    )
-    on_time = len(attendance) - len(late_come_obj)
-
-    data = {}
-    if on_time or late_come_obj or early_out_obj:
-        data = {
-            "label": dept.department,
-            "data": [on_time, len(late_come_obj), len(early_out_obj)],
-        }
-
-    return data if data else None
+    start_date, end_date = get_chart_date_range(type, start_date, end_date)
+    totals = statistics_totals(start_date, end_date, department=dept)
+    on_time = totals["present_count"] - totals["late_come_count"]
+    if not (on_time or totals["late_come_count"] or totals["early_out_count"]):
+        return None
+    return {
+        "label": dept.department,
+        "data": [on_time, totals["late_come_count"], totals["early_out_count"]],
+    }
 
 
 @login_required
@@ -350,12 +321,23 @@ def dashboard_attendance(request):
     if request.GET.get("end_date"):
         end_date = request.GET.get("end_date")
 
-    # get all departments for filtration
-    departments = Department.objects.all()
-    for dept in departments:
-        data_set.append(generate_data_set(request, start_date, type, end_date, dept))
+    # the per department figures are read from the materialized daily
+    # statistics in one grouped query
+    start_date, end_date = get_chart_date_range(type, start_date, end_date)
+    for totals in statistics_totals(start_date, end_date, group_by_department=True):
+        on_time = totals["present_count"] - totals["late_come_count"]
+        if on_time or totals["late_come_count"] or totals["early_out_count"]:
+            data_set.append(
+                {
+                    "label": totals["department"],
+                    "data": [
+                        on_time,
+                        totals["late_come_count"],
+                        totals["early_out_count"],
+                    ],
+                }
+            )
     message = _("No records available at the moment.")
-    data_set = list(filter(None, data_set))
     return JsonResponse({"dataSet": data_set, "labels": labels, "message": message})
 
 
@@ -384,70 +366,23 @@ def department_overtime_chart(request):
         request.GET.get("end_date") if request.GET.get("end_date") else start_date
     )
 
-    if chart_type == "day":
-        start_date = start_date
-        end_date = start_date
-    if chart_type == "weekly":
-        start_date, end_date = get_week_start_end_dates(start_date)
-    if chart_type == "monthly":
-        start_date, end_date = get_month_start_end_dates(start_date)
-    if chart_type == "date_range":
-        start_date = start_date
-        end_date = end_date
-
-    attendance = total_attendance(
-        start_date=start_date, department=None, end_date=end_date
-    )
-
-    condition = AttendanceValidationCondition.objects.first()
-    min_ot = strtime_seconds("00:00")
-    if condition is not None and condition.minimum_overtime_to_approve is not None:
-        min_ot = strtime_seconds(condition.minimum_overtime_to_approve)
-    attendances = attendance.filter(
-        overtime_second__gte=min_ot,
-        attendance_validated=True,
-        employee_id__is_active=True,
-        attendance_overtime_approve=True,
-    )
-    departments = []
-    department_total = []
-
-    for attendance in attendances:
-        if (
-            attendance.employee_id
-            and attendance.employee_id.employee_work_info
-            and attendance.employee_id.employee_work_info.department_id
-        ):
-            departments.append(
-                attendance.employee_id.employee_work_info.department_id.department
-            )
-    departments = list(set(departments))
-
-    for depart in departments:
-        department_total.append({"department": depart, "ot_hours": 0})
-
-    for attendance in attendances:
-        if attendance.employee_id.employee_work_info.department_id:
-            department = (
-                attendance.employee_id.employee_work_info.department_id.department
-            )
-            ot = attendance.approved_overtime_second
-            ot_hrs = ot / 3600
-            for depart in department_total:
-                if depart["department"] == department:
-                    depart["ot_hours"] += ot_hrs
-
+    start_date, end_date = get_chart_date_range(chart_type, start_date, end_date)
+    department_total = [
+        {
+            "department": totals["department"],
+            "ot_hours": totals["approved_overtime_second"] / 3600,
+        }
+        for totals in statistics_totals(start_date, end_date, group_by_department=True)
+        if totals["overtime_count"]
+    ]
+    departments = [depart["department"] for depart in department_total]
     dataset = [
         {
             "label": "",
-            "data": [],
+            "data": [depart["ot_hours"] for depart in department_total],
         }
     ]
 
-    for depart_total, depart in zip(department_total, departments):
-        if depart == depart_total["department"]:
-            dataset[0]["data"].append(depart_total["ot_hours"])
-
     response = {
         "dataset": dataset,
         "labels": departments,
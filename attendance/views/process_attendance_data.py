@@ -9,6 +9,7 @@ from datetime import datetime
 
 import pandas as pd
 
+from attendance.methods.daily_statistics import refresh_statistics_dates
 from attendance.models import Attendance
 from base.models import EmployeeShift, WorkType
 from employee.models import Employee
@@ -207,4 +208,8 @@ def process_attendance_data(attendance_dicts):
             error_list.append(attendance_data)
     if attendance_list:
         Attendance.objects.bulk_create(attendance_list)
+        # bulk_create sends no signals, refresh the dashboard statistics here
+        refresh_statistics_dates(
+            [attendance.attendance_date for attendance in attendance_list]
+        )
     return error_list
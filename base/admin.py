@@ -17,6 +17,7 @@ from base.models import (
     DynamicEmailConfiguration,
     DynamicPagination,
     EmailLog,
+    EmailOutbox,
     EmployeeShift,
     EmployeeShiftDay,
     EmployeeShiftSchedule,
@@ -65,6 +66,7 @@ admin.site.register(DynamicPagination)
 admin.site.register(Announcement)
 admin.site.register(Attachment)
 admin.site.register(EmailLog)
+admin.site.register(EmailOutbox)
 admin.site.register(DashboardEmployeeCharts)
 admin.site.register(Holidays)
 admin.site.register(CompanyLeaves)
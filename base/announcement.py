@@ -3,7 +3,6 @@ Module for managing announcements, including creation, updates, comments, and vi
 """
 
 import json
-from datetime import datetime, timedelta
 
 from django.contrib import messages
 from django.contrib.auth.models import User
@@ -14,6 +13,7 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from base.forms import AnnouncementCommentForm, AnnouncementForm
+from base.audience import visible_announcements
 from base.methods import closest_numbers, filter_own_records
 from base.models import (
     Announcement,
@@ -33,51 +33,74 @@ def announcement_list(request):
     """
     Renders a list of announcements for the authenticated user.
 
-    This view fetches all announcements and updates their expiration dates if not already set.
-    It filters announcements based on the user's permissions and whether the announcements
-    are still valid (not expired). Additionally, it checks if the user has viewed each announcement.
+    The announcements the user can see, and whether the user has viewed them,
+    are resolved in a single query from the announcement audience rules.
     """
-    general_expire_date = (
-        AnnouncementExpire.objects.values_list("days", flat=True).first() or 30
-    )
-    announcements = Announcement.objects.all()
-    announcements_to_update = []
-
-    for announcement in announcements.filter(expire_date__isnull=True):
-        announcement.expire_date = announcement.created_at + timedelta(
-            days=general_expire_date
-        )
-        announcements_to_update.append(announcement)
-
-    if announcements_to_update:
-        Announcement.objects.bulk_update(announcements_to_update, ["expire_date"])
-
-    has_view_permission = request.user.has_perm("base.view_announcement")
-    announcements = announcements.filter(expire_date__gte=datetime.today().date())
-    announcement_items = (
-        announcements
-        if has_view_permission
-        else announcements.filter(
-            Q(employees=request.user.employee_get) | Q(employees__isnull=True)
-        )
-    )
-
-    filtered_announcements = announcement_items.prefetch_related(
-        "announcementview_set"
-    ).order_by("-created_at")
-    for announcement in filtered_announcements:
-        announcement.has_viewed = announcement.announcementview_set.filter(
-            user=request.user, viewed=True
-        ).exists()
+    filtered_announcements = list(visible_announcements(request.user))
     instance_ids = json.dumps([instance.id for instance in filtered_announcements])
     context = {
         "announcements": filtered_announcements,
-        "general_expire_date": general_expire_date,
+        "general_expire_date": AnnouncementExpire.expire_days(),
         "instance_ids": instance_ids,
     }
     return render(request, "announcement/announcements_list.html", context)
 
 
+def notify_announcement_audience(request, employees, departments, job_positions):
+    """
+    Notify the employees targeted by an announcement, department and job
+    position members with their own message
+    """
+    targets = Employee.objects.filter(
+        Q(id__in=employees)
+        | Q(employee_work_info__department_id__in=departments)
+        | Q(employee_work_info__job_position_id__in=job_positions)
+    ).values_list(
+        "id",
+        "employee_user_id",
+        "employee_work_info__department_id",
+        "employee_work_info__job_position_id",
+    )
+    direct_ids = {employee.id for employee in employees}
+    department_ids = {department.id for department in departments}
+    job_position_ids = {job_position.id for job_position in job_positions}
+    dept_user_ids, job_user_ids, direct_user_ids = set(), set(), set()
+    for employee_id, user_id, department_id, job_position_id in targets:
+        if user_id is None:
+            continue
+        if department_id in department_ids:
+            dept_user_ids.add(user_id)
+        if job_position_id in job_position_ids:
+            job_user_ids.add(user_id)
+        if employee_id in direct_ids:
+            direct_user_ids.add(user_id)
+    direct_user_ids -= dept_user_ids | job_user_ids
+
+    sender = request.user.employee_get
+
+    def send_notification(user_ids, verb):
+        if user_ids:
+            notify.send(
+                sender,
+                recipient=User.objects.filter(id__in=user_ids),
+                verb=verb,
+                verb_ar="لقد تم ذكرك في إعلان.",
+                verb_de="Sie wurden in einer Ankündigung erwähnt.",
+                verb_es="Has sido mencionado en un anuncio.",
+                verb_fr="Vous avez été mentionné dans une annonce.",
+                redirect="/",
+                icon="chatbox-ellipses",
+            )
+
+    send_notification(
+        dept_user_ids, _("Your department was mentioned in an announcement.")
+    )
+    send_notification(
+        job_user_ids, _("Your job position was mentioned in an announcement.")
+    )
+    send_notification(direct_user_ids, _("You have been mentioned in an announcement."))
+
+
 @login_required
 @hx_request_required
 def create_announcement(request):
@@ -97,63 +120,14 @@ def create_announcement(request):
             job_positions = form.cleaned_data["job_position"]
             company = form.cleaned_data["company_id"]
 
+            # the audience rules are stored as they are, visibility is
+            # resolved when the announcements are listed
+            announcement.employees.set(employees)
             announcement.department.set(departments)
             announcement.job_position.set(job_positions)
             announcement.company_id.set(company)
 
-            dept_ids = departments.values_list("id", flat=True)
-            job_ids = job_positions.values_list("id", flat=True)
-
-            employees_from_dept = Employee.objects.filter(
-                employee_work_info__department_id__in=dept_ids
-            )
-            employees_from_job = Employee.objects.filter(
-                employee_work_info__job_position_id__in=job_ids
-            )
-
-            all_employees = (
-                employees | employees_from_dept | employees_from_job
-            ).distinct()
-            announcement.employees.add(*all_employees)
-
-            all_emps = employees_from_dept | employees_from_job | employees
-            user_map = User.objects.filter(employee_get__in=all_emps).distinct()
-
-            dept_emp_ids = set(employees_from_dept.values_list("id", flat=True))
-            job_emp_ids = set(employees_from_job.values_list("id", flat=True))
-            direct_emp_ids = set(employees.values_list("id", flat=True))
-
-            notified_ids = dept_emp_ids.union(job_emp_ids)
-            direct_only_ids = direct_emp_ids - notified_ids
-
-            sender = request.user.employee_get
-
-            def send_notification(users, verb):
-                if users.exists():
-                    notify.send(
-                        sender,
-                        recipient=users,
-                        verb=verb,
-                        verb_ar="لقد تم ذكرك في إعلان.",
-                        verb_de="Sie wurden in einer Ankündigung erwähnt.",
-                        verb_es="Has sido mencionado en un anuncio.",
-                        verb_fr="Vous avez été mentionné dans une annonce.",
-                        redirect="/",
-                        icon="chatbox-ellipses",
-                    )
-
-            send_notification(
-                user_map.filter(employee_get__id__in=dept_emp_ids),
-                _("Your department was mentioned in an announcement."),
-            )
-            send_notification(
-                user_map.filter(employee_get__id__in=job_emp_ids),
-                _("Your job position was mentioned in an announcement."),
-            )
-            send_notification(
-                user_map.filter(employee_get__id__in=direct_only_ids),
-                _("You have been mentioned in an announcement."),
-            )
+            notify_announcement_audience(request, employees, departments, job_positions)
 
             messages.success(request, _("Announcement created successfully."))
             form = AnnouncementForm()  # Reset the form
@@ -219,6 +193,7 @@ def update_announcement(request, anoun_id):
             departments = form.cleaned_data["department"]
             job_positions = form.cleaned_data["job_position"]
             company = form.cleaned_data["company_id"]
+            anou.employees.set(employees)
             anou.department.set(departments)
             anou.job_position.set(job_positions)
             anou.company_id.set(company)
@@ -230,13 +205,6 @@ def update_announcement(request, anoun_id):
             emp_jobs = User.objects.filter(
                 employee_get__employee_work_info__job_position_id__in=job_positions
             )
-            employees = employees | Employee.objects.filter(
-                employee_work_info__department_id__in=departments
-            )
-            employees = employees | Employee.objects.filter(
-                employee_work_info__job_position_id__in=job_positions
-            )
-            anou.employees.add(*employees)
 
             notify.send(
                 request.user.employee_get,
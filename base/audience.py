@@ -0,0 +1,95 @@
+"""
+audience.py
+
+This module is used to resolve the audience of announcements at read time.
+Announcements only store their audience rules (companies, departments, job
+positions and explicit employees), the announcements an employee can see are
+selected with `Exists` subqueries on those rules.
+"""
+
+from datetime import timedelta
+
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from base.models import Announcement, AnnouncementExpire, AnnouncementView
+
+
+def rule_exists(field_name, value=None):
+    """
+    Exists subquery on the rows of an audience rule (m2m field) of the outer
+    announcement, limited to the value when it is given
+    """
+    field = Announcement._meta.get_field(field_name)
+    lookup = {field.m2m_field_name(): OuterRef("pk")}
+    if value is not None:
+        lookup[field.m2m_reverse_field_name()] = value
+    return Exists(field.remote_field.through.objects.filter(**lookup))
+
+
+def audience_filter(employee):
+    """
+    Q object matching the announcements addressed to the employee.
+
+    Companies scope an announcement, employees, departments and job positions
+    target it. An announcement without targets is addressed to everyone in
+    its companies (or everyone when it has no company).
+    """
+    work_info = getattr(employee, "employee_work_info", None)
+    department_id = getattr(work_info, "department_id_id", None)
+    job_position_id = getattr(work_info, "job_position_id_id", None)
+    company_id = getattr(work_info, "company_id_id", None)
+
+    targeted = (
+        rule_exists("employees")
+        | rule_exists("department")
+        | rule_exists("job_position")
+    )
+    matches = rule_exists("employees", employee.pk)
+    if department_id:
+        matches |= rule_exists("department", department_id)
+    if job_position_id:
+        matches |= rule_exists("job_position", job_position_id)
+
+    scoped = ~rule_exists("company_id")
+    if company_id:
+        scoped |= rule_exists("company_id", company_id)
+    return (~targeted | matches) & scoped
+
+
+def active_filter(today=None):
+    """
+    Q object matching the announcements that are not expired. Announcements
+    saved before their expire date was defaulted on save expire after the
+    configured number of days.
+    """
+    today = today or timezone.localdate()
+    days = AnnouncementExpire.expire_days()
+    return Q(expire_date__gte=today) | Q(
+        expire_date__isnull=True, created_at__date__gte=today - timedelta(days=days)
+    )
+
+
+def visible_announcements(user, queryset=None):
+    """
+    Returns the active announcements the user can see, newest first, with
+    `has_viewed` annotated
+
+    Args:
+        user: request user
+        queryset: announcements to select from, all by default
+    """
+    queryset = Announcement.objects.all() if queryset is None else queryset
+    queryset = queryset.filter(active_filter())
+    employee = getattr(user, "employee_get", None)
+    if not user.has_perm("base.view_announcement"):
+        if employee is None:
+            return queryset.none()
+        queryset = queryset.filter(audience_filter(employee))
+    return queryset.annotate(
+        has_viewed=Exists(
+            AnnouncementView.objects.filter(
+                announcement=OuterRef("pk"), user=user, viewed=True
+            )
+        )
+    ).order_by("-created_at")
@@ -13,10 +13,47 @@ from django.core.mail.backends.smtp import EmailBackend
 
 from base.models import DynamicEmailConfiguration, EmailLog
 from horilla import settings
+from horilla.horilla_cache import HorillaCache
 from horilla.horilla_middlewares import _thread_locals
 
 logger = logging.getLogger(__name__)
 
+EMAIL_CONFIGURATION_CACHE = HorillaCache("email_configurations")
+
+
+def invalidate_email_configurations():
+    """
+    Invalidate the email configurations cached by every worker process
+    """
+    EMAIL_CONFIGURATION_CACHE.bump()
+
+
+def load_email_configuration(company_id):
+    """
+    Returns the mail server configuration of the company, falling back to the
+    primary configuration
+    """
+    configuration = DynamicEmailConfiguration.objects.filter(
+        company_id=company_id
+    ).first()
+    if configuration is None:
+        configuration = DynamicEmailConfiguration.objects.filter(
+            is_primary=True
+        ).first()
+    return configuration
+
+
+def get_email_configuration(company=None):
+    """
+    Returns the mail server configuration of the company. Configurations are
+    loaded once per process and configuration version instead of on every
+    backend instantiation.
+    """
+    company_id = getattr(company, "pk", company)
+    return EMAIL_CONFIGURATION_CACHE.local(
+        company_id, lambda: load_email_configuration(company_id)
+    )
+
 
 class DefaultHorillaMailBackend(EmailBackend):
     def __init__(
@@ -31,9 +68,10 @@ class DefaultHorillaMailBackend(EmailBackend):
         timeout=None,
         ssl_keyfile=None,
         ssl_certfile=None,
+        configuration=None,
         **kwargs,
     ):
-        self.configuration = self.get_dynamic_email_config()
+        self.configuration = configuration or self.get_dynamic_email_config()
         ssl_keyfile = (
             getattr(self.configuration, "ssl_keyfile", None)
             if self.configuration
@@ -65,13 +103,7 @@ class DefaultHorillaMailBackend(EmailBackend):
         company = None
         if request and not request.user.is_anonymous:
             company = request.user.employee_get.get_company()
-        configuration = DynamicEmailConfiguration.objects.filter(
-            company_id=company
-        ).first()
-        if configuration is None:
-            configuration = DynamicEmailConfiguration.objects.filter(
-                is_primary=True
-            ).first()
+        configuration = get_email_configuration(company)
         if configuration:
             display_email_name = (
                 f"{configuration.display_name} <{configuration.from_email}>"
@@ -0,0 +1,60 @@
+"""
+Django management command to run the shift / work type rotations of a day
+
+Usage:
+    python manage.py rotate_assignments [--date YYYY-MM-DD] [--dry-run]
+
+This command applies the due rotating shift and rotating work type
+assignments. With --dry-run the planned changes are only reported.
+"""
+
+from datetime import date, datetime
+
+from django.core.management.base import BaseCommand
+
+from base.rotation import apply_rotations
+
+
+class Command(BaseCommand):
+    help = "Apply the rotating shift and work type assignments of a day"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=str,
+            help="Day to rotate (YYYY-MM-DD format), defaults to today",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the planned changes without applying them",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            day = (
+                datetime.strptime(options["date"], "%Y-%m-%d").date()
+                if options.get("date")
+                else date.today()
+            )
+        except ValueError:
+            self.stdout.write(self.style.ERROR("Invalid date format. Use YYYY-MM-DD"))
+            return
+
+        dry_run = options["dry_run"]
+        for kind in ["shift", "work_type"]:
+            plan = apply_rotations(kind, today=day, dry_run=dry_run)
+            for assign_id in plan["deactivate"]:
+                self.stdout.write(f"{kind}: deactivate superseded assign {assign_id}")
+            for rotation in plan["rotations"]:
+                self.stdout.write(
+                    f"{kind}: employee {rotation['employee_id']} "
+                    f"{rotation['from']} -> {rotation['to']}, "
+                    f"next {rotation['next']} on {rotation['next_change_date']}"
+                )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{kind}: {len(plan['rotations'])} rotations "
+                    f"{'planned' if dry_run else 'applied'}"
+                )
+            )
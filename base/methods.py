@@ -22,6 +22,7 @@ from django.template.loader import render_to_string
 from django.utils.translation import gettext as _
 
 from base.models import Company, CompanyLeaves, DynamicPagination, Holidays
+from employee.methods.hierarchy import get_subordinate_ids, subordinate_filter
 from employee.models import Employee, EmployeeWorkInformation
 from horilla.horilla_apps import NESTED_SUBORDINATE_VISIBILITY
 from horilla.horilla_middlewares import _thread_locals
@@ -166,30 +167,8 @@ def filtersubordinatesemployeemodel(request, queryset, perm=None):
         return queryset
 
     if NESTED_SUBORDINATE_VISIBILITY:
-        # Initialize the set of subordinates with the current manager(s)
-        current_managers = [
-            request.user.employee_get.id,
-        ]
-        all_subordinates = Q(
-            employee_work_info__reporting_manager_id__in=current_managers
-        )
-
-        # Iteratively find subordinates in the chain
-        while True:
-            sub_managers = queryset.filter(
-                employee_work_info__reporting_manager_id__in=current_managers
-            ).values_list("id", flat=True)
-
-            if not sub_managers.exists():
-                break
-
-            current_managers = sub_managers
-            all_subordinates |= Q(
-                employee_work_info__reporting_manager_id__in=sub_managers
-            )
-
-        # Apply the filter to the queryset
-        return queryset.filter(all_subordinates).distinct()
+        # All subordinates in the chain from the reporting hierarchy closure table
+        return queryset.filter(subordinate_filter(request.user.employee_get.id))
 
     manager = Employee.objects.filter(employee_user_id=user).first()
     queryset = queryset.filter(employee_work_info__reporting_manager_id=manager)
@@ -233,26 +212,9 @@ def choosesubordinates(request, form, perm):
     if not manager:
         return form
 
-    # Start with direct subordinates
-    current_managers = [manager.id]
-    all_subordinates = Q(employee_work_info__reporting_manager_id__in=current_managers)
-
-    if NESTED_SUBORDINATE_VISIBILITY:
-        # Recursively find all subordinates in the chain
-        while True:
-            sub_managers = Employee.objects.filter(
-                employee_work_info__reporting_manager_id__in=current_managers
-            ).values_list("id", flat=True)
-
-            if not sub_managers.exists():
-                break
-
-            current_managers = sub_managers
-            all_subordinates |= Q(
-                employee_work_info__reporting_manager_id__in=sub_managers
-            )
-
-    queryset = Employee.objects.filter(all_subordinates).distinct()
+    queryset = Employee.objects.filter(
+        subordinate_filter(manager.id, nested=NESTED_SUBORDINATE_VISIBILITY)
+    )
 
     # Assign to form field
     if "employee_id" in form.fields:
@@ -274,31 +236,8 @@ def get_subordinate_employee_ids(request, nested=NESTED_SUBORDINATE_VISIBILITY):
 
     manager_id = user.employee_get.id
 
-    if nested:
-        # Recursive approach for all levels
-        current_managers = [manager_id]
-        all_sub_ids = set()
-
-        while current_managers:
-            sub_ids = list(
-                Employee.objects.filter(
-                    employee_work_info__reporting_manager_id__in=current_managers
-                ).values_list("id", flat=True)
-            )
-            if not sub_ids:
-                break
-            all_sub_ids.update(sub_ids)
-            current_managers = sub_ids
-
-        return list(all_sub_ids)
-    else:
-        # Only direct subordinates
-        direct_sub_ids = list(
-            Employee.objects.filter(
-                employee_work_info__reporting_manager_id=manager_id
-            ).values_list("id", flat=True)
-        )
-        return direct_sub_ids
+    # the reporting hierarchy closure table resolves every level in one query
+    return get_subordinate_ids(manager_id, nested=nested)
 
 
 def choosesubordinatesemployeemodel(request, form, perm):
@@ -5,7 +5,6 @@ middleware.py
 from django.apps import apps
 from django.contrib import messages
 from django.contrib.auth import logout
-from django.core.cache import cache
 from django.db.models import Q
 from django.shortcuts import redirect
 from django.utils.translation import gettext_lazy as _
@@ -25,8 +24,6 @@ from horilla.horilla_settings import APPS
 from horilla.methods import get_horilla_model_class
 from horilla_documents.models import DocumentRequest
 
-CACHE_KEY = "horilla_company_models_cache_key"
-
 
 class CompanyMiddleware:
     """
@@ -35,6 +32,7 @@ class CompanyMiddleware:
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self._company_models = None
 
     def _get_company_id(self, request):
         """
@@ -128,9 +126,10 @@ class CompanyMiddleware:
 
     def _get_company_models(self):
         """
-        Retrieve the list of models that are company-specific.
+        Retrieve the list of models that are company-specific. The list only
+        depends on the installed apps, it is built once per process.
         """
-        company_models = cache.get(CACHE_KEY)
+        company_models = self._company_models
 
         if company_models is None:
             company_models = [
@@ -176,7 +175,7 @@ class CompanyMiddleware:
                         [get_horilla_model_class(app_label, model) for model in models]
                     )
 
-            cache.set(CACHE_KEY, company_models)
+            self._company_models = company_models
 
         return company_models
 
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.23 on 2026-10-19 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="emailoutbox",
+            name="context",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                help_text="Data of the sender, handed to the delivery receivers",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="emailoutbox",
+            name="message",
+            field=models.BinaryField(help_text="Rendered MIME message"),
+        ),
+    ]
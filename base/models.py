@@ -1500,6 +1500,13 @@ class AnnouncementExpire(models.Model):
     days = models.IntegerField(null=True, blank=True, default=30)
     objects = models.Manager()
 
+    @classmethod
+    def expire_days(cls):
+        """
+        Returns the number of days announcements stay visible by default
+        """
+        return cls.objects.values_list("days", flat=True).first() or 30
+
 
 class Announcement(HorillaModel):
     """
@@ -1534,10 +1541,6 @@ class Announcement(HorillaModel):
         verbose_name=_("Show Comments to All"),
         help_text=_("If enabled, all employees can view each other's comments."),
     )
-
-    filtered_employees = models.ManyToManyField(
-        Employee, related_name="announcement_filtered_employees", editable=False
-    )
     objects = HorillaCompanyManager(related_company_field="company_id")
 
     class Meta:
@@ -1562,10 +1565,16 @@ class Announcement(HorillaModel):
 
     def save(self, *args, **kwargs):
         """
-        if comments are disabled, force public comments to be false
+        if comments are disabled, force public comments to be false, and
+        default the expire date from the announcement expire settings
         """
         if self.disable_comments:
             self.public_comments = False
+        if self.expire_date is None:
+            created_at = self.created_at or django.utils.timezone.now()
+            self.expire_date = django.utils.timezone.localdate(created_at) + timedelta(
+                days=AnnouncementExpire.expire_days()
+            )
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -1615,6 +1624,52 @@ class EmailLog(models.Model):
     )
 
 
+class EmailOutbox(models.Model):
+    """
+    Durable outbox of rendered mails waiting to be delivered by the outbox
+    worker (`base/outbox.py`)
+    """
+
+    statuses = [
+        ("pending", _("Pending")),
+        ("sending", _("Sending")),
+        ("sent", _("Sent")),
+        ("failed", _("Failed")),
+    ]
+    configuration = models.ForeignKey(
+        DynamicEmailConfiguration,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name=_("Email Configuration"),
+    )
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=512)
+    recipients = models.JSONField(default=list)
+    message = models.BinaryField(help_text=_("Rendered MIME message"))
+    context = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text=_("Data of the sender, handed to the delivery receivers"),
+    )
+    status = models.CharField(max_length=10, choices=statuses, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_retry_at = models.DateTimeField(default=django.utils.timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    objects = models.Manager()
+
+    class Meta:
+        verbose_name = _("Email Outbox")
+        verbose_name_plural = _("Email Outbox")
+        indexes = [models.Index(fields=["status", "next_retry_at"])]
+
+    def __str__(self):
+        return f"{self.subject} ({self.get_status_display()})"
+
+
 class DriverViewed(models.Model):
     """
     Model to store driver viewed status
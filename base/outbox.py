@@ -0,0 +1,282 @@
+"""
+outbox.py
+
+This module is used to queue mails in the durable outbox (`EmailOutbox`) and
+deliver them over one reused connection per mail server configuration
+"""
+
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from email import message_from_bytes
+from email.message import Message
+
+from django.conf import settings
+from django.core.mail import EmailMessage
+from django.core.mail.message import MIMEMixin
+from django.db import connection, transaction
+from django.utils import timezone
+
+from base.backends import ConfiguredEmailBackend, DefaultHorillaMailBackend
+from base.models import EmailLog, EmailOutbox
+from horilla.signals import post_outbox_delivery
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = getattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 6)
+RETRY_BASE_SECONDS = getattr(settings, "EMAIL_OUTBOX_RETRY_BASE_SECONDS", 60)
+RETRY_MAX_SECONDS = getattr(settings, "EMAIL_OUTBOX_RETRY_MAX_SECONDS", 6 * 60 * 60)
+# messages per minute and mail host, 0 disables the limit
+RATE_LIMIT = getattr(settings, "EMAIL_OUTBOX_RATE_LIMIT", 60)
+# claimed mails are picked up again when a worker stops before delivering them
+LEASE_SECONDS = 15 * 60
+BATCH_SIZE = 100
+
+
+class StoredMIMEMessage(MIMEMixin, Message):
+    """
+    Parsed outbox message that the mail backends can serialize
+    """
+
+
+class OutboxEmailMessage(EmailMessage):
+    """
+    EmailMessage wrapping an outbox row, the stored MIME message is sent as is
+    """
+
+    def __init__(self, outbox):
+        # the patched EmailMessage.__init__ is skipped, the row is already
+        # rendered with its sender and reply to addresses
+        self.outbox = outbox
+        self.subject = outbox.subject
+        self.body = outbox.body
+        self.from_email = outbox.from_email
+        self.to = list(outbox.recipients)
+        self.cc = []
+        self.bcc = []
+        self.reply_to = []
+        self.extra_headers = {}
+        self.attachments = []
+        self.connection = None
+        self.encoding = None
+
+    def message(self):
+        return message_from_bytes(bytes(self.outbox.message), _class=StoredMIMEMessage)
+
+
+class HostThrottle:
+    """
+    Spaces the deliveries to a mail host to stay below the rate limit
+    """
+
+    def __init__(self, per_minute):
+        self.interval = 60 / per_minute if per_minute else 0
+        self.last_sent = {}
+
+    def wait(self, host):
+        if not self.interval:
+            return
+        last_sent = self.last_sent.get(host)
+        if last_sent is not None:
+            delay = self.interval - (time.monotonic() - last_sent)
+            if delay > 0:
+                time.sleep(delay)
+        self.last_sent[host] = time.monotonic()
+
+
+_executor = None
+_throttle = HostThrottle(RATE_LIMIT)
+
+
+def get_executor():
+    """
+    Returns the single worker thread draining the outbox of this process
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email-outbox")
+    return _executor
+
+
+def _drain_job():
+    """
+    Worker thread entry point
+    """
+    try:
+        drain_outbox()
+    except Exception as e:
+        logger.error(f"Email outbox drain failed: {e}")
+    finally:
+        connection.close()
+
+
+def wake_outbox_worker():
+    """
+    Ask the worker thread to drain the outbox
+    """
+    get_executor().submit(_drain_job)
+
+
+def enqueue_email(email, configuration=None, context=None):
+    """
+    Render the mail into the outbox. The worker is woken once the surrounding
+    transaction commits.
+
+    Args:
+        email: EmailMessage to deliver
+        configuration: DynamicEmailConfiguration to send with, defaults to
+        the configuration of the current request
+        context: JSON serializable data handed to the `post_outbox_delivery`
+        receivers once the mail is delivered
+    """
+    if configuration is None:
+        configuration = DefaultHorillaMailBackend.get_dynamic_email_config()
+    outbox = EmailOutbox.objects.create(
+        configuration=configuration,
+        subject=str(email.subject)[:255],
+        body=email.body,
+        from_email=email.from_email or "",
+        recipients=email.recipients(),
+        message=email.message().as_bytes(),
+        context=context or {},
+    )
+    transaction.on_commit(wake_outbox_worker)
+    return outbox
+
+
+def retry_delay(attempts):
+    """
+    Returns the exponential backoff (in seconds) after the given attempts
+    """
+    return min(RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), RETRY_MAX_SECONDS)
+
+
+def claim_due_mails(limit=BATCH_SIZE):
+    """
+    Lease the due mails to this worker. Rows locked by another worker are
+    skipped.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            EmailOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status__in=["pending", "sending"], next_retry_at__lte=now)
+            .order_by("next_retry_at")
+            .values_list("id", flat=True)[:limit]
+        )
+        EmailOutbox.objects.filter(id__in=ids).update(
+            status="sending", next_retry_at=now + timedelta(seconds=LEASE_SECONDS)
+        )
+    return list(
+        EmailOutbox.objects.filter(id__in=ids)
+        .select_related("configuration")
+        .order_by("id")
+    )
+
+
+def mark_sent(outbox):
+    """
+    Record the delivery of the outbox row and notify the sender
+    """
+    outbox.attempts += 1
+    outbox.status = "sent"
+    outbox.sent_at = timezone.now()
+    outbox.last_error = ""
+    outbox.save(update_fields=["attempts", "status", "sent_at", "last_error"])
+    try:
+        post_outbox_delivery.send(sender=EmailOutbox, instance=outbox)
+    except Exception as e:
+        logger.error(f"Error in the delivery receivers of outbox {outbox.id}: {e}")
+
+
+def mark_failed(outbox, error):
+    """
+    Schedule the next attempt of the outbox row, or give up after
+    EMAIL_OUTBOX_MAX_ATTEMPTS attempts
+    """
+    outbox.attempts += 1
+    outbox.last_error = str(error)
+    if outbox.attempts >= MAX_ATTEMPTS:
+        outbox.status = "failed"
+        EmailLog.objects.create(
+            subject=outbox.subject,
+            from_email=outbox.from_email,
+            to=", ".join(outbox.recipients),
+            body=outbox.body,
+            status="failed",
+        )
+    else:
+        outbox.status = "pending"
+        outbox.next_retry_at = timezone.now() + timedelta(
+            seconds=retry_delay(outbox.attempts)
+        )
+    outbox.save(update_fields=["attempts", "last_error", "status", "next_retry_at"])
+
+
+def deliver(configuration, mails):
+    """
+    Deliver the mails of one configuration over a single connection
+
+    Returns:
+        tuple: (sent count, failed count)
+    """
+    backend = ConfiguredEmailBackend(configuration=configuration)
+    backend.fail_silently = False
+    host = getattr(backend, "host", None) or ""
+    sent = failed = 0
+    try:
+        backend.open()
+    except Exception as e:
+        logger.error(f"Could not connect to the mail server {host}: {e}")
+        for outbox in mails:
+            mark_failed(outbox, e)
+        return sent, len(mails)
+
+    try:
+        for index, outbox in enumerate(mails):
+            _throttle.wait(host)
+            try:
+                if not backend.send_messages([OutboxEmailMessage(outbox)]):
+                    raise RuntimeError("The mail backend did not send the message")
+            except Exception as e:
+                mark_failed(outbox, e)
+                failed += 1
+                # start over on a fresh connection, the server may have
+                # dropped the current one
+                backend.close()
+                try:
+                    backend.open()
+                except Exception as error:
+                    for pending in mails[index + 1 :]:
+                        mark_failed(pending, error)
+                    return sent, failed + len(mails) - index - 1
+                continue
+            mark_sent(outbox)
+            sent += 1
+    finally:
+        backend.close()
+    return sent, failed
+
+
+def drain_outbox(limit=BATCH_SIZE):
+    """
+    Deliver every due mail of the outbox, grouping them by configuration so
+    each mail server connection is opened once per batch
+
+    Returns:
+        tuple: (sent count, failed count)
+    """
+    sent = failed = 0
+    while True:
+        mails = claim_due_mails(limit)
+        groups = defaultdict(list)
+        for outbox in mails:
+            groups[outbox.configuration_id].append(outbox)
+        for group in groups.values():
+            group_sent, group_failed = deliver(group[0].configuration, group)
+            sent += group_sent
+            failed += group_failed
+        if len(mails) < limit:
+            return sent, failed
@@ -0,0 +1,410 @@
+"""
+rotation.py
+
+This module is used to apply the rotating shift / work type assignments and
+the approved shift / work type requests of a day with a few set based queries
+"""
+
+import calendar
+import logging
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.urls import reverse
+
+from horilla.methods import get_horilla_model_class
+from notifications.signals import notify
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+ROTATIONS = {
+    "shift": {
+        "assign_model": "rotatingshiftassign",
+        "rotation_model": "rotatingshift",
+        "rotation_field": "rotating_shift_id",
+        "current_field": "current_shift",
+        "next_field": "next_shift",
+        "work_info_field": "shift_id",
+        "sequence_fields": ("shift1", "shift2"),
+        "additional_key": "additional_shifts",
+        "index_key": "next_shift_index",
+        # empty additional shift entries are kept in the rotation
+        "keep_empty": True,
+        "single_active": True,
+        "notification": {
+            "verb": "Your shift has been changed.",
+            "verb_ar": "تم تغيير التحول الخاص بك.",
+            "verb_de": "Ihre Schicht wurde geändert.",
+            "verb_es": "Tu turno ha sido cambiado.",
+            "verb_fr": "Votre quart de travail a été modifié.",
+            "icon": "infinite",
+        },
+    },
+    "work_type": {
+        "assign_model": "rotatingworktypeassign",
+        "rotation_model": "rotatingworktype",
+        "rotation_field": "rotating_work_type_id",
+        "current_field": "current_work_type",
+        "next_field": "next_work_type",
+        "work_info_field": "work_type_id",
+        "sequence_fields": ("work_type1", "work_type2"),
+        "additional_key": "additional_work_types",
+        "index_key": "next_work_type_index",
+        "keep_empty": False,
+        "single_active": False,
+        "notification": {
+            "verb": "Your Work Type has been changed.",
+            "verb_ar": "لقد تغير نوع عملك.",
+            "verb_de": "Ihre Art der Arbeit hat sich geändert.",
+            "verb_es": "Su tipo de trabajo ha sido cambiado.",
+            "verb_fr": "Votre type de travail a été modifié.",
+            "icon": "infinite",
+        },
+    },
+}
+
+REQUESTS = {
+    "shift": {
+        "request_model": "shiftrequest",
+        "field": "shift_id",
+        "previous_field": "previous_shift_id",
+        "changed_field": "shift_changed",
+        "switch_notification": {
+            "verb": "Shift Changes notification",
+            "verb_ar": "التحول تغيير الإخطار",
+            "verb_de": "Benachrichtigung über Schichtänderungen",
+            "verb_es": "Notificación de cambios de turno",
+            "verb_fr": "Notification des changements de quart de travail",
+            "icon": "refresh",
+        },
+        "undo_notification": {
+            "verb": "Shift changes notification, Requested date expired.",
+            "verb_ar": "التحول يغير الإخطار ، التاريخ المطلوب انتهت صلاحيته.",
+            "verb_de": "Benachrichtigung über Schichtänderungen, gewünschtes Datum abgelaufen.",
+            "verb_es": "Notificación de cambios de turno, Fecha solicitada vencida.",
+            "verb_fr": "Notification de changement d'équipe, la date demandée a expiré.",
+            "icon": "refresh",
+        },
+    },
+    "work_type": {
+        "request_model": "worktyperequest",
+        "field": "work_type_id",
+        "previous_field": "previous_work_type_id",
+        "changed_field": "work_type_changed",
+        "switch_notification": {
+            "verb": "Work Type Changes notification",
+            "verb_ar": "إخطار تغييرات نوع العمل",
+            "verb_de": "Benachrichtigung über Änderungen des Arbeitstyps",
+            "verb_es": "Notificación de cambios de tipo de trabajo",
+            "verb_fr": "Notification de changement de type de travail",
+            "icon": "swap-horizontal",
+        },
+        "undo_notification": {
+            "verb": "Work type changes notification, Requested date expired.",
+            "verb_ar": "إعلام بتغيير نوع العمل ، انتهاء صلاحية التاريخ المطلوب.",
+            "verb_de": "Benachrichtigung über Änderungen des Arbeitstyps, angefordertes Datum abgelaufen.",
+            "verb_es": "Notificación de cambios de tipo de trabajo, fecha solicitada vencida.",
+            "verb_fr": "Notification de changement de type de travail, la date demandée a expiré.",
+            "icon": "swap-horizontal",
+        },
+    },
+}
+
+
+def add_month(day, day_of_month=None):
+    """
+    Returns the date one month after `day`, on the given day of the month
+    ("last" for the last day) clamped to the length of that month
+    """
+    year, month = (day.year + 1, 1) if day.month == 12 else (day.year, day.month + 1)
+    last_day = calendar.monthrange(year, month)[1]
+    if day_of_month == "last":
+        return date(year, month, last_day)
+    return date(year, month, min(int(day_of_month or day.day), last_day))
+
+
+def due_filter(today):
+    """
+    Q object matching the assignments that switch on the given day
+    """
+    return Q(is_active=True, next_change_date=today) & (
+        Q(based_on="after")
+        | Q(based_on="weekly", rotate_every_weekend=today.strftime("%A").lower())
+        | Q(based_on="monthly", rotate_every__in=[str(today.day), "last"])
+    )
+
+
+def next_change_date(assign, today):
+    """
+    Returns the switch date following today's switch of the assignment
+    """
+    if assign.based_on == "after":
+        return today + timedelta(days=assign.rotate_after_day or 0)
+    if assign.based_on == "weekly":
+        return today + timedelta(days=7)
+    return add_month(today, assign.rotate_every)
+
+
+def rotation_sequences(config, rotation_ids):
+    """
+    Returns {rotation id: [shift / work type ids in rotation order]}
+    """
+    Rotation = get_horilla_model_class(app_label="base", model=config["rotation_model"])
+    first, second = config["sequence_fields"]
+    sequences = {}
+    for rotation_id, first_id, second_id, additional_data in (
+        Rotation.objects.entire()
+        .filter(id__in=rotation_ids)
+        .values_list("id", f"{first}_id", f"{second}_id", "additional_data")
+    ):
+        additional = (additional_data or {}).get(config["additional_key"]) or []
+        additional = [int(item) if item else None for item in additional]
+        if not config["keep_empty"]:
+            additional = [item for item in additional if item]
+        sequences[rotation_id] = [first_id, second_id] + additional
+    return sequences
+
+
+def superseded_assigns(config, today):
+    """
+    Returns the ids of the active assignments that are superseded by a later
+    started active assignment of the same employee
+    """
+    Assign = get_horilla_model_class(app_label="base", model=config["assign_model"])
+    started = Assign.objects.entire().filter(is_active=True, start_date__lte=today)
+    employees = (
+        started.order_by()
+        .values("employee_id")
+        .annotate(assign_count=Count("id"))
+        .filter(assign_count__gt=1)
+        .values("employee_id")
+    )
+    kept = set()
+    superseded = []
+    for assign_id, employee_id in (
+        started.filter(employee_id__in=employees)
+        .order_by("employee_id", "-start_date", "-id")
+        .values_list("id", "employee_id")
+    ):
+        if employee_id in kept:
+            superseded.append(assign_id)
+        else:
+            kept.add(employee_id)
+    return superseded
+
+
+def plan_rotations(kind, today=None):
+    """
+    Compute the rotations of the day without changing anything
+
+    Args:
+        kind: "shift" or "work_type"
+        today: the day to rotate, defaults to today
+
+    Returns:
+        dict: {"deactivate": superseded assignment ids, "rotations": list of
+        dictionaries describing each switch}
+    """
+    config = ROTATIONS[kind]
+    today = today or date.today()
+    Assign = get_horilla_model_class(app_label="base", model=config["assign_model"])
+    EmployeeWorkInformation = get_horilla_model_class(
+        app_label="employee", model="employeeworkinformation"
+    )
+    work_info_field = config["work_info_field"]
+    next_field = config["next_field"]
+
+    deactivate = superseded_assigns(config, today) if config["single_active"] else []
+    assigns = (
+        Assign.objects.entire()
+        .filter(due_filter(today))
+        .exclude(id__in=deactivate)
+        .exclude(employee_id__isnull=True)
+    )
+    if config["single_active"]:
+        assigns = assigns.filter(start_date__lte=today)
+    assigns = list(assigns.order_by("id"))
+
+    sequences = rotation_sequences(
+        config,
+        {getattr(assign, f"{config['rotation_field']}_id") for assign in assigns},
+    )
+    current = dict(
+        EmployeeWorkInformation.objects.entire()
+        .filter(employee_id__in={assign.employee_id_id for assign in assigns})
+        .values_list("employee_id", f"{work_info_field}_id")
+    )
+
+    rotations = []
+    for assign in assigns:
+        sequence = sequences.get(getattr(assign, f"{config['rotation_field']}_id"))
+        if not sequence:
+            continue
+        index = (assign.additional_data or {}).get(config["index_key"]) or 0
+        if index >= len(sequence):
+            index = 0
+        rotations.append(
+            {
+                "assign": assign,
+                "employee_id": assign.employee_id_id,
+                "from": current.get(assign.employee_id_id),
+                "to": getattr(assign, f"{next_field}_id"),
+                "next": sequence[index],
+                "next_index": (index + 1) % len(sequence),
+                "next_change_date": next_change_date(assign, today),
+            }
+        )
+    return {"deactivate": deactivate, "rotations": rotations}
+
+
+def notify_employees(employee_ids, notification):
+    """
+    Send one notification to the users of the employees from the Horilla Bot
+    """
+    from django.contrib.auth.models import User
+
+    Employee = get_horilla_model_class(app_label="employee", model="employee")
+    bot = User.objects.filter(username="Horilla Bot").first()
+    if bot is None or not employee_ids:
+        return
+    recipients = list(
+        User.objects.filter(
+            id__in=Employee.objects.entire()
+            .filter(id__in=employee_ids)
+            .values("employee_user_id")
+        )
+    )
+    if recipients:
+        notify.send(
+            bot,
+            recipient=recipients,
+            redirect=reverse("employee-profile"),
+            **notification,
+        )
+
+
+def update_work_information(field, values):
+    """
+    Set the work information field of the employees, {employee id: value},
+    with bulk updates
+    """
+    EmployeeWorkInformation = get_horilla_model_class(
+        app_label="employee", model="employeeworkinformation"
+    )
+    work_infos = list(
+        EmployeeWorkInformation.objects.entire()
+        .filter(employee_id__in=values.keys())
+        .only("id", "employee_id", field)
+    )
+    for work_info in work_infos:
+        setattr(work_info, f"{field}_id", values[work_info.employee_id_id])
+    EmployeeWorkInformation.objects.bulk_update(
+        work_infos, [field], batch_size=BATCH_SIZE
+    )
+
+
+def apply_rotations(kind, today=None, dry_run=False):
+    """
+    Rotate the due assignments of the day in a single transaction and notify
+    the employees once it commits
+
+    Returns:
+        dict: the applied (or, when dry_run, planned) changes, see
+        `plan_rotations`
+    """
+    config = ROTATIONS[kind]
+    plan = plan_rotations(kind, today)
+    if dry_run:
+        return plan
+
+    Assign = get_horilla_model_class(app_label="base", model=config["assign_model"])
+    rotations = plan["rotations"]
+    assigns = []
+    for rotation in rotations:
+        assign = rotation["assign"]
+        assign.additional_data = assign.additional_data or {}
+        assign.additional_data[config["index_key"]] = rotation["next_index"]
+        setattr(assign, f"{config['current_field']}_id", rotation["to"])
+        setattr(assign, f"{config['next_field']}_id", rotation["next"])
+        assign.next_change_date = rotation["next_change_date"]
+        assigns.append(assign)
+
+    with transaction.atomic():
+        if plan["deactivate"]:
+            Assign.objects.entire().filter(id__in=plan["deactivate"]).update(
+                is_active=False
+            )
+        update_work_information(
+            config["work_info_field"],
+            {rotation["employee_id"]: rotation["to"] for rotation in rotations},
+        )
+        Assign.objects.bulk_update(
+            assigns,
+            [
+                config["current_field"],
+                config["next_field"],
+                "next_change_date",
+                "additional_data",
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        employee_ids = [rotation["employee_id"] for rotation in rotations]
+        transaction.on_commit(
+            lambda: notify_employees(employee_ids, config["notification"])
+        )
+    return plan
+
+
+def apply_requests(kind, undo=False, today=None, dry_run=False):
+    """
+    Switch the work information of the approved requests starting today, or
+    (undo) restore the previous value of the requests that expired
+
+    Returns:
+        list: {"request_id", "employee_id", "to"} dictionaries of the changes
+    """
+    config = REQUESTS[kind]
+    today = today or date.today()
+    Request = get_horilla_model_class(app_label="base", model=config["request_model"])
+    requests = Request.objects.entire().filter(
+        canceled=False, approved=True, employee_id__isnull=False
+    )
+    if undo:
+        requests = requests.filter(
+            requested_till__lt=today, is_active=True, **{config["changed_field"]: True}
+        )
+        value_field = config["previous_field"]
+    else:
+        requests = requests.filter(
+            requested_date=today, **{config["changed_field"]: False}
+        )
+        value_field = config["field"]
+
+    changes = [
+        {"request_id": request_id, "employee_id": employee_id, "to": value}
+        for request_id, employee_id, value in requests.order_by("id").values_list(
+            "id", "employee_id", value_field
+        )
+    ]
+    if dry_run or not changes:
+        return changes
+
+    with transaction.atomic():
+        # later requests of the same employee win, as when saved one by one
+        update_work_information(
+            config["field"], {change["employee_id"]: change["to"] for change in changes}
+        )
+        request_ids = [change["request_id"] for change in changes]
+        if undo:
+            Request.objects.entire().filter(id__in=request_ids).update(is_active=False)
+        else:
+            Request.objects.entire().filter(id__in=request_ids).update(
+                **{config["changed_field"]: True}
+            )
+        employee_ids = {change["employee_id"] for change in changes}
+        notification = config["undo_notification" if undo else "switch_notification"]
+        transaction.on_commit(lambda: notify_employees(employee_ids, notification))
+    return changes
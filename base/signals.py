@@ -7,13 +7,13 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.signals import user_login_failed
-from django.db.models import Max, Q
-from django.db.models.signals import m2m_changed, post_migrate, post_save
+from django.db.models import Max
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
 from django.http import Http404
 from django.shortcuts import redirect, render
 
-from base.models import Announcement, PenaltyAccounts
+from base.models import DynamicEmailConfiguration, PenaltyAccounts
 from horilla.methods import get_horilla_model_class
 
 
@@ -91,26 +91,6 @@ def clean_work_records(sender, **kwargs):
         )
 
 
-@receiver(m2m_changed, sender=Announcement.employees.through)
-def filtered_employees(sender, instance, action, **kwargs):
-    """
-    filtered employees
-    """
-    if action not in ["post_add", "post_remove", "post_clear"]:
-        return  # Only run after M2M changes
-    employee_ids = list(instance.employees.values_list("id", flat=True))
-    department_ids = list(instance.department.values_list("id", flat=True))
-    job_position_ids = list(instance.job_position.values_list("id", flat=True))
-
-    employees = instance.model_employee.objects.filter(
-        Q(id__in=employee_ids)
-        | Q(employee_work_info__department_id__in=department_ids)
-        | Q(employee_work_info__job_position_id__in=job_position_ids)
-    )
-
-    instance.filtered_employees.set(employees)
-
-
 # Logger setup
 logger = logging.getLogger("django.security")
 
@@ -240,3 +220,14 @@ class Fail2BanMiddleware:
 
 
 settings.MIDDLEWARE.append("base.signals.Fail2BanMiddleware")
+
+
+@receiver(post_save, sender=DynamicEmailConfiguration)
+@receiver(post_delete, sender=DynamicEmailConfiguration)
+def email_configuration_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached mail server configurations
+    """
+    from base.backends import invalidate_email_configurations
+
+    invalidate_email_configurations()
@@ -1,3 +1,199 @@
-from django.test import TestCase
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+from email import message_from_bytes
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.core.mail import EmailMessage
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from base.models import DynamicEmailConfiguration, EmailOutbox
+from base.outbox import HostThrottle, drain_outbox, enqueue_email
+from horilla import horilla_cache
+from horilla.horilla_cache import HorillaCache, get_cache_stats
+from horilla.signals import post_outbox_delivery
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:
+    Controller = None
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class CollectingHandler:
+    """
+    aiosmtpd handler keeping the received envelopes
+    """
+
+    def __init__(self):
+        self.envelopes = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        return "250 Message accepted for delivery"
+
+
+@skipUnless(Controller, "aiosmtpd is not installed")
+@mock.patch("base.outbox._throttle", HostThrottle(0))
+class EmailOutboxDeliveryTests(TestCase):
+    """
+    Tests of the outbox delivery against a local SMTP server
+    """
+
+    def setUp(self):
+        self.port = free_port()
+        self.configuration = DynamicEmailConfiguration(
+            host="127.0.0.1",
+            port=self.port,
+            from_email="hr@horilla.com",
+            username="",
+            password="",
+            display_name="HR",
+            use_tls=False,
+            is_primary=True,
+            timeout=5,
+        )
+        self.configuration.save()
+        self.handler = CollectingHandler()
+        self.server = Controller(self.handler, hostname="127.0.0.1", port=self.port)
+
+    def start_server(self):
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def enqueue(self, subject, **kwargs):
+        email = EmailMessage(
+            subject, "Body", "hr@horilla.com", ["employee@horilla.com"]
+        )
+        email.attach("payslip.pdf", b"%PDF-1.4\x00\xff", "application/pdf")
+        return enqueue_email(email, self.configuration, **kwargs)
+
+    def test_queued_mail_is_delivered_as_rendered(self):
+        self.enqueue("Payslip")
+        self.enqueue("Leave")
+        self.start_server()
+        self.assertEqual(drain_outbox(), (2, 0))
+
+        self.assertEqual(len(self.handler.envelopes), 2)
+        envelope = self.handler.envelopes[0]
+        self.assertEqual(envelope.rcpt_tos, ["employee@horilla.com"])
+        message = message_from_bytes(envelope.content)
+        self.assertEqual(message["Subject"], "Payslip")
+        [attachment] = [
+            part for part in message.walk() if part.get_filename() == "payslip.pdf"
+        ]
+        self.assertEqual(attachment.get_payload(decode=True), b"%PDF-1.4\x00\xff")
+        self.assertEqual(
+            set(EmailOutbox.objects.values_list("status", flat=True)), {"sent"}
+        )
+
+    def test_delivery_is_notified_only_once_sent(self):
+        receiver = mock.Mock()
+        post_outbox_delivery.connect(receiver, sender=EmailOutbox)
+        self.addCleanup(post_outbox_delivery.disconnect, receiver, sender=EmailOutbox)
+        outbox = self.enqueue("Payslip", context={"payslip_ids": [1]})
+
+        # the server is down, the mail is retried later
+        self.assertEqual(drain_outbox(), (0, 1))
+        outbox.refresh_from_db()
+        self.assertEqual((outbox.status, outbox.attempts), ("pending", 1))
+        receiver.assert_not_called()
+
+        self.start_server()
+        EmailOutbox.objects.update(next_retry_at=outbox.created_at)
+        self.assertEqual(drain_outbox(), (1, 0))
+        receiver.assert_called_once()
+        self.assertEqual(
+            receiver.call_args.kwargs["instance"].context, {"payslip_ids": [1]}
+        )
+
+
+FILE_CACHE_LOCATION = tempfile.mkdtemp()
+FILE_CACHES = {
+    "default": {
+        "BACKEND": "horilla.horilla_cache.FileBasedCache",
+        "LOCATION": FILE_CACHE_LOCATION,
+        "KEY_PREFIX": "horilla",
+    }
+}
+# another worker of the host, sharing the cache directory
+WORKER_SCRIPT = """
+import sys
+from horilla.horilla_cache import HorillaCache, flush_stats
+
+namespace = HorillaCache(sys.argv[1])
+for command in sys.argv[2:]:
+    if command == "bump":
+        namespace.bump()
+    elif command == "hit":
+        namespace.get("employee")
+    else:
+        print(namespace.get(command))
+flush_stats()
+"""
+
+
+@override_settings(CACHES=FILE_CACHES)
+class SharedCacheTests(SimpleTestCase):
+    """
+    Tests of the namespaced cache shared by two worker processes through the
+    file backend
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(FILE_CACHE_LOCATION, ignore_errors=True)
+
+    def setUp(self):
+        horilla_cache.flush_stats()
+        cache.clear()
+        self.namespace = HorillaCache("shared-tests")
+        self.addCleanup(horilla_cache.NAMESPACES.pop, "shared-tests", None)
+
+    def run_worker(self, *commands):
+        result = subprocess.run(
+            [sys.executable, "-c", WORKER_SCRIPT, "shared-tests", *commands],
+            cwd=settings.BASE_DIR,
+            env={
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": "horilla.settings",
+                "CACHE_BACKEND": "file",
+                "CACHE_LOCATION": FILE_CACHE_LOCATION,
+            },
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.split()
+
+    def test_file_backend_is_the_default(self):
+        self.assertEqual(settings.CACHE_BACKEND, "file")
+
+    def test_bump_reaches_the_other_worker(self):
+        self.namespace.set("employee", "features")
+        self.assertEqual(self.run_worker("employee"), ["features"])
+
+        self.run_worker("bump")
+        self.assertIsNone(self.namespace.get("employee"))
+
+    def test_counters_of_the_workers_are_added(self):
+        self.run_worker("hit", "hit")
+        self.namespace.get("employee")
+        stats = get_cache_stats()
+        [row] = [
+            row for row in stats["namespaces"] if row["namespace"] == "shared-tests"
+        ]
+        self.assertEqual(row["misses"], 3)
+        self.assertEqual(stats["backend"], "horilla.horilla_cache.FileBasedCache")
@@ -14,6 +14,7 @@ from employee.models import (
     Employee,
     EmployeeBankDetails,
     EmployeeNote,
+    EmployeeReportingHierarchy,
     EmployeeTag,
     EmployeeWorkInformation,
     Policy,
@@ -26,6 +27,7 @@ from employee.models import (
 admin.site.register(EmployeeBankDetails)
 admin.site.register([EmployeeNote, EmployeeTag, PolicyMultipleFile, Policy, BonusPoint])
 admin.site.register([DisciplinaryAction, Actiontype])
+admin.site.register(EmployeeReportingHierarchy)
 
 
 class EmployeeWorkInformationAdmin(SimpleHistoryAdmin):
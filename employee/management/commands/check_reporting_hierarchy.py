@@ -0,0 +1,62 @@
+"""
+Django management command to verify the reporting hierarchy closure table
+
+Usage:
+    python manage.py check_reporting_hierarchy [--fix]
+
+This command compares `EmployeeReportingHierarchy` against the reporting
+managers of the employee work information and optionally rebuilds it.
+"""
+
+from django.core.management.base import BaseCommand
+
+from employee.methods.hierarchy import (
+    check_reporting_hierarchy,
+    rebuild_reporting_hierarchy,
+)
+
+
+class Command(BaseCommand):
+    help = "Check the reporting hierarchy closure table for inconsistencies"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rebuild the closure table when inconsistencies are found",
+        )
+        parser.add_argument(
+            "--verbose-rows",
+            action="store_true",
+            help="List every missing and stale row",
+        )
+
+    def handle(self, *args, **options):
+        missing, stale = check_reporting_hierarchy()
+
+        if options.get("verbose_rows"):
+            for (ancestor_id, descendant_id), depth in missing.items():
+                self.stdout.write(
+                    f"Missing: manager {ancestor_id} > employee {descendant_id} "
+                    f"(depth {depth})"
+                )
+            for (ancestor_id, descendant_id), depth in stale.items():
+                self.stdout.write(
+                    f"Stale: manager {ancestor_id} > employee {descendant_id} "
+                    f"(depth {depth})"
+                )
+
+        if not missing and not stale:
+            self.stdout.write(self.style.SUCCESS("Reporting hierarchy is consistent"))
+            return
+
+        self.stdout.write(
+            self.style.WARNING(
+                f"Found {len(missing)} missing and {len(stale)} stale hierarchy rows"
+            )
+        )
+        if options.get("fix"):
+            total = rebuild_reporting_hierarchy()
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt reporting hierarchy: {total} rows")
+            )
@@ -0,0 +1,34 @@
+"""
+Django management command to reconcile the recorded employee avatars
+
+Usage:
+    python manage.py reconcile_avatars [--batch-size N]
+
+Avatars are rendered from what was recorded when the profile image was saved.
+This command marks the profile images that went missing from the storage and
+records the ones saved before avatars were tracked.
+"""
+
+from django.core.management.base import BaseCommand
+
+from employee.methods.avatars import reconcile_avatars
+
+
+class Command(BaseCommand):
+    help = "Reconcile the recorded employee avatars with the media storage"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of employees updated per query",
+        )
+
+    def handle(self, *args, **options):
+        missing, recorded = reconcile_avatars(batch_size=options["batch_size"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Marked {missing} missing and recorded {recorded} avatars"
+            )
+        )
@@ -0,0 +1,170 @@
+"""
+avatars.py
+
+This module is used to record the existence, dimensions and thumbnail of the
+employee profile images when they are uploaded, so that rendering an avatar
+never makes a storage call
+"""
+
+import hashlib
+import logging
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZE = (256, 256)
+THUMBNAIL_DIR = "employee/avatars"
+AVATAR_FIELDS = ["avatar_exists", "avatar_width", "avatar_height", "avatar_thumbnail"]
+
+
+def thumbnail_name(digest, extension, size=THUMBNAIL_SIZE):
+    """
+    Returns the storage name of the thumbnail of an image by its content hash,
+    the same image always maps to the same thumbnail
+    """
+    return f"{THUMBNAIL_DIR}/{digest[:2]}/{digest}_{size[0]}x{size[1]}.{extension}"
+
+
+def make_thumbnail(content, size=THUMBNAIL_SIZE):
+    """
+    Generate the thumbnail of an image once, an existing thumbnail of the same
+    content is reused
+
+    Args:
+        content: bytes of the image
+
+    Returns:
+        tuple: (width, height, thumbnail name) of the image
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    with Image.open(BytesIO(content)) as image:
+        image = ImageOps.exif_transpose(image)
+        width, height = image.size
+        transparent = image.mode in ("RGBA", "LA", "P")
+        extension = "png" if transparent else "jpg"
+        name = thumbnail_name(digest, extension, size)
+        if not default_storage.exists(name):
+            thumbnail = ImageOps.fit(
+                image.convert("RGBA" if transparent else "RGB"), size
+            )
+            buffer = BytesIO()
+            if transparent:
+                thumbnail.save(buffer, "PNG", optimize=True)
+            else:
+                thumbnail.save(buffer, "JPEG", quality=85, optimize=True)
+            name = default_storage.save(name, ContentFile(buffer.getvalue()))
+    return width, height, name
+
+
+def clear_avatar(employee):
+    """
+    Reset the recorded avatar of the employee and delete its thumbnail when no
+    other employee shares it
+    """
+    thumbnail = employee.avatar_thumbnail
+    employee.avatar_exists = False
+    employee.avatar_width = None
+    employee.avatar_height = None
+    employee.avatar_thumbnail = ""
+    if (
+        thumbnail
+        and not type(employee)
+        .objects.entire()
+        .filter(avatar_thumbnail=thumbnail)
+        .exclude(pk=employee.pk)
+        .exists()
+    ):
+        default_storage.delete(thumbnail)
+
+
+def record_avatar(employee):
+    """
+    Record the existence, dimensions and thumbnail of the profile image of the
+    employee. Images Pillow can not open (SVG) are served as they are.
+
+    Returns:
+        bool: whether the profile image could be read
+    """
+    profile = employee.employee_profile
+    try:
+        profile.seek(0)
+        content = profile.read()
+        profile.seek(0)
+    except (OSError, ValueError) as error:
+        logger.warning("profile image %s can not be read: %s", profile.name, error)
+        clear_avatar(employee)
+        return False
+
+    width = height = None
+    thumbnail = ""
+    try:
+        width, height, thumbnail = make_thumbnail(content)
+    except (OSError, Image.DecompressionBombError) as error:
+        if not isinstance(error, UnidentifiedImageError):
+            logger.warning("no thumbnail for %s: %s", profile.name, error)
+    employee.avatar_exists = True
+    employee.avatar_width = width
+    employee.avatar_height = height
+    employee.avatar_thumbnail = thumbnail
+    return True
+
+
+def avatar_url(employee):
+    """
+    Returns the url of the recorded avatar of the employee, None when there is
+    no profile image. Only the recorded fields are read.
+    """
+    if not employee.employee_profile or not employee.avatar_exists:
+        return None
+    if employee.avatar_thumbnail:
+        return default_storage.url(employee.avatar_thumbnail)
+    return employee.employee_profile.url
+
+
+def reconcile_avatars(batch_size=500):
+    """
+    Compare the recorded avatars with the storage. Profile images that went
+    missing are marked as such, images recorded before they were tracked (or
+    that came back) and missing thumbnails are recorded again.
+
+    Returns:
+        tuple: (number of avatars marked missing, number of avatars recorded)
+    """
+    from employee.models import Employee
+
+    employees = (
+        Employee.objects.entire()
+        .exclude(employee_profile="")
+        .exclude(employee_profile__isnull=True)
+        .only("id", "employee_profile", *AVATAR_FIELDS)
+        .order_by("id")
+    )
+    missing = recorded = 0
+    changed = []
+    for employee in employees.iterator(chunk_size=batch_size):
+        exists = default_storage.exists(employee.employee_profile.name)
+        if not exists:
+            if not employee.avatar_exists and not employee.avatar_thumbnail:
+                continue
+            clear_avatar(employee)
+            missing += 1
+        elif employee.avatar_exists and (
+            # images without a thumbnail are served as they are
+            default_storage.exists(employee.avatar_thumbnail)
+            if employee.avatar_thumbnail
+            else employee.avatar_width is None
+        ):
+            continue
+        elif record_avatar(employee):
+            recorded += 1
+        changed.append(employee)
+        if len(changed) >= batch_size:
+            Employee.objects.bulk_update(changed, AVATAR_FIELDS)
+            changed = []
+    if changed:
+        Employee.objects.bulk_update(changed, AVATAR_FIELDS)
+    return missing, recorded
@@ -0,0 +1,278 @@
+"""
+disciplinary.py
+
+This module is used to compute the login block windows of the disciplinary
+actions and to apply the block / unblock transitions that became due
+"""
+
+import logging
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from base.models import EmployeeShiftSchedule
+from employee.models import DisciplinaryAction
+
+logger = logging.getLogger(__name__)
+
+WINDOW_FIELDS = ["block_date", "unblock_date", "block_at", "unblock_at"]
+
+
+def parse_hours(hours):
+    """
+    Returns the timedelta of a "HH:MM" duration, None when it is empty
+    """
+    try:
+        hour, minute = (int(part) for part in str(hours).split(":")[:2])
+    except (TypeError, ValueError):
+        return None
+    duration = timedelta(hours=hour, minutes=minute)
+    return duration if duration > timedelta() else None
+
+
+def shift_start_time(action):
+    """
+    Returns the earliest shift start time of the action's employees on the
+    weekday of the action start date
+    """
+    weekday = action.start_date.strftime("%A").lower()
+    return (
+        EmployeeShiftSchedule.objects.entire()
+        .filter(
+            day__day=weekday,
+            shift_id__employeeworkinformation__employee_id__in=action.employee_id.all(),
+            start_time__isnull=False,
+        )
+        .order_by("start_time")
+        .values_list("start_time", flat=True)
+        .first()
+    ) or time.min
+
+
+def compute_block_window(action):
+    """
+    Returns {field: value} of the block window of the action. Day based
+    actions block on dates, hour based ones from the shift start of the start
+    date for the given number of hours. Dismissals are never unblocked.
+    """
+    window = dict.fromkeys(WINDOW_FIELDS)
+    action_type = action.action.action_type if action.action_id else None
+    if action.start_date is None:
+        return window
+
+    if action_type == "dismissal":
+        window["block_date"] = action.start_date
+        return window
+    if not action.action.block_option:
+        return window
+
+    duration = parse_hours(action.hours) if action.unit_in == "hours" else None
+    if duration is not None:
+        block_at = timezone.make_aware(
+            datetime.combine(action.start_date, shift_start_time(action))
+        )
+        window["block_at"] = block_at
+        window["unblock_at"] = block_at + duration
+    elif action_type == "suspension" and action.days:
+        window["block_date"] = action.start_date
+        window["unblock_date"] = action.start_date + timedelta(days=action.days)
+    return window
+
+
+def stored_window(action):
+    """
+    Returns {field: value} of the block window stored on the action
+    """
+    return {field: getattr(action, field) for field in WINDOW_FIELDS}
+
+
+def refresh_block_window(action):
+    """
+    Store the block window of the action when it changed
+
+    Returns:
+        dict: the previous window of the action
+    """
+    previous = stored_window(action)
+    window = compute_block_window(action)
+    if window != previous:
+        DisciplinaryAction.objects.entire().filter(id=action.id).update(**window)
+        for field, value in window.items():
+            setattr(action, field, value)
+    return previous
+
+
+def window_contains(window, now):
+    """
+    Returns True when the block window ({field: value}) contains `now`, the
+    same test as blocking_filter() for one window
+    """
+    today = timezone.localdate(now)
+    block_date, unblock_date = window["block_date"], window["unblock_date"]
+    block_at, unblock_at = window["block_at"], window["unblock_at"]
+    if block_date is not None and block_date <= today:
+        if unblock_date is not None:
+            if unblock_date > today:
+                return True
+        elif block_at is None:
+            return True
+    return bool(block_at and unblock_at and block_at <= now < unblock_at)
+
+
+def action_user_ids(action, employee_ids=None):
+    """
+    Returns the user ids of the action's employees, restricted to the given
+    employees
+    """
+    employees = action.employee_id.all()
+    if employee_ids is not None:
+        employees = employees.filter(id__in=employee_ids)
+    return list(
+        employees.filter(employee_user_id__isnull=False).values_list(
+            "employee_user_id", flat=True
+        )
+    )
+
+
+def release_users(user_ids, now=None):
+    """
+    Unblock the given users unless another action still blocks them, e.g.
+    after the action blocking them was shortened, deleted or no longer
+    applies to them
+
+    Returns:
+        set: the unblocked user ids
+    """
+    now = now or timezone.now()
+    to_unblock = set(user_ids) - set(
+        DisciplinaryAction.objects.entire()
+        .filter(blocking_filter(now))
+        .filter(employee_id__employee_user_id__in=user_ids)
+        .values_list("employee_id__employee_user_id", flat=True)
+    )
+    if to_unblock:
+        User.objects.filter(id__in=to_unblock).update(is_active=True)
+    return to_unblock
+
+
+def block_if_active(action):
+    """
+    Block the employees of the action right away when its window already
+    started, e.g. for actions recorded after their start
+    """
+    now = timezone.now()
+    blocking = (
+        DisciplinaryAction.objects.entire()
+        .filter(id=action.id)
+        .filter(blocking_filter(now))
+        .exists()
+    )
+    if blocking:
+        User.objects.filter(
+            id__in=action.employee_id.values("employee_user_id")
+        ).update(is_active=False)
+
+
+def blocking_filter(now):
+    """
+    Q object matching the actions whose block window contains `now`
+    """
+    today = timezone.localdate(now)
+    return (
+        Q(block_date__lte=today, unblock_date__gt=today)
+        | Q(block_date__lte=today, block_at__isnull=True, unblock_date__isnull=True)
+        | Q(block_at__lte=now, unblock_at__gt=now)
+    )
+
+
+def reconcile_blocks(now):
+    """
+    Bring every login in line with the current windows: the users of the
+    active windows are blocked and the users of ended windows that no action
+    blocks any more are unblocked. Used when the transitions since the
+    previous run are unknown.
+
+    Returns:
+        tuple: (blocked user ids, unblocked user ids)
+    """
+    actions = DisciplinaryAction.objects.entire().filter(
+        employee_id__employee_user_id__isnull=False
+    )
+    user_field = "employee_id__employee_user_id"
+    to_block = set(
+        actions.filter(blocking_filter(now)).values_list(user_field, flat=True)
+    )
+    ended = set(
+        actions.filter(
+            Q(unblock_date__lte=timezone.localdate(now)) | Q(unblock_at__lte=now)
+        ).values_list(user_field, flat=True)
+    )
+    to_unblock = ended - to_block
+
+    with transaction.atomic():
+        if to_block:
+            User.objects.filter(id__in=to_block).update(is_active=False)
+        if to_unblock:
+            User.objects.filter(id__in=to_unblock, is_active=False).update(
+                is_active=True
+            )
+    return to_block, to_unblock
+
+
+def due_transitions(since, now):
+    """
+    Returns [(instant, user id, is_active)] of the block / unblock transitions
+    in (since, now], ordered by instant
+    """
+    since_date, today = timezone.localdate(since), timezone.localdate(now)
+    actions = DisciplinaryAction.objects.entire()
+    transitions = []
+    directions = [
+        ("block_date", "block_at", False),
+        ("unblock_date", "unblock_at", True),
+    ]
+    for date_field, datetime_field, is_active in directions:
+        due = actions.filter(
+            Q(**{f"{date_field}__gt": since_date, f"{date_field}__lte": today})
+            | Q(**{f"{datetime_field}__gt": since, f"{datetime_field}__lte": now})
+        ).filter(employee_id__employee_user_id__isnull=False)
+        for day, instant, user_id in due.values_list(
+            date_field, datetime_field, "employee_id__employee_user_id"
+        ):
+            instant = instant or timezone.make_aware(datetime.combine(day, time.min))
+            transitions.append((instant, user_id, is_active))
+    return sorted(transitions, key=lambda transition: transition[0])
+
+
+def apply_due_transitions(since, now):
+    """
+    Block / unblock the users of the transitions in (since, now] with one
+    update per direction. The latest transition of a user wins, and users
+    that are still inside another block window are not unblocked.
+
+    Returns:
+        tuple: (blocked user ids, unblocked user ids)
+    """
+    state = {}
+    for _instant, user_id, is_active in due_transitions(since, now):
+        state[user_id] = is_active
+
+    to_block = {user_id for user_id, is_active in state.items() if not is_active}
+    to_unblock = {user_id for user_id, is_active in state.items() if is_active}
+    if to_unblock:
+        to_unblock -= set(
+            DisciplinaryAction.objects.entire()
+            .filter(blocking_filter(now))
+            .filter(employee_id__employee_user_id__in=to_unblock)
+            .values_list("employee_id__employee_user_id", flat=True)
+        )
+
+    with transaction.atomic():
+        if to_block:
+            User.objects.filter(id__in=to_block).update(is_active=False)
+        if to_unblock:
+            User.objects.filter(id__in=to_unblock).update(is_active=True)
+    return to_block, to_unblock
@@ -0,0 +1,254 @@
+"""
+hierarchy.py
+
+This module is used to maintain and read the reporting hierarchy closure table
+(`EmployeeReportingHierarchy`)
+"""
+
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F, Q
+
+from employee.models import (
+    Employee,
+    EmployeeReportingHierarchy,
+    EmployeeWorkInformation,
+)
+
+logger = logging.getLogger(__name__)
+
+# above this many changed employees the whole table is rebuilt instead of
+# moving the sub trees one by one
+REBUILD_THRESHOLD = 500
+
+
+def get_reporting_manager_map():
+    """
+    Returns {employee id: reporting manager id} for every work information row
+    that has a reporting manager
+    """
+    return dict(
+        EmployeeWorkInformation.objects.entire()
+        .filter(employee_id__isnull=False, reporting_manager_id__isnull=False)
+        .exclude(employee_id=F("reporting_manager_id"))
+        .values_list("employee_id", "reporting_manager_id")
+    )
+
+
+def build_closure_rows(manager_map):
+    """
+    Compute the (ancestor, descendant, depth) rows of the given
+    {employee: manager} map. Cycles are cut at the point they repeat.
+    """
+    rows = {}
+    for employee_id in manager_map:
+        visited = {employee_id}
+        manager_id = manager_map.get(employee_id)
+        depth = 1
+        while manager_id is not None and manager_id not in visited:
+            rows[(manager_id, employee_id)] = depth
+            visited.add(manager_id)
+            manager_id = manager_map.get(manager_id)
+            depth += 1
+    return rows
+
+
+def rebuild_reporting_hierarchy(batch_size=5000):
+    """
+    Regenerate the whole closure table from the work information rows
+    """
+    rows = build_closure_rows(get_reporting_manager_map())
+    with transaction.atomic():
+        EmployeeReportingHierarchy.objects.all().delete()
+        EmployeeReportingHierarchy.objects.bulk_create(
+            [
+                EmployeeReportingHierarchy(
+                    ancestor_id=ancestor_id, descendant_id=descendant_id, depth=depth
+                )
+                for (ancestor_id, descendant_id), depth in rows.items()
+            ],
+            batch_size=batch_size,
+        )
+    return len(rows)
+
+
+def check_reporting_hierarchy():
+    """
+    Compare the stored closure rows against the work information rows
+
+    Returns:
+        tuple: (missing rows, stale rows) as {(ancestor, descendant): depth}
+    """
+    expected = build_closure_rows(get_reporting_manager_map())
+    stored_rows = EmployeeReportingHierarchy.objects.values_list(
+        "ancestor_id", "descendant_id", "depth"
+    )
+    stored = {
+        (ancestor_id, descendant_id): depth
+        for ancestor_id, descendant_id, depth in stored_rows
+    }
+    missing = {
+        key: depth for key, depth in expected.items() if stored.get(key) != depth
+    }
+    stale = {key: depth for key, depth in stored.items() if expected.get(key) != depth}
+    return missing, stale
+
+
+def move_employee(employee_id, manager_id):
+    """
+    Re-attach the sub tree rooted at the employee below a new reporting
+    manager (or detach it when manager_id is None)
+    """
+    with transaction.atomic():
+        subtree = dict(
+            EmployeeReportingHierarchy.objects.filter(
+                ancestor_id=employee_id
+            ).values_list("descendant_id", "depth")
+        )
+        subtree[employee_id] = 0
+
+        if manager_id is not None and manager_id in subtree:
+            logger.warning(
+                f"Reporting manager {manager_id} of employee {employee_id} "
+                "creates a cycle, hierarchy left unchanged"
+            )
+            return
+
+        EmployeeReportingHierarchy.objects.filter(
+            descendant_id__in=subtree.keys()
+        ).exclude(ancestor_id__in=subtree.keys()).delete()
+
+        if manager_id is None:
+            return
+
+        ancestors = dict(
+            EmployeeReportingHierarchy.objects.filter(
+                descendant_id=manager_id
+            ).values_list("ancestor_id", "depth")
+        )
+        ancestors[manager_id] = 0
+        EmployeeReportingHierarchy.objects.bulk_create(
+            [
+                EmployeeReportingHierarchy(
+                    ancestor_id=ancestor_id,
+                    descendant_id=descendant_id,
+                    depth=ancestor_depth + 1 + descendant_depth,
+                )
+                for ancestor_id, ancestor_depth in ancestors.items()
+                for descendant_id, descendant_depth in subtree.items()
+            ],
+            batch_size=5000,
+        )
+
+
+def sync_employee_hierarchy(employee_id, manager_id):
+    """
+    Apply a reporting manager change only when it differs from the stored
+    direct manager
+    """
+    current = (
+        EmployeeReportingHierarchy.objects.filter(descendant_id=employee_id, depth=1)
+        .values_list("ancestor_id", flat=True)
+        .first()
+    )
+    if manager_id == employee_id:
+        manager_id = None
+    if current != manager_id:
+        move_employee(employee_id, manager_id)
+
+
+def sync_hierarchy_for(work_infos):
+    """
+    Sync the hierarchy of work information rows written without signals
+    (bulk_create)
+    """
+    pairs = [
+        (work_info.employee_id_id, work_info.reporting_manager_id_id)
+        for work_info in work_infos
+        if work_info.employee_id_id
+    ]
+    if len(pairs) > REBUILD_THRESHOLD:
+        rebuild_reporting_hierarchy()
+        return
+    for employee_id, manager_id in pairs:
+        sync_employee_hierarchy(employee_id, manager_id)
+
+
+def get_subordinate_ids(manager_id, nested=True):
+    """
+    Returns the ids of the employees reporting to the manager, directly or
+    (when nested) at any level, with a single query
+    """
+    relations = EmployeeReportingHierarchy.objects.filter(ancestor_id=manager_id)
+    if not nested:
+        relations = relations.filter(depth=1)
+    return list(relations.values_list("descendant_id", flat=True))
+
+
+def subordinate_filter(manager_id, field="", nested=True):
+    """
+    Returns a Q object matching the manager's subordinates through the given
+    employee field, usable as a sub query filter
+    """
+    relations = EmployeeReportingHierarchy.objects.filter(ancestor_id=manager_id)
+    if not nested:
+        relations = relations.filter(depth=1)
+    lookup = f"{field}__id__in" if field else "id__in"
+    return Q(**{lookup: relations.values("descendant_id")})
+
+
+def get_chain_of_command(employee_id):
+    """
+    Returns the employee's managers ordered from the direct reporting manager
+    up to the top of the hierarchy
+    """
+    ancestors = dict(
+        EmployeeReportingHierarchy.objects.filter(
+            descendant_id=employee_id
+        ).values_list("ancestor_id", "depth")
+    )
+    managers = Employee.objects.entire().filter(id__in=ancestors.keys())
+    return sorted(managers, key=lambda manager: ancestors[manager.id])
+
+
+def get_hierarchy_tree(root, node_builder, active_only=True):
+    """
+    Build the nested org-chart tree below the root employee from one closure
+    query and one employee query.
+
+    Args:
+        root: Employee at the top of the tree
+        node_builder: callable(employee, children) returning the node dict
+        active_only: skip inactive employees (and their sub trees)
+
+    Returns:
+        list: child nodes of the root
+    """
+    descendant_ids = EmployeeReportingHierarchy.objects.filter(
+        ancestor_id=root.id
+    ).values("descendant_id")
+    employees = Employee.objects.filter(id__in=descendant_ids)
+    if active_only:
+        employees = employees.filter(is_active=True)
+    employees = employees.select_related(
+        "employee_work_info", "employee_work_info__job_position_id"
+    )
+
+    children = defaultdict(list)
+    for employee in employees:
+        manager_id = getattr(
+            getattr(employee, "employee_work_info", None),
+            "reporting_manager_id_id",
+            None,
+        )
+        children[manager_id].append(employee)
+
+    def build(manager_id):
+        return [
+            node_builder(employee, build(employee.id))
+            for employee in children.get(manager_id, [])
+        ]
+
+    return build(root.id)
@@ -0,0 +1,230 @@
+"""
+import_contracts.py
+
+This module is used to generate the payroll contracts of imported employees in
+the background. The pending `EmployeeImportContract` rows of an import job are
+the durable queue: they are stored in the transaction of the work information,
+processed in bounded batches once it commits, and picked up again by the
+scheduler when the worker stopped before finishing them.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from employee.models import EmployeeImportContract
+from horilla.methods import get_horilla_model_class
+
+logger = logging.getLogger(__name__)
+
+CONTRACT_BATCH_SIZE = 200
+MAX_ATTEMPTS = 3
+# pending rows untouched for this long belong to a worker that stopped
+STALE_AFTER = timedelta(minutes=5)
+# an employee has at most one contract of each of these statuses
+BLOCKING_STATUSES = ["active", "draft"]
+
+_running_jobs = set()
+_running_lock = threading.Lock()
+
+
+def enqueue_import_contracts(job, employee_ids):
+    """
+    Queue the contract generation of the employees of an import job. Called
+    in the transaction storing their work information, the worker starts
+    once it commits. Employees already queued for the job are ignored.
+    """
+    if not apps.is_installed("payroll"):
+        return
+    EmployeeImportContract.objects.bulk_create(
+        [
+            EmployeeImportContract(job=job, employee_id_id=employee_id)
+            for employee_id in employee_ids
+        ],
+        batch_size=CONTRACT_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+    transaction.on_commit(lambda: start_import_contracts(job.id))
+
+
+def start_import_contracts(job_id):
+    """
+    Run the contract generation of the job in a background thread
+    """
+    thread = threading.Thread(target=run_import_contracts, args=(job_id,))
+    thread.start()
+
+
+def run_import_contracts(job_id):
+    """
+    Process the pending contracts of the job batch by batch. A job is run by
+    a single thread of the process at a time.
+    """
+    with _running_lock:
+        if job_id in _running_jobs:
+            return
+        _running_jobs.add(job_id)
+    try:
+        while process_contract_batch(job_id):
+            pass
+    except Exception:
+        logger.exception("contract generation of import %s stopped", job_id)
+    finally:
+        with _running_lock:
+            _running_jobs.discard(job_id)
+        connection.close()
+
+
+def resume_stale_imports():
+    """
+    Run the contract generation of the import jobs with pending rows nobody
+    touched recently (worker killed by a restart or a crash)
+    """
+    if not apps.is_installed("payroll"):
+        return
+    job_ids = (
+        EmployeeImportContract.objects.filter(
+            status="pending", updated_at__lt=timezone.now() - STALE_AFTER
+        )
+        .order_by()
+        .values_list("job_id", flat=True)
+        .distinct()
+    )
+    for job_id in list(job_ids):
+        run_import_contracts(job_id)
+
+
+def process_contract_batch(job_id, batch_size=CONTRACT_BATCH_SIZE):
+    """
+    Generate the contracts of the next pending rows of the job. When the
+    batch fails its rows are retried one by one, so that a failing employee
+    does not hold back the others.
+
+    Returns:
+        int: number of processed rows, 0 once nothing is left to process
+    """
+    outcome_ids = list(
+        EmployeeImportContract.objects.filter(job_id=job_id, status="pending")
+        .order_by("id")
+        .values_list("id", flat=True)[:batch_size]
+    )
+    if not outcome_ids:
+        return 0
+    try:
+        with transaction.atomic():
+            return generate_contracts(outcome_ids)
+    except Exception as error:
+        logger.warning(
+            "contract batch of import %s failed, retrying one by one: %s",
+            job_id,
+            error,
+        )
+    processed = 0
+    for outcome_id in outcome_ids:
+        try:
+            with transaction.atomic():
+                processed += generate_contracts([outcome_id])
+        except Exception as error:
+            processed += record_failure(outcome_id, error)
+    return processed
+
+
+def generate_contracts(outcome_ids):
+    """
+    Create the draft contracts of the pending rows and store their outcomes,
+    in the transaction of the caller. Rows locked by another worker are left
+    to it, employees that already have a contract are skipped, which makes
+    retries safe.
+
+    Returns:
+        int: number of processed rows
+    """
+    Contract = get_horilla_model_class("payroll", "contract")
+    outcomes = list(
+        EmployeeImportContract.objects.select_for_update(skip_locked=True, of=("self",))
+        .filter(id__in=outcome_ids, status="pending")
+        .select_related("employee_id__employee_work_info")
+    )
+    existing = defaultdict(list)
+    for employee_id, status, start_date, end_date in (
+        Contract.objects.entire()
+        .filter(employee_id__in=[outcome.employee_id_id for outcome in outcomes])
+        .values_list(
+            "employee_id", "contract_status", "contract_start_date", "contract_end_date"
+        )
+    ):
+        existing[employee_id].append((status, start_date, end_date))
+
+    today = date.today()
+    now = timezone.now()
+    contracts = []
+    for outcome in outcomes:
+        employee = outcome.employee_id
+        work_info = getattr(employee, "employee_work_info", None)
+        start_date = getattr(work_info, "date_joining", None) or today
+        outcome.attempts += 1
+        outcome.updated_at = now
+        outcome.status = "skipped"
+        blocking = next(
+            (
+                status
+                for status, contract_start, contract_end in existing[employee.pk]
+                if status in BLOCKING_STATUSES
+                or (contract_start == start_date and contract_end is None)
+            ),
+            None,
+        )
+        if blocking:
+            outcome.message = _("The employee already has a {} contract.").format(
+                blocking
+            )
+        elif work_info is None:
+            outcome.message = _("The employee has no work information.")
+        else:
+            outcome.status = "created"
+            outcome.message = ""
+            contracts.append(
+                Contract(
+                    contract_name=f"{employee}'s Contract",
+                    employee_id=employee,
+                    contract_start_date=start_date,
+                    department_id=work_info.department_id_id,
+                    job_position_id=work_info.job_position_id_id,
+                    job_role_id=work_info.job_role_id_id,
+                    shift_id=work_info.shift_id_id,
+                    work_type_id=work_info.work_type_id_id,
+                    wage=work_info.basic_salary or 0,
+                )
+            )
+    Contract.objects.bulk_create(contracts)
+    EmployeeImportContract.objects.bulk_update(
+        outcomes, ["status", "message", "attempts", "updated_at"]
+    )
+    return len(outcomes)
+
+
+def record_failure(outcome_id, error):
+    """
+    Count a failed attempt of a row, the row fails for good after
+    MAX_ATTEMPTS attempts
+
+    Returns:
+        int: 1 when the row was updated
+    """
+    outcome = EmployeeImportContract.objects.filter(
+        id=outcome_id, status="pending"
+    ).first()
+    if outcome is None:
+        return 0
+    outcome.attempts += 1
+    outcome.message = str(error)
+    if outcome.attempts >= MAX_ATTEMPTS:
+        outcome.status = "failed"
+    outcome.save(update_fields=["attempts", "message", "status", "updated_at"])
+    return 1
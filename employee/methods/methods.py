@@ -4,14 +4,15 @@ employee/methods.py
 
 import logging
 import re
-import threading
+from collections import defaultdict
 from datetime import date, datetime
+from functools import cached_property
 from itertools import chain, groupby
 
 import pandas as pd
-from django.apps import apps
 from django.contrib.auth.models import User
 from django.db import connection, models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from base.context_processors import get_initial_prefix
@@ -24,7 +25,10 @@ from base.models import (
     JobRole,
     WorkType,
 )
-from employee.models import Employee, EmployeeWorkInformation
+from employee.methods.hierarchy import sync_hierarchy_for
+from employee.methods.import_contracts import enqueue_import_contracts
+from employee.methods.passwords import hash_passwords
+from employee.models import Employee, EmployeeImportJob, EmployeeWorkInformation
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +68,7 @@ error_data_template = {
         "Salary Hour Error",
         "User ID Error",
         "Company Error",
+        "Reporting Manager Error",
     ]
 }
 
@@ -255,17 +260,31 @@ def process_employee_records(data_frame):
     email_regex = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
     phone_regex = re.compile(r"^\+?\d{10,15}$")
     allowed_genders = frozenset(choice[0] for choice in Employee.choice_gender)
-    existing_badge_ids = frozenset(Employee.objects.values_list("badge_id", flat=True))
-    existing_usernames = frozenset(User.objects.values_list("username", flat=True))
+    success_list, error_list = [], []
+    employee_dicts = data_frame.to_dict("records")
+
+    # only the badge IDs, emails and companies of the file are looked up
+    badge_ids = {clean_badge_id(emp.get("Badge ID")) for emp in employee_dicts}
+    emails = {str(emp.get("Email", "")).strip().lower() for emp in employee_dicts}
+    existing_badge_ids = frozenset(
+        fetch_in(
+            Employee.objects.values_list("badge_id", flat=True), "badge_id", badge_ids
+        )
+    )
+    existing_usernames = frozenset(
+        fetch_in(User.objects.values_list("username", flat=True), "username", emails)
+    )
     existing_name_emails = frozenset(
-        (fname, lname, email)
-        for fname, lname, email in Employee.objects.values_list(
-            "employee_first_name", "employee_last_name", "email"
+        fetch_in(
+            Employee.objects.values_list(
+                "employee_first_name", "employee_last_name", "email"
+            ),
+            "email",
+            emails,
         )
     )
-    existing_companies = frozenset(Company.objects.values_list("company", flat=True))
-    success_list, error_list = [], []
-    employee_dicts = data_frame.to_dict("records")
+    resolver = ImportResolver(employee_dicts, pending_rows=True)
+    existing_companies = frozenset(resolver.companies)
 
     created_count = 0
     seen_badge_ids = set(existing_badge_ids)
@@ -363,6 +382,12 @@ def process_employee_records(data_frame):
             errors["Company Error"] = f"Company '{company}' does not exist."
             save = False
 
+        # Reporting manager validation
+        _manager, manager_error = resolver.reporting_manager(emp)
+        if manager_error:
+            errors["Reporting Manager Error"] = manager_error
+            save = False
+
         # Salary validation
         if basic_salary not in [None, ""]:
             try:
@@ -398,9 +423,14 @@ def process_employee_records(data_frame):
     return success_list, error_list, created_count
 
 
-def bulk_create_user_import(success_lists):
+def bulk_create_user_import(success_lists, job=None):
     """
     Creates new User instances in bulk from a list of dictionaries containing user data.
+    The initial passwords (the phone numbers) are hashed before the insert.
+
+    Args:
+        success_lists: validated import rows
+        job: EmployeeImportJob the hashing progress is reported to
 
     Returns:
         list: A list of created User instances. If no new users are created, returns an empty list.
@@ -419,15 +449,21 @@ def bulk_create_user_import(success_lists):
         )
     )
 
+    new_rows = [row for row in success_lists if row["Email"] not in existing_usernames]
+    passwords = hash_passwords(
+        (str(row["Phone"]).strip() for row in new_rows),
+        on_progress=(
+            (lambda done: update_import_job(job, processed=done)) if job else None
+        ),
+    )
     users_to_create = [
         User(
             username=row["Email"],
             email=row["Email"],
-            password=str(row["Phone"]).strip(),
+            password=password,
             is_superuser=False,
         )
-        for row in success_lists
-        if row["Email"] not in existing_usernames
+        for row, password in zip(new_rows, passwords)
     ]
 
     created_users = []
@@ -483,37 +519,248 @@ def bulk_create_employee_import(success_lists):
     return created_employees
 
 
-def set_initial_password(employees):
+def fetch_in(queryset, field, values):
     """
-    method to set initial password
+    Returns the rows of the queryset whose field is one of the values. SQLite
+    limits the number of query parameters, so the values are chunked there.
     """
+    values = list(values)
+    if not values:
+        return []
+    if is_postgres:
+        return list(queryset.filter(**{f"{field}__in": values}))
+    return list(
+        chain.from_iterable(
+            queryset.filter(**{f"{field}__in": chunk}) for chunk in chunked(values, 999)
+        )
+    )
 
-    logger.info("started to set initial password")
-    for employee in employees:
-        try:
-            employee.employee_user_id.set_password(str(employee.phone))
-            employee.employee_user_id.save()
-        except Exception as e:
-            logger.error(f"falied to set initial password for {employee}")
-    logger.info("initial password configured")
+
+def normalize_name(*parts):
+    """
+    Returns the words of the name parts joined by single spaces
+    """
+    return " ".join(" ".join(str(part) for part in parts if part).split())
 
 
-def optimize_reporting_manager_lookup():
+class ImportResolver:
     """
-    Optimizes the lookup of reporting managers from a list of work information.
+    Resolves the names referenced by the rows of an employee import to their
+    instances. Every lookup fetches only the distinct values referenced by the
+    rows, with `__in` queries.
 
-    This function identifies unique reporting manager names from the provided
-    list of work information, queries all matching `Employee` objects in a
-    single database query, and creates a dictionary for quick lookups based
-    on the full name of the reporting managers.
+    Reporting managers are resolved by badge ID, then by email, then by full
+    name. A full name shared by several employees is ambiguous and is
+    reported as an error instead of picking one of them.
     """
-    employees = Employee.objects.entire()
 
-    employee_dict = {
-        f"{employee.employee_first_name} {employee.employee_last_name}": employee
-        for employee in employees
-    }
-    return employee_dict
+    def __init__(self, rows, pending_rows=False):
+        """
+        Args:
+            rows: import rows
+            pending_rows: let reporting managers refer to the employees of the
+                rows as well, when validating rows that are not created yet
+        """
+        self.rows = rows
+        self.pending_rows = pending_rows
+
+    def values(self, column):
+        """
+        Returns the distinct names of a column
+        """
+        return {value for row in self.rows if (value := convert_nan(column, row))}
+
+    @cached_property
+    def employees(self):
+        badge_ids = {row["Badge ID"] for row in self.rows}
+        return {
+            employee.badge_id: employee
+            for employee in fetch_in(
+                Employee.objects.entire().only("id", "badge_id"), "badge_id", badge_ids
+            )
+        }
+
+    @cached_property
+    def work_infos(self):
+        return {
+            work_info.employee_id_id: work_info
+            for work_info in fetch_in(
+                EmployeeWorkInformation.objects.only("id", "employee_id"),
+                "employee_id",
+                self.employees.values(),
+            )
+        }
+
+    @cached_property
+    def departments(self):
+        return {
+            department.department: department
+            for department in fetch_in(
+                Department.objects.only("id", "department"),
+                "department",
+                self.values("Department"),
+            )
+        }
+
+    @cached_property
+    def job_positions(self):
+        return {
+            (job_position.department_id_id, job_position.job_position): job_position
+            for job_position in fetch_in(
+                JobPosition.objects.filter(
+                    department_id__in=self.departments.values()
+                ).only("id", "job_position", "department_id"),
+                "job_position",
+                self.values("Job Position"),
+            )
+        }
+
+    @cached_property
+    def job_roles(self):
+        return {
+            (job_role.job_position_id_id, job_role.job_role): job_role
+            for job_role in fetch_in(
+                JobRole.objects.filter(
+                    job_position_id__in=self.job_positions.values()
+                ).only("id", "job_role", "job_position_id"),
+                "job_role",
+                self.values("Job Role"),
+            )
+        }
+
+    @cached_property
+    def work_types(self):
+        return {
+            work_type.work_type: work_type
+            for work_type in fetch_in(
+                WorkType.objects.only("id", "work_type"),
+                "work_type",
+                self.values("Work Type"),
+            )
+        }
+
+    @cached_property
+    def shifts(self):
+        return {
+            shift.employee_shift: shift
+            for shift in fetch_in(
+                EmployeeShift.objects.only("id", "employee_shift"),
+                "employee_shift",
+                self.values("Shift"),
+            )
+        }
+
+    @cached_property
+    def employee_types(self):
+        return {
+            employee_type.employee_type: employee_type
+            for employee_type in fetch_in(
+                EmployeeType.objects.only("id", "employee_type"),
+                "employee_type",
+                self.values("Employee Type"),
+            )
+        }
+
+    @cached_property
+    def companies(self):
+        return {
+            company.company: company
+            for company in fetch_in(
+                Company.objects.only("id", "company"),
+                "company",
+                self.values("Company"),
+            )
+        }
+
+    @cached_property
+    def managers(self):
+        """
+        Returns the badge ID, email and full name indexes of the employees the
+        reporting managers of the rows can refer to. Full names map to
+        {email: candidate} so that ambiguity is detected.
+        """
+        values = {
+            value
+            for row in self.rows
+            if (value := normalize_name(clean_badge_id(row.get("Reporting Manager"))))
+        }
+        # first names of every split of the values, first names may have spaces
+        first_names = {
+            " ".join(words[:end])
+            for words in (value.split() for value in values)
+            for end in range(1, len(words) + 1)
+        }
+        queryset = Employee.objects.entire().only(
+            "id", "badge_id", "email", "employee_first_name", "employee_last_name"
+        )
+        candidates = {
+            employee.pk: employee
+            for employee in chain(
+                fetch_in(queryset, "badge_id", values),
+                fetch_in(queryset, "email", {value.lower() for value in values}),
+                fetch_in(queryset, "employee_first_name", first_names),
+            )
+        }
+
+        by_badge_id, by_email, by_name = {}, {}, defaultdict(dict)
+        for employee in candidates.values():
+            if employee.badge_id:
+                by_badge_id[employee.badge_id] = employee
+            by_email[employee.email.lower()] = employee
+            name = normalize_name(
+                employee.employee_first_name, employee.employee_last_name
+            )
+            by_name[name][employee.email.lower()] = employee
+        if self.pending_rows:
+            for row in self.rows:
+                email = str(row.get("Email", "")).strip().lower()
+                badge_id = clean_badge_id(row.get("Badge ID"))
+                if badge_id:
+                    by_badge_id.setdefault(badge_id, row)
+                by_email.setdefault(email, row)
+                name = normalize_name(
+                    convert_nan("First Name", row), convert_nan("Last Name", row)
+                )
+                by_name[name].setdefault(email, row)
+        return by_badge_id, by_email, by_name
+
+    def reporting_manager(self, row):
+        """
+        Resolve the reporting manager of a row
+
+        Returns:
+            tuple: (the manager, or the row of a pending manager, or None;
+            error message or None)
+        """
+        value = normalize_name(clean_badge_id(row.get("Reporting Manager")))
+        if not value:
+            return None, None
+        by_badge_id, by_email, by_name = self.managers
+        manager = by_badge_id.get(value) or by_email.get(value.lower())
+        if manager is not None:
+            return manager, None
+        matches = list(by_name.get(value, {}).values())
+        if len(matches) > 1:
+            return None, (
+                f"Reporting manager '{value}' matches {len(matches)} employees, "
+                "use the badge ID or email of the manager."
+            )
+        return (matches[0] if matches else None), None
+
+    def department(self, row):
+        return self.departments.get(convert_nan("Department", row))
+
+    def job_position(self, row):
+        department = self.department(row)
+        if department is None:
+            return None
+        return self.job_positions.get((department.pk, convert_nan("Job Position", row)))
+
+    def job_role(self, row):
+        job_position = self.job_position(row)
+        if job_position is None:
+            return None
+        return self.job_roles.get((job_position.pk, convert_nan("Job Role", row)))
 
 
 def bulk_create_department_import(success_lists):
@@ -526,7 +773,13 @@ def bulk_create_department_import(success_lists):
         if (dept := convert_nan("Department", work_info))
     }
 
-    existing_departments = set(Department.objects.values_list("department", flat=True))
+    existing_departments = set(
+        fetch_in(
+            Department.objects.values_list("department", flat=True),
+            "department",
+            departments_to_import,
+        )
+    )
 
     new_departments = [
         Department(department=dept)
@@ -542,48 +795,22 @@ def bulk_create_department_import(success_lists):
 
 def bulk_create_job_position_import(success_lists):
     """
-    Optimized: Bulk creation of job position instances based on the Excel import of employees.
+    Bulk creation of job position instances based on the Excel import of employees.
     """
-
-    # Step 1: Extract unique (job_position, department_name) pairs
+    resolver = ImportResolver(success_lists)
     job_positions_to_import = {
-        (convert_nan("Job Position", item), convert_nan("Department", item))
-        for item in success_lists
-        if convert_nan("Job Position", item) and convert_nan("Department", item)
+        (job_position, department)
+        for row in success_lists
+        if (job_position := convert_nan("Job Position", row))
+        and (department := resolver.department(row))
     }
 
-    if not job_positions_to_import:
-        return  # No valid data to import
-
-    # Step 2: Fetch all departments at once and build a name -> object map
-    department_objs = Department.objects.only("id", "department")
-    department_lookup = {dep.department: dep for dep in department_objs}
-
-    # Step 3: Filter out entries with unknown departments
-    valid_pairs = [
-        (jp, department_lookup[dept])
-        for jp, dept in job_positions_to_import
-        if dept in department_lookup
-    ]
-
-    if not valid_pairs:
-        return  # No valid (job_position, department_id) pairs to process
-
-    # Step 4: Fetch existing job positions
-    existing_pairs = set(
-        JobPosition.objects.filter(
-            department_id__in={dept_id for _, dept_id in valid_pairs}
-        ).values_list("job_position", "department_id")
-    )
-
-    # Step 5: Create list of new JobPosition instances
     new_positions = [
-        JobPosition(job_position=jp, department_id=dept_id)
-        for jp, dept_id in valid_pairs
-        if (jp, dept_id) not in existing_pairs
+        JobPosition(job_position=job_position, department_id=department)
+        for job_position, department in job_positions_to_import
+        if (department.pk, job_position) not in resolver.job_positions
     ]
 
-    # Step 6: Bulk create in a transaction
     if new_positions:
         with transaction.atomic():
             JobPosition.objects.bulk_create(
@@ -595,27 +822,20 @@ def bulk_create_job_role_import(success_lists):
     """
     Bulk creation of job role instances based on the excel import of employees
     """
-    # Extract unique (job_role, job_position) pairs, filtering out empty values
+    resolver = ImportResolver(success_lists)
     job_roles_to_import = {
-        (role, pos)
-        for work_info in success_lists
-        if (role := convert_nan("Job Role", work_info))
-        and (pos := convert_nan("Job Position", work_info))
+        (job_role, job_position)
+        for row in success_lists
+        if (job_role := convert_nan("Job Role", row))
+        and (job_position := resolver.job_position(row))
     }
 
-    # Prefetch existing data efficiently
-    job_positions = JobPosition.objects.only("id", "job_position")
-    existing_job_roles = set(JobRole.objects.values_list("job_role", "job_position_id"))
-
-    # Create new job roles
     new_job_roles = [
-        JobRole(job_role=role, job_position_id=job_positions[pos].id)
-        for role, pos in job_roles_to_import
-        if pos in job_positions
-        and (role, job_positions[pos].id) not in existing_job_roles
+        JobRole(job_role=job_role, job_position_id=job_position)
+        for job_role, job_position in job_roles_to_import
+        if (job_position.pk, job_role) not in resolver.job_roles
     ]
 
-    # Bulk create if there are new roles
     if new_job_roles:
         with transaction.atomic():
             JobRole.objects.bulk_create(
@@ -627,20 +847,12 @@ def bulk_create_work_types(success_lists):
     """
     Bulk creation of work type instances based on the excel import of employees
     """
-    # Extract unique work types, filtering out None values
-    work_types_to_import = {
-        wt for work_info in success_lists if (wt := convert_nan("Work Type", work_info))
-    }
-
-    # Get existing work types in one optimized query
-    existing_work_types = set(WorkType.objects.values_list("work_type", flat=True))
-
-    # Create new work type objects
+    resolver = ImportResolver(success_lists)
     new_work_types = [
-        WorkType(work_type=wt) for wt in work_types_to_import - existing_work_types
+        WorkType(work_type=wt)
+        for wt in resolver.values("Work Type") - set(resolver.work_types)
     ]
 
-    # Bulk create if there are new work types
     if new_work_types:
         with transaction.atomic():
             WorkType.objects.bulk_create(
@@ -652,25 +864,12 @@ def bulk_create_shifts(success_lists):
     """
     Bulk creation of shift instances based on the excel import of employees
     """
-    # Extract unique shifts, filtering out None values
-    shifts_to_import = {
-        shift
-        for work_info in success_lists
-        if (shift := convert_nan("Shift", work_info))
-    }
-
-    # Get existing shifts in one optimized query
-    existing_shifts = set(
-        EmployeeShift.objects.values_list("employee_shift", flat=True)
-    )
-
-    # Create new shift objects
+    resolver = ImportResolver(success_lists)
     new_shifts = [
         EmployeeShift(employee_shift=shift)
-        for shift in shifts_to_import - existing_shifts
+        for shift in resolver.values("Shift") - set(resolver.shifts)
     ]
 
-    # Bulk create if there are new shifts
     if new_shifts:
         with transaction.atomic():
             EmployeeShift.objects.bulk_create(
@@ -682,25 +881,12 @@ def bulk_create_employee_types(success_lists):
     """
     Bulk creation of employee type instances based on the excel import of employees
     """
-    # Extract unique employee types, filtering out None values
-    employee_types_to_import = {
-        et
-        for work_info in success_lists
-        if (et := convert_nan("Employee Type", work_info))
-    }
-
-    # Get existing employee types in one optimized query
-    existing_employee_types = set(
-        EmployeeType.objects.values_list("employee_type", flat=True)
-    )
-
-    # Create new employee type objects
+    resolver = ImportResolver(success_lists)
     new_employee_types = [
         EmployeeType(employee_type=et)
-        for et in employee_types_to_import - existing_employee_types
+        for et in resolver.values("Employee Type") - set(resolver.employee_types)
     ]
 
-    # Bulk create if there are new types
     if new_employee_types:
         with transaction.atomic():
             EmployeeType.objects.bulk_create(
@@ -708,152 +894,35 @@ def bulk_create_employee_types(success_lists):
             )
 
 
-def create_contracts_in_thread(new_work_info_list, update_work_info_list):
-    """
-    Creates employee contracts in bulk based on provided work information.
-    """
-    from payroll.models.models import Contract
-
-    def get_or_none(value):
-        return value if value else None
-
-    contracts_list = [
-        Contract(
-            contract_name=f"{work_info.employee_id}'s Contract",
-            employee_id=work_info.employee_id,
-            contract_start_date=(
-                work_info.date_joining if work_info.date_joining else datetime.today()
-            ),
-            department=get_or_none(work_info.department_id),
-            job_position=get_or_none(work_info.job_position_id),
-            job_role=get_or_none(work_info.job_role_id),
-            shift=get_or_none(work_info.shift_id),
-            work_type=get_or_none(work_info.work_type_id),
-            wage=work_info.basic_salary or 0,
-        )
-        for work_info in new_work_info_list + update_work_info_list
-        if work_info.employee_id
-    ]
-
-    Contract.objects.bulk_create(contracts_list)
-
-
-def bulk_create_work_info_import(success_lists):
+def bulk_create_work_info_import(success_lists, job=None):
     """
-    Bulk creation of employee work info instances based on the excel import of employees
+    Bulk creation of employee work info instances based on the excel import of employees.
+    The contracts of the employees are queued for the import job in the same
+    transaction, see employee.methods.import_contracts.
     """
     new_work_info_list = []
     update_work_info_list = []
 
-    badge_ids = [row["Badge ID"] for row in success_lists]
-    departments = set(row.get("Department") for row in success_lists)
-    job_positions = set(row.get("Job Position") for row in success_lists)
-    job_roles = set(row.get("Job Role") for row in success_lists)
-    work_types = set(row.get("Work Type") for row in success_lists)
-    employee_types = set(row.get("Employee Type") for row in success_lists)
-    shifts = set(row.get("Shift") for row in success_lists)
-    companies = set(row.get("Company") for row in success_lists)
-
-    chunk_size = None if is_postgres else 999
-    employee_qs = (
-        chain.from_iterable(
-            Employee.objects.entire().filter(badge_id__in=chunk).only("badge_id")
-            for chunk in chunked(badge_ids, chunk_size)
-        )
-        if chunk_size
-        else Employee.objects.entire().filter(badge_id__in=badge_ids).only("badge_id")
-    )
-
-    existing_employees = {emp.badge_id: emp for emp in employee_qs}
-
-    existing_employee_work_infos = {
-        emp.employee_id: emp
-        for emp in (
-            EmployeeWorkInformation.objects.filter(
-                employee_id__in=existing_employees.values()
-            ).only("employee_id")
-            if is_postgres
-            else chain.from_iterable(
-                EmployeeWorkInformation.objects.filter(employee_id__in=chunk).only(
-                    "employee_id"
-                )
-                for chunk in chunked(list(existing_employees.values()), 900)
-            )
-        )
-    }
-
-    existing_departments = {
-        dep.department: dep
-        for dep in Department.objects.filter(department__in=departments).only(
-            "department"
-        )
-    }
-    existing_job_positions = {
-        (jp.department_id, jp.job_position): jp
-        for jp in JobPosition.objects.filter(job_position__in=job_positions)
-        .select_related("department_id")
-        .only("department_id", "job_position")
-    }
-    existing_job_roles = {
-        (jr.job_position_id, jr.job_role): jr
-        for jr in JobRole.objects.filter(job_role__in=job_roles)
-        .select_related("job_position_id")
-        .only("job_position_id", "job_role")
-    }
-    existing_work_types = {
-        wt.work_type: wt
-        for wt in WorkType.objects.filter(work_type__in=work_types).only("work_type")
-    }
-    existing_shifts = {
-        es.employee_shift: es
-        for es in EmployeeShift.objects.filter(employee_shift__in=shifts).only(
-            "employee_shift"
-        )
-    }
-    existing_employee_types = {
-        et.employee_type: et
-        for et in EmployeeType.objects.filter(employee_type__in=employee_types).only(
-            "employee_type"
-        )
-    }
-    existing_companies = {
-        comp.company: comp
-        for comp in Company.objects.filter(company__in=companies).only("company")
-    }
-    reporting_manager_dict = optimize_reporting_manager_lookup()
+    resolver = ImportResolver(success_lists)
 
     for work_info in success_lists:
-        badge_id = work_info["Badge ID"]
-        employee_obj = existing_employees.get(badge_id)
+        employee_obj = resolver.employees.get(work_info["Badge ID"])
         if not employee_obj:
             continue
 
         email = work_info["Email"]
-        employee_work_info = existing_employee_work_infos.get(employee_obj)
-        department_obj = existing_departments.get(work_info.get("Department"))
-
-        job_position_key = (
-            existing_departments.get(work_info.get("Department")),
-            work_info.get("Job Position"),
+        employee_work_info = resolver.work_infos.get(employee_obj.pk)
+        department_obj = resolver.department(work_info)
+        job_position_obj = resolver.job_position(work_info)
+        job_role_obj = resolver.job_role(work_info)
+        work_type_obj = resolver.work_types.get(convert_nan("Work Type", work_info))
+        employee_type_obj = resolver.employee_types.get(
+            convert_nan("Employee Type", work_info)
         )
-        job_position_obj = existing_job_positions.get(job_position_key)
-
-        job_role_key = (
-            job_position_obj,
-            work_info.get("Job Role"),
-        )
-        job_role_obj = existing_job_roles.get(job_role_key)
-
-        work_type_obj = existing_work_types.get(work_info.get("Work Type"))
-        employee_type_obj = existing_employee_types.get(work_info.get("Employee Type"))
-        shift_obj = existing_shifts.get(work_info.get("Shift"))
-        reporting_manager = work_info.get("Reporting Manager")
-        reporting_manager_obj = None
-        if isinstance(reporting_manager, str) and " " in reporting_manager:
-            if reporting_manager in reporting_manager_dict:
-                reporting_manager_obj = reporting_manager_dict[reporting_manager]
-
-        company_obj = existing_companies.get(work_info.get("Company"))
+        shift_obj = resolver.shifts.get(convert_nan("Shift", work_info))
+        # ambiguous managers are rejected when the rows are validated
+        reporting_manager_obj, _error = resolver.reporting_manager(work_info)
+        company_obj = resolver.companies.get(convert_nan("Company", work_info))
         location = work_info.get("Location")
 
         # Parsing dates and salary
@@ -924,35 +993,93 @@ def bulk_create_work_info_import(success_lists):
             employee_work_info.basic_salary = basic_salary
             employee_work_info.salary_hour = salary_hour
             update_work_info_list.append(employee_work_info)
-    if new_work_info_list:
-        EmployeeWorkInformation.objects.bulk_create(
-            new_work_info_list, batch_size=None if is_postgres else 999
-        )
-    if update_work_info_list:
-        EmployeeWorkInformation.objects.bulk_update(
-            update_work_info_list,
-            [
-                "email",
-                "department_id",
-                "job_position_id",
-                "job_role_id",
-                "work_type_id",
-                "employee_type_id",
-                "shift_id",
-                "reporting_manager_id",
-                "company_id",
-                "location",
-                "date_joining",
-                "contract_end_date",
-                "basic_salary",
-                "salary_hour",
-            ],
-            batch_size=None if is_postgres else 999,
-        )
-    if apps.is_installed("payroll"):
+    with transaction.atomic():
+        if new_work_info_list:
+            EmployeeWorkInformation.objects.bulk_create(
+                new_work_info_list, batch_size=None if is_postgres else 999
+            )
+            # bulk_create sends no post_save, the reporting managers of the
+            # new rows reach the hierarchy closure table here
+            sync_hierarchy_for(new_work_info_list)
+        if update_work_info_list:
+            EmployeeWorkInformation.objects.bulk_update(
+                update_work_info_list,
+                [
+                    "email",
+                    "department_id",
+                    "job_position_id",
+                    "job_role_id",
+                    "work_type_id",
+                    "employee_type_id",
+                    "shift_id",
+                    "reporting_manager_id",
+                    "company_id",
+                    "location",
+                    "date_joining",
+                    "contract_end_date",
+                    "basic_salary",
+                    "salary_hour",
+                ],
+                batch_size=None if is_postgres else 999,
+            )
+        if job is not None:
+            enqueue_import_contracts(
+                job,
+                [
+                    work_info.employee_id_id
+                    for work_info in new_work_info_list + update_work_info_list
+                ],
+            )
 
-        contract_creation_thread = threading.Thread(
-            target=create_contracts_in_thread,
-            args=(new_work_info_list, update_work_info_list),
-        )
-        contract_creation_thread.start()
+
+def update_import_job(job, **fields):
+    """
+    Store progress fields of the import job
+    """
+    for field, value in fields.items():
+        setattr(job, field, value)
+    EmployeeImportJob.objects.filter(id=job.id).update(
+        updated_at=timezone.now(), **fields
+    )
+
+
+def run_employee_import(job, success_lists):
+    """
+    Creates the users, employees and work information of the validated import
+    rows, reporting the progress through the import job. Meant to run in a
+    background thread started by the import view.
+    """
+    steps = [
+        (_("Creating users"), lambda: bulk_create_user_import(success_lists, job)),
+        (_("Creating employees"), lambda: bulk_create_employee_import(success_lists)),
+        (
+            _("Creating departments"),
+            lambda: bulk_create_department_import(success_lists),
+        ),
+        (
+            _("Creating job positions"),
+            lambda: bulk_create_job_position_import(success_lists),
+        ),
+        (_("Creating job roles"), lambda: bulk_create_job_role_import(success_lists)),
+        (_("Creating work types"), lambda: bulk_create_work_types(success_lists)),
+        (_("Creating shifts"), lambda: bulk_create_shifts(success_lists)),
+        (
+            _("Creating employee types"),
+            lambda: bulk_create_employee_types(success_lists),
+        ),
+        (
+            _("Creating work information"),
+            lambda: bulk_create_work_info_import(success_lists, job),
+        ),
+    ]
+    try:
+        update_import_job(job, status="running", total=len(success_lists))
+        for step, create in steps:
+            update_import_job(job, step=str(step))
+            create()
+        update_import_job(job, status="completed", step="", processed=job.total)
+    except Exception as error:
+        logger.exception("employee import %s failed", job.id)
+        update_import_job(job, status="failed", error=str(error))
+    finally:
+        connection.close()
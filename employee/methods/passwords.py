@@ -0,0 +1,73 @@
+"""
+passwords.py
+
+This module is used to hash the initial passwords of imported users in a
+thread pool, so that users are inserted already hashed. The key derivation
+of the hashers (pbkdf2_hmac, argon2, bcrypt) releases the GIL, so threads
+use every CPU without forking the server process.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+from django.contrib.auth.hashers import get_hasher
+
+# below this many passwords starting the pool costs more than it saves
+POOL_THRESHOLD = 50
+CHUNK_SIZE = 100
+
+
+def encode_password(hasher, password):
+    """
+    Returns the hash of the password, run by the pool threads
+    """
+    return hasher.encode(password, hasher.salt())
+
+
+def hash_serially(hasher, passwords, on_progress=None, done=0):
+    """
+    Returns the hashes of the passwords computed in this process
+    """
+    hashes = []
+    for start in range(0, len(passwords), CHUNK_SIZE):
+        hashes.extend(
+            encode_password(hasher, password)
+            for password in passwords[start : start + CHUNK_SIZE]
+        )
+        if on_progress:
+            on_progress(done + len(hashes))
+    return hashes
+
+
+def hash_passwords(passwords, on_progress=None, workers=None):
+    """
+    Hash passwords with the default hasher in a thread pool sized to the
+    CPUs. Small batches are hashed in the calling thread.
+
+    Args:
+        passwords: raw passwords
+        on_progress: called with the number of hashed passwords after every
+            batch
+        workers: size of the pool, the number of CPUs by default
+
+    Returns:
+        list: the hashes, in the order of the passwords
+    """
+    hasher = get_hasher()
+    passwords = list(passwords)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(passwords) < POOL_THRESHOLD:
+        return hash_serially(hasher, passwords, on_progress)
+
+    hashes = []
+    batch_size = CHUNK_SIZE * workers
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="password-hashing"
+    ) as executor:
+        for start in range(0, len(passwords), batch_size):
+            batch = passwords[start : start + batch_size]
+            hashes.extend(executor.map(encode_password, repeat(hasher), batch))
+            if on_progress:
+                on_progress(len(hashes))
+    return hashes
@@ -0,0 +1,103 @@
+"""
+status.py
+
+This module is used to annotate the daily status of employees (leave,
+attendance and online state) onto employee querysets, so that the status
+badges of the employee cards and lists are read from the rows instead of
+being queried per employee
+"""
+
+from collections import defaultdict
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.db.models import Exists, OuterRef, Value
+
+from horilla.methods import get_horilla_model_class
+
+# annotation names read by the Employee status methods
+STATUS_FIELDS = [
+    "leave_today",
+    "on_leave_today",
+    "leave_requested_today",
+    "attended_today",
+    "is_online",
+]
+
+
+def annotate_status(queryset, today=None):
+    """
+    Annotate the leave, attendance and online state of the day onto an
+    employee queryset with `Exists` subqueries
+
+    Args:
+        queryset: Employee queryset
+        today: the day of the status, today by default
+    """
+    today = today or date.today()
+    annotations = dict.fromkeys(STATUS_FIELDS, Value(False))
+    if apps.is_installed("leave"):
+        LeaveRequest = get_horilla_model_class("leave", "leaverequest")
+        leaves = LeaveRequest.objects.entire().filter(
+            employee_id=OuterRef("pk"), start_date__lte=today, end_date__gte=today
+        )
+        annotations["leave_today"] = Exists(leaves)
+        annotations["on_leave_today"] = Exists(leaves.filter(status="approved"))
+        annotations["leave_requested_today"] = Exists(leaves.filter(status="requested"))
+    if apps.is_installed("attendance"):
+        Attendance = get_horilla_model_class("attendance", "attendance")
+        attendances = Attendance.objects.entire().filter(employee_id=OuterRef("pk"))
+        annotations["attended_today"] = Exists(
+            attendances.filter(attendance_date=today)
+        )
+        annotations["is_online"] = Exists(
+            attendances.filter(
+                attendance_date__gte=today - timedelta(days=1),
+                attendance_date__lte=today,
+                attendance_clock_out_date__isnull=True,
+            )
+        )
+    return queryset.annotate(**annotations)
+
+
+def attach_forecasts(employees, today=None):
+    """
+    Load the attendances and activities of yesterday and today of the
+    employees in two queries and store them on the employees for
+    `Employee.get_forecasted_at_work`
+
+    Args:
+        employees: Employee instances (a page)
+    """
+    employees = list(employees)
+    if not employees or not apps.is_installed("attendance"):
+        return employees
+    Attendance = get_horilla_model_class("attendance", "attendance")
+    AttendanceActivity = get_horilla_model_class("attendance", "attendanceactivity")
+    today = today or date.today()
+    days = [today - timedelta(days=1), today]
+
+    attendances = {}
+    for attendance in Attendance.objects.entire().filter(
+        employee_id__in=employees, attendance_date__in=days
+    ):
+        # today's attendance wins over yesterday's
+        current = attendances.get(attendance.employee_id_id)
+        if current is None or current.attendance_date < attendance.attendance_date:
+            attendances[attendance.employee_id_id] = attendance
+
+    activities = defaultdict(list)
+    for activity in (
+        AttendanceActivity.objects.entire()
+        .filter(employee_id__in=employees, attendance_date__in=days)
+        .order_by("clock_in")
+    ):
+        activities[(activity.employee_id_id, activity.attendance_date)].append(activity)
+
+    for employee in employees:
+        attendance = attendances.get(employee.pk)
+        employee.forecast_attendance = attendance
+        employee.forecast_activities = (
+            activities[(employee.pk, attendance.attendance_date)] if attendance else []
+        )
+    return employees
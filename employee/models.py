@@ -12,7 +12,6 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.models import Permission, User
 from django.core.exceptions import ValidationError
-from django.core.files.storage import default_storage
 from django.db import models
 from django.db.models.query import QuerySet
 from django.db.models.signals import post_save
@@ -34,6 +33,12 @@ from base.models import (
     WorkType,
     validate_time_format,
 )
+from employee.methods.avatars import (
+    AVATAR_FIELDS,
+    avatar_url,
+    clear_avatar,
+    record_avatar,
+)
 from employee.methods.duration_methods import format_time, strtime_seconds
 from horilla import horilla_middlewares
 from horilla.methods import get_horilla_model_class
@@ -82,6 +87,13 @@ class Employee(models.Model):
         max_length=200, null=True, blank=True, verbose_name=_("Last Name")
     )
     employee_profile = models.ImageField(upload_to=upload_path, null=True, blank=True)
+    # recorded when the profile image is saved, see employee.methods.avatars
+    avatar_exists = models.BooleanField(default=False, editable=False)
+    avatar_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    avatar_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    avatar_thumbnail = models.CharField(
+        max_length=255, blank=True, default="", editable=False
+    )
     email = models.EmailField(max_length=254, unique=True)
     phone = models.CharField(
         max_length=25,
@@ -245,34 +257,65 @@ class Employee(models.Model):
         )
 
     def get_avatar(self):
-        if self.employee_profile and default_storage.exists(self.employee_profile.name):
-            return self.employee_profile.url
-        return static("images/ui/default_avatar.jpg")
+        """
+        Returns the url of the avatar from the recorded profile image, without
+        a storage call
+        """
+        return avatar_url(self) or static("images/ui/default_avatar.jpg")
+
+    def update_avatar(self):
+        """
+        Record the profile image when a new one is assigned or it is removed
+        """
+        if "employee_profile" in self.get_deferred_fields():
+            return
+        profile = self.employee_profile
+        if not profile:
+            if self.avatar_exists or self.avatar_thumbnail:
+                clear_avatar(self)
+        elif not profile._committed or not self.avatar_exists:
+            record_avatar(self)
 
     def get_leave_status(self):
         """
         This method is used to get the leave status of the employee
         """
-        today = date.today()
-        leaves_requests = (
-            self.leaverequest_set.filter(start_date__lte=today, end_date__gte=today)
-            if apps.is_installed("leave")
-            else QuerySet().none()
-        )
+        if hasattr(self, "leave_today"):
+            # annotated by employee.methods.status.annotate_status
+            leave_today = self.leave_today
+            on_leave = self.on_leave_today
+            leave_requested = self.leave_requested_today
+            attended = self.attended_today
+        else:
+            today = date.today()
+            leaves_requests = (
+                self.leaverequest_set.filter(start_date__lte=today, end_date__gte=today)
+                if apps.is_installed("leave")
+                else QuerySet().none()
+            )
+            leave_today = leaves_requests.exists()
+            on_leave = (
+                leave_today and leaves_requests.filter(status="approved").exists()
+            )
+            leave_requested = (
+                leave_today and leaves_requests.filter(status="requested").exists()
+            )
+            attended = (
+                not leave_today
+                and apps.is_installed("attendance")
+                and self.employee_attendances.filter(
+                    attendance_date=today,
+                ).exists()
+            )
         status = _("Expected working")
-        if leaves_requests.exists():
-            if leaves_requests.filter(status="approved").exists():
+        if leave_today:
+            if on_leave:
                 status = _("On Leave")
-            elif leaves_requests.filter(status="requested"):
+            elif leave_requested:
                 status = _("Waiting Approval")
             else:
                 status = _("Canceled / Rejected")
-        elif (
-            apps.is_installed("attendance")
-            and self.employee_attendances.filter(
-                attendance_date=today,
-            ).exists()
-        ):
+        elif attended:
             status = _("On a break")
         return status
 
@@ -281,33 +324,39 @@ class Employee(models.Model):
         This method is used to the employees current day shift status
         """
         if apps.is_installed("attendance"):
-            today = datetime.today()
-            yesterday = today - timedelta(days=1)
-            today_attendance = None
-            yesterday_attendance = None
-            attendances = list(
-                self.employee_attendances.filter(
-                    attendance_date__in=[yesterday, today]
-                ).order_by("attendance_date")
-            )
-
-            if len(attendances) == 1:
-                yesterday_attendance, today_attendance = attendances[0], None
-            elif len(attendances) == 2:
-                yesterday_attendance, today_attendance = attendances
+            activities = None
+            if hasattr(self, "forecast_attendance"):
+                # loaded by employee.methods.status.attach_forecasts
+                attendance = self.forecast_attendance
+                activities = self.forecast_activities
             else:
-                yesterday_attendance, today_attendance = None, None
+                today = datetime.today()
+                yesterday = today - timedelta(days=1)
+                today_attendance = None
+                yesterday_attendance = None
+                attendances = list(
+                    self.employee_attendances.filter(
+                        attendance_date__in=[yesterday, today]
+                    ).order_by("attendance_date")
+                )
+
+                if len(attendances) == 1:
+                    yesterday_attendance, today_attendance = attendances[0], None
+                elif len(attendances) == 2:
+                    yesterday_attendance, today_attendance = attendances
+                else:
+                    yesterday_attendance, today_attendance = None, None
 
-            attendance = today_attendance
-            if not today_attendance:
-                attendance = yesterday_attendance
+                attendance = today_attendance
+                if not today_attendance:
+                    attendance = yesterday_attendance
             minimum_hour_seconds = strtime_seconds(
                 getattr(attendance, "minimum_hour", "0")
             )
             at_work = 0
             forecasted_pending_hours = 0
             if attendance:
-                at_work = attendance.get_at_work_from_activities()
+                at_work = attendance.get_at_work_from_activities(activities)
             forecasted_pending_hours = max(0, (minimum_hour_seconds - at_work))
 
             return {
@@ -440,6 +489,9 @@ class Employee(models.Model):
         """
         This method is used to check if the user is in the list of online users.
         """
+        if hasattr(self, "is_online"):
+            # annotated by employee.methods.status.annotate_status
+            return self.is_online
         if apps.is_installed("attendance"):
             Attendance = get_horilla_model_class("attendance", "attendance")
             request = getattr(horilla_middlewares._thread_locals, "request", None)
@@ -549,6 +601,11 @@ class Employee(models.Model):
 
     def save(self, *args, **kwargs):
         self.full_clean()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "employee_profile" in update_fields:
+            self.update_avatar()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *AVATAR_FIELDS}
         super().save(*args, **kwargs)
 
         request = getattr(horilla_middlewares._thread_locals, "request", None)
@@ -743,6 +800,41 @@ class EmployeeWorkInformation(models.Model):
         return self
 
 
+class EmployeeReportingHierarchy(models.Model):
+    """
+    Closure table of the reporting hierarchy defined by
+    `EmployeeWorkInformation.reporting_manager_id`. Every (ancestor, descendant)
+    pair of the reporting chain is stored with its distance, so subordinates,
+    chain of command and org-chart reads are single queries.
+    """
+
+    ancestor = models.ForeignKey(
+        Employee,
+        on_delete=models.CASCADE,
+        related_name="reporting_descendants",
+        verbose_name=_("Manager"),
+    )
+    descendant = models.ForeignKey(
+        Employee,
+        on_delete=models.CASCADE,
+        related_name="reporting_ancestors",
+        verbose_name=_("Subordinate"),
+    )
+    depth = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ("ancestor", "descendant")
+        indexes = [
+            models.Index(fields=["ancestor", "depth"]),
+            models.Index(fields=["descendant", "depth"]),
+        ]
+        verbose_name = _("Reporting Hierarchy")
+        verbose_name_plural = _("Reporting Hierarchy")
+
+    def __str__(self) -> str:
+        return f"{self.ancestor_id} > {self.descendant_id} ({self.depth})"
+
+
 class EmployeeBankDetails(HorillaModel):
     """
     EmployeeBankDetails model
@@ -970,6 +1062,11 @@ class DisciplinaryAction(HorillaModel):
     )
     start_date = models.DateField(null=True)
     attachment = models.FileField(upload_to=upload_path, null=True, blank=True)
+    # login block window, maintained by employee/methods/disciplinary.py
+    block_date = models.DateField(null=True, editable=False, db_index=True)
+    unblock_date = models.DateField(null=True, editable=False, db_index=True)
+    block_at = models.DateTimeField(null=True, editable=False, db_index=True)
+    unblock_at = models.DateTimeField(null=True, editable=False, db_index=True)
     objects = HorillaCompanyManager("employee_id__employee_work_info__company_id")
 
     def __str__(self) -> str:
@@ -998,6 +1095,109 @@ class ProfileEditFeature(HorillaModel):
     objects = models.Manager()
 
 
+class EmployeeImportJob(models.Model):
+    """
+    Progress of the background part of an employee import, polled by the
+    import result popup
+    """
+
+    statuses = [
+        ("pending", _("Pending")),
+        ("running", _("Running")),
+        ("completed", _("Completed")),
+        ("failed", _("Failed")),
+    ]
+    status = models.CharField(max_length=10, choices=statuses, default="pending")
+    step = models.CharField(max_length=100, blank=True)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    objects = models.Manager()
+
+    class Meta:
+        ordering = ["-id"]
+        verbose_name = _("Employee Import Job")
+        verbose_name_plural = _("Employee Import Jobs")
+
+    def progress(self):
+        """
+        Returns the completed percentage of the job
+        """
+        if self.status == "completed":
+            return 100
+        return int(self.processed * 100 / self.total) if self.total else 0
+
+    def is_finished(self):
+        """
+        The import is finished once its steps ran and no contract is pending
+        """
+        return self.status in ["completed", "failed"] and not (
+            self.contracts.filter(status="pending").exists()
+        )
+
+    def contract_summary(self):
+        """
+        Returns {status: count} of the contract outcomes of the import
+        """
+        return dict(
+            self.contracts.order_by()
+            .values_list("status")
+            .annotate(count=models.Count("id"))
+        )
+
+    def contract_issues(self, limit=50):
+        """
+        Returns the skipped and failed contract outcomes of the import
+        """
+        return self.contracts.filter(status__in=["skipped", "failed"]).select_related(
+            "employee_id"
+        )[:limit]
+
+    def __str__(self) -> str:
+        return f"{self.id} ({self.status})"
+
+
+class EmployeeImportContract(models.Model):
+    """
+    Contract generation outcome of an imported employee. The pending rows are
+    the durable queue of the contract generation of an import job, see
+    employee.methods.import_contracts
+    """
+
+    statuses = [
+        ("pending", _("Pending")),
+        ("created", _("Created")),
+        ("skipped", _("Skipped")),
+        ("failed", _("Failed")),
+    ]
+    job = models.ForeignKey(
+        EmployeeImportJob, on_delete=models.CASCADE, related_name="contracts"
+    )
+    employee_id = models.ForeignKey(
+        Employee, on_delete=models.CASCADE, related_name="import_contracts"
+    )
+    status = models.CharField(max_length=10, choices=statuses, default="pending")
+    message = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    objects = models.Manager()
+
+    class Meta:
+        ordering = ["id"]
+        unique_together = ("job", "employee_id")
+        indexes = [models.Index(fields=["status", "updated_at"])]
+        verbose_name = _("Employee Import Contract")
+        verbose_name_plural = _("Employee Import Contracts")
+
+    def __str__(self) -> str:
+        return f"{self.employee_id} ({self.status})"
+
+
 ACCESSBILITY_FEATURE.append(("gender_chart", "Can view Gender Chart"))
 ACCESSBILITY_FEATURE.append(("department_chart", "Can view Department Chart"))
 ACCESSBILITY_FEATURE.append(("employees_chart", "Can view Employees Chart"))
@@ -20,6 +20,7 @@ from base.forms import MailTemplateForm
 from base.methods import export_data, generate_pdf
 from base.models import HorillaMailTemplate
 from employee.filters import EmployeeFilter
+from employee.methods.status import annotate_status, attach_forecasts
 from employee.models import Employee
 from horilla import settings
 from horilla.decorators import login_required, manager_can_enter
@@ -43,7 +44,7 @@ def not_in_yet(request):
     """
     page_number = request.GET.get("page")
     previous_data = request.GET.urlencode()
-    emps = (
+    emps = annotate_status(
         EmployeeFilter({"not_in_yet": date.today()})
         .qs.exclude(employee_work_info__isnull=True)
         .filter(is_active=True)
@@ -71,7 +72,9 @@ def not_out_yet(request):
         .qs.exclude(employee_work_info__isnull=True)
         .filter(is_active=True)
     )
-    return render(request, "dashboard/not_out_yet.html", {"employees": emps})
+    return render(
+        request, "dashboard/not_out_yet.html", {"employees": attach_forecasts(emps)}
+    )
 
 
 @login_required
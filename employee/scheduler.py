@@ -1,22 +1,47 @@
 import datetime
 import sys
-from datetime import timedelta
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from django.db import OperationalError
+from django.db import OperationalError, transaction
 
 
-def update_experience():
-    from employee.models import EmployeeWorkInformation
+EXPERIENCE_UPDATED_ON_KEY = "employee_experience_updated_on"
+
 
+def update_experience(batch_size=1000):
     """
-    This scheduled task to trigger the experience calculator
-    to update the employee work experience
+    This scheduled task updates the employee work experience computed from the
+    joining date. Only the rows whose experience changed are written, and the
+    task is skipped until the date rolls over after a run.
     """
+    from django.core.cache import cache
+
+    from employee.models import EmployeeWorkInformation
+
     try:
-        queryset = EmployeeWorkInformation.objects.filter(employee_id__is_active=True)
-        for instance in queryset:
-            instance.experience_calculator()
+        today = datetime.date.today()
+        if cache.get(EXPERIENCE_UPDATED_ON_KEY) == today:
+            return
+        rows = (
+            EmployeeWorkInformation.objects.entire()
+            .filter(employee_id__is_active=True, date_joining__isnull=False)
+            .values_list("id", "date_joining", "experience")
+            .iterator(chunk_size=batch_size)
+        )
+        changed = []
+        for work_info_id, date_joining, experience in rows:
+            # same formula as EmployeeWorkInformation.experience_calculator
+            value = (today - date_joining).days / 365.0
+            if value != experience:
+                changed.append(
+                    EmployeeWorkInformation(id=work_info_id, experience=value)
+                )
+        for start in range(0, len(changed), batch_size):
+            with transaction.atomic():
+                EmployeeWorkInformation.objects.bulk_update(
+                    changed[start : start + batch_size], ["experience"]
+                )
+        cache.set(EXPERIENCE_UPDATED_ON_KEY, today, None)
     except OperationalError:
         # Database tables not ready yet (migrations not completed)
         pass
@@ -28,115 +53,29 @@ def update_experience():
     return
 
 
+DISCIPLINARY_WATERMARK_KEY = "employee_disciplinary_last_run"
+
+
 def block_unblock_disciplinary():
     """
-    This scheduled task to trigger the Disciplinary action and take the suspens
+    This scheduled task blocks / unblocks the employees' logins for the
+    disciplinary action windows that started or ended since the previous run
     """
-    from base.models import EmployeeShiftSchedule
-    from employee.models import DisciplinaryAction
-    from employee.policies import employee_account_block_unblock
+    from django.core.cache import cache
+    from django.utils import timezone
+
+    from employee.methods.disciplinary import apply_due_transitions, reconcile_blocks
 
     try:
-        dis_action = DisciplinaryAction.objects.all()
-        for dis in dis_action:
-            if dis.action.block_option:
-                if dis.action.action_type == "suspension":
-                    if dis.days:
-                        day = dis.days
-                        end_date = dis.start_date + timedelta(days=day)
-                        if (
-                            datetime.date.today() >= dis.start_date
-                            or datetime.date.today() >= end_date
-                        ):
-                            if datetime.date.today() >= dis.start_date:
-                                r = False
-                            if datetime.date.today() >= end_date:
-                                r = True
-
-                            employees = dis.employee_id.all()
-                            for emp in employees:
-                                employee_account_block_unblock(emp_id=emp.id, result=r)
-
-                if dis.hours:
-                    hour_str = dis.hours + ":00"
-                    if hour_str > "00:00:00":
-                        # Checking the date of action date.
-                        if datetime.date.today() >= dis.start_date:
-
-                            employees = dis.employee_id.all()
-                            for emp in employees:
-
-                                # Taking the shift of employee for taking the work start time
-                                shift = emp.employee_work_info.shift_id
-                                shift_detail = EmployeeShiftSchedule.objects.filter(
-                                    shift_id=shift
-                                )
-                                for shi in shift_detail:
-                                    today = datetime.datetime.today()
-                                    day_of_week = today.weekday()
-
-                                    # List of weekday names
-                                    weekday_names = [
-                                        "monday",
-                                        "tuesday",
-                                        "wednesday",
-                                        "thursday",
-                                        "friday",
-                                        "saturday",
-                                        "sunday",
-                                    ]
-                                    if weekday_names[day_of_week] == shi.day.day:
-
-                                        st_time = shi.start_time
-
-                                        hour_time = datetime.datetime.strptime(
-                                            hour_str, "%H:%M:%S"
-                                        ).time()
-
-                                        time1 = st_time
-                                        time2 = hour_time
-
-                                        # Convert them to datetime objects
-                                        datetime1 = datetime.datetime.combine(
-                                            datetime.date.today(), time1
-                                        )
-                                        datetime2 = datetime.datetime.combine(
-                                            datetime.date.today(), time2
-                                        )
-
-                                        # Add the datetime objects
-                                        result_datetime = (
-                                            datetime1
-                                            + datetime.timedelta(
-                                                hours=datetime2.hour,
-                                                minutes=datetime2.minute,
-                                                seconds=datetime2.second,
-                                            )
-                                        )
-
-                                        # Extract the time component from the result
-                                        result_time = result_datetime.time()
-
-                                        # Get the current time
-                                        current_time = datetime.datetime.now().time()
-
-                                        # Check if the current time matches st_time
-                                        if current_time >= st_time:
-                                            r = False
-                                        if current_time >= result_time:
-                                            r = True
-
-                                    employee_account_block_unblock(
-                                        emp_id=emp.id, result=r
-                                    )
-
-            if dis.action.action_type == "dismissal":
-                if datetime.date.today() >= dis.start_date:
-                    if datetime.date.today() >= dis.start_date:
-                        r = False
-                    employees = dis.employee_id.all()
-                    for emp in employees:
-                        employee_account_block_unblock(emp_id=emp.id, result=r)
+        now = timezone.now()
+        since = cache.get(DISCIPLINARY_WATERMARK_KEY)
+        if since is None:
+            # the transitions since the previous run are unknown, reconcile
+            # the logins with every window instead
+            reconcile_blocks(now)
+        else:
+            apply_due_transitions(since, now)
+        cache.set(DISCIPLINARY_WATERMARK_KEY, now, None)
     except OperationalError:
         # Database tables not ready yet (migrations not completed)
         pass
@@ -149,6 +88,27 @@ def block_unblock_disciplinary():
     return
 
 
+def resume_import_contracts():
+    """
+    This scheduled task resumes the contract generation of employee imports
+    whose worker stopped before processing every pending row
+    """
+    from employee.methods.import_contracts import resume_stale_imports
+
+    try:
+        resume_stale_imports()
+    except OperationalError:
+        # Database tables not ready yet (migrations not completed)
+        pass
+    except Exception as e:
+        # Log other errors but don't crash the scheduler
+        import logging
+        logger = logging.getLogger(__name__)
+        logger.error(f"Error in resume_import_contracts scheduler: {e}")
+
+    return
+
+
 if not any(
     cmd in sys.argv
     for cmd in ["makemigrations", "migrate", "compilemessages", "flush", "shell"]
@@ -159,4 +119,5 @@ if not any(
     scheduler = BackgroundScheduler()
     scheduler.add_job(update_experience, "interval", hours=4)
     scheduler.add_job(block_unblock_disciplinary, "interval", seconds=25)
+    scheduler.add_job(resume_import_contracts, "interval", minutes=5)
     scheduler.start()
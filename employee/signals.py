@@ -0,0 +1,169 @@
+"""
+employee/signals.py
+"""
+
+import sys
+
+from django.db import transaction
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from employee.methods.disciplinary import (
+    action_user_ids,
+    block_if_active,
+    refresh_block_window,
+    release_users,
+    stored_window,
+    window_contains,
+)
+from employee.methods.hierarchy import (
+    move_employee,
+    rebuild_reporting_hierarchy,
+    sync_employee_hierarchy,
+)
+from employee.models import (
+    Actiontype,
+    DisciplinaryAction,
+    EmployeeReportingHierarchy,
+    EmployeeWorkInformation,
+)
+from horilla.signals import post_bulk_update
+
+
+@receiver(post_save, sender=EmployeeWorkInformation)
+def update_reporting_hierarchy(sender, instance, **kwargs):
+    """
+    Keep the reporting hierarchy closure table in sync with the work
+    information reporting manager
+    """
+    if instance.employee_id_id:
+        sync_employee_hierarchy(
+            instance.employee_id_id, instance.reporting_manager_id_id
+        )
+
+
+@receiver(post_delete, sender=EmployeeWorkInformation)
+def remove_reporting_hierarchy(sender, instance, **kwargs):
+    """
+    Detach the employee's sub tree when the work information is removed
+    """
+    if instance.employee_id_id:
+        move_employee(instance.employee_id_id, None)
+
+
+@receiver(post_bulk_update, sender=EmployeeWorkInformation)
+def bulk_update_reporting_hierarchy(sender, queryset, *args, **kwargs):
+    """
+    Sync the hierarchy after queryset.update() calls that change the
+    reporting manager
+    """
+    if "reporting_manager_id" not in kwargs.get("kwargs", {}):
+        return
+    for employee_id, manager_id in queryset.values_list(
+        "employee_id", "reporting_manager_id"
+    ):
+        if employee_id:
+            sync_employee_hierarchy(employee_id, manager_id)
+
+
+@receiver(post_migrate)
+def populate_reporting_hierarchy(sender, **kwargs):
+    """
+    Build the closure table once for existing data after it is first migrated
+    """
+    if sender.label != "employee":
+        return
+    try:
+        if not EmployeeReportingHierarchy.objects.exists():
+            rebuild_reporting_hierarchy()
+    except Exception as e:
+        stdout = kwargs.get("stdout") or sys.stdout
+        stdout.write(f"Error building the reporting hierarchy: {e}\n")
+
+
+def update_disciplinary_window(action):
+    """
+    Store the block window of the action and apply it when already started.
+    The employees are unblocked when the change ended a window that blocked
+    them and no other action blocks them.
+    """
+    previous = refresh_block_window(action)
+    block_if_active(action)
+    now = timezone.now()
+    current = stored_window(action)
+    if window_contains(previous, now) and not window_contains(current, now):
+        release_users(action_user_ids(action), now)
+
+
+@receiver(post_save, sender=DisciplinaryAction)
+def disciplinary_action_saved(sender, instance, **kwargs):
+    """
+    Recompute the block window once the employees are saved as well
+    """
+    transaction.on_commit(lambda: update_disciplinary_window(instance))
+
+
+@receiver(m2m_changed, sender=DisciplinaryAction.employee_id.through)
+def disciplinary_employees_changed(sender, instance, action, **kwargs):
+    """
+    The window of hour based actions depends on the employees' shifts
+    """
+    if not isinstance(instance, DisciplinaryAction):
+        return
+    if action in ["pre_remove", "pre_clear"]:
+        # the removed employees are no longer blocked by this action
+        window = stored_window(instance)
+        if window_contains(window, timezone.now()):
+            user_ids = action_user_ids(instance, kwargs.get("pk_set"))
+            transaction.on_commit(lambda: release_users(user_ids))
+    if action in ["post_add", "post_remove", "post_clear"]:
+        transaction.on_commit(lambda: update_disciplinary_window(instance))
+
+
+@receiver(pre_delete, sender=DisciplinaryAction)
+def disciplinary_action_deleted(sender, instance, **kwargs):
+    """
+    Unblock the employees of a deleted action that was blocking them, unless
+    another action still blocks them
+    """
+    window = stored_window(instance)
+    if window_contains(window, timezone.now()):
+        user_ids = action_user_ids(instance)
+        transaction.on_commit(lambda: release_users(user_ids))
+
+
+@receiver(post_save, sender=Actiontype)
+def disciplinary_action_type_saved(sender, instance, **kwargs):
+    """
+    Recompute the windows of the actions of the type (block option or type
+    changes)
+    """
+    for action in DisciplinaryAction.objects.entire().filter(action=instance):
+        refresh_block_window(action)
+
+
+@receiver(post_migrate)
+def populate_disciplinary_windows(sender, **kwargs):
+    """
+    Compute the block windows of the existing actions after the window fields
+    are first migrated
+    """
+    if sender.label != "employee":
+        return
+    try:
+        for action in DisciplinaryAction.objects.entire().filter(
+            start_date__isnull=False,
+            block_date__isnull=True,
+            block_at__isnull=True,
+        ):
+            refresh_block_window(action)
+    except Exception as e:
+        stdout = kwargs.get("stdout") or sys.stdout
+        stdout.write(f"Error computing the disciplinary block windows: {e}\n")
@@ -1,3 +1,476 @@
-from django.test import TestCase
+import threading
+from datetime import date, datetime, timedelta
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.contrib.auth.hashers import check_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import (
+    SimpleTestCase,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.utils import timezone
+
+from attendance.models import Attendance
+from employee.methods import import_contracts, passwords
+from employee.methods.hierarchy import (
+    check_reporting_hierarchy,
+    get_hierarchy_tree,
+    get_subordinate_ids,
+)
+from employee.methods.methods import bulk_create_work_info_import
+from employee.methods.status import annotate_status
+from employee.models import (
+    Actiontype,
+    DisciplinaryAction,
+    Employee,
+    EmployeeImportContract,
+    EmployeeImportJob,
+    EmployeeWorkInformation,
+)
+from employee.scheduler import DISCIPLINARY_WATERMARK_KEY, block_unblock_disciplinary
+from leave.models import LeaveRequest, LeaveType
+from payroll.models.models import Contract
+
+NAN = float("nan")
+
+
+def create_employee(badge_id, **fields):
+    return Employee.objects.create(
+        employee_first_name=badge_id,
+        email=f"{badge_id.lower()}@horilla.com",
+        phone="1234567890",
+        badge_id=badge_id,
+        **fields,
+    )
+
+
+def work_info_row(badge_id, manager=NAN):
+    return {
+        "Badge ID": badge_id,
+        "Email": f"{badge_id.lower()}@horilla.com",
+        "Reporting Manager": manager,
+        "Department": NAN,
+        "Job Position": NAN,
+        "Job Role": NAN,
+        "Work Type": NAN,
+        "Employee Type": NAN,
+        "Shift": NAN,
+        "Company": NAN,
+        "Location": "",
+        "Date Joining": NAN,
+        "Contract End Date": NAN,
+        "Basic Salary": NAN,
+        "Salary Hour": NAN,
+    }
+
+
+class ReportingHierarchyImportTests(TestCase):
+    """
+    Tests of the reporting hierarchy of imported work information
+    """
+
+    def setUp(self):
+        self.director = create_employee("DIR")
+        self.manager = create_employee("MGR")
+        self.engineer = create_employee("ENG")
+        # imported employees have no work information yet, the import
+        # inserts it with bulk_create
+        EmployeeWorkInformation.objects.all().delete()
+
+    def test_bulk_created_work_info_reaches_the_hierarchy(self):
+        bulk_create_work_info_import(
+            [
+                work_info_row("ENG", "MGR"),
+                work_info_row("MGR", "DIR"),
+                work_info_row("DIR"),
+            ]
+        )
+        self.assertEqual(EmployeeWorkInformation.objects.count(), 3)
+        self.assertEqual(
+            set(get_subordinate_ids(self.director.id)),
+            {self.manager.id, self.engineer.id},
+        )
+        self.assertEqual(get_subordinate_ids(self.manager.id), [self.engineer.id])
+        self.assertEqual(check_reporting_hierarchy(), ({}, {}))
+
+    def test_hierarchy_tree_of_imported_employees(self):
+        bulk_create_work_info_import(
+            [work_info_row("MGR", "DIR"), work_info_row("ENG", "MGR")]
+        )
+        tree = get_hierarchy_tree(
+            self.director,
+            lambda employee, children: {
+                "badge_id": employee.badge_id,
+                "children": children,
+            },
+        )
+        self.assertEqual(
+            tree,
+            [{"badge_id": "MGR", "children": [{"badge_id": "ENG", "children": []}]}],
+        )
+
+
+TODAY = date(2025, 3, 12)
+NOW = timezone.make_aware(datetime(2025, 3, 12, 10, 0))
+
+
+@mock.patch("django.utils.timezone.now", lambda: NOW)
+class DisciplinaryBlockTests(TestCase):
+    """
+    Tests of the login blocks of the disciplinary actions, on a frozen clock
+    """
+
+    def setUp(self):
+        self.employee = create_employee("SUS")
+        self.suspension = Actiontype.objects.create(
+            title="Suspension", action_type="suspension", block_option=True
+        )
+
+    def suspend(self, start_date, days, employee=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            action = DisciplinaryAction.objects.create(
+                action=self.suspension,
+                description="-",
+                start_date=start_date,
+                days=days,
+            )
+            action.employee_id.add(employee or self.employee)
+        return action
+
+    def is_active(self, employee=None):
+        employee = employee or self.employee
+        return User.objects.get(id=employee.employee_user_id_id).is_active
+
+    def test_shortened_window_unblocks(self):
+        action = self.suspend(TODAY - timedelta(days=1), days=5)
+        self.assertFalse(self.is_active())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            action.days = 1
+            action.save()
+        self.assertEqual(action.unblock_date, TODAY)
+        self.assertTrue(self.is_active())
+
+    def test_deleted_action_unblocks(self):
+        action = self.suspend(TODAY, days=3)
+        self.assertFalse(self.is_active())
+        with self.captureOnCommitCallbacks(execute=True):
+            action.delete()
+        self.assertTrue(self.is_active())
+
+    def test_other_active_action_keeps_the_block(self):
+        action = self.suspend(TODAY, days=3)
+        self.suspend(TODAY - timedelta(days=1), days=2)
+        with self.captureOnCommitCallbacks(execute=True):
+            action.delete()
+        self.assertFalse(self.is_active())
+
+    def test_removed_employee_is_unblocked(self):
+        colleague = create_employee("COL")
+        action = self.suspend(TODAY, days=3)
+        with self.captureOnCommitCallbacks(execute=True):
+            action.employee_id.add(colleague)
+        self.assertFalse(self.is_active(colleague))
+        with self.captureOnCommitCallbacks(execute=True):
+            action.employee_id.remove(colleague)
+        self.assertTrue(self.is_active(colleague))
+        self.assertFalse(self.is_active())
+
+    def test_missing_watermark_reconciles_every_window(self):
+        colleague = create_employee("COL")
+        self.suspend(TODAY - timedelta(days=10), days=3)
+        self.suspend(TODAY - timedelta(days=10), 30, colleague)
+        # the windows started and ended while the scheduler was not running,
+        # long before the one day the scheduler used to look back
+        User.objects.filter(id=self.employee.employee_user_id_id).update(
+            is_active=False
+        )
+        User.objects.filter(id=colleague.employee_user_id_id).update(is_active=True)
+
+        cache.delete(DISCIPLINARY_WATERMARK_KEY)
+        block_unblock_disciplinary()
+        self.assertTrue(self.is_active())
+        self.assertFalse(self.is_active(colleague))
+        self.assertEqual(cache.get(DISCIPLINARY_WATERMARK_KEY), NOW)
+
+
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class PasswordHashingTests(SimpleTestCase):
+    """
+    Tests of the hashing of the imported user passwords
+    """
+
+    def test_passwords_are_hashed_in_order_by_the_pool_threads(self):
+        threads = set()
+        encode_password = passwords.encode_password
+
+        def record_thread(hasher, password):
+            threads.add(threading.current_thread().name)
+            return encode_password(hasher, password)
+
+        raw = [f"98765{index:05d}" for index in range(250)]
+        progress = []
+        with mock.patch.object(passwords, "encode_password", record_thread):
+            hashes = passwords.hash_passwords(
+                raw, on_progress=progress.append, workers=2
+            )
+        self.assertEqual(len(hashes), 250)
+        self.assertTrue(all(map(check_password, raw, hashes)))
+        self.assertEqual(progress, [200, 250])
+        self.assertTrue(threads)
+        self.assertTrue(all(name.startswith("password-hashing") for name in threads))
+
+    def test_small_batches_are_hashed_in_the_calling_thread(self):
+        with mock.patch.object(passwords, "ThreadPoolExecutor") as executor:
+            hashes = passwords.hash_passwords(["secret"] * 10, workers=4)
+        executor.assert_not_called()
+        self.assertTrue(check_password("secret", hashes[0]))
+
+
+class EmployeeStatusTests(TestCase):
+    """
+    Tests of the status badges annotated onto a page of employee cards
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = date.today()
+        cls.employees = Employee.objects.bulk_create(
+            [
+                Employee(
+                    employee_first_name=f"Card {index:03d}",
+                    email=f"card{index}@horilla.com",
+                    phone="1234567890",
+                    badge_id=f"CARD{index}",
+                )
+                for index in range(100)
+            ]
+        )
+        [leave_type] = LeaveType.objects.bulk_create(
+            [LeaveType(name="Casual", reset_month="1")]
+        )
+        LeaveRequest.objects.bulk_create(
+            [
+                LeaveRequest(
+                    employee_id=employee,
+                    leave_type_id=leave_type,
+                    start_date=cls.today,
+                    end_date=cls.today,
+                    description="Leave",
+                    reject_reason="",
+                    status=status,
+                )
+                for employee, status in zip(
+                    cls.employees, ["approved", "requested", "rejected"]
+                )
+            ]
+        )
+        Attendance.objects.bulk_create(
+            [
+                Attendance(employee_id=cls.employees[3], attendance_date=cls.today),
+                Attendance(
+                    employee_id=cls.employees[4],
+                    attendance_date=cls.today,
+                    attendance_clock_out_date=cls.today,
+                ),
+            ]
+        )
+
+    def test_card_page_statuses_are_one_query(self):
+        queryset = annotate_status(Employee.objects.entire().order_by("pk"), self.today)
+        with self.assertNumQueries(1):
+            employees = list(queryset)
+            statuses = [employee.get_leave_status() for employee in employees]
+            online = [employee.check_online() for employee in employees]
+        self.assertEqual(len(employees), 100)
+        self.assertEqual(
+            statuses[:6],
+            [
+                "On Leave",
+                "Waiting Approval",
+                "Canceled / Rejected",
+                "On a break",
+                "On a break",
+                "Expected working",
+            ],
+        )
+        self.assertEqual(online[:6], [False, False, False, True, False, False])
+        self.assertEqual(statuses.count("Expected working"), 95)
+
+        # the annotated statuses match the per employee queries
+        for employee in self.employees[:6]:
+            employee = Employee.objects.entire().get(pk=employee.pk)
+            self.assertNotIn("leave_today", employee.__dict__)
+            self.assertEqual(
+                employee.get_leave_status(), statuses[self.employees.index(employee)]
+            )
+
+
+def queue_contracts(count):
+    job = EmployeeImportJob.objects.create()
+    employees = [create_employee(f"IMP{index}") for index in range(count)]
+    # bulk imported work information does not get the contract of the signal
+    Contract.objects.entire().delete()
+    import_contracts.enqueue_import_contracts(job, [emp.pk for emp in employees])
+    return job, employees
+
+
+def drain(job, batch_size=import_contracts.CONTRACT_BATCH_SIZE):
+    while import_contracts.process_contract_batch(job.id, batch_size):
+        pass
+
+
+class ImportContractTests(TestCase):
+    """
+    Tests of the durable queue generating the contracts of imported employees
+    """
+
+    def outcomes(self, job):
+        return dict(
+            EmployeeImportContract.objects.filter(job=job).values_list(
+                "employee_id", "status"
+            )
+        )
+
+    def test_killed_run_is_resumed_without_duplicates(self):
+        job, employees = queue_contracts(5)
+        bulk_update = EmployeeImportContract.objects.bulk_update
+        calls = []
+
+        def killed_on_second_batch(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == 2:
+                # the worker dies after inserting the contracts of the batch
+                raise KeyboardInterrupt
+            return bulk_update(*args, **kwargs)
+
+        with mock.patch.object(
+            EmployeeImportContract.objects, "bulk_update", killed_on_second_batch
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                drain(job, batch_size=2)
+        self.assertEqual(Contract.objects.entire().count(), 2)
+        self.assertEqual(list(self.outcomes(job).values()).count("pending"), 3)
+
+        # picked up again by the scheduler once stale
+        EmployeeImportContract.objects.update(
+            updated_at=timezone.now() - import_contracts.STALE_AFTER * 2
+        )
+        with mock.patch.object(import_contracts, "connection"):
+            import_contracts.resume_stale_imports()
+        self.assertEqual(set(self.outcomes(job).values()), {"created"})
+        self.assertEqual(
+            sorted(Contract.objects.entire().values_list("employee_id", flat=True)),
+            sorted(emp.pk for emp in employees),
+        )
+
+        # importing the same employees again skips them
+        job_again = EmployeeImportJob.objects.create()
+        import_contracts.enqueue_import_contracts(
+            job_again, [emp.pk for emp in employees]
+        )
+        import_contracts.enqueue_import_contracts(
+            job_again, [emp.pk for emp in employees]
+        )
+        drain(job_again)
+        self.assertEqual(set(self.outcomes(job_again).values()), {"skipped"})
+        self.assertEqual(
+            EmployeeImportContract.objects.filter(job=job_again).count(), 5
+        )
+        self.assertEqual(Contract.objects.entire().count(), 5)
+
+    def test_failing_row_fails_after_three_attempts(self):
+        job, employees = queue_contracts(4)
+        failing = EmployeeImportContract.objects.get(employee_id=employees[1])
+        generate_contracts = import_contracts.generate_contracts
+
+        def fail_one(outcome_ids):
+            if failing.id in outcome_ids:
+                raise ValueError("broken work information")
+            return generate_contracts(outcome_ids)
+
+        with mock.patch.object(import_contracts, "generate_contracts", fail_one):
+            drain(job)
+        failing.refresh_from_db()
+        self.assertEqual(failing.status, "failed")
+        self.assertEqual(failing.attempts, import_contracts.MAX_ATTEMPTS)
+        self.assertEqual(failing.message, "broken work information")
+        self.assertEqual(
+            list(self.outcomes(job).values()).count("created"), len(employees) - 1
+        )
+        self.assertFalse(
+            Contract.objects.entire().filter(employee_id=employees[1]).exists()
+        )
+
+    def test_job_is_run_by_one_thread_of_the_process(self):
+        job, _employees = queue_contracts(1)
+        started, release = threading.Event(), threading.Event()
+
+        def blocked_batch(job_id):
+            started.set()
+            release.wait(5)
+            return 0
+
+        with mock.patch.object(
+            import_contracts, "process_contract_batch", side_effect=blocked_batch
+        ) as process, mock.patch.object(import_contracts, "connection"):
+            worker = threading.Thread(
+                target=import_contracts.run_import_contracts, args=(job.id,)
+            )
+            worker.start()
+            started.wait(5)
+            import_contracts.run_import_contracts(job.id)
+            release.set()
+            worker.join()
+        self.assertEqual(process.call_count, 1)
+
+
+@skipUnless(
+    connection.features.has_select_for_update_skip_locked,
+    "the database does not lock rows",
+)
+class ImportContractLockTests(TransactionTestCase):
+    """
+    Tests of the row locks shared by the workers of several processes
+    """
+
+    def test_rows_locked_by_another_worker_are_left_to_it(self):
+        with mock.patch.object(import_contracts, "start_import_contracts"):
+            job, _employees = queue_contracts(4)
+        locked_ids = list(
+            EmployeeImportContract.objects.filter(job=job).values_list("id", flat=True)
+        )[:2]
+        locked, release = threading.Event(), threading.Event()
+
+        def other_worker():
+            with transaction.atomic():
+                list(
+                    EmployeeImportContract.objects.select_for_update().filter(
+                        id__in=locked_ids
+                    )
+                )
+                locked.set()
+                release.wait(10)
+            connection.close()
+
+        worker = threading.Thread(target=other_worker)
+        worker.start()
+        locked.wait(10)
+        try:
+            drain(job)
+        finally:
+            release.set()
+            worker.join()
+        self.assertEqual(
+            list(
+                EmployeeImportContract.objects.filter(job=job)
+                .order_by("id")
+                .values_list("status", flat=True)
+            ),
+            ["pending", "pending", "created", "created"],
+        )
+        self.assertEqual(Contract.objects.entire().count(), 2)
@@ -173,6 +173,11 @@ urlpatterns = [
         views.work_info_import_file,
         name="work-info-import-file",
     ),
+    path(
+        "employee-import-job/<int:job_id>",
+        views.employee_import_job,
+        name="employee-import-job",
+    ),
     path("work-info-export", views.work_info_export, name="work-info-export"),
     path("get-birthday", views.get_employees_birthday, name="get-birthday"),
     path("dashboard", views.dashboard, name="dashboard"),
@@ -25,7 +25,6 @@ from django.apps import apps
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.models import User
-from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.db.models import F, ProtectedError
@@ -41,8 +40,6 @@ from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_http_methods
 
 from accessibility.decorators import enter_if_accessible
-from accessibility.methods import update_employee_accessibility_cache
-from accessibility.middlewares import ACCESSIBILITY_CACHE_USER_KEYS
 from accessibility.models import DefaultAccessibility
 from base.forms import ModelForm
 from base.methods import (
@@ -81,20 +78,14 @@ from employee.forms import (
     EmployeeWorkInformationUpdateForm,
     excel_columns,
 )
+from employee.methods.avatars import AVATAR_FIELDS
+from employee.methods.hierarchy import get_hierarchy_tree
+from employee.methods.status import annotate_status
 from employee.methods.methods import (
-    bulk_create_department_import,
-    bulk_create_employee_import,
-    bulk_create_employee_types,
-    bulk_create_job_position_import,
-    bulk_create_job_role_import,
-    bulk_create_shifts,
-    bulk_create_user_import,
-    bulk_create_work_info_import,
-    bulk_create_work_types,
     error_data_template,
     get_ordered_badge_ids,
     process_employee_records,
-    set_initial_password,
+    run_employee_import,
     valid_import_file_headers,
 )
 from employee.models import (
@@ -102,6 +93,7 @@ from employee.models import (
     Employee,
     EmployeeBankDetails,
     EmployeeGeneralSetting,
+    EmployeeImportJob,
     EmployeeNote,
     EmployeeTag,
     EmployeeWorkInformation,
@@ -285,18 +277,12 @@ def profile_edit_access(request, emp_id):
         employees = Employee.objects.filter(id=emp_id)
 
         if employee := employees.first():
-            if employee in accessibility.employees.all():
+            # the cached accessible features are invalidated by the m2m signal
+            if accessibility.employees.filter(pk=employee.pk).exists():
                 accessibility.employees.remove(employee)
             else:
                 accessibility.employees.add(employee)
 
-            user_cache_key = ACCESSIBILITY_CACHE_USER_KEYS.get(
-                employees.first().employee_user_id.id, None
-            )
-            if user_cache_key:
-                cache.delete(user_cache_key[-1])
-                update_employee_accessibility_cache(user_cache_key[-1], employee)
-
     return HttpResponseRedirect(request.META.get("HTTP_REFERER", "/"))
 
 
@@ -1068,6 +1054,8 @@ def employee_view(request):
     if request.GET.get("is_active") != "False":
         filter_obj = filter_obj.filter(is_active=True)
 
+    filter_obj = annotate_status(filter_obj)
+
     update_fields = BulkUpdateFieldForm()
     data_dict = parse_qs(previous_data)
     get_key_instances(Employee, data_dict)
@@ -1800,6 +1788,7 @@ def employee_filter_view(request):
         and selected_company != "all"
     ):
         employees = employees.filter(employee_work_info__company_id=selected_company)
+    employees = annotate_status(employees)
     page_number = request.GET.get("page")
     view = request.GET.get("view")
     data_dict = parse_qs(previous_data)
@@ -1857,7 +1846,7 @@ def employee_card(request):
             queryset=employees.filter(employee_first_name__icontains=search),
         )
     page_number = request.GET.get("page")
-    employees = sortby(request, filter_obj.qs, "orderby")
+    employees = annotate_status(sortby(request, filter_obj.qs, "orderby"))
     return render(
         request,
         "employee_personal_info/employee_card.html",
@@ -1895,7 +1884,7 @@ def employee_list(request):
     employees = filtersubordinatesemployeemodel(
         request, filter_obj.qs, "employee.view_employee"
     )
-    employees = sortby(request, employees, "orderby")
+    employees = annotate_status(sortby(request, employees, "orderby"))
     page_number = request.GET.get("page")
     return render(
         request,
@@ -2281,7 +2270,7 @@ def employee_search(request):
     employees = filtersubordinatesemployeemodel(
         request, employees, "employee.view_employee"
     )
-    employees = sortby(request, employees, "orderby")
+    employees = annotate_status(sortby(request, employees, "orderby"))
     data_dict = parse_qs(previous_data)
     get_key_instances(Employee, data_dict)
     return render(
@@ -2512,6 +2501,8 @@ def employee_export(_):
     field_names.remove("is_from_onboarding")
     field_names.remove("is_directly_converted")
     field_names.remove("is_active")
+    for field_name in AVATAR_FIELDS:
+        field_names.remove(field_name)
 
     # Get the existing employee data and convert it to a DataFrame
     employee_data = Employee.objects.values_list(*field_names)
@@ -2619,25 +2610,15 @@ def work_info_import(request):
             success_list, error_list, created_count = process_employee_records(
                 data_frame
             )
+            job = None
             if success_list:
-                try:
-                    users = bulk_create_user_import(success_list)
-                    employees = bulk_create_employee_import(success_list)
-                    bulk_create_department_import(success_list)
-                    bulk_create_job_position_import(success_list)
-                    bulk_create_job_role_import(success_list)
-                    bulk_create_work_types(success_list)
-                    bulk_create_shifts(success_list)
-                    bulk_create_employee_types(success_list)
-                    bulk_create_work_info_import(success_list)
-                    thread = threading.Thread(
-                        target=set_initial_password, args=(employees,)
-                    )
-                    thread.start()
-
-                except Exception as e:
-                    messages.error(request, _("Error Occured {}").format(e))
-                    logger.error(e)
+                job = EmployeeImportJob.objects.create(
+                    created_by=request.user, total=len(success_list)
+                )
+                thread = threading.Thread(
+                    target=run_employee_import, args=(job, success_list)
+                )
+                thread.start()
 
             path_info = (
                 generate_error_report(
@@ -2653,6 +2634,7 @@ def work_info_import(request):
                 "error_count": len(error_list),
                 "model": _("Employees"),
                 "path_info": path_info,
+                "import_job": job,
             }
             result = render_to_string("import_popup.html", context)
             result += """
@@ -2675,6 +2657,18 @@ def work_info_import(request):
     )
 
 
+@login_required
+@hx_request_required
+@permission_required("employee.add_employee")
+def employee_import_job(request, job_id):
+    """
+    Renders the progress of an employee import job, polled by the import
+    result popup until the job is finished
+    """
+    job = get_object_or_404(EmployeeImportJob, id=job_id)
+    return render(request, "employee/import_job.html", {"import_job": job})
+
+
 @login_required
 @manager_can_enter("employee.view_employee")
 def work_info_export(request):
@@ -3375,52 +3369,27 @@ def organisation_chart(request):
     # Iterate through the queryset and add reporting manager id and name to the dictionary
     result_dict = {item.id: item.get_full_name() for item in reporting_managers}
 
-    entered_req_managers = []
+    def hierarchy_node(employee, children):
+        """
+        Org chart node builder, subordinates who are not reporting managers
+        are rendered as middle level nodes
+        """
+        node = {
+            "name": employee.get_full_name(),
+            "title": getattr(employee.get_job_position(), "job_position", _("Not set")),
+            "children": children,
+        }
+        if employee.id not in result_dict:
+            node["className"] = "middle-level"
+        return node
 
-    # Helper function to recursively create the hierarchy structure
+    # the whole tree below a manager is read from the reporting hierarchy
+    # closure table in a single pass
     def create_hierarchy(manager):
         """
         Hierarchy generator method
         """
-        nodes = []
-        # check the manager is a reporting manager if yes, store it into entered_req_managers
-        if manager.id in result_dict.keys():
-            entered_req_managers.append(manager)
-        # filter the subordinates
-        subordinates = Employee.objects.filter(
-            is_active=True, employee_work_info__reporting_manager_id=manager
-        ).exclude(id=manager.id)
-
-        # itrating through subordinates
-        for employee in subordinates:
-            if employee in entered_req_managers:
-                continue
-            # check the employee is a reporting manager if yes,remove className store
-            # it into entered_req_managers
-            if employee.id in result_dict.keys():
-                nodes.append(
-                    {
-                        "name": employee.get_full_name(),
-                        "title": getattr(
-                            employee.get_job_position(), "job_position", _("Not set")
-                        ),
-                        "children": create_hierarchy(employee),
-                    }
-                )
-                entered_req_managers.append(employee)
-
-            else:
-                nodes.append(
-                    {
-                        "name": employee.get_full_name(),
-                        "title": getattr(
-                            employee.get_job_position(), "job_position", _("Not set")
-                        ),
-                        "className": "middle-level",
-                        "children": create_hierarchy(employee),
-                    }
-                )
-        return nodes
+        return get_hierarchy_tree(manager, hierarchy_node)
 
     selected_company = request.session.get("selected_company")
     if (
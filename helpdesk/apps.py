@@ -8,6 +8,7 @@ class HelpdeskConfig(AppConfig):
     def ready(self):
         from django.urls import include, path
 
+        from helpdesk import signals
         from horilla.horilla_settings import APPS
         from horilla.urls import urlpatterns
 
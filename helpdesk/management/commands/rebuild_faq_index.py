@@ -0,0 +1,29 @@
+"""
+Django management command to rebuild the FAQ search index
+
+Usage:
+    python manage.py rebuild_faq_index [--batch-size N]
+
+This command indexes the question, answer, tags and category of every FAQ
+again, e.g. after FAQs were loaded without signals.
+"""
+
+from django.core.management.base import BaseCommand
+
+from helpdesk.search import INDEX_BATCH_SIZE, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the FAQ search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=INDEX_BATCH_SIZE,
+            help="Number of FAQs indexed per batch",
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} FAQs"))
@@ -1,4 +1,11 @@
-from helpdesk.models import DepartmentManager
+from django.core.paginator import Paginator
+from django.db.models import Count, Exists, OuterRef, Q
+
+from base.methods import get_pagination
+from base.models import JobPosition
+from employee.models import EmployeeReportingHierarchy
+from helpdesk.models import DepartmentManager, Ticket
+from horilla.horilla_apps import NESTED_SUBORDINATE_VISIBILITY
 
 
 def is_department_manager(request, ticket):
@@ -16,3 +23,98 @@ def is_department_manager(request, ticket):
     return DepartmentManager.objects.filter(
         manager=user_emp, department=department
     ).exists()
+
+
+def ticket_queue_filters(request):
+    """
+    Returns the {tab: Q object} of the ticket queue tabs of the user
+
+    my: tickets the user raised or owns
+    allocated: active tickets forwarded to the user, their department or
+    their job position
+    all: every ticket with view permission, otherwise the tickets the user
+    can open (raised, assigned, of a subordinate or of a managed department)
+    """
+    user = request.user
+    employee = user.employee_get
+    my_tickets = Q(employee_id=employee) | Q(created_by=user)
+
+    allocated = Q(assigning_type="individual", raised_on=str(employee.id))
+    work_info = getattr(employee, "employee_work_info", None)
+    if work_info and work_info.department_id_id:
+        allocated |= Q(
+            assigning_type="department", raised_on=str(work_info.department_id_id)
+        )
+    if work_info and work_info.job_position_id_id:
+        allocated |= Q(
+            assigning_type="job_position", raised_on=str(work_info.job_position_id_id)
+        )
+
+    if user.has_perm("helpdesk.view_ticket"):
+        all_tickets = Q()
+    else:
+        subordinates = EmployeeReportingHierarchy.objects.filter(
+            ancestor_id=employee.id, descendant_id=OuterRef("employee_id")
+        )
+        if not NESTED_SUBORDINATE_VISIBILITY:
+            subordinates = subordinates.filter(depth=1)
+        assignees = Ticket.assigned_to.through.objects.filter(
+            ticket_id=OuterRef("pk"), employee_id=employee.id
+        )
+        departments = list(
+            DepartmentManager.objects.entire()
+            .filter(manager=employee)
+            .values_list("department_id", flat=True)
+        )
+        job_positions = JobPosition.objects.entire().filter(
+            department_id__in=departments
+        )
+        all_tickets = (
+            my_tickets
+            | Q(Exists(assignees))
+            | Q(Exists(subordinates))
+            | Q(
+                assigning_type="department",
+                raised_on__in=[str(department) for department in departments],
+            )
+            | Q(
+                assigning_type="job_position",
+                raised_on__in=[
+                    str(job_position)
+                    for job_position in job_positions.values_list("id", flat=True)
+                ],
+            )
+        )
+    return {
+        "my": my_tickets,
+        "allocated": Q(is_active=True) & allocated,
+        "all": all_tickets,
+    }
+
+
+def ticket_queues(request, tickets):
+    """
+    Split the tickets into the queue tabs of the user
+
+    Returns:
+        tuple: ({tab: queryset}, {tab: ticket count}), the counts of every
+        tab come from a single aggregate query
+    """
+    filters = ticket_queue_filters(request)
+    counts = tickets.order_by().aggregate(
+        **{tab: Count("pk", filter=condition) for tab, condition in filters.items()}
+    )
+    queues = {
+        tab: tickets.filter(condition).select_related("employee_id", "ticket_type")
+        for tab, condition in filters.items()
+    }
+    return queues, counts
+
+
+def paginate_queue(queryset, page_number, count):
+    """
+    Paginate a ticket queue whose count is already known
+    """
+    paginator = Paginator(queryset, get_pagination())
+    paginator.count = count
+    return paginator.get_page(page_number)
@@ -132,6 +132,14 @@ class Ticket(HorillaModel):
         ordering = ["-created_date"]
         verbose_name = _("Ticket")
         verbose_name_plural = _("Tickets")
+        indexes = [
+            models.Index(fields=["status"]),
+            models.Index(fields=["priority"]),
+            models.Index(fields=["deadline"]),
+            models.Index(fields=["assigning_type", "raised_on"]),
+            # cursor pagination of the ticket API
+            models.Index(fields=["-created_date", "-id"]),
+        ]
 
     def get_raised_on(self):
         obj_id = self.raised_on
@@ -309,3 +317,19 @@ class FAQ(HorillaModel):
     class Meta:
         verbose_name = _("FAQ")
         verbose_name_plural = _("FAQs")
+
+
+class FAQSearchTerm(models.Model):
+    """
+    Search index entry of a FAQ, one row per distinct term of the FAQ with
+    the weight of the most relevant field it appears in
+    """
+
+    faq = models.ForeignKey(FAQ, on_delete=models.CASCADE, related_name="search_terms")
+    term = models.CharField(max_length=64, db_index=True)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        verbose_name = _("FAQ Search Term")
+        verbose_name_plural = _("FAQ Search Terms")
+        unique_together = ("faq", "term")
@@ -0,0 +1,156 @@
+"""
+search.py
+
+This module is used to maintain the FAQ search index (`FAQSearchTerm`) and to
+run ranked prefix / fuzzy searches against it
+"""
+
+import re
+from difflib import get_close_matches
+from functools import reduce
+from operator import or_
+
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Q, Sum, When
+from django.utils.html import strip_tags
+
+from helpdesk.models import FAQ, FAQSearchTerm
+
+# weight of a term by the field it is found in, the highest one is kept
+FIELD_WEIGHTS = {"question": 8, "tags": 4, "category": 2, "answer": 1}
+# matches on a whole query word rank above matches on a longer term
+EXACT_MATCH_BONUS = 2
+MIN_TERM_LENGTH = 2
+MAX_TERM_LENGTH = 64
+MAX_QUERY_TERMS = 8
+# terms compared with a misspelled query word
+FUZZY_CANDIDATES = 500
+FUZZY_CUTOFF = 0.75
+FAQ_SEARCH_LIMIT = 50
+FAQ_SUGGESTION_LIMIT = 10
+INDEX_BATCH_SIZE = 1000
+
+
+def tokenize(text):
+    """
+    Returns the lowercase words of the text, html tags removed
+    """
+    return [
+        word[:MAX_TERM_LENGTH]
+        for word in re.findall(r"\w+", strip_tags(text or "").lower())
+        if len(word) >= MIN_TERM_LENGTH
+    ]
+
+
+def faq_terms(faq):
+    """
+    Returns {term: weight} of the FAQ
+    """
+    fields = {
+        "question": faq.question,
+        "answer": faq.answer,
+        "category": faq.category.title if faq.category_id else "",
+        "tags": " ".join(tag.title for tag in faq.tags.all()),
+    }
+    terms = {}
+    for field, text in fields.items():
+        for term in tokenize(text):
+            terms[term] = max(terms.get(term, 0), FIELD_WEIGHTS[field])
+    return terms
+
+
+def index_faqs(faqs):
+    """
+    Replace the index entries of the FAQs
+
+    Args:
+        faqs: FAQ queryset
+    """
+    faqs = list(faqs.select_related("category").prefetch_related("tags"))
+    entries = [
+        FAQSearchTerm(faq=faq, term=term, weight=weight)
+        for faq in faqs
+        for term, weight in faq_terms(faq).items()
+    ]
+    with transaction.atomic():
+        FAQSearchTerm.objects.filter(faq__in=faqs).delete()
+        FAQSearchTerm.objects.bulk_create(entries, batch_size=INDEX_BATCH_SIZE)
+
+
+def rebuild_index(batch_size=INDEX_BATCH_SIZE):
+    """
+    Rebuild the whole FAQ search index
+
+    Returns:
+        int: number of indexed FAQs
+    """
+    FAQSearchTerm.objects.all().delete()
+    ids = list(FAQ.objects.entire().order_by("id").values_list("id", flat=True))
+    for start in range(0, len(ids), batch_size):
+        index_faqs(FAQ.objects.entire().filter(id__in=ids[start : start + batch_size]))
+    return len(ids)
+
+
+def fuzzy_terms(word):
+    """
+    Returns the indexed terms close to a word that matches no term
+    """
+    candidates = (
+        FAQSearchTerm.objects.filter(term__startswith=word[:MIN_TERM_LENGTH])
+        .values_list("term", flat=True)
+        .distinct()[:FUZZY_CANDIDATES]
+    )
+    return get_close_matches(word, list(candidates), n=3, cutoff=FUZZY_CUTOFF)
+
+
+def search_faqs(query, queryset, limit=FAQ_SEARCH_LIMIT):
+    """
+    Ranked search of the FAQs. Every query word matches the indexed terms it
+    is a prefix of, words matching no term are corrected to the closest
+    indexed terms.
+
+    Args:
+        query: search text
+        queryset: FAQs to search in
+        limit: maximum number of results
+
+    Returns:
+        queryset: the best matching FAQs of the queryset, best first
+    """
+    words = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    if not words:
+        return queryset.none()
+
+    exact = set()
+    conditions = []
+    for word in words:
+        if FAQSearchTerm.objects.filter(term__startswith=word).exists():
+            exact.add(word)
+            conditions.append(Q(term__startswith=word))
+        else:
+            corrected = fuzzy_terms(word)
+            exact.update(corrected)
+            conditions.append(Q(term__in=corrected))
+
+    ranked = list(
+        FAQSearchTerm.objects.filter(
+            reduce(or_, conditions), faq__in=queryset.values("id")
+        )
+        .values("faq_id")
+        .annotate(
+            score=Sum(
+                Case(
+                    When(term__in=exact, then=F("weight") * EXACT_MATCH_BONUS),
+                    default=F("weight"),
+                    output_field=IntegerField(),
+                )
+            )
+        )
+        .order_by("-score", "faq_id")
+        .values_list("faq_id", flat=True)[:limit]
+    )
+    rank = Case(
+        *[When(id=faq_id, then=position) for position, faq_id in enumerate(ranked)],
+        output_field=IntegerField(),
+    )
+    return queryset.filter(id__in=ranked).order_by(rank) if ranked else queryset.none()
@@ -0,0 +1,72 @@
+"""
+helpdesk/signals.py
+
+This module is used to keep the FAQ search index current
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from base.models import Tags
+from helpdesk.models import FAQ, FAQCategory
+from helpdesk.search import index_faqs
+
+
+@receiver(post_save, sender=FAQ)
+def faq_post_save(sender, instance, **kwargs):
+    """
+    Reindex the saved FAQ, its index entries are removed along with it on
+    delete
+    """
+    index_faqs(FAQ.objects.entire().filter(id=instance.id))
+
+
+@receiver(m2m_changed, sender=FAQ.tags.through)
+def faq_tags_changed(sender, instance, action, pk_set, **kwargs):
+    """
+    Reindex the FAQs whose tags changed
+    """
+    if action not in ["post_add", "post_remove", "post_clear"]:
+        return
+    if isinstance(instance, FAQ):
+        faqs = FAQ.objects.entire().filter(id=instance.id)
+    else:
+        faqs = FAQ.objects.entire().filter(id__in=pk_set or [])
+    index_faqs(faqs)
+
+
+@receiver(post_save, sender=FAQCategory)
+def faq_category_post_save(sender, instance, created, **kwargs):
+    """
+    Reindex the FAQs of a renamed category
+    """
+    if not created:
+        index_faqs(FAQ.objects.entire().filter(category=instance))
+
+
+@receiver(post_save, sender=Tags)
+def tags_post_save(sender, instance, created, **kwargs):
+    """
+    Reindex the FAQs of a renamed tag
+    """
+    if not created:
+        index_faqs(FAQ.objects.entire().filter(tags=instance))
+
+
+@receiver(pre_delete, sender=Tags)
+def tags_pre_delete(sender, instance, **kwargs):
+    """
+    Remember the FAQs of a tag before its links are deleted
+    """
+    instance.tagged_faq_ids = list(
+        FAQ.objects.entire().filter(tags=instance).values_list("id", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Tags)
+def tags_post_delete(sender, instance, **kwargs):
+    """
+    Reindex the FAQs of a deleted tag
+    """
+    if getattr(instance, "tagged_faq_ids", None):
+        index_faqs(FAQ.objects.entire().filter(id__in=instance.tagged_faq_ids))
@@ -1,3 +1,68 @@
-from django.test import TestCase
-
-# Create your tests here.
+from django.test import TestCase
+
+from employee.models import Employee
+from helpdesk.models import FAQ, FAQCategory
+from helpdesk.search import FAQ_SEARCH_LIMIT, index_faqs
+from horilla.horilla_middlewares import _thread_locals
+
+
+class FAQSearchTests(TestCase):
+    """
+    Tests of the ranked FAQ search of a category
+    """
+
+    def setUp(self):
+        # bulk inserts, saving FAQs outside of a request is not supported
+        self.accounts, self.payroll = FAQCategory.objects.bulk_create(
+            [FAQCategory(title="Accounts"), FAQCategory(title="Payroll")]
+        )
+        FAQ.objects.bulk_create(
+            [
+                FAQ(
+                    question=f"How do I reset my password {index}?",
+                    answer="Use the login page.",
+                    category=self.accounts,
+                )
+                for index in range(FAQ_SEARCH_LIMIT + 10)
+            ]
+            + [
+                FAQ(
+                    question="Is my payslip password protected?",
+                    answer="Yes.",
+                    category=self.payroll,
+                ),
+                FAQ(
+                    question="Where is the old payslip password?",
+                    answer="Archived.",
+                    category=self.payroll,
+                    is_active=False,
+                ),
+            ]
+        )
+        index_faqs(FAQ.objects.all())
+        employee = Employee.objects.create(
+            employee_first_name="Reader",
+            email="reader@horilla.com",
+            phone="1234567890",
+            badge_id="RDR",
+        )
+        user = employee.employee_user_id
+        user.is_new_employee = False
+        user.save()
+        self.client.force_login(user)
+
+    def tearDown(self):
+        # the middleware leaves the last request of the client in the thread
+        _thread_locals.__dict__.pop("request", None)
+
+    def test_search_is_restricted_to_the_active_faqs_of_the_category(self):
+        response = self.client.get(
+            # the helpdesk urls are appended once the url resolver is cached
+            "/helpdesk/faq-search/",
+            {"search": "password", "cat_id": self.payroll.id},
+            HTTP_HX_REQUEST="true",
+        )
+        self.assertEqual(
+            [faq.question for faq in response.context["faqs"]],
+            ["Is my payslip password protected?"],
+        )
@@ -18,13 +18,7 @@ from django.utils.translation import gettext as _
 from django.views.decorators.http import require_http_methods
 
 from base.forms import TagsForm
-from base.methods import (
-    filtersubordinates,
-    get_key_instances,
-    is_reportingmanager,
-    paginator_qry,
-    sortby,
-)
+from base.methods import get_key_instances, sortby
 from base.models import Department, JobPosition, Tags
 from employee.models import Employee
 from employee.views import get_content_type
@@ -32,7 +26,6 @@ from helpdesk.decorators import ticket_owner_can_enter
 from helpdesk.filter import (
     FAQCategoryFilter,
     FAQFilter,
-    FaqSearch,
     TicketFilter,
     TicketReGroup,
 )
@@ -48,7 +41,12 @@ from helpdesk.forms import (
     TicketTagForm,
     TicketTypeForm,
 )
-from helpdesk.methods import is_department_manager
+from helpdesk.methods import (
+    is_department_manager,
+    paginate_queue,
+    ticket_queue_filters,
+    ticket_queues,
+)
 from helpdesk.models import (
     FAQ,
     TICKET_STATUS,
@@ -60,6 +58,7 @@ from helpdesk.models import (
     Ticket,
     TicketType,
 )
+from helpdesk.search import FAQ_SUGGESTION_LIMIT, search_faqs
 from helpdesk.threading import AddAssigneeThread, RemoveAssigneeThread, TicketSendThread
 from horilla.decorators import (
     hx_request_required,
@@ -299,17 +298,16 @@ def faq_search(request):
     data_dict = parse_qs(previous_data)
     get_key_instances(FAQ, data_dict)
 
-    if query:
-        faqs = FaqSearch(request.GET).qs
-
-    else:
-        faqs = FAQ.objects.filter(is_active=True)
-        if category:
-            return redirect(faq_category_search)
-
+    faqs = FAQ.objects.filter(is_active=True)
     if id:
         data_dict.pop("cat_id")
         faqs = faqs.filter(category=id)
+    if query:
+        # rank within the category, the search returns a limited page
+        faqs = search_faqs(query, faqs)
+    elif category:
+        return redirect(faq_category_search)
+
     if category:
         data_dict.pop("category")
 
@@ -353,7 +351,13 @@ def faq_filter(request, id):
 
 @login_required
 def faq_suggestion(request):
-    faqs = FAQFilter(request.GET).qs
+    data = request.GET.copy()
+    query = data.pop("search", [""])[-1]
+    faqs = FAQFilter(data).qs
+    if query:
+        faqs = search_faqs(query, faqs, limit=FAQ_SUGGESTION_LIMIT)
+    else:
+        faqs = faqs[:FAQ_SUGGESTION_LIMIT]
     data_list = list(faqs.values())
     response = {
         "faqs": data_list,
@@ -387,47 +391,22 @@ def ticket_view(request):
     """
     tickets = Ticket.objects.filter(is_active=True)
     view = request.GET.get("view") if request.GET.get("view") else "list"
-    employee = request.user.employee_get
     previous_data = request.GET.urlencode()
-    my_page_number = request.GET.get("my_page")
-    all_page_number = request.GET.get("all_page")
-    allocated_page_number = request.GET.get("allocated_page")
-
-    my_tickets = tickets.filter(employee_id=employee) | tickets.filter(
-        created_by=request.user
-    )
-    all_tickets = []
-    if is_reportingmanager(request):
-        all_tickets = filtersubordinates(request, tickets, "helpdesk.view_ticket")
-    if request.user.has_perm("helpdesk.view_ticket"):
-        all_tickets = tickets
-    allocated_tickets = []
-    ticket_list = tickets.filter(is_active=True)
-    user = request.user.employee_get
-    if hasattr(user, "employee_work_info"):
-        department = user.employee_work_info.department_id
-        job_position = user.employee_work_info.job_position_id
-        if department:
-            tickets_items = ticket_list.filter(
-                raised_on=department.id, assigning_type="department"
-            )
-            allocated_tickets += tickets_items
-        if job_position:
-            tickets_items = ticket_list.filter(
-                raised_on=job_position.id, assigning_type="job_position"
-            )
-            allocated_tickets += tickets_items
-
-    tickets_items = ticket_list.filter(raised_on=user.id, assigning_type="individual")
-    allocated_tickets += tickets_items
+    queues, counts = ticket_queues(request, tickets)
 
     data_dict = parse_qs(previous_data)
     get_key_instances(Ticket, data_dict)
     template = "helpdesk/ticket/ticket_view.html"
     context = {
-        "my_tickets": paginator_qry(my_tickets, my_page_number),
-        "all_tickets": paginator_qry(all_tickets, all_page_number),
-        "allocated_tickets": paginator_qry(allocated_tickets, allocated_page_number),
+        "my_tickets": paginate_queue(
+            queues["my"], request.GET.get("my_page"), counts["my"]
+        ),
+        "all_tickets": paginate_queue(
+            queues["all"], request.GET.get("all_page"), counts["all"]
+        ),
+        "allocated_tickets": paginate_queue(
+            queues["allocated"], request.GET.get("allocated_page"), counts["allocated"]
+        ),
         "f": TicketFilter(request.GET),
         "gp_fields": TicketReGroup.fields,
         "ticket_status": TICKET_STATUS,
@@ -725,24 +704,7 @@ def ticket_delete(request, ticket_id):
 
 
 def get_allocated_tickets(request):
-    user = request.user.employee_get
-    department = user.employee_work_info.department_id
-    job_position = user.employee_work_info.job_position_id
-
-    tickets_items1 = Ticket.objects.filter(
-        is_active=True, raised_on=department.id, assigning_type="department"
-    )
-    # allocated_tickets += tickets_items
-    tickets_items2 = Ticket.objects.filter(
-        is_active=True, raised_on=job_position.id, assigning_type="job_position"
-    )
-    # allocated_tickets += tickets_items
-    tickets_items3 = Ticket.objects.filter(
-        is_active=True, raised_on=user.id, assigning_type="individual"
-    )
-    # allocated_tickets += tickets_items
-    allocated_tickets = tickets_items1 | tickets_items2 | tickets_items3
-    return allocated_tickets
+    return Ticket.objects.filter(ticket_queue_filters(request)["allocated"])
 
 
 @login_required
@@ -760,52 +722,17 @@ def ticket_filter(request):
     """
     previous_data = request.GET.urlencode()
     tickets = TicketFilter(request.GET).qs
-    my_page_number = request.GET.get("my_page")
-    all_page_number = request.GET.get("all_page")
-    allocated_page_number = request.GET.get("allocated_page")
-    tickets_items1 = Ticket.objects.none()
-    tickets_items2 = Ticket.objects.none()
-
-    my_tickets = tickets.filter(employee_id=request.user.employee_get) | tickets.filter(
-        created_by=request.user
-    )
-
-    all_tickets = tickets.filter(is_active=True)
-    all_tickets = filtersubordinates(request, tickets, "helpdesk.add_tickets")
-    if request.user.has_perm("helpdesk.view_ticket"):
-        all_tickets = tickets
-
-    allocated_tickets = Ticket.objects.none()
-    user = request.user.employee_get
-    department = user.employee_work_info.department_id
-    job_position = user.employee_work_info.job_position_id
-    ticket_list = tickets.filter(is_active=True)
-
-    if hasattr(user, "employee_work_info"):
-        department = user.employee_work_info.department_id
-        job_position = user.employee_work_info.job_position_id
-        if department:
-            tickets_items1 = ticket_list.filter(
-                raised_on=department.id, assigning_type="department"
-            )
-        if job_position:
-            tickets_items2 = ticket_list.filter(
-                raised_on=job_position.id, assigning_type="job_position"
-            )
-
-    tickets_items3 = ticket_list.filter(raised_on=user.id, assigning_type="individual")
+    queues, counts = ticket_queues(request, tickets)
+    my_tickets = queues["my"]
+    all_tickets = queues["all"]
+    allocated_tickets = queues["allocated"]
 
     template = "helpdesk/ticket/ticket_list.html"
-
     if request.GET.get("view") == "card":
         template = "helpdesk/ticket/ticket_card.html"
-    allocated_tickets = (
-        list(tickets_items1) + list(tickets_items2) + list(tickets_items3)
-    )
     if request.GET.get("sortby"):
         all_tickets = sortby(request, all_tickets, "sortby")
         my_tickets = sortby(request, my_tickets, "sortby")
-        allocated_tickets = tickets_items1 | tickets_items2 | tickets_items3
         allocated_tickets = sortby(request, allocated_tickets, "sortby")
 
     field = request.GET.get("field")
@@ -816,23 +743,23 @@ def ticket_filter(request):
         all_tickets = group_by_queryset(
             all_tickets, field, request.GET.get("all_page"), "all_page"
         )
-        tickets_items1 = group_by_queryset(
-            tickets_items1, field, request.GET.get("allocated_page"), "allocated_page"
+        allocated_tickets = group_by_queryset(
+            allocated_tickets,
+            field,
+            request.GET.get("allocated_page"),
+            "allocated_page",
         )
-        tickets_items2 = group_by_queryset(
-            tickets_items2, field, request.GET.get("allocated_page"), "allocated_page"
+        template = "helpdesk/ticket/ticket_group.html"
+    else:
+        my_tickets = paginate_queue(
+            my_tickets, request.GET.get("my_page"), counts["my"]
         )
-        tickets_items3 = group_by_queryset(
-            tickets_items3, field, request.GET.get("allocated_page"), "allocated_page"
+        all_tickets = paginate_queue(
+            all_tickets, request.GET.get("all_page"), counts["all"]
         )
-        template = "helpdesk/ticket/ticket_group.html"
-        allocated_tickets = (
-            list(tickets_items1) + list(tickets_items2) + list(tickets_items3)
+        allocated_tickets = paginate_queue(
+            allocated_tickets, request.GET.get("allocated_page"), counts["allocated"]
         )
-    else:
-        my_tickets = paginator_qry(my_tickets, my_page_number)
-        all_tickets = paginator_qry(all_tickets, all_page_number)
-        allocated_tickets = paginator_qry(allocated_tickets, allocated_page_number)
 
     data_dict = parse_qs(previous_data)
     get_key_instances(Ticket, data_dict)
@@ -27,9 +27,6 @@ def import_method(accessibility):
     return accessibility_method
 
 
-ALL_MENUS = {}
-
-
 def sidebar(request):
 
     base_dir_apps = get_apps_in_base_dir()
@@ -79,10 +76,11 @@ def sidebar(request):
                                 PermWrapper(request.user),
                             ):
                                 MENU["submenu"].append(submenu)
-        ALL_MENUS[request.session.session_key] = MENUS
 
 
 def get_MENUS(request):
-    ALL_MENUS[request.session.session_key] = []
+    # the menus are built per request, they depend on the permissions and
+    # the accessibility of the user
+    request.MENUS = []
     sidebar(request)
-    return {"sidebar": ALL_MENUS.get(request.session.session_key)}
+    return {"sidebar": request.MENUS}
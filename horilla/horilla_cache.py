@@ -0,0 +1,305 @@
+"""
+horilla/horilla_cache.py
+
+Cache backends and the namespaced cache helper of Horilla.
+
+The backends are the Django ones counting the entries they evict to stay
+under MAX_ENTRIES. `HorillaCache` groups the keys of a feature under a
+namespace: entries expire after the namespace timeout and `bump()` drops the
+whole namespace on every worker sharing the backend. A process local backend
+is not shared, the entries and versions of its namespaces expire after
+PROCESS_CACHE_TIMEOUT so that the other workers see a bump within that
+delay. Hits, misses, sets and invalidations are counted per namespace and
+shown on the admin cache stats page.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from uuid import uuid4
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.filebased import (
+    FileBasedCache as DjangoFileBasedCache,
+)
+from django.core.cache.backends.locmem import LocMemCache as DjangoLocMemCache
+from django.core.cache.backends.redis import RedisCache as DjangoRedisCache
+
+logger = logging.getLogger(__name__)
+
+STATS_KEY = "horilla_cache_stats"
+STATS_EVENTS = ["hits", "misses", "sets", "invalidations"]
+# namespace of the entries evicted by the backend
+BACKEND_NAMESPACE = "backend"
+# counters are buffered per process and added to the shared cache in batches
+FLUSH_EVENTS = 100
+FLUSH_INTERVAL = 10
+# entries of the process local memo of a namespace
+LOCAL_MAX_ENTRIES = 1000
+# lifetime of the namespaced entries of a process local backend, whose
+# invalidations do not reach the other workers
+PROCESS_CACHE_TIMEOUT = 60
+
+NAMESPACES = {}
+
+_MISSING = object()
+_pending = Counter()
+_pending_lock = threading.Lock()
+_last_flush = [time.monotonic()]
+
+
+def is_shared_cache():
+    """
+    Returns whether the default cache is shared by the workers
+    """
+    return not isinstance(caches["default"], DjangoLocMemCache)
+
+
+def stats_key(namespace, event):
+    """
+    Returns the cache key of an event counter of the namespace
+    """
+    return f"{STATS_KEY}:{namespace}:{event}"
+
+
+def record(namespace, event, count=1, flush=True):
+    """
+    Count events of the namespace. Backends record with flush=False, the
+    counters must not be written while they hold their own lock.
+    """
+    if not count:
+        return
+    with _pending_lock:
+        _pending[(namespace, event)] += count
+        due = flush and (
+            sum(_pending.values()) >= FLUSH_EVENTS
+            or time.monotonic() - _last_flush[0] >= FLUSH_INTERVAL
+        )
+    if due:
+        flush_stats()
+
+
+def flush_stats():
+    """
+    Add the counters buffered by the process to the shared counters
+    """
+    with _pending_lock:
+        pending = dict(_pending)
+        _pending.clear()
+        _last_flush[0] = time.monotonic()
+    for (namespace, event), count in pending.items():
+        key = stats_key(namespace, event)
+        try:
+            if not cache.add(key, count, None):
+                cache.incr(key, count)
+        except ValueError:
+            # the counter was evicted between add and incr
+            cache.set(key, count, None)
+        except Exception as error:
+            logger.warning("cache stats %s not recorded: %s", key, error)
+
+
+def get_cache_stats():
+    """
+    Returns the counters of the registered namespaces and the number of
+    entries evicted by the backend
+    """
+    flush_stats()
+    keys = [
+        stats_key(namespace, event)
+        for namespace in NAMESPACES
+        for event in STATS_EVENTS
+    ]
+    evictions_key = stats_key(BACKEND_NAMESPACE, "evictions")
+    counters = cache.get_many(keys + [evictions_key])
+    namespaces = []
+    for namespace in sorted(NAMESPACES):
+        row = {
+            event: counters.get(stats_key(namespace, event), 0)
+            for event in STATS_EVENTS
+        }
+        lookups = row["hits"] + row["misses"]
+        row["namespace"] = namespace
+        row["hit_rate"] = round(row["hits"] * 100 / lookups, 1) if lookups else None
+        namespaces.append(row)
+    backend = caches["default"]
+    evictions = getattr(backend, "evictions", None)
+    return {
+        "backend": f"{type(backend).__module__}.{type(backend).__name__}",
+        "namespaces": namespaces,
+        "evictions": (
+            evictions() if callable(evictions) else counters.get(evictions_key, 0)
+        ),
+    }
+
+
+class LocMemCache(DjangoLocMemCache):
+    """
+    Process local cache counting the entries culled above MAX_ENTRIES
+    """
+
+    def _cull(self):
+        size = len(self._cache)
+        super()._cull()
+        record(BACKEND_NAMESPACE, "evictions", size - len(self._cache), flush=False)
+
+
+class FileBasedCache(DjangoFileBasedCache):
+    """
+    Cache shared by the workers of a host through a directory, counting the
+    entries culled above MAX_ENTRIES
+    """
+
+    def _cull(self):
+        filelist = self._list_cache_files()
+        num_entries = len(filelist)
+        if num_entries < self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            self.clear()
+            record(BACKEND_NAMESPACE, "evictions", num_entries, flush=False)
+            return
+        filelist = random.sample(filelist, int(num_entries / self._cull_frequency))
+        evicted = sum(1 for fname in filelist if self._delete(fname))
+        record(BACKEND_NAMESPACE, "evictions", evicted, flush=False)
+
+
+class RedisCache(DjangoRedisCache):
+    """
+    Cache on a Redis compatible server, which bounds its memory itself
+    (maxmemory) and reports its evictions
+    """
+
+    def evictions(self):
+        """
+        Returns the number of keys evicted by the server
+        """
+        try:
+            return self._cache.get_client().info("stats").get("evicted_keys", 0)
+        except Exception as error:
+            logger.warning("redis evictions not available: %s", error)
+            return None
+
+
+class HorillaCache:
+    """
+    Namespaced view of the default cache. Keys are prefixed with the namespace
+    and its version, a random token, so that `bump()` invalidates the
+    namespace on every worker and an evicted version never brings back stale
+    entries.
+
+    Usage:
+        ACCESSIBILITY_CACHE = HorillaCache("accessibility", timeout=60 * 60)
+        features = ACCESSIBILITY_CACHE.get_or_set(
+            employee.pk, lambda: compile_rules(employee)
+        )
+    """
+
+    def __init__(self, namespace, timeout=DEFAULT_TIMEOUT):
+        self.namespace = namespace
+        self.timeout = timeout
+        self._local = {"version": None, "values": {}}
+        self._lock = threading.Lock()
+        NAMESPACES[namespace] = self
+
+    def __repr__(self):
+        return f"HorillaCache({self.namespace!r})"
+
+    @property
+    def version_key(self):
+        return f"{self.namespace}:version"
+
+    def bound_timeout(self, timeout):
+        """
+        Returns the timeout of an entry, at most PROCESS_CACHE_TIMEOUT when the
+        cache is local to the process
+        """
+        if is_shared_cache():
+            return timeout
+        if timeout is None or timeout is DEFAULT_TIMEOUT:
+            return PROCESS_CACHE_TIMEOUT
+        return min(timeout, PROCESS_CACHE_TIMEOUT)
+
+    def version(self):
+        """
+        Returns the current version of the namespace, a missing version is
+        initialised
+        """
+        version = cache.get(self.version_key)
+        if version is None:
+            version = uuid4().hex
+            cache.add(self.version_key, version, self.bound_timeout(None))
+            version = cache.get(self.version_key, version)
+        return version
+
+    def make_key(self, key, version=None):
+        return f"{self.namespace}:{version or self.version()}:{key}"
+
+    def get(self, key, default=None):
+        value = cache.get(self.make_key(key), _MISSING)
+        if value is _MISSING:
+            record(self.namespace, "misses")
+            return default
+        record(self.namespace, "hits")
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.timeout
+        cache.set(self.make_key(key), value, self.bound_timeout(timeout))
+        record(self.namespace, "sets")
+
+    def get_or_set(self, key, compute, timeout=DEFAULT_TIMEOUT):
+        """
+        Returns the cached value of the key, computed by `compute()` and
+        cached when missing
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value, timeout)
+        return value
+
+    def delete(self, key):
+        self.delete_many([key])
+
+    def delete_many(self, keys):
+        version = self.version()
+        keys = [self.make_key(key, version) for key in keys]
+        if keys:
+            cache.delete_many(keys)
+            record(self.namespace, "invalidations", len(keys))
+
+    def bump(self):
+        """
+        Invalidate every entry of the namespace
+        """
+        cache.set(self.version_key, uuid4().hex, self.bound_timeout(None))
+        record(self.namespace, "invalidations")
+
+    def local(self, key, compute):
+        """
+        Process local memo of values that are expensive to share (compiled
+        objects, model instances). Entries live until the namespace is bumped.
+        """
+        version = self.version()
+        with self._lock:
+            if self._local["version"] != version:
+                self._local = {"version": version, "values": {}}
+            values = self._local["values"]
+            value = values.get(key, _MISSING)
+        if value is not _MISSING:
+            record(self.namespace, "hits")
+            return value
+        record(self.namespace, "misses")
+        value = compute()
+        with self._lock:
+            if self._local["version"] == version:
+                values = self._local["values"]
+                if len(values) >= LOCAL_MAX_ENTRIES:
+                    values.clear()
+                values[key] = value
+        return value
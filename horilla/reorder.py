@@ -0,0 +1,129 @@
+"""
+reorder.py
+
+This module is used to persist the drag and drop ordering of kanban columns
+(tasks, pipeline candidates, stages) with a single query to read and a single
+bulk update to write the changed sequence values
+"""
+
+from bisect import bisect_left
+
+from django.db import transaction
+
+# distance left between neighbouring sequence values when a column is
+# renumbered, so that later moves usually rewrite a single row
+SEQUENCE_GAP = 1024
+
+
+def ordered_ids_from_sequence(sequence_data):
+    """
+    Returns the ids of a posted {id: position} map ordered by position
+    """
+    positions = {
+        str(item_id): int(position)
+        for item_id, position in sequence_data.items()
+        if position is not None and str(position).lstrip("-").isdigit()
+    }
+    return sorted(positions, key=lambda item_id: positions[item_id])
+
+
+def _kept_positions(values):
+    """
+    Returns the positions of a longest strictly increasing subsequence of the
+    values (None values are never kept)
+    """
+    tails = []
+    tail_positions = []
+    previous = [None] * len(values)
+    for position, value in enumerate(values):
+        if value is None:
+            continue
+        index = bisect_left(tails, value)
+        if index == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[index] = value
+            tail_positions[index] = position
+        previous[position] = tail_positions[index - 1] if index else None
+
+    kept = set()
+    position = tail_positions[-1] if tail_positions else None
+    while position is not None:
+        kept.add(position)
+        position = previous[position]
+    return kept
+
+
+def plan_sequences(values, gap=SEQUENCE_GAP):
+    """
+    Compute the new sequence values of a column.
+
+    Args:
+        values: current sequence values in the new display order
+        gap: spacing used when the column has to be renumbered
+
+    Returns:
+        list: new sequence values, equal to the current value for every item
+        that does not need to move
+    """
+    kept = _kept_positions(values)
+    planned = list(values)
+    position = 0
+    while position < len(values):
+        if position in kept:
+            position += 1
+            continue
+        end = position
+        while end < len(values) and end not in kept:
+            end += 1
+        count = end - position
+        low = planned[position - 1] if position else None
+        high = values[end] if end < len(values) else None
+        if low is None and high is None:
+            new_values = [gap * (index + 1) for index in range(count)]
+        elif high is None:
+            new_values = [low + gap * (index + 1) for index in range(count)]
+        else:
+            if low is None:
+                low = max(-1, high - gap * (count + 1))
+            step = (high - low) // (count + 1)
+            if step < 1:
+                # no room left between the neighbours, renumber the column
+                return [gap * (index + 1) for index in range(len(values))]
+            new_values = [low + step * (index + 1) for index in range(count)]
+        planned[position:end] = new_values
+        position = end
+    return planned
+
+
+def reorder(queryset, ordered_ids, field="sequence", gap=SEQUENCE_GAP):
+    """
+    Store the order of the items of a column.
+
+    Args:
+        queryset: queryset the items are looked up in (permission scoped)
+        ordered_ids: ids of the column items in their new order
+        field: integer field holding the order
+        gap: spacing used when the column has to be renumbered
+
+    Returns:
+        int: number of rows written
+    """
+    model = queryset.model
+    items = {
+        str(item.pk): item
+        for item in queryset.filter(pk__in=ordered_ids).only("pk", field)
+    }
+    items = [items[str(item_id)] for item_id in ordered_ids if str(item_id) in items]
+    planned = plan_sequences([getattr(item, field) for item in items], gap)
+
+    changed = []
+    for item, value in zip(items, planned):
+        if getattr(item, field) != value:
+            setattr(item, field, value)
+            changed.append(item)
+    if changed:
+        with transaction.atomic():
+            model.objects.bulk_update(changed, [field], batch_size=500)
+    return len(changed)
@@ -138,6 +138,38 @@ else:
         }
     }
 
+# Cache
+# CACHE_BACKEND selects the cache of the workers: "file" (the default) shares
+# a directory between the workers of a host and "redis" uses a local Redis
+# compatible server (needs the redis package), for workers on several hosts.
+# The workers must share the cache to see each other's invalidations.
+# "locmem" keeps one cache per process and only suits a single process (e.g.
+# runserver): the other workers would not see an invalidation until the
+# cached entries expire, after at most a minute.
+
+CACHE_BACKEND = env("CACHE_BACKEND", default="file")
+CACHE_BACKENDS = {
+    "locmem": ("horilla.horilla_cache.LocMemCache", "horilla"),
+    "file": (
+        "horilla.horilla_cache.FileBasedCache",
+        os.path.join(BASE_DIR, "cache"),
+    ),
+    "redis": ("horilla.horilla_cache.RedisCache", "redis://127.0.0.1:6379/1"),
+}
+CACHES = {
+    "default": {
+        "BACKEND": CACHE_BACKENDS[CACHE_BACKEND][0],
+        "LOCATION": env("CACHE_LOCATION", default=CACHE_BACKENDS[CACHE_BACKEND][1]),
+        "TIMEOUT": env.int("CACHE_TIMEOUT", default=300),
+        "KEY_PREFIX": "horilla",
+    }
+}
+if CACHE_BACKEND != "redis":
+    # the server bounds a redis cache with its maxmemory setting
+    CACHES["default"]["OPTIONS"] = {
+        "MAX_ENTRIES": env.int("CACHE_MAX_ENTRIES", default=10000),
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
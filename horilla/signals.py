@@ -18,3 +18,5 @@ post_generic_delete = Signal()
 
 pre_generic_import = Signal()
 post_generic_import = Signal()
+
+post_outbox_delivery = Signal()
@@ -17,18 +17,37 @@ Including another URLconf
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.http import JsonResponse
+from django.shortcuts import render
 from django.urls import include, path, re_path
 
 import notifications.urls
 
 from . import settings
+from .horilla_cache import get_cache_stats
 
 
 def health_check(request):
     return JsonResponse({"status": "ok"}, status=200)
 
 
+def cache_stats(request):
+    """
+    Admin page of the cache hits, misses, invalidations and evictions
+    """
+    context = {
+        **admin.site.each_context(request),
+        "title": "Cache statistics",
+        "stats": get_cache_stats(),
+    }
+    return render(request, "admin/cache_stats.html", context)
+
+
 urlpatterns = [
+    path(
+        "admin/cache-stats/",
+        admin.site.admin_view(cache_stats),
+        name="admin-cache-stats",
+    ),
     path("admin/", admin.site.urls),
     path("accounts/", include("django.contrib.auth.urls")),
     path("accounts/", include("django.contrib.auth.urls")),
@@ -49,12 +49,9 @@ def enter_if_accessible(function, feature, perm=None, method=None):
             self.request = request
 
         accessible = False
-        session_key = getattr(request.session, "session_key", None)
-        if session_key:
-            cache_key = session_key + "accessibility_filter"
-            employee = getattr(request.user, "employee_get", None)
-            if employee:
-                accessible = check_is_accessible(feature, cache_key, employee)
+        employee = getattr(request.user, "employee_get", None)
+        if employee:
+            accessible = check_is_accessible(feature, employee)
         has_perm = True
         if perm:
             has_perm = request.user.has_perm(perm)
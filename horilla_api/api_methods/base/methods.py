@@ -1,8 +1,12 @@
-from collections import Counter
+import json
+from functools import lru_cache
 
-from django.db.models import Q
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Prefetch, Q, QuerySet
 from django.http import QueryDict
-from rest_framework.pagination import PageNumberPagination
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 from employee.models import EmployeeWorkInformation
 
@@ -15,34 +19,308 @@ def get_filter_url(current_url, request):
     return base_url + "?" + query_params.urlencode()
 
 
-def groupby_queryset(request, url, field_name, queryset):
-    queryset_with_counts = queryset.values(field_name)
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination positioned on every field of the ordering. The cursor
+    keeps the values of the last row, and the next page starts strictly
+    after that tuple, so rows sharing the first field (e.g. the attendances
+    of a day) are neither skipped nor repeated across pages. The ordering
+    must end with a unique, non-null field such as "-id".
+    """
 
-    counts = Counter(item[field_name] for item in queryset_with_counts)
+    def keyset_filter(self, position, reverse):
+        """
+        Returns the filter of the rows following the position in the order
+        of the page, `(a, b) > (x, y)` is `a > x OR (a = x AND b > y)`
+        """
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        keyset = Q(pk__in=[])
+        equal = {}
+        for order, value in zip(self.ordering, values):
+            field_name = order.lstrip("-")
+            lookup = "lt" if order.startswith("-") != reverse else "gt"
+            keyset |= Q(**equal, **{f"{field_name}__{lookup}": value})
+            equal[field_name] = value
+        return keyset
 
-    result_list = []
-    for i in counts:
-        result_list.append({field_name: i, "count": counts[i]})
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
 
-    counts_and_objects = []
-    url = get_filter_url(url, request)
-    for item in result_list:
-        count = item["count"]
-        related_fields = field_name.split("__")
-        if item[field_name]:
-            related_obj = queryset.filter(**{field_name: item[field_name]}).first()
-            for field in related_fields:
-                related_obj = getattr(related_obj, field)
-            counts_and_objects.append(
-                {
-                    "count": count,
-                    "name": str(related_obj),
-                    "filter_url": f"{url}&{field_name}={item[field_name]}",
-                }
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(
+                *(
+                    order[1:] if order.startswith("-") else f"-{order}"
+                    for order in self.ordering
+                )
             )
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if current_position is not None:
+            queryset = queryset.filter(self.keyset_filter(current_position, reverse))
+
+        # one more row tells whether a page follows
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = results[: self.page_size]
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            if self.has_next:
+                self.next_position = current_position
+            if self.has_previous:
+                self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            if self.has_next:
+                self.next_position = following_position
+            if self.has_previous:
+                self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for order in ordering:
+            field_name = order.lstrip("-")
+            if isinstance(instance, dict):
+                value = instance[field_name]
+            else:
+                value = getattr(instance, field_name)
+            values.append(str(value))
+        return json.dumps(values)
+
+
+def get_paginator(request, ordering):
+    """
+    Returns the paginator of a list request. Page numbers are the default,
+    clients opt in to cursor pagination with `?pagination=cursor`, which
+    pages on the `ordering` tuple without counting the rows or scanning an
+    offset.
+
+    Args:
+        request: list request
+        ordering: stable, indexed ordering of the list ending with a unique
+            field, e.g. ("-attendance_date", "-id")
+    """
+    if request.GET.get("pagination") == "cursor":
+        paginator = KeysetCursorPagination()
+        paginator.ordering = ordering
+        return paginator
+    return PageNumberPagination()
+
+
+def get_related_field(model, name):
+    """
+    Returns the model field or the reverse relation of the attribute name,
+    None when the name is not a field (e.g. a property or a method)
+    """
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return next(
+            (
+                relation
+                for relation in model._meta.related_objects
+                if relation.get_accessor_name() == name
+            ),
+            None,
+        )
+
+
+def source_paths(model, source):
+    """
+    Returns (select_related path, prefetch_related path, related model) of
+    the relations traversed by a dotted serializer source. The paths are ""
+    when there are none, the model is None unless every part of the source
+    is a relation.
+    """
+    select, prefetch = [], []
+    for name in source.split("."):
+        field = get_related_field(model, name)
+        if field is None or not field.is_relation or field.related_model is None:
+            model = None
+            break
+        if prefetch or field.one_to_many or field.many_to_many:
+            prefetch.append(name)
+        else:
+            select.append(name)
+        model = field.related_model
+    if prefetch:
+        return "", "__".join(select + prefetch), model
+    return "__".join(select), "", model
+
+
+def serializer_paths(serializer, model):
+    """
+    Returns the (select_related, prefetch_related) path sets used by the
+    fields of a serializer instance
+    """
+    meta = getattr(serializer, "Meta", None)
+    select = set(getattr(meta, "select_related", []))
+    prefetch = set(getattr(meta, "prefetch_related", []))
+    for field in serializer.fields.values():
+        source = field.source
+        if field.write_only or source == "*":
+            continue
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            # the primary key is read from the foreign key column
+            if "." not in source:
+                continue
+            source = source.rsplit(".", 1)[0]
+        select_path, prefetch_path, related_model = source_paths(model, source)
+        path = select_path or prefetch_path
+        if isinstance(field, serializers.ManyRelatedField):
+            select_path, prefetch_path = "", path
+        nested = getattr(field, "child", field)
+        if related_model and isinstance(nested, serializers.BaseSerializer):
+            nested_select, nested_prefetch = serializer_paths(nested, related_model)
+            if prefetch_path or nested is not field:
+                select_path, prefetch_path = "", path
+                nested_prefetch |= nested_select
+                nested_select = set()
+            select.update(f"{path}__{related}" for related in nested_select)
+            prefetch.update(f"{path}__{related}" for related in nested_prefetch)
+        if prefetch_path:
+            prefetch.add(prefetch_path)
+        elif select_path:
+            select.add(select_path)
+    return select, prefetch
+
+
+@lru_cache(maxsize=None)
+def related_paths(serializer_class):
+    """
+    Returns the (select_related, prefetch_related) paths a model serializer
+    needs, from the relations its dotted sources, relational and nested
+    fields traverse, plus the paths its `Meta.select_related` and
+    `Meta.prefetch_related` declare for the method fields
+    """
+    select, prefetch = serializer_paths(serializer_class(), serializer_class.Meta.model)
+    return sorted(select), sorted(prefetch)
+
+
+def prefetch_lookup(model, path):
+    """
+    Returns the prefetch lookup of a path. A to-many relation is prefetched
+    with the queryset of its default manager, the related managers would
+    otherwise build that queryset again for every prefetched row
+    """
+    field = None
+    for name in path.split("__"):
+        field = get_related_field(model, name)
+        if field is None or field.related_model is None:
+            return path
+        model = field.related_model
+    if field.one_to_many or field.many_to_many:
+        return Prefetch(path, queryset=model._default_manager.get_queryset())
+    return path
+
+
+def plan_queryset(queryset, serializer_class):
+    """
+    Apply the select_related / prefetch_related paths of the serializer to
+    the queryset, so that listing a page costs a constant number of queries
+
+    Args:
+        queryset: queryset of the serializer model
+        serializer_class: model serializer the rows are rendered with
+    """
+    model = getattr(getattr(serializer_class, "Meta", None), "model", None)
+    if (
+        not isinstance(queryset, QuerySet)
+        or model is None
+        or not issubclass(queryset.model, model)
+        or queryset.query.values_select
+        or queryset.query.combinator
+    ):
+        return queryset
+    select, prefetch = related_paths(serializer_class)
+    prefetch = [prefetch_lookup(queryset.model, path) for path in prefetch]
+    if queryset.query.deferred_loading[0]:
+        # deferred fields can not be traversed by select_related
+        return queryset.prefetch_related(*select, *prefetch)
+    return queryset.select_related(*select).prefetch_related(*prefetch)
+
+
+def group_labels(model, field_name, values):
+    """
+    Returns {value: label} of the grouped values of a field path, related
+    objects are fetched with one query
+    """
+    field = None
+    for name in field_name.split("__"):
+        field = get_related_field(model, name)
+        if field is None:
+            return {}
+        model = field.related_model
+    if field is None or not field.is_relation or model is None:
+        return {}
+    if field.many_to_one or (field.one_to_one and field.concrete):
+        lookup = field.target_field.name
+    else:
+        lookup = model._meta.pk.name
+    objects = model._base_manager.in_bulk(values, field_name=lookup)
+    return {value: str(related_obj) for value, related_obj in objects.items()}
+
+
+def groupby_queryset(request, url, field_name, queryset):
+    """
+    Returns the paginated groups {count, name, filter_url} of the queryset by
+    a field path, counted with one grouped query and labelled with one query
+    per page
+    """
+    groups = [
+        group
+        for group in queryset.order_by()
+        .values(field_name)
+        .annotate(count=Count("pk", distinct=True))
+        .order_by(field_name)
+        if group[field_name]
+    ]
     pagination = PageNumberPagination()
-    page = pagination.paginate_queryset(counts_and_objects, request)
-    return pagination.get_paginated_response(page)
+    page = pagination.paginate_queryset(groups, request)
+    labels = group_labels(
+        queryset.model, field_name, [group[field_name] for group in page]
+    )
+    url = get_filter_url(url, request)
+    counts_and_objects = [
+        {
+            "count": group["count"],
+            "name": labels.get(group[field_name], str(group[field_name])),
+            "filter_url": f"{url}&{field_name}={group[field_name]}",
+        }
+        for group in page
+    ]
+    return pagination.get_paginated_response(counts_and_objects)
 
 
 def permission_based_queryset(user, perm, queryset, user_obj=None):
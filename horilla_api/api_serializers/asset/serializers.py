@@ -8,6 +8,7 @@ class AssetCategorySerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AssetCategory
+        prefetch_related = ["asset_set"]
         exclude = ["created_at", "created_by", "company_id", "is_active"]
 
     def get_asset_count(self, obj):
@@ -54,6 +55,7 @@ class AssetAssignmentGetSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AssetAssignment
+        select_related = ["asset_id__asset_category_id", "assigned_to_employee_id"]
         fields = [
             "id",
             "asset",
@@ -85,6 +87,8 @@ class AssetRequestGetSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AssetRequest
+        select_related = ["asset_category_id", "requested_employee_id"]
+        prefetch_related = ["asset_category_id__asset_set"]
         fields = "__all__"
 
     def get_asset_category_id(self, obj):
@@ -119,6 +119,11 @@ class RotatingWorkTypeAssignSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = RotatingWorkTypeAssign
+        select_related = [
+            "rotating_work_type_id",
+            "current_work_type",
+            "next_work_type",
+        ]
         fields = "__all__"
 
     def get_current_work_type_name(self, instance):
@@ -243,6 +248,7 @@ class RotatingShiftAssignSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = RotatingShiftAssign
+        select_related = ["rotating_shift_id", "current_shift", "next_shift"]
         fields = "__all__"
 
     def validate(self, attrs):
@@ -333,6 +339,7 @@ class WorkTypeRequestSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = WorkTypeRequest
+        select_related = ["previous_work_type_id"]
         fields = "__all__"
 
     def validate(self, attrs):
@@ -440,4 +447,5 @@ class ShiftRequestSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ShiftRequest
+        select_related = ["previous_shift_id", "shift_id"]
         fields = "__all__"
@@ -105,6 +105,7 @@ class EmployeeWorkInformationSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = EmployeeWorkInformation
+        prefetch_related = ["tags"]
         fields = "__all__"
 
 
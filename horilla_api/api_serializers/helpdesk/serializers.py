@@ -49,6 +49,7 @@ class DepartmentManagerSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = DepartmentManager
+        select_related = ["manager", "department"]
         fields = "__all__"
 
     def get_manager(self, obj):
@@ -81,6 +82,7 @@ class CommentSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Comment
+        select_related = ["employee_id"]
         fields = "__all__"
 
     def get_employee_id(self, obj):
@@ -119,6 +121,7 @@ class ClaimRequestSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ClaimRequest
+        select_related = ["ticket_id", "employee_id"]
         fields = "__all__"
 
     def get_ticket_id(self, obj):
@@ -163,6 +166,8 @@ class TicketSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Ticket
+        select_related = ["employee_id"]
+        prefetch_related = ["assigned_to", "tags"]
         fields = "__all__"
         extra_kwargs = {
             'assigned_to': {'read_only': True},
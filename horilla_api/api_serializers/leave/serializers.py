@@ -113,6 +113,7 @@ class GetAvailableLeaveTypeSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AvailableLeave
+        select_related = ["leave_type_id"]
         fields = [
             "id",
             "leave_type_id",
@@ -142,6 +143,7 @@ class userLeaveRequestGetAllSerilaizer(serializers.ModelSerializer):
 
     class Meta:
         model = LeaveRequest
+        select_related = ["leave_type_id"]
         exclude = [
             "requested_date",
             "description",
@@ -165,6 +167,7 @@ class UserLeaveRequestGetSerilaizer(serializers.ModelSerializer):
 
     class Meta:
         model = LeaveRequest
+        select_related = ["leave_type_id"]
         exclude = [
             "requested_date",
             "approved_available_days",
@@ -304,6 +307,7 @@ class AssignLeaveGetSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = AvailableLeave
+        select_related = ["employee_id", "leave_type_id"]
         exclude = ["reset_date", "expired_date"]
 
     def get_employee_id(self, obj):
@@ -344,6 +348,7 @@ class LeaveRequestGetAllSerilaizer(serializers.ModelSerializer):
 
     class Meta:
         model = LeaveRequest
+        select_related = ["employee_id", "leave_type_id"]
         exclude = [
             "requested_date",
             "description",
@@ -386,6 +391,7 @@ class LeaveRequestGetSerilaizer(serializers.ModelSerializer):
 
     class Meta:
         model = LeaveRequest
+        select_related = ["employee_id", "leave_type_id"]
         exclude = [
             "requested_date",
             "approved_available_days",
@@ -438,6 +444,7 @@ class LeaveAllocationRequestGetSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = LeaveAllocationRequest
+        select_related = ["employee_id", "leave_type_id", "created_by"]
         exclude = ["requested_date", "created_at", "reject_reason"]
 
     def get_employee_id(self, obj):
@@ -34,6 +34,7 @@ class PayslipSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Payslip
+        select_related = ["employee_id"]
         fields = "__all__"
         # exclude = ['reference',
         #            'sent_to_employee',
@@ -79,6 +80,7 @@ class ContractSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Contract
+        select_related = ["employee_id"]
         fields = "__all__"
 
 
@@ -188,6 +190,7 @@ class LoanAccountSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = LoanAccount
+        select_related = ["employee_id"]
         fields = "__all__"
 
     def get_employee_profile_url(self, obj):
@@ -214,6 +217,8 @@ class ReimbursementSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Reimbursement
+        select_related = ["employee_id"]
+        prefetch_related = ["other_attachments"]
         fields = "__all__"
 
     def get_other_attachements(self, obj):
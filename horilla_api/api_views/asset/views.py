@@ -12,6 +12,7 @@ from asset.filters import AssetFilter
 from asset.models import *
 
 from ...api_filters.asset.filters import AssetCategoryFilter
+from ...api_methods.base.methods import plan_queryset
 from ...api_serializers.asset.serializers import *
 
 
@@ -34,7 +35,9 @@ class AssetAPIView(APIView):
         paginator = PageNumberPagination()
         queryset = Asset.objects.all()
         filterset = self.filterset_class(request.GET, queryset=queryset)
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, AssetGetAllSerializer), request
+        )
         serializer = AssetGetAllSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -78,7 +81,9 @@ class AssetCategoryAPIView(APIView):
         paginator = PageNumberPagination()
         queryset = AssetCategory.objects.all()
         filterset = self.filterset_class(request.GET, queryset=queryset)
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, AssetCategorySerializer), request
+        )
         serializer = AssetCategorySerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -119,7 +124,9 @@ class AssetLotAPIView(APIView):
             return Response(serializer.data)
         paginator = PageNumberPagination()
         assets = AssetLot.objects.all()
-        page = paginator.paginate_queryset(assets, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(assets, AssetLotSerializer), request
+        )
         serializer = AssetLotSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -160,7 +167,9 @@ class AssetAllocationAPIView(APIView):
             return Response(serializer.data)
         paginator = PageNumberPagination()
         assets = AssetAssignment.objects.all()
-        page = paginator.paginate_queryset(assets, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(assets, AssetAssignmentGetSerializer), request
+        )
         serializer = AssetAssignmentGetSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -201,7 +210,9 @@ class AssetRequestAPIView(APIView):
             return Response(serializer.data)
         paginator = PageNumberPagination()
         assets = AssetRequest.objects.all().order_by("-id")
-        page = paginator.paginate_queryset(assets, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(assets, AssetRequestGetSerializer), request
+        )
         serializer = AssetRequestGetSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
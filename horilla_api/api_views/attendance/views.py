@@ -31,7 +31,12 @@ from ...api_decorators.base.decorators import (
     manager_permission_required,
     permission_required,
 )
-from ...api_methods.base.methods import groupby_queryset, permission_based_queryset
+from ...api_methods.base.methods import (
+    get_paginator,
+    groupby_queryset,
+    permission_based_queryset,
+    plan_queryset,
+)
 from ...api_serializers.attendance.serializers import (
     AttendanceActivitySerializer,
     AttendanceLateComeEarlyOutSerializer,
@@ -242,8 +247,10 @@ class AttendanceView(APIView):
                 request, url, field_name, attendances_filter_queryset
             )
         # pagination workflow
-        paginater = PageNumberPagination()
-        page = paginater.paginate_queryset(attendances_filter_queryset, request)
+        paginater = get_paginator(request, ("-attendance_date", "-id"))
+        page = paginater.paginate_queryset(
+            plan_queryset(attendances_filter_queryset, AttendanceSerializer), request
+        )
         serializer = AttendanceSerializer(page, many=True)
         return paginater.get_paginated_response(serializer.data)
 
@@ -434,7 +441,9 @@ class AttendanceRequestView(APIView):
             return groupby_queryset(request, url, field_name, request_filtered_queryset)
 
         pagenation = PageNumberPagination()
-        page = pagenation.paginate_queryset(request_filtered_queryset, request)
+        page = pagenation.paginate_queryset(
+            plan_queryset(request_filtered_queryset, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return pagenation.get_paginated_response(serializer.data)
 
@@ -625,7 +634,9 @@ class AttendanceOverTimeView(APIView):
             return groupby_queryset(request, url, field_name, queryset)
 
         pagenation = PageNumberPagination()
-        page = pagenation.paginate_queryset(queryset, request)
+        page = pagenation.paginate_queryset(
+            plan_queryset(queryset, AttendanceOverTimeSerializer), request
+        )
         serializer = AttendanceOverTimeSerializer(page, many=True)
         return pagenation.get_paginated_response(serializer.data)
 
@@ -1035,7 +1046,9 @@ class UserAttendanceView(APIView):
 
         paginator = PageNumberPagination()
         paginator.page_size = 20
-        page = paginator.paginate_queryset(attendance_queryset, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(attendance_queryset, self.serializer_class), request
+        )
 
         serializer = self.serializer_class(page, many=True)
         return paginator.get_paginated_response(serializer.data)
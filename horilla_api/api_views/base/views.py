@@ -44,7 +44,11 @@ from ...api_decorators.base.decorators import (
     manager_permission_required,
     permission_required,
 )
-from ...api_methods.base.methods import groupby_queryset, permission_based_queryset
+from ...api_methods.base.methods import (
+    groupby_queryset,
+    permission_based_queryset,
+    plan_queryset,
+)
 from ...api_serializers.base.serializers import (
     CompanySerializer,
     DepartmentSerializer,
@@ -118,7 +122,9 @@ class JobPositionView(APIView):
 
         job_positions = JobPosition.objects.all()
         paginater = PageNumberPagination()
-        page = paginater.paginate_queryset(job_positions, request)
+        page = paginater.paginate_queryset(
+            plan_queryset(job_positions, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return paginater.get_paginated_response(serializer.data)
 
@@ -165,7 +171,9 @@ class DepartmentView(APIView):
 
         departments = Department.objects.all()
         paginator = PageNumberPagination()
-        page: list[Any] | None = paginator.paginate_queryset(departments, request)
+        page: list[Any] | None = paginator.paginate_queryset(
+            plan_queryset(departments, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -212,7 +220,9 @@ class JobRoleView(APIView):
 
         job_roles = JobRole.objects.all()
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(job_roles, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(job_roles, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -259,7 +269,9 @@ class CompanyView(APIView):
 
         companies = Company.objects.all()
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(companies, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(companies, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -374,7 +386,10 @@ class WorkTypeRequestView(APIView):
             )
         # pagination workflow
         paginater = PageNumberPagination()
-        page = paginater.paginate_queryset(work_type_request_filter_queryset, request)
+        page = paginater.paginate_queryset(
+            plan_queryset(work_type_request_filter_queryset, self.serializer_class),
+            request,
+        )
         serializer = self.serializer_class(page, many=True)
         return paginater.get_paginated_response(serializer.data)
 
@@ -535,7 +550,9 @@ class IndividualRotatingWorktypesView(APIView):
             employee_id=employee_id
         )
         pagenation = PageNumberPagination()
-        page = pagenation.paginate_queryset(rotating_work_type_assigns, request)
+        page = pagenation.paginate_queryset(
+            plan_queryset(rotating_work_type_assigns, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return pagenation.get_paginated_response(serializer.data)
 
@@ -583,7 +600,10 @@ class RotatingWorkTypeAssignView(APIView):
 
         pagenation = PageNumberPagination()
         page = pagenation.paginate_queryset(
-            rotating_work_type_assigns_filter_queryset, request
+            plan_queryset(
+                rotating_work_type_assigns_filter_queryset, self.serializer_class
+            ),
+            request,
         )
         serializer = self.serializer_class(page, many=True)
         return pagenation.get_paginated_response(serializer.data)
@@ -650,7 +670,9 @@ class IndividualWorkTypeRequestView(APIView):
         employee_id = request.GET.get("employee_id", None)
         work_type_request = WorkTypeRequest.objects.filter(employee_id=employee_id)
         paginater = PageNumberPagination()
-        page = paginater.paginate_queryset(work_type_request, request)
+        page = paginater.paginate_queryset(
+            plan_queryset(work_type_request, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return paginater.get_paginated_response(serializer.data)
 
@@ -828,7 +850,9 @@ class IndividualRotatingShiftView(APIView):
         )
 
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(rotating_shift_assigns, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(rotating_shift_assigns, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -861,7 +885,10 @@ class RotatingShiftAssignView(APIView):
 
         paginator = PageNumberPagination()
         page = paginator.paginate_queryset(
-            rotating_shift_assigns_filter_queryset, request
+            plan_queryset(
+                rotating_shift_assigns_filter_queryset, self.serializer_class
+            ),
+            request,
         )
         serializer = self.serializer_class(page, many=True)
         return paginator.get_paginated_response(serializer.data)
@@ -911,7 +938,9 @@ class IndividualShiftRequestView(APIView):
         employee_id = request.GET.get("employee_id", None)
         shift_requests = ShiftRequest.objects.filter(employee_id=employee_id)
         paginater = PageNumberPagination()
-        page = paginater.paginate_queryset(shift_requests, request)
+        page = paginater.paginate_queryset(
+            plan_queryset(shift_requests, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return paginater.get_paginated_response(serializer.data)
 
@@ -955,7 +984,10 @@ class ShiftRequestView(APIView):
             )
         # pagination section
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(shift_requests_filter_queryset, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(shift_requests_filter_queryset, self.serializer_class),
+            request,
+        )
         serializer = self.serializer_class(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -1305,12 +1337,9 @@ class CheckUserLevel(APIView):
         return Response({"error": "No permission"}, status=400)
 
 
-from datetime import datetime, timedelta
-
 from bs4 import BeautifulSoup
-from django.db.models import Q
 
-from base.models import Announcement, AnnouncementExpire
+from base.audience import visible_announcements
 
 
 class AnnouncementPagination(PageNumberPagination):
@@ -1322,8 +1351,7 @@ class AnnouncementListAPIView(APIView):
     """
     API endpoint to list announcements for the authenticated user.
 
-    - Updates expire dates if missing.
-    - Filters based on user permissions and validity.
+    - Filters based on the announcement audience rules and validity.
     - Marks announcements with whether the user has viewed them.
     - Supports pagination.
     """
@@ -1332,35 +1360,12 @@ class AnnouncementListAPIView(APIView):
     pagination_class = AnnouncementPagination
 
     def get(self, request, *args, **kwargs):
-        # Default expire days
-        expire_days = (
-            AnnouncementExpire.objects.values_list("days", flat=True).first() or 30
-        )
-
-        # Update missing expire_date in bulk
-        announcements_to_update = Announcement.objects.filter(
-            expire_date__isnull=True
-        ).only("id", "created_at")
-        for ann in announcements_to_update:
-            ann.expire_date = ann.created_at + timedelta(days=expire_days)
-        if announcements_to_update:
-            Announcement.objects.bulk_update(announcements_to_update, ["expire_date"])
-
-        # Base queryset: non-expired announcements
-        announcements = Announcement.objects.filter(
-            expire_date__gte=datetime.today().date()
-        )
-
-        # Permission filter
-        if not request.user.has_perm("base.view_announcement"):
-            announcements = announcements.filter(
-                Q(employees=request.user.employee_get) | Q(employees__isnull=True)
-            )
+        # Non-expired announcements visible to the user, with viewed state
+        announcements = visible_announcements(request.user)
 
-        # Prefetch related views for efficiency
-        announcements = announcements.prefetch_related("announcementview_set").order_by(
-            "-created_at"
-        )
+        # Apply pagination
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(announcements, request)
 
         # Build response data
         data = [
@@ -1370,17 +1375,11 @@ class AnnouncementListAPIView(APIView):
                 "content": self._parse_description(ann.description),
                 "created_at": ann.created_at,
                 "expire_date": ann.expire_date,
-                "has_viewed": ann.announcementview_set.filter(
-                    user=request.user, viewed=True
-                ).exists(),
+                "has_viewed": ann.has_viewed,
             }
-            for ann in announcements
+            for ann in page
         ]
-
-        # Apply pagination
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(data, request)
-        return paginator.get_paginated_response(page)
+        return paginator.get_paginated_response(data)
 
     @staticmethod
     def _parse_description(description: str) -> list[dict]:
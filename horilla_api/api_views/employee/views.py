@@ -34,7 +34,11 @@ from ...api_decorators.base.decorators import (
     manager_permission_required,
 )
 from ...api_decorators.employee.decorators import or_condition
-from ...api_methods.base.methods import groupby_queryset, permission_based_queryset
+from ...api_methods.base.methods import (
+    groupby_queryset,
+    permission_based_queryset,
+    plan_queryset,
+)
 from ...api_serializers.employee.serializers import (
     ActiontypeSerializer,
     DisciplinaryActionSerializer,
@@ -197,9 +201,14 @@ class EmployeeListAPIView(APIView):
         search = request.query_params.get("search")
 
         # Start with a base queryset with only required fields
-        employees_queryset = Employee.objects.only(
-            "id", "employee_first_name", "employee_last_name"
-        )
+        list_fields = [
+            "id",
+            "employee_first_name",
+            "employee_last_name",
+            "email",
+            "employee_profile",
+        ]
+        employees_queryset = Employee.objects.only(*list_fields)
 
         # Permission-based filtering
         if user.has_perm("employee.view_employee"):
@@ -207,9 +216,7 @@ class EmployeeListAPIView(APIView):
         else:
             subordinate_qs = user.employee_get.get_subordinate_employees()
             if subordinate_qs.exists():
-                employees_queryset = subordinate_qs.only(
-                    "id", "employee_first_name", "employee_last_name"
-                )
+                employees_queryset = subordinate_qs.only(*list_fields)
             else:
                 employees_queryset = employees_queryset.filter(id=user.employee_get.id)
 
@@ -222,7 +229,9 @@ class EmployeeListAPIView(APIView):
 
         # Paginate
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(employees_queryset, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(employees_queryset, EmployeeListSerializer), request
+        )
 
         serializer = EmployeeListSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
@@ -474,7 +483,9 @@ class ActiontypeView(APIView):
             return Response(serializer.data, status=200)
         action_types = Actiontype.objects.all()
         paginater = PageNumberPagination()
-        page = paginater.paginate_queryset(action_types, request)
+        page = paginater.paginate_queryset(
+            plan_queryset(action_types, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return paginater.get_paginated_response(serializer.data)
 
@@ -583,7 +594,10 @@ class DisciplinaryActionAPIView(APIView):
                 request.GET, queryset=disciplinary_actions
             ).qs
             page = paginator.paginate_queryset(
-                disciplinary_action_filter_queryset, request
+                plan_queryset(
+                    disciplinary_action_filter_queryset, DisciplinaryActionSerializer
+                ),
+                request,
             )
             serializer = DisciplinaryActionSerializer(page, many=True)
             return paginator.get_paginated_response(serializer.data)
@@ -659,7 +673,9 @@ class PolicyAPIView(APIView):
                 policies = Policy.objects.all()
             serializer = PolicySerializer(policies, many=True)
             paginator = PageNumberPagination()
-            page = paginator.paginate_queryset(policies, request)
+            page = paginator.paginate_queryset(
+                plan_queryset(policies, PolicySerializer), request
+            )
             serializer = PolicySerializer(page, many=True)
             return paginator.get_paginated_response(serializer.data)
 
@@ -729,7 +745,9 @@ class DocumentRequestAPIView(APIView):
         else:
             document_requests = DocumentRequest.objects.all()
             pagination = PageNumberPagination()
-            page = pagination.paginate_queryset(document_requests, request)
+            page = pagination.paginate_queryset(
+                plan_queryset(document_requests, DocumentRequestSerializer), request
+            )
             serializer = DocumentRequestSerializer(page, many=True)
             return pagination.get_paginated_response(serializer.data)
 
@@ -795,7 +813,9 @@ class DocumentAPIView(APIView):
                 request.GET, queryset=documents
             ).qs
             paginator = PageNumberPagination()
-            page = paginator.paginate_queryset(document_requests_filtered, request)
+            page = paginator.paginate_queryset(
+                plan_queryset(document_requests_filtered, DocumentSerializer), request
+            )
             serializer = DocumentSerializer(page, many=True)
             return paginator.get_paginated_response(serializer.data)
 
@@ -934,7 +954,9 @@ class EmployeeSelectorView(APIView):
             employees = Employee.objects.all()
 
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(employees, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(employees, EmployeeSelectorSerializer), request
+        )
         serializer = EmployeeSelectorSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -34,7 +34,12 @@ from helpdesk.models import (
     DepartmentManager,
 )
 from helpdesk.filter import TicketFilter, FAQFilter, FAQCategoryFilter
-from ...api_methods.base.methods import groupby_queryset, permission_based_queryset
+from ...api_methods.base.methods import (
+    get_paginator,
+    groupby_queryset,
+    permission_based_queryset,
+    plan_queryset,
+)
 from ...api_decorators.base.decorators import (
     manager_permission_required,
     permission_required,
@@ -64,7 +69,9 @@ class TicketTypeGetCreateAPIView(APIView):
     def get(self, request):
         ticket_types = self.get_queryset()
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(ticket_types, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(ticket_types, TicketTypeSerializer), request
+        )
         serializer = TicketTypeSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -126,7 +133,9 @@ class FAQCategoryGetCreateAPIView(APIView):
         faq_categories = self.get_queryset()
         filterset = self.filterset_class(request.GET, queryset=faq_categories)
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, FAQCategorySerializer), request
+        )
         serializer = FAQCategorySerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -191,7 +200,9 @@ class FAQGetCreateAPIView(APIView):
             faqs = self.get_queryset()
         filterset = self.filterset_class(request.GET, queryset=faqs)
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, FAQSerializer), request
+        )
         serializer = FAQSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -262,8 +273,10 @@ class TicketGetCreateAPIView(APIView):
         if field_name:
             url = request.build_absolute_uri()
             return groupby_queryset(request, url, field_name, filterset.qs)
-        paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(filterset.qs, request)
+        paginator = get_paginator(request, ("-created_date", "-id"))
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, TicketSerializer), request
+        )
         serializer = TicketSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -360,7 +373,9 @@ class CommentGetCreateAPIView(APIView):
             return Response({"error": "Ticket not found"}, status=404)
         comments = Comment.objects.filter(ticket_id=ticket_id)
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(comments, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(comments, CommentSerializer), request
+        )
         serializer = CommentSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -428,7 +443,9 @@ class AttachmentGetCreateAPIView(APIView):
         else:
             return Response({"error": "ticket_id or comment_id required"}, status=400)
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(attachments, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(attachments, AttachmentSerializer), request
+        )
         serializer = AttachmentSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -471,7 +488,9 @@ class ClaimRequestGetCreateAPIView(APIView):
         else:
             claim_requests = ClaimRequest.objects.all()
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(claim_requests, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(claim_requests, ClaimRequestSerializer), request
+        )
         serializer = ClaimRequestSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -527,7 +546,9 @@ class DepartmentManagerGetCreateAPIView(APIView):
     def get(self, request):
         department_managers = self.get_queryset()
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(department_managers, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(department_managers, DepartmentManagerSerializer), request
+        )
         serializer = DepartmentManagerSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -19,7 +19,11 @@ from leave.models import AvailableLeave, LeaveAllocationRequest, LeaveRequest, L
 from notifications.signals import notify
 
 from ...api_decorators.base.decorators import manager_permission_required
-from ...api_methods.base.methods import groupby_queryset
+from ...api_methods.base.methods import (
+    get_paginator,
+    groupby_queryset,
+    plan_queryset,
+)
 
 
 class EmployeeAvailableLeaveGetAPIView(APIView):
@@ -29,7 +33,9 @@ class EmployeeAvailableLeaveGetAPIView(APIView):
         employee = request.user.employee_get
         available_leave = employee.available_leave.all()
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(available_leave, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(available_leave, GetAvailableLeaveTypeSerializer), request
+        )
         serializer = GetAvailableLeaveTypeSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -52,12 +58,14 @@ class EmployeeLeaveRequestGetCreateAPIView(APIView):
         employee = request.user.employee_get
         leave_request = employee.leaverequest_set.all().order_by("-id")
         filterset = self.filterset_class(request.GET, queryset=leave_request)
-        paginator = PageNumberPagination()
+        paginator = get_paginator(request, ("-id",))
         field_name = request.GET.get("groupby_field", None)
         if field_name:
             url = request.build_absolute_uri()
             return groupby_queryset(request, url, field_name, filterset.qs)
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, userLeaveRequestGetAllSerilaizer), request
+        )
         serializer = userLeaveRequestGetAllSerilaizer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -163,7 +171,9 @@ class LeaveTypeGetCreateAPIView(APIView):
         leave_type = LeaveType.objects.all()
         filterset = self.filterset_class(request.GET, queryset=leave_type)
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, LeaveTypeAllGetSerializer), request
+        )
         serializer = LeaveTypeAllGetSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -253,7 +263,9 @@ class LeaveAllocationRequestGetCreateAPIView(APIView):
         if field_name:
             url = request.build_absolute_uri()
             return groupby_queryset(request, url, field_name, filterset.qs)
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, LeaveAllocationRequestGetSerializer), request
+        )
         serializer = LeaveAllocationRequestGetSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -357,7 +369,9 @@ class AssignLeaveGetCreateAPIView(APIView):
         if field_name:
             url = request.build_absolute_uri()
             return groupby_queryset(request, url, field_name, filterset.qs)
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, AssignLeaveGetSerializer), request
+        )
         serializer = AssignLeaveGetSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -464,12 +478,14 @@ class LeaveRequestGetCreateAPIView(APIView):
             | multiple_approvals
         )
         filterset = self.filterset_class(request.GET, queryset=queryset)
-        paginator = PageNumberPagination()
+        paginator = get_paginator(request, ("-id",))
         field_name = request.GET.get("groupby_field", None)
         if field_name:
             url = request.build_absolute_uri()
             return groupby_queryset(request, url, field_name, filterset.qs)
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, LeaveRequestGetAllSerilaizer), request
+        )
         serializer = LeaveRequestGetAllSerilaizer(
             page, context={"request": request}, many=True
         )
@@ -581,7 +597,9 @@ class CompanyLeaveGetCreateAPIView(APIView):
     def get(self, request):
         company_leave = CompanyLeave.objects.all().order_by("-id")
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(company_leave, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(company_leave, CompanyLeaveSerializer), request
+        )
         serializer = CompanyLeaveSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -646,7 +664,9 @@ class HolidayGetCreateAPIView(APIView):
     def get(self, request):
         holiday = Holiday.objects.all().order_by("-id")
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(holiday, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(holiday, HoildaySerializer), request
+        )
         serializer = HoildaySerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -995,7 +1015,9 @@ class EmployeeLeaveAllocationGetCreateAPIView(APIView):
         if field_name:
             url = request.build_absolute_uri()
             return groupby_queryset(request, url, field_name, filterset.qs)
-        page = paginator.paginate_queryset(filterset.qs, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(filterset.qs, LeaveAllocationRequestGetSerializer), request
+        )
         serializer = LeaveAllocationRequestGetSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -1087,7 +1109,9 @@ class EmployeeAvailableLeaveTypeGetAPIView(APIView):
         leave_type_ids = available_leave.values_list("leave_type_id", flat=True)
         leave_types = LeaveType.objects.filter(id__in=leave_type_ids)
         paginator = PageNumberPagination()
-        page = paginator.paginate_queryset(leave_types, request)
+        page = paginator.paginate_queryset(
+            plan_queryset(leave_types, LeaveTypeAllGetSerializer), request
+        )
         serializer = LeaveTypeAllGetSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
@@ -1,8 +1,8 @@
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ...api_methods.base.methods import get_paginator, plan_queryset
 from ...api_serializers.notifications.serializers import NotificationSerializer
 
 # Create your views here.
@@ -17,8 +17,10 @@ class NotificationView(APIView):
         elif type == "unread":
             queryset = request.user.notifications.unread()
 
-        pagination = PageNumberPagination()
-        page = pagination.paginate_queryset(queryset, request)
+        pagination = get_paginator(request, ("-timestamp", "-id"))
+        page = pagination.paginate_queryset(
+            plan_queryset(queryset, NotificationSerializer), request
+        )
         serializer = NotificationSerializer(page, many=True)
         return pagination.get_paginated_response(serializer.data)
 
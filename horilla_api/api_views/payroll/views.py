@@ -29,7 +29,11 @@ from payroll.models.tax_models import TaxBracket
 from payroll.threadings.mail import MailSendThread
 from payroll.views.views import payslip_pdf
 
-from ...api_methods.base.methods import groupby_queryset
+from ...api_methods.base.methods import (
+    get_paginator,
+    groupby_queryset,
+    plan_queryset,
+)
 from ...api_serializers.payroll.serializers import (
     AllowanceSerializer,
     ContractSerializer,
@@ -66,8 +70,10 @@ class PayslipView(APIView):
         if field_name:
             url = request.build_absolute_uri()
             return groupby_queryset(request, url, field_name, payslip_filter_queryset)
-        pagination = PageNumberPagination()
-        page = pagination.paginate_queryset(payslip_filter_queryset, request)
+        pagination = get_paginator(request, ("-end_date", "-id"))
+        page = pagination.paginate_queryset(
+            plan_queryset(payslip_filter_queryset, PayslipSerializer), request
+        )
         serializer = PayslipSerializer(page, many=True)
         return pagination.get_paginated_response(serializer.data)
 
@@ -132,7 +138,9 @@ class ContractView(APIView):
             url = request.build_absolute_uri()
             return groupby_queryset(request, url, field_name, filter_queryset)
         pagination = PageNumberPagination()
-        page = pagination.paginate_queryset(filter_queryset, request)
+        page = pagination.paginate_queryset(
+            plan_queryset(filter_queryset, ContractSerializer), request
+        )
         serializer = ContractSerializer(page, many=True)
         return pagination.get_paginated_response(serializer.data)
 
@@ -172,7 +180,9 @@ class AllowanceView(APIView):
         allowance = Allowance.objects.all()
         filter_queryset = AllowanceFilter(request.GET, allowance).qs
         pagination = PageNumberPagination()
-        page = pagination.paginate_queryset(filter_queryset, request)
+        page = pagination.paginate_queryset(
+            plan_queryset(filter_queryset, AllowanceSerializer), request
+        )
         serializer = AllowanceSerializer(page, many=True)
         return pagination.get_paginated_response(serializer.data)
 
@@ -212,7 +222,9 @@ class DeductionView(APIView):
         deduction = Deduction.objects.all()
         filter_queryset = DeductionFilter(request.GET, deduction).qs
         pagination = PageNumberPagination()
-        page = pagination.paginate_queryset(filter_queryset, request)
+        page = pagination.paginate_queryset(
+            plan_queryset(filter_queryset, DeductionSerializer), request
+        )
         serializer = DeductionSerializer(page, many=True)
         return pagination.get_paginated_response(serializer.data)
 
@@ -259,7 +271,9 @@ class LoanAccountView(APIView):
             return Response(serializer.data, status=200)
         loan_accounts = LoanAccount.objects.all()
         pagination = PageNumberPagination()
-        page = pagination.paginate_queryset(loan_accounts, request)
+        page = pagination.paginate_queryset(
+            plan_queryset(loan_accounts, LoanAccountSerializer), request
+        )
         serializer = LoanAccountSerializer(page, many=True)
         return pagination.get_paginated_response(serializer.data)
 
@@ -297,7 +311,9 @@ class ReimbursementView(APIView):
                 employee_id=request.user.employee_get
             )
         pagination = PageNumberPagination()
-        page = pagination.paginate_queryset(reimbursements, request)
+        page = pagination.paginate_queryset(
+            plan_queryset(reimbursements, self.serializer_class), request
+        )
         serializer = self.serializer_class(page, many=True)
         return pagination.get_paginated_response(serializer.data)
 
@@ -1,3 +1,183 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 
-# Create your tests here.
+from asset.models import Asset, AssetCategory, AssetLot
+from horilla_api.api_methods.base.methods import (
+    get_paginator,
+    groupby_queryset,
+    plan_queryset,
+)
+
+
+class AssetLotSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AssetLot
+        fields = ["id", "lot_number"]
+
+
+class AssetSerializer(serializers.ModelSerializer):
+    category = serializers.CharField(source="asset_category_id.asset_category_name")
+    lot = AssetLotSerializer(source="asset_lot_number_id")
+
+    class Meta:
+        model = Asset
+        fields = ["id", "asset_name", "category", "lot"]
+
+
+class AssetCategorySerializer(serializers.ModelSerializer):
+    assets = AssetSerializer(source="asset_set", many=True)
+
+    class Meta:
+        model = AssetCategory
+        fields = ["id", "asset_category_name", "assets"]
+
+
+class QueryPlanTests(TestCase):
+    """
+    Tests of the number of queries of the planned API list querysets
+    """
+
+    def create_assets(self, count):
+        start = AssetLot.objects.count()
+        categories = AssetCategory.objects.bulk_create(
+            [
+                AssetCategory(asset_category_name=f"Category {index}")
+                for index in range(start, start + count)
+            ]
+        )
+        lots = AssetLot.objects.bulk_create(
+            [
+                AssetLot(lot_number=f"LOT-{index}")
+                for index in range(start, start + count)
+            ]
+        )
+        Asset.objects.bulk_create(
+            [
+                Asset(
+                    asset_name=f"Asset {start + index}",
+                    asset_tracking_id=f"TRK-{start + index}",
+                    asset_purchase_date="2024-01-01",
+                    asset_purchase_cost=100,
+                    asset_category_id=categories[index],
+                    asset_lot_number_id=lots[index],
+                )
+                for index in range(count)
+            ]
+        )
+
+    def serialize_queries(self, serializer_class, queryset):
+        with CaptureQueriesContext(connection) as queries:
+            data = serializer_class(
+                plan_queryset(queryset, serializer_class), many=True
+            ).data
+        return len(queries), data
+
+    def test_related_rows_are_loaded_with_the_page(self):
+        self.create_assets(5)
+        queries, data = self.serialize_queries(AssetSerializer, Asset.objects.all())
+        self.assertEqual(queries, 1)
+        self.assertEqual(len(data), 5)
+
+        self.create_assets(40)
+        queries, data = self.serialize_queries(AssetSerializer, Asset.objects.all())
+        self.assertEqual(queries, 1)
+        self.assertEqual(len(data), 45)
+
+    def test_nested_reverse_relations_are_prefetched(self):
+        self.create_assets(5)
+        small, _data = self.serialize_queries(
+            AssetCategorySerializer, AssetCategory.objects.all()
+        )
+        self.create_assets(40)
+        large, data = self.serialize_queries(
+            AssetCategorySerializer, AssetCategory.objects.all()
+        )
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, 5)
+        self.assertEqual(data[0]["assets"][0]["lot"]["lot_number"], "LOT-0")
+
+    def groupby_queries(self, count):
+        Asset.objects.all().delete()
+        AssetCategory.objects.all().delete()
+        self.create_assets(count)
+        request = Request(
+            APIRequestFactory().get("/api/asset/", {"groupby_field": "category"})
+        )
+        # the company manager counts the rows once when the queryset is built
+        queryset = Asset.objects.all()
+        with CaptureQueriesContext(connection) as queries:
+            response = groupby_queryset(
+                request, request.build_absolute_uri(), "asset_category_id", queryset
+            )
+        self.assertEqual(response.data["count"], count)
+        self.assertEqual(response.data["results"][0]["count"], 1)
+        return len(queries)
+
+    def test_groups_are_counted_and_labelled_in_constant_queries(self):
+        self.assertEqual(self.groupby_queries(5), 2)
+        self.assertEqual(self.groupby_queries(60), 2)
+
+
+class KeysetCursorPaginationTests(TestCase):
+    """
+    Tests of the cursor pagination over orderings whose first field repeats
+    """
+
+    def setUp(self):
+        category = AssetCategory.objects.create(asset_category_name="Laptops")
+        # five purchase dates shared by four assets each
+        Asset.objects.bulk_create(
+            [
+                Asset(
+                    asset_name=f"Asset {index}",
+                    asset_tracking_id=f"TRK-{index}",
+                    asset_purchase_date=f"2024-01-0{index % 5 + 1}",
+                    asset_purchase_cost=100,
+                    asset_category_id=category,
+                )
+                for index in range(20)
+            ]
+        )
+        self.expected = list(
+            Asset.objects.order_by("-asset_purchase_date", "-id").values_list(
+                "id", flat=True
+            )
+        )
+
+    def get_page(self, url):
+        request = Request(APIRequestFactory().get(url))
+        paginator = get_paginator(request, ("-asset_purchase_date", "-id"))
+        paginator.page_size = 3
+        page = paginator.paginate_queryset(Asset.objects.entire(), request)
+        return [asset.id for asset in page], paginator
+
+    def test_pages_do_not_skip_or_repeat_tied_rows(self):
+        pages = []
+        url = "/api/asset/?pagination=cursor"
+        while url:
+            ids, paginator = self.get_page(url)
+            pages.append(ids)
+            url = paginator.get_next_link()
+        self.assertEqual(sum(pages, []), self.expected)
+        self.assertEqual(len(pages), 7)
+
+        # and back from the last page
+        backwards = []
+        url = paginator.get_previous_link()
+        while url:
+            ids, paginator = self.get_page(url)
+            backwards = ids + backwards
+            url = paginator.get_previous_link()
+        self.assertEqual(backwards + pages[-1], self.expected)
+
+    def test_malformed_position_is_rejected(self):
+        request = Request(APIRequestFactory().get("/api/asset/?pagination=cursor"))
+        paginator = get_paginator(request, ("-asset_purchase_date", "-id"))
+        for position in ["2024-01-01", '["2024-01-01"]']:
+            with self.assertRaises(NotFound):
+                paginator.keyset_filter(position, False)
@@ -0,0 +1,225 @@
+# Generated by Django 4.2.23 on 2026-10-19 00:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import horilla.models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("employee", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DocumentRequest",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, null=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                ("title", models.CharField(max_length=100, verbose_name="Title")),
+                (
+                    "format",
+                    models.CharField(
+                        choices=[
+                            ("any", "Any"),
+                            ("pdf", "PDF"),
+                            ("txt", "TXT"),
+                            ("docx", "DOCX"),
+                            ("xlsx", "XLSX"),
+                            ("jpg", "JPG"),
+                            ("png", "PNG"),
+                            ("jpeg", "JPEG"),
+                        ],
+                        max_length=10,
+                        verbose_name="Format",
+                    ),
+                ),
+                (
+                    "max_size",
+                    models.IntegerField(
+                        blank=True, null=True, verbose_name="Max size (In MB)"
+                    ),
+                ),
+                (
+                    "description",
+                    models.TextField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="Description",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Created By",
+                    ),
+                ),
+                (
+                    "employee_id",
+                    models.ManyToManyField(
+                        to="employee.employee", verbose_name="Employees"
+                    ),
+                ),
+                (
+                    "modified_by",
+                    models.ForeignKey(
+                        blank=True,
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_modified_by",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Modified By",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Document Request",
+                "verbose_name_plural": "Document Requests",
+            },
+        ),
+        migrations.CreateModel(
+            name="Document",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, null=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, verbose_name="Is Active"),
+                ),
+                ("title", models.CharField(max_length=250)),
+                (
+                    "document",
+                    models.FileField(
+                        null=True,
+                        upload_to=horilla.models.upload_path,
+                        verbose_name="Document",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("requested", "Requested"),
+                            ("approved", "Approved"),
+                            ("rejected", "Rejected"),
+                        ],
+                        default="requested",
+                        max_length=10,
+                        verbose_name="Status",
+                    ),
+                ),
+                (
+                    "reject_reason",
+                    models.TextField(
+                        blank=True,
+                        max_length=255,
+                        null=True,
+                        verbose_name="Reject Reason",
+                    ),
+                ),
+                (
+                    "issue_date",
+                    models.DateField(blank=True, null=True, verbose_name="Issue Date"),
+                ),
+                (
+                    "expiry_date",
+                    models.DateField(blank=True, null=True, verbose_name="Expiry Date"),
+                ),
+                (
+                    "notify_before",
+                    models.IntegerField(
+                        default=1, null=True, verbose_name="Notify Before"
+                    ),
+                ),
+                (
+                    "is_digital_asset",
+                    models.BooleanField(default=False, verbose_name="Is Digital Asset"),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Created By",
+                    ),
+                ),
+                (
+                    "document_request_id",
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to="horilla_documents.documentrequest",
+                    ),
+                ),
+                (
+                    "employee_id",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        to="employee.employee",
+                        verbose_name="Employee",
+                    ),
+                ),
+                (
+                    "modified_by",
+                    models.ForeignKey(
+                        blank=True,
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_modified_by",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Modified By",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Document",
+                "verbose_name_plural": "Documents",
+            },
+        ),
+    ]
@@ -3,7 +3,13 @@
 import threading
 
 from django.apps import apps
-from django.db.models.signals import post_migrate, post_save, pre_delete, pre_save
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
@@ -87,6 +93,16 @@ if apps.is_installed("attendance"):
 
         work_records = WorkRecords.objects.filter(leave_request_id=instance).delete()
 
+    @receiver(post_save, sender=LeaveRequest)
+    @receiver(post_delete, sender=LeaveRequest)
+    def leaverequest_update_attendance_statistics(sender, instance, **kwargs):
+        """
+        Refresh the attendance dashboard statistics of the leave period
+        """
+        from attendance.methods.daily_statistics import refresh_employee_statistics
+
+        refresh_employee_statistics(instance.employee_id, instance.requested_dates())
+
 
 # @receiver(post_migrate)
 def add_missing_leave_to_workrecords(sender, **kwargs):
@@ -8,6 +8,7 @@ from django.template.loader import render_to_string
 from django.utils.translation import gettext as _
 
 from base.backends import ConfiguredEmailBackend
+from base.outbox import enqueue_email
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,7 @@ class LeaveMailSendThread(Thread):
                 )
                 email.content_subtype = "html"
                 try:
-                    email.send()
+                    enqueue_email(email, email_backend.configuration)
                 except:
                     messages.error(
                         self.request, f"Mail not sent to {recipient.get_full_name()}"
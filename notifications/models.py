@@ -14,3 +14,7 @@ class Notification(AbstractNotification):
     class Meta(AbstractNotification.Meta):
         abstract = False
         swappable = swappable_setting("notifications", "Notification")
+        indexes = [
+            # cursor pagination of the notification API
+            models.Index(fields=["recipient", "-timestamp", "-id"]),
+        ]
@@ -1,3 +1,58 @@
-from django.test import TestCase
-
-# Create your tests here.
+from django.test import TestCase
+from django.urls import reverse
+
+from employee.models import Employee
+from horilla.horilla_middlewares import _thread_locals
+from onboarding.models import OnboardingStage
+from recruitment.models import Recruitment
+
+
+class StageCandidatesTests(TestCase):
+    """
+    Tests of the lazily loaded onboarding stage columns
+    """
+
+    def setUp(self):
+        self.manager = Employee.objects.create(
+            employee_first_name="Manager",
+            email="manager@horilla.com",
+            phone="1234567890",
+            badge_id="MGR",
+        )
+        self.managed = self.create_recruitment("Managed")
+        self.managed.recruitment_managers.add(self.manager)
+        self.other = self.create_recruitment("Other")
+        user = self.manager.employee_user_id
+        user.is_new_employee = False
+        user.save()
+        self.client.force_login(user)
+
+    def tearDown(self):
+        # the middleware leaves the last request of the client in the thread
+        _thread_locals.__dict__.pop("request", None)
+
+    def create_recruitment(self, title):
+        recruitment = Recruitment(title=title, vacancy=1)
+        recruitment.save()
+        stage = OnboardingStage.objects.create(
+            stage_title=f"{title} stage", recruitment_id=recruitment, sequence=1
+        )
+        recruitment.stage = stage
+        return recruitment
+
+    def stage_candidates(self, recruitment):
+        return self.client.get(
+            reverse("onboarding-stage-candidates", args=[recruitment.stage.id]),
+            HTTP_HX_REQUEST="true",
+        )
+
+    def test_manager_loads_the_stages_of_managed_recruitments(self):
+        response = self.stage_candidates(self.managed)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Managed stage")
+
+    def test_manager_cannot_load_the_stages_of_other_recruitments(self):
+        response = self.stage_candidates(self.other)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "Other stage")
+        self.assertEqual(response.content, b"")
@@ -47,6 +47,11 @@ urlpatterns = [
     path("email-send", views.email_send, name="email-send"),
     path("onboarding-view/", views.onboarding_view, name="onboarding-view"),
     path("kanban-view", views.kanban_view, name="kanban-view"),
+    path(
+        "stage-candidates/<int:stage_id>",
+        views.stage_candidates,
+        name="onboarding-stage-candidates",
+    ),
     path(
         "candidate-task-update/<int:taskId>",
         views.candidate_task_update,
@@ -17,6 +17,7 @@ import logging
 import os
 import random
 import secrets
+from collections import defaultdict
 from urllib.parse import parse_qs
 
 from django import template
@@ -26,7 +27,14 @@ from django.contrib.auth.models import User
 from django.core.files.base import ContentFile
 from django.core.mail import EmailMessage, send_mail
 from django.core.paginator import Paginator
-from django.db.models import ProtectedError
+from django.db.models import (
+    Count,
+    F,
+    ProtectedError,
+    Q,
+    Window,
+)
+from django.db.models.functions import RowNumber
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import redirect, render
 from django.template.loader import render_to_string
@@ -54,6 +62,7 @@ from horilla.decorators import (
     permission_required,
 )
 from horilla.group_by import group_by_queryset as general_group_by
+from horilla.reorder import ordered_ids_from_sequence, reorder
 from horilla_documents.models import Document
 from notifications.signals import notify
 from onboarding.decorators import (
@@ -81,10 +90,12 @@ from onboarding.models import (
 from recruitment.filters import CandidateFilter, CandidateReGroup, RecruitmentFilter
 from recruitment.forms import RejectedCandidateForm
 from recruitment.models import Candidate, Recruitment, RejectedCandidate
-from recruitment.pipeline_grouper import group_by_queryset
 
 logger = logging.getLogger(__name__)
 
+# candidates shown per page of an onboarding stage column
+ONBOARDING_STAGE_PAGE_SIZE = 10
+
 
 @login_required
 @hx_request_required
@@ -729,59 +740,122 @@ def email_send(request):
     return HttpResponse("<script>window.location.reload()</script>")
 
 
-def onboarding_query_grouper(request, queryset):
+def stage_page_name(stage):
+    """
+    Returns the query parameter holding the page number of a stage column
+    """
+    return f"dynamic_page_onboarding_stage{stage.id}"
+
+
+def onboarding_query_grouper(request, queryset, stage_id=None):
     """
-    This method is used to make group of the onboarding records
+    This method is used to make group of the onboarding records. The stages
+    of the recruitments, the candidate count of every stage and the visible
+    page of every stage column are each loaded with a single query.
     """
+    recruitments = list(queryset)
+    stages = OnboardingStage.objects.entire().filter(recruitment_id__in=recruitments)
+    if stage_id is not None:
+        stages = stages.filter(id=stage_id)
+    stages = list(
+        OnboardingStageFilter(request.GET, queryset=stages)
+        .qs.prefetch_related("employee_id", "onboarding_task")
+        .order_by("sequence")
+    )
+
+    candidates = CandidateStage.objects.entire().filter(
+        pk__in=OnboardingCandidateFilter(
+            request.GET,
+            CandidateStage.objects.entire().filter(
+                onboarding_stage_id__in=stages,
+                candidate_id__is_active=True,
+            ),
+        ).qs.values("pk")
+    )
+    counts = dict(
+        candidates.order_by()
+        .values_list("onboarding_stage_id")
+        .annotate(count=Count("pk"))
+    )
+
+    pages = {}
+    visible = Q()
+    for stage in stages:
+        if counts.get(stage.id):
+            paginator = Paginator(range(counts[stage.id]), ONBOARDING_STAGE_PAGE_SIZE)
+            page = paginator.get_page(request.GET.get(stage_page_name(stage)))
+            page.object_list = []
+            pages[stage.id] = page
+            visible |= Q(
+                onboarding_stage_id=stage.id,
+                position__gte=page.start_index(),
+                position__lte=page.end_index(),
+            )
+    if pages:
+        rows = (
+            candidates.annotate(
+                position=Window(
+                    RowNumber(),
+                    partition_by=[F("onboarding_stage_id")],
+                    order_by=[F("sequence").asc(), F("id").asc()],
+                )
+            )
+            .filter(visible)
+            .select_related(
+                "candidate_id__recruitment_id",
+                "candidate_id__job_position_id",
+                "candidate_id__onboarding_portal",
+            )
+            .order_by("onboarding_stage_id", "position")
+        )
+        for row in rows:
+            pages[row.onboarding_stage_id_id].object_list.append(row)
+
+    employee_ids = defaultdict(list)
+    for stage, candidate in (
+        CandidateStage.objects.entire()
+        .filter(onboarding_stage_id__in=stages)
+        .values_list("onboarding_stage_id", "candidate_id")
+    ):
+        employee_ids[stage].append(candidate)
+
+    grouped = defaultdict(list)
+    for stage in stages:
+        grouped[stage.recruitment_id_id].append(stage)
     groups = []
-    for rec in queryset:
-        employees = []
-        stages = OnboardingStageFilter(
-            request.GET, queryset=rec.onboarding_stage.all()
-        ).qs.order_by("sequence")
-        all_stages_grouper = []
-        data = {"recruitment": rec, "stages": []}
-        for stage in stages:
-            all_stages_grouper.append({"grouper": stage, "list": []})
-            stage_candidates = OnboardingCandidateFilter(
-                request.GET,
-                stage.candidate.filter(
-                    candidate_id__is_active=True,
-                ),
-            ).qs.order_by("sequence")
-
-            page_name = "page" + stage.stage_title + str(rec.id)
-            grouper = group_by_queryset(
-                stage_candidates,
-                "onboarding_stage_id",
-                request.GET.get(page_name),
-                page_name,
-            ).object_list
-            data["stages"] = data["stages"] + grouper
-            employees = employees + [
-                employee.candidate_id.id for employee in stage.candidate.all()
-            ]
-        ordered_data = []
-        # combining un used groups in to the grouper
-        groupers = data["stages"]
-        for stage in stages:
-            found = False
-            for grouper in groupers:
-                if grouper["grouper"] == stage:
-                    ordered_data.append(grouper)
-                    found = True
-                    break
-            if not found:
-                ordered_data.append({"grouper": stage})
-        data = {
-            "recruitment": rec,
-            "stages": ordered_data,
-            "employee_ids": employees,
-        }
+    for rec in recruitments:
+        data = {"recruitment": rec, "stages": [], "employee_ids": []}
+        for stage in grouped[rec.id]:
+            grouper = {"grouper": stage, "count": counts.get(stage.id, 0)}
+            if stage.id in pages:
+                grouper["list"] = pages[stage.id]
+                grouper["dynamic_name"] = stage_page_name(stage)
+            data["stages"].append(grouper)
+            data["employee_ids"] += employee_ids[stage.id]
         groups.append(data)
     return groups
 
 
+def visible_recruitments(request, recruitments):
+    """
+    Restrict the recruitments to the ones the user manages, is a stage
+    manager of or has onboarding tasks in, unless the user can view every
+    onboarding stage
+    """
+    if request.user.has_perm("onboarding.view_onboardingstage"):
+        return recruitments
+    employee = request.user.employee_get
+    return recruitments.filter(
+        Q(is_active=True, recruitment_managers=employee)
+        | Q(onboarding_stage__employee_id=employee)
+        | Q(
+            id__in=employee.onboarding_task.filter(stage_id__isnull=False).values(
+                "stage_id__recruitment_id"
+            )
+        )
+    ).distinct()
+
+
 @login_required
 @all_manager_can_enter("onboarding.view_onboardingstage")
 def onboarding_view(request):
@@ -796,19 +870,7 @@ def onboarding_view(request):
     """
     filter_obj = RecruitmentFilter(request.GET)
     # is active filteration not providing on pipeline
-    recruitments = filter_obj.qs
-    if not request.user.has_perm("onboarding.view_onboardingstage"):
-        recruitments = recruitments.filter(
-            is_active=True, recruitment_managers__in=[request.user.employee_get]
-        ) | recruitments.filter(
-            onboarding_stage__employee_id__in=[request.user.employee_get]
-        )
-    employee_tasks = request.user.employee_get.onboarding_task.all()
-    for task in employee_tasks:
-        if task.stage_id and task.stage_id.recruitment_id not in recruitments:
-            recruitments = recruitments | filter_obj.qs.filter(
-                id=task.stage_id.recruitment_id.id
-            )
+    recruitments = visible_recruitments(request, filter_obj.qs)
     recruitments = recruitments.filter(is_active=True).distinct()
     status = request.GET.get("closed")
     if not status:
@@ -843,6 +905,41 @@ def onboarding_view(request):
     )
 
 
+@login_required
+@hx_request_required
+@all_manager_can_enter("onboarding.view_onboardingstage")
+def stage_candidates(request, stage_id):
+    """
+    function used to load a page of an onboarding stage column.
+
+    Parameters:
+    request (HttpRequest): The HTTP request object.
+    stage_id : OnboardingStage id
+
+    Returns:
+    GET : return the onboarding stage template
+    """
+    recruitments = visible_recruitments(
+        request, Recruitment.objects.filter(onboarding_stage__id=stage_id)
+    )
+    groups = onboarding_query_grouper(request, recruitments, stage_id=stage_id)
+    if not groups or not groups[0]["stages"]:
+        return HttpResponse("")
+    recruitment = groups[0]["recruitment"]
+    setattr(recruitment, "stages", groups[0]["stages"])
+    setattr(recruitment, "employee_ids", groups[0]["employee_ids"])
+    return render(
+        request,
+        "onboarding/onboarding_stage.html",
+        {
+            "recruitment": recruitment,
+            "stage": recruitment.stages[0],
+            "choices": CandidateTask.choice,
+            "pd": request.GET.urlencode(),
+        },
+    )
+
+
 @login_required
 @all_manager_can_enter("onboarding.view_onboardingstage")
 def kanban_view(request):
@@ -1554,13 +1651,9 @@ def candidate_sequence_update(request):
     This method is used to update the sequence of candidate
     """
     sequence_data = json.loads(request.POST["sequenceData"])
-    updated = False
-    for cand_id, seq in sequence_data.items():
-        cand = CandidateStage.objects.get(id=cand_id)
-        if cand.sequence != seq:
-            cand.sequence = seq
-            cand.save()
-            updated = True
+    updated = reorder(
+        CandidateStage.objects.entire(), ordered_ids_from_sequence(sequence_data)
+    )
     if updated:
         return JsonResponse(
             {"message": _("Candidate sequence updated"), "type": "info"}
@@ -1575,14 +1668,12 @@ def stage_sequence_update(request):
     This method is used to update the sequence of the stages
     """
     sequence_data = json.loads(request.POST["sequenceData"])
-    updated = False
-
-    for stage_id, seq in sequence_data.items():
-        stage = OnboardingStage.objects.get(id=stage_id)
-        if stage.sequence != seq:
-            stage.sequence = seq
-            stage.save()
-            updated = True
+    # stages are few, keep their sequences consecutive
+    updated = reorder(
+        OnboardingStage.objects.entire(),
+        ordered_ids_from_sequence(sequence_data),
+        gap=1,
+    )
 
     if updated:
         return JsonResponse({"type": "success", "message": _("Stage sequence updated")})
@@ -1457,6 +1457,10 @@ class Payslip(HorillaModel):
         ordering = [
             "-end_date",
         ]
+        indexes = [
+            # cursor pagination of the payslip API
+            models.Index(fields=["-end_date", "-id"]),
+        ]
 
 
 class LoanAccount(HorillaModel):
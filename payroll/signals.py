@@ -4,7 +4,9 @@ from django.apps import apps
 from django.db.models.signals import post_save, pre_save
 from django.dispatch import receiver
 
+from base.models import EmailOutbox
 from employee.models import EmployeeWorkInformation
+from horilla.signals import post_outbox_delivery
 from payroll.methods.deductions import create_deductions
 from payroll.models.models import Allowance, Contract, Deduction, LoanAccount, Payslip
 
@@ -112,3 +114,13 @@ def create_installments(sender, instance, created, **kwargs):
                         installments.append(installment)
 
                 instance.deduction_ids.add(*installments)
+
+
+@receiver(post_outbox_delivery, sender=EmailOutbox)
+def mark_payslips_sent(sender, instance, **kwargs):
+    """
+    Mark the payslips of a delivered payslip mail as sent to the employee
+    """
+    payslip_ids = instance.context.get("payslip_ids")
+    if payslip_ids:
+        Payslip.objects.filter(id__in=payslip_ids).update(sent_to_employee=True)
@@ -1,5 +1,45 @@
 """test cases"""
 
+from datetime import date
+
+from django.core.mail import EmailMessage
 from django.test import TestCase
 
-# Create your tests here.
+from base.outbox import enqueue_email, mark_failed, mark_sent
+from employee.models import Employee
+from payroll.models.models import Payslip
+
+
+class PayslipMailTests(TestCase):
+    """
+    Tests of the sent flag of mailed payslips
+    """
+
+    def setUp(self):
+        employee = Employee.objects.create(
+            employee_first_name="Paid",
+            email="paid@horilla.com",
+            phone="1234567890",
+            badge_id="PAY",
+        )
+        self.payslip = Payslip.objects.create(
+            employee_id=employee,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 1, 31),
+            pay_head_data={},
+        )
+        email = EmailMessage("Payslip", "Body", "hr@horilla.com", [employee.email])
+        self.outbox = enqueue_email(email, context={"payslip_ids": [self.payslip.id]})
+
+    def sent_to_employee(self):
+        self.payslip.refresh_from_db()
+        return self.payslip.sent_to_employee
+
+    def test_queued_payslip_is_not_marked_as_sent(self):
+        self.assertFalse(self.sent_to_employee())
+        mark_failed(self.outbox, "Connection refused")
+        self.assertFalse(self.sent_to_employee())
+
+    def test_delivered_payslip_is_marked_as_sent(self):
+        mark_sent(self.outbox)
+        self.assertTrue(self.sent_to_employee())
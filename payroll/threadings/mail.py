@@ -11,8 +11,8 @@ from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
 
 from base.backends import ConfiguredEmailBackend
+from base.outbox import enqueue_email
 from employee.models import EmployeeWorkInformation
-from payroll.models.models import Payslip
 from payroll.views.views import payslip_pdf
 
 logger = logging.getLogger(__name__)
@@ -71,11 +71,17 @@ class MailSendThread(Thread):
             )
             email.attachments = attachments
 
-            # Send the email
+            # Queue the email, the payslips are marked as sent once the outbox
+            # worker delivers it
             email.content_subtype = "html"
             try:
-                email.send()
-                Payslip.objects.filter(id__in=self.ids).update(sent_to_employee=True)
+                enqueue_email(
+                    email,
+                    email_backend.configuration,
+                    context={
+                        "payslip_ids": [instance.id for instance in record["instances"]]
+                    },
+                )
             except Exception as e:
                 logger.exception(e)
 
@@ -8,15 +8,16 @@ responses in pms app.
 import datetime
 import json
 import logging
-from itertools import tee
 from urllib.parse import parse_qs, urlencode, urlparse
 
 from dateutil.relativedelta import relativedelta
 from django import forms
 from django.contrib import messages
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import ProtectedError, Q
+from django.db.models import F, ProtectedError, Q, Window
+from django.db.models.functions import Lag
 from django.db.utils import IntegrityError
 from django.forms import modelformset_factory
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
@@ -104,6 +105,11 @@ from pms.models import (
 
 logger = logging.getLogger(__name__)
 
+# key result changes shown per page of the objective activity timeline
+KEY_RESULT_HISTORY_LIMIT = 50
+KEY_RESULT_DELTA_CACHE_PREFIX = "pms_key_result_delta_"
+KEY_RESULT_DELTA_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+
 
 # objectives
 @login_required
@@ -680,54 +686,111 @@ def objective_dashboard_view(request):
     )
 
 
-def objective_history(emp_obj_id):
+def key_result_deltas(records):
+    """
+    Returns {history id: changes} of the key result history records. The
+    changes of a record never change, so they are cached per history id and
+    only the missing ones are diffed against their previous record.
+    """
+    keys = {
+        record.history_id: f"{KEY_RESULT_DELTA_CACHE_PREFIX}{record.history_id}"
+        for record in records
+    }
+    cached = cache.get_many(keys.values())
+    deltas = {
+        history_id: cached[key] for history_id, key in keys.items() if key in cached
+    }
+    missing = [record for record in records if record.history_id not in deltas]
+    if not missing:
+        return deltas
+
+    previous = {record.history_id: record for record in records}
+    previous_ids = {record.previous_id for record in missing} - set(previous)
+    previous.update(
+        (record.history_id, record)
+        for record in EmployeeKeyResult.history.filter(history_id__in=previous_ids)
+    )
+    computed = {}
+    for record in missing:
+        delta = record.diff_against(previous[record.previous_id])
+        deltas[record.history_id] = [
+            {"field": change.field, "old": change.old, "new": change.new}
+            for change in delta.changes
+        ]
+        computed[keys[record.history_id]] = deltas[record.history_id]
+    cache.set_many(computed, KEY_RESULT_DELTA_CACHE_TIMEOUT)
+    return deltas
+
+
+def objective_history(emp_obj_id, before=None, limit=KEY_RESULT_HISTORY_LIMIT):
     """
     This view is used to get history of EmployeeObjective,  return objects.
     Args:
         id (int): Primarykey of EmployeeObjective.
+        before (tuple): (history date, history id) keyset cursor, only the
+        changes older than it are returned
+        limit (int): number of changes to return
     Returns:
-        All the history of EmployeeObjective.
+        tuple: the key result changes of the EmployeeObjective, newest first,
+        and the cursor of the next page (None on the last page)
     """
-
-    def pair_history(iterable):
-        """this function return two history pair"""
-        a, b = tee(iterable)
-        next(b, None)
-        return zip(a, b)
-
-    changed_key_results = []
-
-    def key_result_history(key_result):
-        """key result history"""
-        key_result_iterator = (
-            key_result.history.all().order_by("history_date").iterator()
+    records = EmployeeKeyResult.history.filter(
+        id__in=EmployeeKeyResult.objects.entire()
+        .filter(employee_objective_id=emp_obj_id)
+        .values("id")
+    )
+    if before is not None:
+        history_date, history_id = before
+        records = records.filter(
+            Q(history_date__lt=history_date)
+            | Q(history_date=history_date, history_id__lt=history_id)
         )
-        for record_pair in pair_history(key_result_iterator):
-            old_record, new_record = record_pair
-            delta = new_record.diff_against(old_record)
-            history_user_id = delta.new_record.history_user
-            history_change_date = delta.new_record.history_date
-            employee = Employee.objects.filter(employee_user_id=history_user_id).first()
-            key_result = delta.new_record.key_result_id
-            changed_key_results.append(
-                {
-                    "delta": delta,
-                    "changed_user": employee,
-                    "changed_date": history_change_date,
-                    "k_r": key_result,
-                }
+    records = list(
+        records.annotate(
+            previous_id=Window(
+                Lag("history_id"),
+                partition_by=[F("id")],
+                order_by=[F("history_date").asc(), F("history_id").asc()],
             )
-
-    obj_objective = EmployeeObjective.objects.get(id=emp_obj_id)
-    all_key_results = EmployeeKeyResult.objects.filter(
-        employee_objective_id=obj_objective
+        )
+        # the first record of a key result has nothing to be compared with
+        .filter(previous_id__isnull=False)
+        .select_related("key_result_id")
+        .order_by("-history_date", "-history_id")[: limit + 1]
     )
+    cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        cursor = (records[-1].history_date, records[-1].history_id)
+
+    deltas = key_result_deltas(records)
+    employees = {
+        employee.employee_user_id_id: employee
+        for employee in Employee.objects.entire().filter(
+            employee_user_id__in={record.history_user_id for record in records}
+        )
+    }
+    changed_key_results = [
+        {
+            "delta": {"changes": deltas[record.history_id]},
+            "changed_user": employees.get(record.history_user_id),
+            "changed_date": record.history_date,
+            "k_r": record.key_result_id,
+        }
+        for record in records
+    ]
+    return changed_key_results, cursor
 
-    for key_result in all_key_results:
-        # loop each key result and generate it's history
-        key_result_history(key_result)
-    changed_key_results.reverse()
-    return changed_key_results
+
+def parse_history_cursor(value):
+    """
+    Returns the (history date, history id) of a "<iso date>,<id>" cursor
+    """
+    history_date, _sep, history_id = (value or "").rpartition(",")
+    try:
+        return datetime.datetime.fromisoformat(history_date), int(history_id)
+    except ValueError:
+        return None
 
 
 @login_required
@@ -807,13 +870,27 @@ def objective_detailed_view_activity(request, id):
         or request.user.employee_get in objective.objective_id.managers.all()
         or request.user.has_perm("pms.view_comment")
     ):
-        key_result_history = objective_history(id)
+        before = parse_history_cursor(request.GET.get("before"))
+        key_result_history, cursor = objective_history(id, before=before)
+        # the other activities are windowed to the dates of the key result
+        # changes of this page, so the pages of the timeline do not overlap
+        upper = before[0] if before else None
+        lower = key_result_history[-1]["changed_date"] if cursor else None
+
+        def in_page(date):
+            return (lower is None or date >= lower) and (upper is None or date < upper)
+
         history = objective.tracking()
         comments = Comment.objects.filter(employee_objective_id=objective)
+        if upper is not None:
+            comments = comments.filter(created_at__lt=upper)
+        if lower is not None:
+            comments = comments.filter(created_at__gte=lower)
         activity_list = []
         for hist in history:
             hist["date"] = hist["pair"][0].history_date
-            activity_list.append(hist)
+            if in_page(hist["date"]):
+                activity_list.append(hist)
         for com in comments:
             comment = {
                 "type": "comment",
@@ -837,7 +914,12 @@ def objective_detailed_view_activity(request, id):
             "historys": history,
             "comments": comments,
             "activity_list": activity_list,
+            "history_cursor": (
+                f"{cursor[0].isoformat()},{cursor[1]}" if cursor else None
+            ),
         }
+        if before is not None:
+            return render(request, "okr/objective_activity_list.html", context)
         return render(request, "okr/objective_detailed_view_activity.html", context)
     else:
         messages.info(request, _("You dont have permission."))
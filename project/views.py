@@ -19,6 +19,7 @@ from django.utils.translation import gettext_lazy as _
 
 from base.methods import filtersubordinates, get_key_instances
 from horilla.decorators import hx_request_required, login_required, permission_required
+from horilla.reorder import ordered_ids_from_sequence, reorder
 from notifications.signals import notify
 from project.cbv.projects import DynamicProjectCreationFormView
 from project.cbv.tasks import DynamicTaskCreateFormView
@@ -1070,10 +1071,11 @@ def drag_and_drop_task(request):
             task.save()
             change = True
         sequence = json.loads(request.POST["sequence"])
-        for key, val in sequence.items():
-            if Task.objects.get(id=key).sequence != val:
-                Task.objects.filter(id=key).update(sequence=val)
-                change = True
+        if reorder(
+            Task.objects.entire().filter(project=project),
+            ordered_ids_from_sequence(sequence),
+        ):
+            change = True
         message = (
             _("Task stage has been successfully updated.")
             if previous_stage_id != updated_stage_id
@@ -15,6 +15,7 @@ from recruitment.models import (
     RecruitmentSurvey,
     RecruitmentSurveyAnswer,
     RejectedCandidate,
+    ResumeDocument,
     SkillZone,
     Stage,
 )
@@ -32,3 +33,4 @@ admin.site.register(CandidateRating)
 admin.site.register(SkillZone)
 admin.site.register(InterviewSchedule)
 admin.site.register(LinkedInAccount)
+admin.site.register(ResumeDocument)
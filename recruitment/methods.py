@@ -5,7 +5,9 @@ This page is used to write reusable methods.
 
 """
 
-from recruitment.models import Recruitment, RecruitmentSurvey
+from django.utils import timezone
+
+from recruitment.models import Candidate, Recruitment, RecruitmentSurvey
 
 
 def is_stagemanager(request):
@@ -70,3 +72,34 @@ def update_rec_template_grp(upt_template_ids, template_groups, rec_id):
             )
             for survey in rec_surveys_templates:
                 survey.recruitment_ids.add(recruitment_obj)
+
+
+def convert_existing_candidates(users):
+    """
+    Mark the active candidates that already have a user account (the username
+    is the candidate email) as converted with a single update
+
+    Args:
+        users: User queryset to match the candidates against
+    """
+    return (
+        Candidate.objects.entire()
+        .filter(
+            is_active=True,
+            converted=False,
+            email__in=users.values("username"),
+        )
+        .update(converted=True, hired=False, canceled=False)
+    )
+
+
+def close_ended_recruitments(day=None):
+    """
+    Close and unpublish the open recruitments whose end date has been reached
+    """
+    day = day or timezone.localdate()
+    return (
+        Recruitment.objects.entire()
+        .filter(closed=False, end_date__lte=day)
+        .update(closed=True, is_published=False)
+    )
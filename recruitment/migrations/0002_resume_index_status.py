@@ -0,0 +1,27 @@
+# Generated by Django 4.2.23 on 2026-10-19 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recruitment", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resume",
+            name="index_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("indexed", "Indexed"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                editable=False,
+                max_length=10,
+            ),
+        ),
+    ]
@@ -214,6 +214,7 @@ class Recruitment(HorillaModel):
             ),
             ("job_position_id", "start_date", "company_id"),
         ]
+        indexes = [models.Index(fields=["closed", "end_date"])]
         permissions = (("archive_recruitment", "Archive Recruitment"),)
         verbose_name = _("Recruitment")
         verbose_name_plural = _("Recruitments")
@@ -995,6 +996,46 @@ class InterviewSchedule(HorillaModel):
         verbose_name_plural = _("Schedule Interviews")
 
 
+class ResumeDocument(models.Model):
+    """
+    Text extracted from a resume file, stored once per file content hash and
+    shared by every resume uploading the same file
+    """
+
+    file_hash = models.CharField(max_length=64, unique=True)
+    token_count = models.IntegerField(default=0)
+    extracted_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.file_hash} ({self.token_count} tokens)"
+
+
+class ResumeTerm(models.Model):
+    """
+    Inverted index entry, the frequency of a term in a resume document
+    """
+
+    document = models.ForeignKey(
+        ResumeDocument, on_delete=models.CASCADE, related_name="terms"
+    )
+    term = models.CharField(max_length=100)
+    frequency = models.IntegerField(default=1)
+
+    class Meta:
+        unique_together = ("document", "term")
+        indexes = [models.Index(fields=["term", "document"])]
+
+    def __str__(self):
+        return f"{self.term} ({self.frequency})"
+
+
+RESUME_INDEX_STATUS = [
+    ("pending", _("Pending")),
+    ("indexed", _("Indexed")),
+    ("failed", _("Failed")),
+]
+
+
 class Resume(models.Model):
     file = models.FileField(
         upload_to=upload_path,
@@ -1006,6 +1047,20 @@ class Resume(models.Model):
         Recruitment, on_delete=models.CASCADE, related_name="resume"
     )
     is_candidate = models.BooleanField(default=False)
+    document = models.ForeignKey(
+        ResumeDocument,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="resumes",
+    )
+    index_status = models.CharField(
+        max_length=10,
+        choices=RESUME_INDEX_STATUS,
+        default="pending",
+        editable=False,
+    )
 
     def __str__(self):
         return f"{self.recruitment_id} - Resume {self.pk}"
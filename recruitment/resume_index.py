@@ -0,0 +1,239 @@
+"""
+resume_index.py
+
+This module is used to extract resume text once per file content and keep a
+term index of it, which the resume matching view ranks with BM25
+"""
+
+import hashlib
+import logging
+import math
+import os
+import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz  # type: ignore
+from django.db import connection, transaction
+
+from recruitment.models import Resume, ResumeDocument, ResumeTerm
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\b\w+\b")
+
+# BM25 tuning constants
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_executor = None
+
+
+def get_executor():
+    """
+    Returns the shared worker pool used to index uploaded resumes
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 2, thread_name_prefix="resume-index"
+        )
+    return _executor
+
+
+def tokenize(text):
+    """
+    Split the text into lower case word tokens
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def file_hash(file):
+    """
+    Returns the sha256 hex digest of the file content
+    """
+    digest = hashlib.sha256()
+    file.open("rb")
+    try:
+        for chunk in file.chunks():
+            digest.update(chunk)
+    finally:
+        file.close()
+    return digest.hexdigest()
+
+
+def extract_terms(file):
+    """
+    Extract the text of the pdf file and return the term frequencies
+    """
+    file.open("rb")
+    try:
+        pdf_document = fitz.open("pdf", file.read())
+    finally:
+        file.close()
+
+    terms = Counter()
+    try:
+        for page in pdf_document:
+            terms.update(tokenize(page.get_text()))
+    finally:
+        pdf_document.close()
+    return terms
+
+
+def index_resume(resume):
+    """
+    Link the resume to the indexed document of its file content, extracting
+    and indexing the text only when that content has not been seen before
+    """
+    digest = file_hash(resume.file)
+    document = ResumeDocument.objects.filter(file_hash=digest).first()
+    if document is None:
+        terms = extract_terms(resume.file)
+        with transaction.atomic():
+            document, created = ResumeDocument.objects.get_or_create(
+                file_hash=digest,
+                defaults={"token_count": sum(terms.values())},
+            )
+            if created:
+                ResumeTerm.objects.bulk_create(
+                    [
+                        ResumeTerm(document=document, term=term[:100], frequency=count)
+                        for term, count in terms.items()
+                    ],
+                    batch_size=1000,
+                    ignore_conflicts=True,
+                )
+    Resume.objects.filter(id=resume.id).update(
+        document=document, index_status="indexed"
+    )
+    resume.document = document
+    resume.index_status = "indexed"
+    return document
+
+
+def mark_index_failed(resume, error):
+    """
+    Record that the text of the resume could not be extracted, the resume is
+    indexed again once its file changes
+    """
+    logger.error(f"Resume indexing failed for resume {resume.id}: {error}")
+    Resume.objects.filter(id=resume.id).update(index_status="failed")
+    resume.index_status = "failed"
+
+
+def _index_resume_job(resume_id):
+    """
+    Worker pool entry point
+    """
+    resume = None
+    try:
+        resume = Resume.objects.filter(id=resume_id).first()
+        if resume is not None and resume.file:
+            index_resume(resume)
+    except Exception as e:
+        if resume is not None:
+            mark_index_failed(resume, e)
+    finally:
+        connection.close()
+
+
+def schedule_resume_indexing(resume):
+    """
+    Index the resume in the worker pool once the upload transaction commits.
+    The resume loses its previous document until the new file is indexed.
+    """
+    Resume.objects.filter(id=resume.id).update(document=None, index_status="pending")
+    resume.document = None
+    resume.index_status = "pending"
+    transaction.on_commit(lambda: get_executor().submit(_index_resume_job, resume.id))
+
+
+def skill_terms(skills):
+    """
+    Returns {skill: tokens} for the skill titles
+    """
+    return {skill: tokenize(skill) for skill in skills if tokenize(skill)}
+
+
+def rank_resumes(resumes, skills):
+    """
+    Rank the resumes against the skills using BM25 over the term index. The
+    postings of every skill term are read with a single query.
+
+    Args:
+        resumes: Resume queryset or list
+        skills: skill titles
+
+    Returns:
+        list: dictionaries with the resume, its score, the number of matching
+        skills, an `index_failed` flag for resumes whose text could not be
+        extracted and an `image_pdf` flag for resumes without any text
+    """
+    resumes = list(resumes)
+    for resume in resumes:
+        if (
+            resume.document_id is None
+            and resume.file
+            and resume.index_status == "pending"
+        ):
+            try:
+                index_resume(resume)
+            except Exception as e:
+                mark_index_failed(resume, e)
+
+    documents = {
+        document.id: document
+        for document in ResumeDocument.objects.filter(
+            id__in={resume.document_id for resume in resumes if resume.document_id}
+        )
+    }
+    skills = skill_terms(skills)
+    query_terms = {term for tokens in skills.values() for term in tokens}
+
+    postings = {}
+    document_frequency = Counter()
+    if documents and query_terms:
+        for document_id, term, frequency in ResumeTerm.objects.filter(
+            document_id__in=documents.keys(), term__in=query_terms
+        ).values_list("document_id", "term", "frequency"):
+            postings.setdefault(document_id, {})[term] = frequency
+            document_frequency[term] += 1
+
+    total_documents = len(documents) or 1
+    average_length = (
+        sum(document.token_count for document in documents.values()) / total_documents
+        or 1
+    )
+
+    def bm25(document):
+        terms = postings.get(document.id, {})
+        score = 0.0
+        for term, frequency in terms.items():
+            idf = math.log(
+                1
+                + (total_documents - document_frequency[term] + 0.5)
+                / (document_frequency[term] + 0.5)
+            )
+            norm = BM25_K1 * (
+                1 - BM25_B + BM25_B * document.token_count / average_length
+            )
+            score += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        return score
+
+    ranks = []
+    for resume in resumes:
+        document = documents.get(resume.document_id)
+        item = {"resume": resume, "score": 0.0, "matching_skills_count": 0}
+        if resume.index_status == "failed":
+            item["index_failed"] = True
+        elif document is None or not document.token_count:
+            item["image_pdf"] = True
+        else:
+            terms = postings.get(document.id, {})
+            item["score"] = bm25(document)
+            item["matching_skills_count"] = sum(
+                all(token in terms for token in tokens) for tokens in skills.values()
+            )
+        ranks.append(item)
+    return ranks
@@ -1,13 +1,9 @@
-import calendar
-import datetime as dt
 import sys
-from datetime import datetime, timedelta
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from dateutil.relativedelta import relativedelta
 from django.db import OperationalError
 
-today = datetime.now()
+CANDIDATE_CONVERT_WATERMARK_KEY = "recruitment_candidate_convert_watermark"
 
 
 def recruitment_close():
@@ -15,19 +11,10 @@ def recruitment_close():
     Closes recruitment campaigns that have reached their end date.
 
     """
-    from recruitment.models import Recruitment
+    from recruitment.methods import close_ended_recruitments
 
     try:
-        today_date = today.date()
-
-        recruitments = Recruitment.objects.filter(closed=False)
-
-        for rec in recruitments:
-            if rec.end_date:
-                if rec.end_date == today_date:
-                    rec.closed = True
-                    rec.is_published = False
-                    rec.save()
+        close_ended_recruitments()
     except OperationalError:
         # Database tables not ready yet (migrations not completed)
         pass
@@ -40,21 +27,23 @@ def recruitment_close():
 def candidate_convert():
     """
     Converts candidates to a "converted" state if they already exist as users.
+    Only the users that joined since the previous run are matched, the whole
+    user table is matched when no previous run is recorded.
     """
     from django.contrib.auth.models import User
+    from django.core.cache import cache
+    from django.utils import timezone
 
-    from recruitment.models import Candidate
+    from recruitment.methods import convert_existing_candidates
 
     try:
-        candidates = Candidate.objects.filter(is_active=True)
-        mails = list(Candidate.objects.values_list("email", flat=True))
-        existing_emails = list(
-            User.objects.filter(username__in=mails).values_list("email", flat=True)
-        )
-        for cand in candidates:
-            if cand.email in existing_emails:
-                cand.converted = True
-                cand.save()
+        started_at = timezone.now()
+        watermark = cache.get(CANDIDATE_CONVERT_WATERMARK_KEY)
+        users = User.objects.all()
+        if watermark is not None:
+            users = users.filter(date_joined__gte=watermark)
+        convert_existing_candidates(users)
+        cache.set(CANDIDATE_CONVERT_WATERMARK_KEY, started_at, None)
     except OperationalError:
         # Database tables not ready yet (migrations not completed)
         pass
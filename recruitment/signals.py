@@ -1,12 +1,18 @@
-from django.db.models.signals import m2m_changed, post_save
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_save, pre_save
 from django.dispatch import receiver
 
 from recruitment.models import (
+    Candidate,
     CandidateDocument,
     CandidateDocumentRequest,
     Recruitment,
+    Resume,
     Stage,
 )
+from recruitment.methods import convert_existing_candidates
+from recruitment.resume_index import schedule_resume_indexing
 
 
 @receiver(post_save, sender=Recruitment)
@@ -49,3 +55,53 @@ def candidate_document_create(instance):
         )
         document.title = f"Upload {instance.title}"
         document.save()
+
+
+@receiver(pre_save, sender=Resume)
+def track_resume_file(sender, instance, **kwargs):
+    """
+    Remember the stored file of the resume to detect a new upload
+    """
+    instance._previous_file = None
+    if instance.pk is not None:
+        instance._previous_file = (
+            Resume.objects.filter(pk=instance.pk).values_list("file", flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Resume)
+def index_uploaded_resume(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Queue the uploaded resume for text extraction and indexing, saves that
+    keep the file (e.g. toggling is_candidate) are skipped
+    """
+    if not instance.file:
+        return
+    if update_fields is not None and "file" not in update_fields:
+        return
+    if created or instance.file.name != getattr(instance, "_previous_file", None):
+        schedule_resume_indexing(instance)
+
+
+@receiver(post_save, sender=User)
+def convert_candidate_on_user_creation(sender, instance, created, **kwargs):
+    """
+    Mark the candidates of a newly created user as converted
+    """
+    if created:
+        transaction.on_commit(
+            lambda: convert_existing_candidates(User.objects.filter(id=instance.id))
+        )
+
+
+@receiver(post_save, sender=Candidate)
+def convert_candidate_of_existing_user(sender, instance, created, **kwargs):
+    """
+    Mark a new candidate as converted when a user with its email exists
+    """
+    if created and not instance.converted:
+        transaction.on_commit(
+            lambda: convert_existing_candidates(
+                User.objects.filter(username=instance.email)
+            )
+        )
@@ -1,3 +1,145 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from horilla.reorder import reorder
+
+from recruitment.methods import convert_existing_candidates
+from recruitment.models import Candidate, Recruitment, Resume
+from recruitment.resume_index import rank_resumes
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ResumeIndexTests(TestCase):
+    """
+    Tests of the resume indexing triggered by resume uploads
+    """
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruitment = Recruitment(title="Engineers", vacancy=1)
+        cls.recruitment.save()
+
+    def upload(self, content=b"%PDF-1.4 not really a pdf"):
+        return SimpleUploadedFile("resume.pdf", content, "application/pdf")
+
+    @mock.patch("recruitment.signals.schedule_resume_indexing")
+    def test_saving_without_a_new_file_does_not_reindex(self, schedule):
+        resume = Resume.objects.create(
+            recruitment_id=self.recruitment, file=self.upload()
+        )
+        self.assertEqual(schedule.call_count, 1)
+
+        resume.is_candidate = True
+        resume.save()
+        Resume.objects.get(pk=resume.pk).save(update_fields=["is_candidate"])
+        self.assertEqual(schedule.call_count, 1)
+
+        resume.file = self.upload()
+        resume.save()
+        self.assertEqual(schedule.call_count, 2)
+
+    def test_unreadable_resume_is_reported_as_failed(self):
+        with self.captureOnCommitCallbacks(execute=False):
+            resume = Resume.objects.create(
+                recruitment_id=self.recruitment, file=self.upload()
+            )
+        [rank] = rank_resumes(Resume.objects.filter(pk=resume.pk), ["python"])
+        self.assertTrue(rank.get("index_failed"))
+        self.assertNotIn("image_pdf", rank)
+        self.assertEqual(Resume.objects.get(pk=resume.pk).index_status, "failed")
+
+        # a failed resume is not extracted again until its file changes
+        with mock.patch("recruitment.resume_index.index_resume") as index_resume:
+            rank_resumes(Resume.objects.filter(pk=resume.pk), ["python"])
+        index_resume.assert_not_called()
+
+
+class CandidateConversionTests(TestCase):
+    """
+    Tests of the conversion of candidates that already have a user account
+    """
+
+    def create_candidates(self, count):
+        Candidate.objects.bulk_create(
+            [
+                Candidate(name=f"Candidate {index}", email=f"candidate{index}@mail.com")
+                for index in range(count)
+            ]
+        )
+        User.objects.bulk_create(
+            [
+                User(username=f"candidate{index}@mail.com")
+                for index in range(0, count, 2)
+            ]
+        )
+
+    def test_conversion_is_a_single_query(self):
+        self.create_candidates(100)
+        with self.assertNumQueries(1):
+            converted = convert_existing_candidates(User.objects.all())
+        self.assertEqual(converted, 50)
+        self.assertEqual(Candidate.objects.filter(converted=True).count(), 50)
+
+    def test_only_the_given_users_are_matched(self):
+        self.create_candidates(4)
+        users = User.objects.filter(username="candidate2@mail.com")
+        with self.assertNumQueries(1):
+            self.assertEqual(convert_existing_candidates(users), 1)
+        self.assertEqual(
+            list(
+                Candidate.objects.filter(converted=True).values_list("email", flat=True)
+            ),
+            ["candidate2@mail.com"],
+        )
+
+
+class CandidateReorderTests(TestCase):
+    """
+    Tests of the drag and drop ordering of the pipeline candidates
+    """
+
+    def create_candidates(self, count):
+        Candidate.objects.bulk_create(
+            [
+                Candidate(name=f"Candidate {index}", email=f"candidate{index}@mail.com")
+                for index in range(count)
+            ]
+        )
+        return list(Candidate.objects.order_by("id").values_list("id", flat=True))
+
+    def reorder_queries(self, count):
+        ids = self.create_candidates(count)
+        reorder(Candidate.objects.all(), ids)
+        # move the last candidate to the top, then renumber the whole column
+        with CaptureQueriesContext(connection) as moved:
+            self.assertEqual(reorder(Candidate.objects.all(), ids[-1:] + ids[:-1]), 1)
+        with CaptureQueriesContext(connection) as renumbered:
+            reorder(Candidate.objects.all(), ids[::-1], gap=1)
+        Candidate.objects.all().delete()
+        return len(moved), len(renumbered)
+
+    def test_reorder_query_count_does_not_grow_with_the_column(self):
+        self.assertEqual(self.reorder_queries(10), self.reorder_queries(300))
+
+    def test_reorder_stores_the_order(self):
+        ids = self.create_candidates(20)
+        new_order = ids[5:] + ids[:5]
+        reorder(Candidate.objects.all(), new_order)
+        self.assertEqual(
+            list(Candidate.objects.order_by("sequence").values_list("id", flat=True)),
+            new_order,
+        )
@@ -63,6 +63,7 @@ from horilla.decorators import (
     permission_required,
 )
 from horilla.group_by import group_by_queryset
+from horilla.reorder import ordered_ids_from_sequence, reorder
 from horilla_documents.models import Document
 from notifications.signals import notify
 from recruitment.auth import CandidateAuthenticationBackend
@@ -119,6 +120,7 @@ from recruitment.models import (
     StageFiles,
     StageNote,
 )
+from recruitment.resume_index import rank_resumes
 from recruitment.views.linkedin import delete_post, post_recruitment_in_linkedin
 from recruitment.views.paginator_qry import paginator_qry
 
@@ -565,11 +567,9 @@ def update_candidate_stage_and_sequence(request):
         .first()
     )
     context = {}
-    for index, cand_id in enumerate(order_list):
-        candidate = CACHE.get(request.session.session_key + "pipeline")[
-            "candidates"
-        ].filter(id=cand_id)
-        candidate.update(sequence=index, stage_id=stage)
+    candidates = CACHE.get(request.session.session_key + "pipeline")["candidates"]
+    candidates.filter(id__in=order_list).exclude(stage_id=stage).update(stage_id=stage)
+    reorder(candidates, order_list)
     if stage.stage_type == "hired":
         if stage.recruitment_id.is_vacancy_filled():
             context["message"] = _("Vaccancy is filled")
@@ -592,13 +592,12 @@ def update_candidate_sequence(request):
     )
     data = {}
 
-    for index, cand_id in enumerate(order_list):
-        candidate = CACHE.get(request.session.session_key + "pipeline")[
-            "candidates"
-        ].filter(id=cand_id)
-        candidate.update(
-            sequence=index, stage_id=stage, hired=(stage.stage_type == "hired")
-        )
+    candidates = CACHE.get(request.session.session_key + "pipeline")["candidates"]
+    hired = stage.stage_type == "hired"
+    candidates.filter(id__in=order_list).exclude(stage_id=stage, hired=hired).update(
+        stage_id=stage, hired=hired
+    )
+    reorder(candidates, order_list)
 
     return JsonResponse(data)
 
@@ -2080,10 +2079,7 @@ def candidate_sequence_update(request):
     This method is used to update the sequence of candidate
     """
     sequence_data = json.loads(request.POST["sequenceData"])
-    for cand_id, seq in sequence_data.items():
-        cand = Candidate.objects.get(id=cand_id)
-        cand.sequence = seq
-        cand.save()
+    reorder(Candidate.objects.entire(), ordered_ids_from_sequence(sequence_data))
 
     return JsonResponse({"message": "Sequence updated", "type": "info"})
 
@@ -2095,10 +2091,8 @@ def stage_sequence_update(request):
     This method is used to update the sequence of the stages
     """
     sequence_data = json.loads(request.POST["sequence"])
-    for stage_id, seq in sequence_data.items():
-        stage = Stage.objects.get(id=stage_id)
-        stage.sequence = seq
-        stage.save()
+    # stages are few, keep their sequences consecutive
+    reorder(Stage.objects.entire(), ordered_ids_from_sequence(sequence_data), gap=1)
     return JsonResponse({"type": "success", "message": "Stage sequence updated"})
 
 
@@ -3150,30 +3144,6 @@ def delete_resume_file(request):
     return redirect(f"{url}{query_params}")
 
 
-def extract_words_from_pdf(pdf_file):
-    """
-    This method is used to extract the words from the pdf file into a list.
-    Args:
-        pdf_file: pdf file
-
-    """
-    pdf_document = fitz.open(pdf_file.path)
-
-    words = []
-
-    for page_num in range(len(pdf_document)):
-        page = pdf_document.load_page(page_num)
-        page_text = page.get_text()
-
-        page_words = re.findall(r"\b\w+\b", page_text.lower())
-
-        words.extend(page_words)
-
-    pdf_document.close()
-
-    return words
-
-
 @login_required
 @hx_request_required
 @manager_can_enter("recruitment.add_candidate")
@@ -3188,32 +3158,24 @@ def matching_resumes(request, rec_id):
     recruitment = Recruitment.objects.filter(id=rec_id).first()
     skills = recruitment.skills.values_list("title", flat=True)
     resumes = recruitment.resume.all()
-    is_candidate = resumes.filter(is_candidate=True)
-    is_candidate_ids = set(is_candidate.values_list("id", flat=True))
-
-    resume_ranks = []
-    for resume in resumes:
-        words = extract_words_from_pdf(resume.file)
-        matching_skills_count = sum(skill.lower() in words for skill in skills)
 
-        item = {"resume": resume, "matching_skills_count": matching_skills_count}
-        if not len(words):
-            item["image_pdf"] = True
+    # resume text is indexed once per file on upload, ranking is an index lookup
+    resume_ranks = rank_resumes(resumes, skills)
 
-        resume_ranks.append(item)
-
-    candidate_resumes = [
-        rank for rank in resume_ranks if rank["resume"].id in is_candidate_ids
-    ]
+    candidate_resumes = [rank for rank in resume_ranks if rank["resume"].is_candidate]
     non_candidate_resumes = [
-        rank for rank in resume_ranks if rank["resume"].id not in is_candidate_ids
+        rank for rank in resume_ranks if not rank["resume"].is_candidate
     ]
 
     non_candidate_resumes = sorted(
-        non_candidate_resumes, key=lambda x: x["matching_skills_count"], reverse=True
+        non_candidate_resumes,
+        key=lambda x: (x["score"], x["matching_skills_count"]),
+        reverse=True,
     )
     candidate_resumes = sorted(
-        candidate_resumes, key=lambda x: x["matching_skills_count"], reverse=True
+        candidate_resumes,
+        key=lambda x: (x["score"], x["matching_skills_count"]),
+        reverse=True,
     )
 
     ranked_resumes = non_candidate_resumes + candidate_resumes